@@ -13,6 +13,9 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+from ..config.settings import get_settings
+from ..llm.routing import LLMTaskClass, default_model_for
+
 # Import existing blueprint tools
 from ..tools.blueprint_tools import BlueprintGenerationTool, DocumentFormattingTool
 
@@ -28,7 +31,7 @@ def create_blueprint_agent() -> Agent:
         Agent: Configured CrewAI Blueprint Agent
     """
     # Initialize Gemma-2B LLM for document generation
-    llm = OllamaLLM(model="gemma:2b")
+    llm = OllamaLLM(model=default_model_for(LLMTaskClass.GENERATION, get_settings().llm))
     
     # Initialize blueprint tools (preserving existing logic)
     blueprint_generation_tool = BlueprintGenerationTool()
@@ -523,7 +526,7 @@ class BlueprintAgentCoordinator:
         """
         return {
             'agent_type': 'blueprint',
-            'llm_model': 'gemma:2b',
+            'llm_model': default_model_for(LLMTaskClass.GENERATION, get_settings().llm),
             'tools_available': ['BlueprintGenerationTool', 'DocumentFormattingTool'],
             'blueprints_generated': len(self.generated_blueprints),
             'templates_cached': len(self.document_templates),
@@ -14,6 +14,9 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+from ..config.settings import get_settings
+from ..llm.routing import LLMTaskClass, default_model_for
+
 # Import existing budget tools
 from ..tools.budget_tools import BudgetAllocationTool, FitnessCalculationTool
 
@@ -29,7 +32,7 @@ def create_budgeting_agent() -> Agent:
         Agent: Configured CrewAI Budgeting Agent
     """
     # Initialize Gemma-2B LLM
-    llm = OllamaLLM(model="gemma:2b")
+    llm = OllamaLLM(model=default_model_for(LLMTaskClass.GENERATION, get_settings().llm))
     
     # Initialize budget tools (preserving existing logic)
     budget_allocation_tool = BudgetAllocationTool()
@@ -374,7 +377,7 @@ class BudgetingAgentCoordinator:
         """
         return {
             'agent_type': 'budgeting',
-            'llm_model': 'gemma:2b',
+            'llm_model': default_model_for(LLMTaskClass.GENERATION, get_settings().llm),
             'tools_available': ['BudgetAllocationTool', 'FitnessCalculationTool'],
             'mcp_integration': self.mcp_integration_enabled,
             'capabilities': [
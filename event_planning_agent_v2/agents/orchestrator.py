@@ -15,6 +15,9 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+from ..config.settings import get_settings
+from ..llm.routing import LLMTaskClass, default_model_for
+
 
 class BeamSearchToolInput(BaseModel):
     """Input schema for BeamSearchTool"""
@@ -409,7 +412,7 @@ def create_orchestrator_agent() -> Agent:
         Agent: Configured CrewAI Orchestrator Agent
     """
     # Initialize LLM
-    llm = OllamaLLM(model="gemma:2b")
+    llm = OllamaLLM(model=default_model_for(LLMTaskClass.GENERATION, get_settings().llm))
     
     # Initialize tools
     beam_search_tool = BeamSearchTool()
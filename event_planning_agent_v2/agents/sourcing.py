@@ -14,6 +14,9 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+from ..config.settings import get_settings
+from ..llm.routing import LLMTaskClass, default_model_for
+
 # Import existing vendor tools
 from ..tools.vendor_tools import HybridFilterTool, VendorDatabaseTool, VendorRankingTool
 
@@ -29,7 +32,7 @@ def create_sourcing_agent() -> Agent:
         Agent: Configured CrewAI Sourcing Agent
     """
     # Initialize TinyLLaMA for requirement parsing
-    llm = OllamaLLM(model="tinyllama")
+    llm = OllamaLLM(model=default_model_for(LLMTaskClass.EXTRACTION, get_settings().llm))
     
     # Initialize vendor tools (preserving existing logic)
     hybrid_filter_tool = HybridFilterTool()
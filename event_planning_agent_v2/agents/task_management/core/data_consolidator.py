@@ -20,6 +20,7 @@ from datetime import timedelta
 from ..models.task_models import PrioritizedTask, GranularTask, TaskWithDependencies
 from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
 from ..models.data_models import Resource
+from ..models.dependency_graph import DependencyGraph, build_dependency_graph
 from ..exceptions import ConsolidationError, SubAgentDataError
 
 logger = logging.getLogger(__name__)
@@ -105,8 +106,8 @@ class DataConsolidator:
                     })
                     # Continue with next task
             
-            # Validate consolidated data
-            self._validate_consolidated_data(consolidated_tasks)
+            # Validate consolidated data and build the dependency graph
+            dependency_graph = self._validate_consolidated_data(consolidated_tasks)
             
             # Create consolidated data object
             consolidated_data = ConsolidatedTaskData(
@@ -120,7 +121,8 @@ class DataConsolidator:
                     'errors': self.consolidation_errors,
                     'warnings': self.warnings,
                     'tasks_with_missing_data': len(self.consolidation_errors)
-                }
+                },
+                dependency_graph=dependency_graph
             )
             
             logger.info(f"Consolidation complete: {len(consolidated_tasks)} tasks, "
@@ -386,7 +388,7 @@ class DataConsolidator:
             'resource_conflicts': resource_conflicts
         }
     
-    def _validate_consolidated_data(self, consolidated_tasks: List[ConsolidatedTask]) -> None:
+    def _validate_consolidated_data(self, consolidated_tasks: List[ConsolidatedTask]) -> DependencyGraph:
         """
         Validate consolidated data for missing or inconsistent information.
         
@@ -398,12 +400,15 @@ class DataConsolidator:
         
         Args:
             consolidated_tasks: List of consolidated tasks to validate
+        
+        Returns:
+            DependencyGraph of the tasks, for the tools to reuse
         """
         logger.info(f"Validating {len(consolidated_tasks)} consolidated tasks")
         
         if not consolidated_tasks:
             logger.warning("No consolidated tasks to validate")
-            return
+            return DependencyGraph()
         
         # Build task ID set for validation
         task_ids = {task.task_id for task in consolidated_tasks}
@@ -443,56 +448,38 @@ class DataConsolidator:
                 })
         
         # Check for circular dependencies
-        self._check_circular_dependencies(consolidated_tasks)
+        dependency_graph = self._check_circular_dependencies(consolidated_tasks)
         
         logger.info(f"Validation complete: {len(self.warnings)} warnings found")
+        return dependency_graph
     
-    def _check_circular_dependencies(self, consolidated_tasks: List[ConsolidatedTask]) -> None:
+    def _check_circular_dependencies(self, consolidated_tasks: List[ConsolidatedTask]) -> DependencyGraph:
         """
         Check for circular dependencies in the task graph.
         
-        Uses depth-first search to detect cycles in the dependency graph.
+        Builds the dependency graph with an iterative Tarjan SCC pass, which
+        runs in linear time and finds every cycle, and records one warning
+        per cycle listing all of its members.
         
         Args:
             consolidated_tasks: List of consolidated tasks to check
-        """
-        # Build adjacency list for dependency graph
-        dependency_graph: Dict[str, List[str]] = {}
-        for task in consolidated_tasks:
-            dependency_graph[task.task_id] = task.dependencies
         
-        # Track visited nodes and recursion stack
-        visited: Set[str] = set()
-        rec_stack: Set[str] = set()
+        Returns:
+            DependencyGraph of the tasks, with cycles broken
+        """
+        dependency_graph = build_dependency_graph(consolidated_tasks)
         
-        def has_cycle(task_id: str) -> bool:
-            """DFS helper to detect cycles"""
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            
-            # Check all dependencies
-            for dep_id in dependency_graph.get(task_id, []):
-                if dep_id not in visited:
-                    if has_cycle(dep_id):
-                        return True
-                elif dep_id in rec_stack:
-                    # Found a cycle
-                    return True
-            
-            rec_stack.remove(task_id)
-            return False
+        for members in dependency_graph.cycles:
+            warning_msg = f"Circular dependency detected among tasks: {', '.join(members)}"
+            logger.warning(warning_msg)
+            self.warnings.append({
+                'task_id': members[0],
+                'warning': 'Circular dependency detected',
+                'validation': 'circular_dependency',
+                'cycle': members
+            })
         
-        # Check each task for cycles
-        for task in consolidated_tasks:
-            if task.task_id not in visited:
-                if has_cycle(task.task_id):
-                    warning_msg = f"Circular dependency detected involving task {task.task_id}"
-                    logger.warning(warning_msg)
-                    self.warnings.append({
-                        'task_id': task.task_id,
-                        'warning': 'Circular dependency detected',
-                        'validation': 'circular_dependency'
-                    })
+        return dependency_graph
     
     def _handle_missing_data(
         self,
@@ -14,20 +14,24 @@ Integrates with:
 - EventPlanningState for error count and last_error updates
 """
 
+from __future__ import annotations
+
 import logging
 import traceback
-from typing import Dict, Any, Optional, List, Callable
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Callable
 from datetime import datetime
 from functools import wraps
 
 from ..exceptions import TaskManagementError, SubAgentDataError, ToolExecutionError, ConsolidationError
 from ..models.extended_models import ExtendedTask, ExtendedTaskList, ProcessingSummary
 from ..models.consolidated_models import ConsolidatedTaskData
-from ....workflows.state_models import EventPlanningState, WorkflowStatus, StateTransitionLogger
 from ....error_handling.handlers import ErrorHandler, ErrorContext, HandlerAction, AgentErrorHandler
 from ....error_handling.monitoring import get_error_monitor, record_error
 from ....error_handling.exceptions import AgentError, ErrorSeverity, ErrorCategory
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +48,9 @@ class TaskManagementErrorHandler:
     
     def __init__(self):
         """Initialize error handler with monitoring and logging"""
+        # Imported here since the workflows package imports this one
+        from ....workflows.state_models import StateTransitionLogger
+        
         self.error_monitor = get_error_monitor()
         self.transition_logger = StateTransitionLogger()
         self.agent_error_handler = AgentErrorHandler()
@@ -243,6 +250,8 @@ class TaskManagementErrorHandler:
         # Track error internally
         self.critical_errors.append(error_details)
         
+        from ....workflows.state_models import WorkflowStatus
+        
         # Update state to FAILED
         state['workflow_status'] = WorkflowStatus.FAILED.value
         state['error_count'] = state.get('error_count', 0) + 1
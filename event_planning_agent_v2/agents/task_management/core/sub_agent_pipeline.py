@@ -0,0 +1,224 @@
+"""
+Sub-Agent Pipeline for Task Management Agent
+
+Streams tasks through the three sub-agents instead of running them as
+whole-list passes:
+
+    Prioritization --queue--> Granularity --queue--> Resource identification
+                                                          |
+                                       global dependency linking (one pass)
+
+Each prioritized task is handed to the Granularity Agent as soon as it is
+ready; the Granularity Agent takes whatever has queued up (at most one
+prompt pack) per call, and each decomposed subtree goes straight on to
+resource identification. Dependencies can cross subtrees, so they are
+linked in a final pass over all granular tasks, which is rule-based and
+cheap. Queues are bounded so a fast stage cannot run arbitrarily far ahead
+of a slow one. Wall time drops from the sum of the stages toward the
+slowest stage.
+
+A stage that fails keeps what it already produced and still closes its
+output queue, so the stages after it finish with partial data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..models.data_models import Resource
+from ..models.task_models import GranularTask, PrioritizedTask, TaskWithDependencies
+from ..sub_agents.granularity_agent import GranularityAgentCore
+from ..sub_agents.prioritization_agent import PrioritizationAgentCore
+from ..sub_agents.resource_dependency_agent import ResourceDependencyAgentCore
+
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+@dataclass
+class SubAgentPipelineResult:
+    """Outputs, failures and timings of one pipeline run"""
+    prioritized_tasks: List[PrioritizedTask] = field(default_factory=list)
+    granular_tasks: List[GranularTask] = field(default_factory=list)
+    dependency_tasks: List[TaskWithDependencies] = field(default_factory=list)
+    errors: Dict[str, Exception] = field(default_factory=dict)  # Sub-agent name -> first error
+    stage_ms: Dict[str, float] = field(default_factory=dict)    # Sub-agent name -> busy time
+    wall_ms: float = 0.0
+
+
+class SubAgentPipeline:
+    """
+    Streaming pipeline over the Prioritization, Granularity and
+    Resource & Dependency agents.
+    """
+
+    def __init__(
+        self,
+        prioritization_agent: PrioritizationAgentCore,
+        granularity_agent: GranularityAgentCore,
+        resource_dependency_agent: ResourceDependencyAgentCore,
+        queue_size: int = 32,
+        batch_size: int = 8
+    ):
+        """
+        Initialize Sub-Agent Pipeline
+
+        Args:
+            prioritization_agent: Agent producing prioritized tasks
+            granularity_agent: Agent decomposing prioritized tasks
+            resource_dependency_agent: Agent identifying resources and dependencies
+            queue_size: Maximum items buffered between two stages
+            batch_size: Maximum prioritized tasks per Granularity Agent call
+        """
+        self.prioritization_agent = prioritization_agent
+        self.granularity_agent = granularity_agent
+        self.resource_dependency_agent = resource_dependency_agent
+        self.queue_size = max(1, queue_size)
+        self.batch_size = max(1, batch_size)
+
+    async def run(self, state: EventPlanningState) -> SubAgentPipelineResult:
+        """
+        Run all three sub-agents over the plan's tasks.
+
+        Args:
+            state: Current EventPlanningState
+
+        Returns:
+            SubAgentPipelineResult with the outputs of every sub-agent
+        """
+        result = SubAgentPipelineResult()
+        prioritized: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        decomposed: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        started = time.perf_counter()
+
+        _, _, resources = await asyncio.gather(
+            self._prioritize(state, prioritized, result),
+            self._decompose(state, prioritized, decomposed, result),
+            self._identify_resources(state, decomposed, result)
+        )
+
+        # Dependencies can cross subtrees, so they are linked once over the whole plan
+        stage_started = time.perf_counter()
+        try:
+            result.dependency_tasks = self.resource_dependency_agent.link_dependencies(
+                result.granular_tasks, resources
+            )
+        except Exception as e:
+            result.errors.setdefault("ResourceDependencyAgent", e)
+        self._add_stage_time(result, "ResourceDependencyAgent", stage_started)
+
+        result.wall_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Sub-agent pipeline produced {len(result.dependency_tasks)} tasks in {result.wall_ms:.0f}ms "
+            f"(stage time: {', '.join(f'{name} {ms:.0f}ms' for name, ms in result.stage_ms.items())})"
+        )
+        return result
+
+    async def _prioritize(
+        self,
+        state: EventPlanningState,
+        output: asyncio.Queue,
+        result: SubAgentPipelineResult
+    ) -> None:
+        """Stream prioritized tasks into the granularity queue"""
+        stage_started = time.perf_counter()
+        try:
+            async for task in self.prioritization_agent.prioritize_tasks_stream(state):
+                result.prioritized_tasks.append(task)
+                # Time spent blocked on a full queue isn't prioritization work
+                self._add_stage_time(result, "PrioritizationAgent", stage_started)
+                await output.put(task)
+                stage_started = time.perf_counter()
+        except Exception as e:
+            result.errors.setdefault("PrioritizationAgent", e)
+        finally:
+            self._add_stage_time(result, "PrioritizationAgent", stage_started)
+            await output.put(_DONE)
+
+    async def _decompose(
+        self,
+        state: EventPlanningState,
+        source: asyncio.Queue,
+        output: asyncio.Queue,
+        result: SubAgentPipelineResult
+    ) -> None:
+        """Decompose prioritized tasks as they arrive, passing each batch's subtrees on"""
+        try:
+            finished = False
+            while not finished:
+                batch, finished = await self._next_batch(source)
+                if not batch:
+                    continue
+
+                stage_started = time.perf_counter()
+                try:
+                    granular_tasks = await self.granularity_agent.decompose_tasks(batch, state)
+                except Exception as e:
+                    result.errors.setdefault("GranularityAgent", e)
+                    continue
+                finally:
+                    self._add_stage_time(result, "GranularityAgent", stage_started)
+
+                result.granular_tasks.extend(granular_tasks)
+                if granular_tasks:
+                    await output.put(granular_tasks)
+        finally:
+            await output.put(_DONE)
+
+    async def _identify_resources(
+        self,
+        state: EventPlanningState,
+        source: asyncio.Queue,
+        result: SubAgentPipelineResult
+    ) -> List[Optional[List[Resource]]]:
+        """Identify resources of each decomposed subtree as it arrives"""
+        resources: List[Optional[List[Resource]]] = []
+        while True:
+            group = await source.get()
+            if group is _DONE:
+                return resources
+
+            stage_started = time.perf_counter()
+            try:
+                resources.extend(await self.resource_dependency_agent.identify_task_resources(group, state))
+            except Exception as e:
+                result.errors.setdefault("ResourceDependencyAgent", e)
+                resources.extend([None] * len(group))
+            finally:
+                self._add_stage_time(result, "ResourceDependencyAgent", stage_started)
+
+    async def _next_batch(self, source: asyncio.Queue) -> Tuple[List[Any], bool]:
+        """
+        Wait for one item, then take whatever else is already queued.
+
+        Returns:
+            (items, whether the source is finished)
+        """
+        item = await source.get()
+        if item is _DONE:
+            return [], True
+
+        batch = [item]
+        while len(batch) < self.batch_size:
+            try:
+                item = source.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    @staticmethod
+    def _add_stage_time(result: SubAgentPipelineResult, name: str, stage_started: float) -> None:
+        elapsed_ms = (time.perf_counter() - stage_started) * 1000
+        result.stage_ms[name] = result.stage_ms.get(name, 0.0) + elapsed_ms
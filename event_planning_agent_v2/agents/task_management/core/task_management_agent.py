@@ -6,7 +6,7 @@ a comprehensive extended task list. This agent:
 
 1. Invokes three sub-agents (Prioritization, Granularity, Resource & Dependency)
 2. Consolidates sub-agent outputs using DataConsolidator
-3. Processes consolidated data through six tools sequentially:
+3. Processes consolidated data through six tools, running independent tools concurrently:
    - Timeline Calculation Tool
    - API/LLM Tool
    - Vendor Task Tool
@@ -23,10 +23,13 @@ Integrates with:
 - Error handling infrastructure
 """
 
+from __future__ import annotations
+
 import logging
 import time
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from datetime import datetime
+from dataclasses import asdict, is_dataclass
 
 # Import structured logging
 from ....observability.logging import get_logger, correlation_context
@@ -40,11 +43,13 @@ from ..tools.vendor_task_tool import VendorTaskTool
 from ..tools.logistics_check_tool import LogisticsCheckTool
 from ..tools.conflict_check_tool import ConflictCheckTool
 from ..tools.venue_lookup_tool import VenueLookupTool
+from ..tools.logistics_context import SharedLogisticsContext
 from .data_consolidator import DataConsolidator
+from .tool_executor import ToolGraphExecutor, ToolNode, ToolRun
+from .sub_agent_pipeline import SubAgentPipeline
 from ..models.extended_models import ExtendedTask, ExtendedTaskList, ProcessingSummary
 from ..models.consolidated_models import ConsolidatedTaskData
 from ..exceptions import TaskManagementError, SubAgentDataError, ToolExecutionError
-from ....workflows.state_models import EventPlanningState, WorkflowStatus
 from ....database.state_manager import WorkflowStateManager
 from ....llm.optimized_manager import get_llm_manager
 from ....config.settings import get_settings
@@ -58,10 +63,33 @@ from ....config.task_management_config import (
     load_config_from_env
 )
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 # Initialize structured logger for task management
 logger = get_logger(__name__, component="task_management")
 
 
+def _to_plain(value: Any) -> Any:
+    """
+    Convert nested dataclasses, lists and dicts to plain containers.
+    
+    Same result as dataclasses.asdict for the task models, but leaves
+    (strings, numbers, datetimes, timedeltas) are immutable and shared
+    rather than deep-copied one by one.
+    """
+    fields = getattr(type(value), '__dataclass_fields__', None)
+    if fields is not None:
+        return {name: _to_plain(getattr(value, name)) for name in fields}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_to_plain(item) for item in value)
+    return value
+
+
 class TaskManagementAgent:
     """
     Main orchestrator for Task Management Agent.
@@ -71,6 +99,16 @@ class TaskManagementAgent:
     logistics verification, and conflict detection.
     """
     
+    # Tool status key -> (output key, tool class name, log label, count metadata key)
+    TOOL_DESCRIPTIONS = {
+        'timeline_calculation': ('timelines', 'TimelineCalculationTool', 'Timeline Calculation Tool', 'timeline_count'),
+        'llm_enhancement': ('llm_enhancements', 'APILLMTool', 'API/LLM Tool', 'enhancement_count'),
+        'vendor_assignment': ('vendor_assignments', 'VendorTaskTool', 'Vendor Task Tool', 'assignment_count'),
+        'logistics_check': ('logistics_statuses', 'LogisticsCheckTool', 'Logistics Check Tool', 'status_count'),
+        'conflict_check': ('conflicts', 'ConflictCheckTool', 'Conflict Check Tool', 'conflict_count'),
+        'venue_lookup': ('venue_info', 'VenueLookupTool', 'Venue Lookup Tool', 'venue_count'),
+    }
+    
     def __init__(
         self,
         state_manager: Optional[WorkflowStateManager] = None,
@@ -155,6 +193,7 @@ class TaskManagementAgent:
         
         # Processing metrics
         self.tool_execution_status: Dict[str, str] = {}
+        self.tool_timings: Dict[str, Any] = {}
         
         # Initialize error handler
         self.error_handler = TaskManagementErrorHandler()
@@ -338,7 +377,7 @@ class TaskManagementAgent:
                 operation="process_complete",
                 metadata={
                     "processing_time_seconds": processing_time,
-                    "summary": extended_task_list.processing_summary.__dict__
+                    "summary": asdict(extended_task_list.processing_summary)
                 }
             )
             
@@ -361,6 +400,8 @@ class TaskManagementAgent:
             # Update state with error information
             state['error_count'] = state.get('error_count', 0) + 1
             state['last_error'] = f"Task Management Agent error: {str(e)}"
+            # Imported here since the workflows package imports this one
+            from ....workflows.state_models import WorkflowStatus
             state['workflow_status'] = WorkflowStatus.FAILED.value
             
             # Persist error state for recovery
@@ -380,7 +421,9 @@ class TaskManagementAgent:
         Invoke all three sub-agents and collect their outputs.
         
         Uses error handler to gracefully handle sub-agent failures and
-        continue with partial data when possible.
+        continue with partial data when possible. With pipeline_sub_agents
+        enabled and all three sub-agents on, tasks stream through the
+        sub-agents (see SubAgentPipeline) instead of three whole-list passes.
         
         Args:
             state: Current EventPlanningState
@@ -391,6 +434,14 @@ class TaskManagementAgent:
         Raises:
             SubAgentDataError: If all sub-agents fail and no data is available
         """
+        if (
+            self.config.pipeline_sub_agents
+            and self.config.enable_prioritization_agent
+            and self.config.enable_granularity_agent
+            and self.config.enable_resource_dependency_agent
+        ):
+            return await self._invoke_sub_agents_pipelined(state)
+        
         logger.info(
             "Invoking sub-agents",
             operation="invoke_sub_agents",
@@ -431,7 +482,7 @@ class TaskManagementAgent:
                     logger.debug(
                         f"Prioritization Agent output: {len(prioritized_tasks)} tasks",
                         operation="prioritization_output",
-                        metadata={"tasks": [t.__dict__ if hasattr(t, '__dict__') else str(t) for t in prioritized_tasks[:5]]}
+                        metadata={"tasks": [asdict(t) if is_dataclass(t) else str(t) for t in prioritized_tasks[:5]]}
                     )
             except Exception as e:
                 duration_ms = (time.time() - start_time) * 1000
@@ -479,7 +530,7 @@ class TaskManagementAgent:
                     logger.debug(
                         f"Granularity Agent output: {len(granular_tasks)} tasks",
                         operation="granularity_output",
-                        metadata={"tasks": [t.__dict__ if hasattr(t, '__dict__') else str(t) for t in granular_tasks[:5]]}
+                        metadata={"tasks": [asdict(t) if is_dataclass(t) else str(t) for t in granular_tasks[:5]]}
                     )
             except Exception as e:
                 duration_ms = (time.time() - start_time) * 1000
@@ -527,7 +578,7 @@ class TaskManagementAgent:
                     logger.debug(
                         f"Resource & Dependency Agent output: {len(dependency_tasks)} tasks",
                         operation="resource_dependency_output",
-                        metadata={"tasks": [t.__dict__ if hasattr(t, '__dict__') else str(t) for t in dependency_tasks[:5]]}
+                        metadata={"tasks": [asdict(t) if is_dataclass(t) else str(t) for t in dependency_tasks[:5]]}
                     )
             except Exception as e:
                 duration_ms = (time.time() - start_time) * 1000
@@ -562,6 +613,86 @@ class TaskManagementAgent:
         
         return sub_agent_outputs
     
+    async def _invoke_sub_agents_pipelined(self, state: EventPlanningState) -> Dict[str, List]:
+        """
+        Stream tasks through all three sub-agents with bounded queues.
+        
+        Args:
+            state: Current EventPlanningState
+            
+        Returns:
+            Dictionary with keys: prioritized_tasks, granular_tasks, dependency_tasks
+            
+        Raises:
+            SubAgentDataError: If all sub-agents fail and no data is available
+        """
+        logger.info(
+            "Invoking sub-agents as a pipeline",
+            operation="invoke_sub_agents",
+            metadata={"queue_size": self.config.sub_agent_queue_size}
+        )
+        
+        pipeline = SubAgentPipeline(
+            self.prioritization_agent,
+            self.granularity_agent,
+            self.resource_dependency_agent,
+            queue_size=self.config.sub_agent_queue_size,
+            batch_size=self.settings.llm.max_tasks_per_prompt
+        )
+        result = await pipeline.run(state)
+        
+        sub_agent_outputs = {
+            'prioritized_tasks': result.prioritized_tasks,
+            'granular_tasks': result.granular_tasks,
+            'dependency_tasks': result.dependency_tasks
+        }
+        
+        stages = [
+            ("PrioritizationAgent", "prioritize_tasks", 'prioritized_tasks'),
+            ("GranularityAgent", "decompose_tasks", 'granular_tasks'),
+            ("ResourceDependencyAgent", "analyze_dependencies", 'dependency_tasks'),
+        ]
+        for agent_name, action, output_key in stages:
+            error = result.errors.get(agent_name)
+            logger.log_agent_interaction(
+                agent_name=agent_name,
+                action=action,
+                duration_ms=result.stage_ms.get(agent_name, 0.0),
+                success=error is None,
+                output_data={"task_count": len(sub_agent_outputs[output_key])},
+                metadata={
+                    "plan_id": state.get('plan_id', 'unknown'),
+                    "pipelined": True,
+                    **({"error": str(error)} if error else {})
+                }
+            )
+            if error:
+                # Use error handler to log and continue with what the stage produced
+                self.error_handler.handle_sub_agent_error(
+                    error=error,
+                    sub_agent_name=agent_name,
+                    state=state,
+                    partial_data=sub_agent_outputs[output_key] or None
+                )
+        
+        logger.log_performance(
+            operation="sub_agent_pipeline",
+            duration_ms=result.wall_ms,
+            success=not result.errors,
+            metadata={"stage_ms": {name: round(ms, 2) for name, ms in result.stage_ms.items()}}
+        )
+        
+        # Check if we have any data at all
+        total_tasks = sum(len(tasks) for tasks in sub_agent_outputs.values())
+        if total_tasks == 0:
+            raise SubAgentDataError(
+                sub_agent_name="all",
+                message="All sub-agents returned empty data",
+                details={'sub_agent_outputs': sub_agent_outputs}
+            )
+        
+        return sub_agent_outputs
+    
     def _consolidate_data(
         self,
         prioritized_tasks: List,
@@ -660,9 +791,14 @@ class TaskManagementAgent:
         state: EventPlanningState
     ) -> Dict[str, Any]:
         """
-        Process consolidated data through all six tools sequentially.
-        
-        Tools are invoked in order:
+        Process consolidated data through all six tools.
+        
+        Tools run as a dependency graph (see ToolGraphExecutor). Only the
+        Conflict Check Tool waits for another tool, the Timeline Calculation
+        Tool; the API/LLM, Vendor Task, Logistics Check and Venue Lookup tools
+        work from the consolidated data alone and run concurrently with it
+        when parallel_tool_execution is enabled. Otherwise tools run one at a
+        time in this order:
         1. Timeline Calculation Tool
         2. API/LLM Tool
         3. Vendor Task Tool
@@ -670,6 +806,11 @@ class TaskManagementAgent:
         5. Conflict Check Tool
         6. Venue Lookup Tool
         
+        A failing tool is logged through the error handler and recorded in
+        tool_execution_status without stopping the others. Per-tool and
+        critical-path timings are stored in self.tool_timings and in
+        consolidated_data.processing_metadata['tool_timings'].
+        
         Args:
             consolidated_data: Consolidated task data from sub-agents
             state: Current EventPlanningState
@@ -677,7 +818,8 @@ class TaskManagementAgent:
         Returns:
             Dictionary with tool outputs keyed by tool name
         """
-        logger.info("Processing through tools sequentially...")
+        parallel = self.config.parallel_tool_execution
+        logger.info(f"Processing through tools {'concurrently' if parallel else 'sequentially'}...")
         
         tool_outputs = {
             'timelines': [],
@@ -691,255 +833,131 @@ class TaskManagementAgent:
         # Reset tool execution status
         self.tool_execution_status = {}
         
-        # Tool 1: Timeline Calculation
-        if self.config.enable_timeline_calculation:
-            logger.debug("Executing Timeline Calculation Tool", operation="tool_timeline_calculation")
-            start_time = time.time()
-            try:
-                timelines = self.timeline_tool.calculate_timelines(consolidated_data, state)
-                tool_outputs['timelines'] = timelines
-                self.tool_execution_status['timeline_calculation'] = 'success'
-                duration_ms = (time.time() - start_time) * 1000
-                
-                logger.log_performance(
-                    operation="timeline_calculation_tool",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={"timeline_count": len(timelines)}
-                )
-                
-                if self.config.log_tool_results:
-                    logger.debug(
-                        f"Timeline Calculation Tool results: {len(timelines)} timelines",
-                        operation="timeline_results",
-                        metadata={"timelines": [t.__dict__ if hasattr(t, '__dict__') else str(t) for t in timelines[:5]]}
-                    )
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.tool_execution_status['timeline_calculation'] = f'failed: {str(e)}'
-                
-                logger.log_performance(
-                    operation="timeline_calculation_tool",
-                    duration_ms=duration_ms,
-                    success=False,
-                    metadata={"error": str(e)}
-                )
-                
-                # Use error handler to log and continue
-                should_continue, error_metadata = self.error_handler.handle_tool_error(
-                    error=e,
-                    tool_name="TimelineCalculationTool",
-                    state=state,
-                    affected_tasks=[task.task_id for task in consolidated_data.tasks]
-                )
+        nodes = self._build_tool_nodes(consolidated_data, state)
+        executor = ToolGraphExecutor(
+            nodes,
+            concurrent=parallel,
+            on_complete=lambda run: self._record_tool_run(run, consolidated_data, state)
+        )
+        outputs, _, timings = await executor.run()
+        tool_outputs.update(outputs)
+        
+        self.tool_timings = timings.to_dict()
+        consolidated_data.processing_metadata['tool_timings'] = self.tool_timings
+        logger.log_performance(
+            operation="tool_processing",
+            duration_ms=timings.wall_ms,
+            success=all(status == 'success' for status in self.tool_execution_status.values()),
+            metadata=self.tool_timings
+        )
         
-        # Tool 2: API/LLM Enhancement
-        if self.config.enable_llm_enhancement:
-            logger.debug("Executing API/LLM Tool", operation="tool_llm_enhancement")
-            start_time = time.time()
-            try:
-                llm_enhancements = await self.llm_tool.enhance_tasks(
-                    consolidated_data,
-                    event_context=state.get('client_request', {})
-                )
-                tool_outputs['llm_enhancements'] = llm_enhancements
-                self.tool_execution_status['llm_enhancement'] = 'success'
-                duration_ms = (time.time() - start_time) * 1000
-                
-                logger.log_performance(
-                    operation="llm_enhancement_tool",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={"enhancement_count": len(llm_enhancements)}
-                )
-                
-                if self.config.log_tool_results:
-                    logger.debug(
-                        f"API/LLM Tool results: {len(llm_enhancements)} enhancements",
-                        operation="llm_results",
-                        metadata={"enhancements": [e.__dict__ if hasattr(e, '__dict__') else str(e) for e in llm_enhancements[:5]]}
-                    )
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.tool_execution_status['llm_enhancement'] = f'failed: {str(e)}'
-                
-                logger.log_performance(
-                    operation="llm_enhancement_tool",
-                    duration_ms=duration_ms,
-                    success=False,
-                    metadata={"error": str(e)}
-                )
-                
-                # Use error handler to log and continue
-                should_continue, error_metadata = self.error_handler.handle_tool_error(
-                    error=e,
-                    tool_name="APILLMTool",
-                    state=state,
-                    affected_tasks=[task.task_id for task in consolidated_data.tasks]
-                )
+        logger.info(
+            f"  Tool processing completed in {timings.wall_ms:.0f}ms "
+            f"({timings.total_tool_ms:.0f}ms of tool time, critical path "
+            f"{' -> '.join(timings.critical_path) or 'empty'} {timings.critical_path_ms:.0f}ms)"
+        )
+        return tool_outputs
+    
+    def _build_tool_nodes(
+        self,
+        consolidated_data: ConsolidatedTaskData,
+        state: EventPlanningState
+    ) -> List[ToolNode]:
+        """
+        Build the execution graph of the enabled tools, in sequential order.
         
-        # Tool 3: Vendor Task Assignment
-        if self.config.enable_vendor_assignment:
-            logger.debug("Executing Vendor Task Tool", operation="tool_vendor_assignment")
-            start_time = time.time()
-            try:
-                vendor_assignments = self.vendor_tool.assign_vendors(consolidated_data, state)
-                tool_outputs['vendor_assignments'] = vendor_assignments
-                self.tool_execution_status['vendor_assignment'] = 'success'
-                duration_ms = (time.time() - start_time) * 1000
-                
-                logger.log_performance(
-                    operation="vendor_assignment_tool",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={"assignment_count": len(vendor_assignments)}
-                )
-                
-                if self.config.log_tool_results:
-                    logger.debug(
-                        f"Vendor Task Tool results: {len(vendor_assignments)} assignments",
-                        operation="vendor_results"
-                    )
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.tool_execution_status['vendor_assignment'] = f'failed: {str(e)}'
-                
-                logger.log_performance(
-                    operation="vendor_assignment_tool",
-                    duration_ms=duration_ms,
-                    success=False,
-                    metadata={"error": str(e)}
-                )
-                
-                should_continue, error_metadata = self.error_handler.handle_tool_error(
-                    error=e,
-                    tool_name="VendorTaskTool",
-                    state=state,
-                    affected_tasks=[task.task_id for task in consolidated_data.tasks]
-                )
+        The Logistics Check and Venue Lookup tools share one LogisticsContext,
+        loaded by whichever of them starts first.
         
-        # Tool 4: Logistics Check
-        if self.config.enable_logistics_check:
-            logger.debug("Executing Logistics Check Tool", operation="tool_logistics_check")
-            start_time = time.time()
-            try:
-                logistics_statuses = self.logistics_tool.verify_logistics(consolidated_data, state)
-                tool_outputs['logistics_statuses'] = logistics_statuses
-                self.tool_execution_status['logistics_check'] = 'success'
-                duration_ms = (time.time() - start_time) * 1000
-                
-                logger.log_performance(
-                    operation="logistics_check_tool",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={"status_count": len(logistics_statuses)}
-                )
-                
-                if self.config.log_tool_results:
-                    logger.debug(
-                        f"Logistics Check Tool results: {len(logistics_statuses)} statuses",
-                        operation="logistics_results"
-                    )
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.tool_execution_status['logistics_check'] = f'failed: {str(e)}'
-                
-                logger.log_performance(
-                    operation="logistics_check_tool",
-                    duration_ms=duration_ms,
-                    success=False,
-                    metadata={"error": str(e)}
-                )
-                
-                should_continue, error_metadata = self.error_handler.handle_tool_error(
-                    error=e,
-                    tool_name="LogisticsCheckTool",
-                    state=state,
-                    affected_tasks=[task.task_id for task in consolidated_data.tasks]
-                )
+        Args:
+            consolidated_data: Consolidated task data from sub-agents
+            state: Current EventPlanningState
+            
+        Returns:
+            ToolNode per enabled tool
+        """
+        async def enhance_tasks(outputs):
+            return await self.llm_tool.enhance_tasks(
+                consolidated_data,
+                event_context=state.get('client_request', {})
+            )
         
-        # Tool 5: Conflict Check
-        if self.config.enable_conflict_detection:
-            logger.debug("Executing Conflict Check Tool", operation="tool_conflict_check")
-            start_time = time.time()
-            try:
-                conflicts = self.conflict_tool.check_conflicts(consolidated_data, state)
-                tool_outputs['conflicts'] = conflicts
-                self.tool_execution_status['conflict_check'] = 'success'
-                duration_ms = (time.time() - start_time) * 1000
-                
-                logger.log_performance(
-                    operation="conflict_check_tool",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={"conflict_count": len(conflicts)}
-                )
-                
-                if self.config.log_tool_results:
-                    logger.debug(
-                        f"Conflict Check Tool results: {len(conflicts)} conflicts",
-                        operation="conflict_results"
-                    )
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.tool_execution_status['conflict_check'] = f'failed: {str(e)}'
-                
-                logger.log_performance(
-                    operation="conflict_check_tool",
-                    duration_ms=duration_ms,
-                    success=False,
-                    metadata={"error": str(e)}
-                )
-                
-                should_continue, error_metadata = self.error_handler.handle_tool_error(
-                    error=e,
-                    tool_name="ConflictCheckTool",
-                    state=state,
-                    affected_tasks=[task.task_id for task in consolidated_data.tasks]
-                )
+        logistics_context = SharedLogisticsContext(
+            self.logistics_tool.db_manager, state.get('selected_combination')
+        )
         
-        # Tool 6: Venue Lookup
-        if self.config.enable_venue_lookup:
-            logger.debug("Executing Venue Lookup Tool", operation="tool_venue_lookup")
-            start_time = time.time()
-            try:
-                venue_info = self.venue_tool.lookup_venues(consolidated_data, state)
-                tool_outputs['venue_info'] = venue_info
-                self.tool_execution_status['venue_lookup'] = 'success'
-                duration_ms = (time.time() - start_time) * 1000
-                
-                logger.log_performance(
-                    operation="venue_lookup_tool",
-                    duration_ms=duration_ms,
-                    success=True,
-                    metadata={"venue_count": len(venue_info)}
-                )
-                
-                if self.config.log_tool_results:
-                    logger.debug(
-                        f"Venue Lookup Tool results: {len(venue_info)} venues",
-                        operation="venue_results"
-                    )
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                self.tool_execution_status['venue_lookup'] = f'failed: {str(e)}'
-                
-                logger.log_performance(
-                    operation="venue_lookup_tool",
-                    duration_ms=duration_ms,
-                    success=False,
-                    metadata={"error": str(e)}
-                )
-                
-                should_continue, error_metadata = self.error_handler.handle_tool_error(
-                    error=e,
-                    tool_name="VenueLookupTool",
-                    state=state,
-                    affected_tasks=[task.task_id for task in consolidated_data.tasks]
+        candidates = [
+            (self.config.enable_timeline_calculation, 'timeline_calculation',
+             lambda outputs: self.timeline_tool.calculate_timelines(consolidated_data, state), ()),
+            (self.config.enable_llm_enhancement, 'llm_enhancement', enhance_tasks, ()),
+            (self.config.enable_vendor_assignment, 'vendor_assignment',
+             lambda outputs: self.vendor_tool.assign_vendors(consolidated_data, state), ()),
+            (self.config.enable_logistics_check, 'logistics_check',
+             lambda outputs: self.logistics_tool.verify_logistics(
+                 consolidated_data, state, context=logistics_context.get()
+             ), ()),
+            (self.config.enable_conflict_detection, 'conflict_check',
+             lambda outputs: self.conflict_tool.check_conflicts(consolidated_data, state), ('timelines',)),
+            (self.config.enable_venue_lookup, 'venue_lookup',
+             lambda outputs: self.venue_tool.lookup_venues(
+                 consolidated_data, state, context=logistics_context.get()
+             ), ()),
+        ]
+        
+        return [
+            ToolNode(name=name, run=run, output=self.TOOL_DESCRIPTIONS[name][0], inputs=inputs)
+            for enabled, name, run, inputs in candidates
+            if enabled
+        ]
+    
+    def _record_tool_run(
+        self,
+        run: ToolRun,
+        consolidated_data: ConsolidatedTaskData,
+        state: EventPlanningState
+    ) -> None:
+        """
+        Record a finished tool's status and performance, handling its error.
+        
+        Args:
+            run: Finished tool run
+            consolidated_data: Consolidated task data from sub-agents
+            state: Current EventPlanningState
+        """
+        _, tool_name, label, count_key = self.TOOL_DESCRIPTIONS[run.name]
+        operation = f"{run.name}_tool"
+        
+        if run.success:
+            self.tool_execution_status[run.name] = 'success'
+            logger.log_performance(
+                operation=operation,
+                duration_ms=run.duration_ms,
+                success=True,
+                metadata={count_key: len(run.output), "started_ms": round(run.started_ms, 2)}
+            )
+            
+            if self.config.log_tool_results:
+                logger.debug(
+                    f"{label} results: {len(run.output)} items",
+                    operation=f"{run.name}_results"
                 )
+            return
+        
+        self.tool_execution_status[run.name] = f'failed: {str(run.error)}'
+        logger.log_performance(
+            operation=operation,
+            duration_ms=run.duration_ms,
+            success=False,
+            metadata={"error": str(run.error)}
+        )
         
-        logger.info("  Tool processing completed")
-        return tool_outputs
+        # Use error handler to log and continue
+        self.error_handler.handle_tool_error(
+            error=run.error,
+            tool_name=tool_name,
+            state=state,
+            affected_tasks=[task.task_id for task in consolidated_data.tasks]
+        )
     
     def _generate_extended_task_list(
         self,
@@ -1134,6 +1152,7 @@ class TaskManagementAgent:
         
         # Update workflow status to indicate task management completion
         # This allows Blueprint Agent to know task management has completed
+        from ....workflows.state_models import WorkflowStatus
         state['workflow_status'] = WorkflowStatus.RUNNING.value
         
         # Persist state to database using StateManager
@@ -1294,10 +1313,8 @@ class TaskManagementAgent:
         Returns:
             Dictionary representation
         """
-        from dataclasses import asdict
-        
         # Convert to dict (handles nested dataclasses)
-        result = asdict(extended_task_list)
+        result = _to_plain(extended_task_list)
         
         # Convert timedelta objects to strings for JSON serialization
         for task in result['tasks']:
@@ -1309,6 +1326,8 @@ class TaskManagementAgent:
                 buffer = task['timeline']['buffer_time']
                 if hasattr(buffer, 'total_seconds'):
                     task['timeline']['buffer_time'] = buffer.total_seconds()
+            if task.get('timeline') and hasattr(task['timeline'].get('slack'), 'total_seconds'):
+                task['timeline']['slack'] = task['timeline']['slack'].total_seconds()
         
         return result
     
@@ -0,0 +1,204 @@
+"""
+Tool Executor for Task Management Agent
+
+Runs the Task Management tools as a small dependency graph. Each tool
+declares the outputs it needs; a tool starts as soon as those are available,
+so independent tools run concurrently. Coroutine tools are awaited on the
+event loop and synchronous tools run in the default thread pool.
+
+A failing tool never stops the others: its error is recorded on its ToolRun
+and tools that need its output still run with whatever was produced, as in
+sequential processing. Every run records its start offset and duration, and
+the executor reports the critical path, the longest chain of dependent tools.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ToolNode:
+    """One tool in the execution graph"""
+    name: str                             # Key in tool_execution_status
+    run: Callable[[Dict[str, Any]], Any]  # Called with the outputs produced so far
+    output: str                           # Key of the output this tool produces
+    inputs: Tuple[str, ...] = ()          # Outputs that must be produced first
+
+
+@dataclass
+class ToolRun:
+    """Outcome and timing of one tool execution"""
+    name: str
+    output: Any = None
+    error: Optional[Exception] = None
+    started_ms: float = 0.0   # Offset from the start of the executor run
+    duration_ms: float = 0.0
+    path_ms: float = 0.0      # Duration of the longest chain of tools ending here
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ToolGraphTimings:
+    """Timings of one executor run"""
+    wall_ms: float = 0.0
+    total_tool_ms: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_ms: float = 0.0
+    tool_ms: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'wall_ms': round(self.wall_ms, 2),
+            'total_tool_ms': round(self.total_tool_ms, 2),
+            'critical_path': self.critical_path,
+            'critical_path_ms': round(self.critical_path_ms, 2),
+            'tool_ms': {name: round(ms, 2) for name, ms in self.tool_ms.items()},
+        }
+
+
+class ToolGraphExecutor:
+    """
+    Dependency-driven executor for Task Management tools.
+
+    Nodes are given in their sequential order, which is also the order used
+    when concurrency is disabled. Inputs that no node produces (a disabled
+    tool) are treated as already available.
+    """
+
+    def __init__(
+        self,
+        nodes: List[ToolNode],
+        concurrent: bool = True,
+        on_complete: Optional[Callable[[ToolRun], None]] = None
+    ):
+        """
+        Initialize Tool Graph Executor
+
+        Args:
+            nodes: Tools in sequential order
+            concurrent: Run independent tools concurrently
+            on_complete: Called on the event loop as each tool finishes
+
+        Raises:
+            ValueError: If two nodes produce the same output or inputs form a cycle
+        """
+        self.nodes = nodes
+        self.concurrent = concurrent
+        self.on_complete = on_complete
+
+        producers: Dict[str, ToolNode] = {}
+        for node in nodes:
+            if node.output in producers:
+                raise ValueError(f"Output '{node.output}' is produced by both {producers[node.output].name} and {node.name}")
+            producers[node.output] = node
+
+        # Tool name -> names of the tools producing its inputs
+        self.upstream: Dict[str, List[str]] = {
+            node.name: [producers[key].name for key in node.inputs if key in producers]
+            for node in nodes
+        }
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        remaining = {name: set(upstream) for name, upstream in self.upstream.items()}
+        while remaining:
+            ready = [name for name, upstream in remaining.items() if not upstream]
+            if not ready:
+                raise ValueError(f"Tool inputs form a cycle between {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+            for upstream in remaining.values():
+                upstream.difference_update(ready)
+
+    async def run(self) -> Tuple[Dict[str, Any], Dict[str, ToolRun], ToolGraphTimings]:
+        """
+        Execute every tool once its inputs are available.
+
+        Returns:
+            (outputs by output key, ToolRun by tool name, timings)
+        """
+        outputs: Dict[str, Any] = {}
+        runs: Dict[str, ToolRun] = {}
+        started = time.perf_counter()
+
+        if not self.concurrent:
+            for node in self.nodes:
+                self._finish(await self._execute(node, outputs, started), runs)
+        else:
+            waiting = {name: set(upstream) for name, upstream in self.upstream.items()}
+            nodes = {node.name: node for node in self.nodes}
+            running: Dict[asyncio.Task, str] = {}
+
+            while waiting or running:
+                for name in [name for name, upstream in waiting.items() if not upstream]:
+                    del waiting[name]
+                    running[asyncio.ensure_future(self._execute(nodes[name], outputs, started))] = name
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    self._finish(task.result(), runs)
+                    for upstream in waiting.values():
+                        upstream.discard(name)
+
+        timings = self._timings(runs, (time.perf_counter() - started) * 1000)
+        return outputs, runs, timings
+
+    async def _execute(self, node: ToolNode, outputs: Dict[str, Any], started: float) -> ToolRun:
+        """Run one tool, capturing its output or error"""
+        run = ToolRun(name=node.name)
+        tool_started = time.perf_counter()
+        run.started_ms = (tool_started - started) * 1000
+
+        try:
+            if inspect.iscoroutinefunction(node.run):
+                run.output = await node.run(outputs)
+            elif self.concurrent:
+                run.output = await asyncio.to_thread(node.run, outputs)
+            else:
+                run.output = node.run(outputs)
+            outputs[node.output] = run.output
+        except Exception as e:
+            run.error = e
+
+        run.duration_ms = (time.perf_counter() - tool_started) * 1000
+        return run
+
+    def _finish(self, run: ToolRun, runs: Dict[str, ToolRun]) -> None:
+        run.path_ms = run.duration_ms + max(
+            (runs[name].path_ms for name in self.upstream[run.name]), default=0.0
+        )
+        runs[run.name] = run
+        if self.on_complete:
+            try:
+                self.on_complete(run)
+            except Exception as e:
+                logger.error(f"Tool completion handler failed for {run.name}: {e}")
+
+    def _timings(self, runs: Dict[str, ToolRun], wall_ms: float) -> ToolGraphTimings:
+        """Per-tool durations and the chain of tools that bounded the run"""
+        timings = ToolGraphTimings(
+            wall_ms=wall_ms,
+            total_tool_ms=sum(run.duration_ms for run in runs.values()),
+            tool_ms={name: run.duration_ms for name, run in runs.items()},
+        )
+        if not runs:
+            return timings
+
+        name = max(runs, key=lambda n: runs[n].path_ms)
+        timings.critical_path_ms = runs[name].path_ms
+        path = [name]
+        while self.upstream[name]:
+            name = max(self.upstream[name], key=lambda n: runs[n].path_ms)
+            path.append(name)
+        timings.critical_path = path[::-1]
+        return timings
@@ -5,6 +5,7 @@ Contains all data models used by the Task Management Agent:
 - Base data models (Resource, TaskTimeline, etc.)
 - Task-specific models (PrioritizedTask, GranularTask, etc.)
 - Consolidated models (ConsolidatedTask, ConsolidatedTaskData)
+- Dependency graph (DependencyGraph, build_dependency_graph)
 - Extended models (ExtendedTask, ExtendedTaskList, ProcessingSummary)
 """
 
@@ -29,6 +30,11 @@ from .consolidated_models import (
     ConsolidatedTaskData
 )
 
+from .dependency_graph import (
+    DependencyGraph,
+    build_dependency_graph
+)
+
 from .extended_models import (
     ExtendedTask,
     ExtendedTaskList,
@@ -51,6 +57,9 @@ __all__ = [
     # Consolidated models
     'ConsolidatedTask',
     'ConsolidatedTaskData',
+    # Dependency graph
+    'DependencyGraph',
+    'build_dependency_graph',
     # Extended models
     'ExtendedTask',
     'ExtendedTaskList',
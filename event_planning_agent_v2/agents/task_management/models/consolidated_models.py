@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import List, Optional, Dict
 from .data_models import (
+    SLOTTED,
+    intern_label,
     Resource,
     TaskTimeline,
     VendorAssignment,
@@ -17,9 +19,10 @@ from .data_models import (
     Conflict,
     VenueInfo
 )
+from .dependency_graph import DependencyGraph
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class ConsolidatedTask:
     """
     Unified task data combining outputs from all three sub-agents.
@@ -52,8 +55,11 @@ class ConsolidatedTask:
     conflicts: List[Conflict] = field(default_factory=list)
     venue_info: Optional[VenueInfo] = None
 
+    def __post_init__(self):
+        self.priority_level = intern_label(self.priority_level)
 
-@dataclass
+
+@dataclass(**SLOTTED)
 class ConsolidatedTaskData:
     """
     Collection of consolidated tasks with event context and processing metadata.
@@ -62,3 +68,4 @@ class ConsolidatedTaskData:
     tasks: List[ConsolidatedTask] = field(default_factory=list)
     event_context: Dict = field(default_factory=dict)
     processing_metadata: Dict = field(default_factory=dict)
+    dependency_graph: Optional[DependencyGraph] = None  # Built by the DataConsolidator, reused by the tools
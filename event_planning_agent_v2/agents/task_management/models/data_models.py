@@ -9,14 +9,28 @@ Contains fundamental data structures used across the Task Management Agent:
 - LogisticsStatus: Logistics verification results
 - Conflict: Detected conflicts
 - VenueInfo: Venue information for tasks
+
+Every model is a slotted dataclass (no per-instance __dict__) on Python
+3.10+, since a large plan holds several of them per task. Labels that
+repeat across tasks (resource types, statuses, vendor names) are interned
+so each distinct value is stored once.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
+
+# dataclass() only accepts slots=True from Python 3.10
+SLOTTED: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
+def intern_label(value: Any) -> Any:
+    """Intern a label repeated across tasks; non-strings are returned unchanged"""
+    return sys.intern(value) if type(value) is str else value
 
-@dataclass
+
+@dataclass(**SLOTTED)
 class Resource:
     """Represents a resource required for a task"""
     resource_type: str  # vendor, equipment, personnel, venue
@@ -25,8 +39,13 @@ class Resource:
     quantity_required: int
     availability_constraint: Optional[str] = None
 
+    def __post_init__(self):
+        self.resource_type = intern_label(self.resource_type)
+        self.resource_id = intern_label(self.resource_id)
+        self.resource_name = intern_label(self.resource_name)
+
 
-@dataclass
+@dataclass(**SLOTTED)
 class TaskTimeline:
     """Timeline information for a task"""
     task_id: str
@@ -35,9 +54,11 @@ class TaskTimeline:
     duration: timedelta
     buffer_time: timedelta
     scheduling_constraints: List[str] = field(default_factory=list)
+    slack: Optional[timedelta] = None  # How long the task can slip without delaying the schedule
+    is_critical: bool = False  # On the critical path (no slack)
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class EnhancedTask:
     """LLM-enhanced task information"""
     task_id: str
@@ -48,7 +69,7 @@ class EnhancedTask:
     requires_manual_review: bool = False
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class VendorAssignment:
     """Vendor assignment to a task"""
     task_id: str
@@ -59,8 +80,13 @@ class VendorAssignment:
     assignment_rationale: str
     requires_manual_assignment: bool = False
 
+    def __post_init__(self):
+        self.vendor_id = intern_label(self.vendor_id)
+        self.vendor_name = intern_label(self.vendor_name)
+        self.vendor_type = intern_label(self.vendor_type)
 
-@dataclass
+
+@dataclass(**SLOTTED)
 class LogisticsStatus:
     """Logistics verification status for a task"""
     task_id: str
@@ -73,8 +99,14 @@ class LogisticsStatus:
     overall_feasibility: str  # feasible, needs_attention, not_feasible
     issues: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.transportation_status = intern_label(self.transportation_status)
+        self.equipment_status = intern_label(self.equipment_status)
+        self.setup_status = intern_label(self.setup_status)
+        self.overall_feasibility = intern_label(self.overall_feasibility)
+
 
-@dataclass
+@dataclass(**SLOTTED)
 class Conflict:
     """Represents a detected conflict"""
     conflict_id: str
@@ -84,8 +116,12 @@ class Conflict:
     conflict_description: str = ""
     suggested_resolutions: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.conflict_type = intern_label(self.conflict_type)
+        self.severity = intern_label(self.severity)
 
-@dataclass
+
+@dataclass(**SLOTTED)
 class VenueInfo:
     """Venue information for a task"""
     task_id: str
@@ -98,3 +134,8 @@ class VenueInfo:
     teardown_time_required: timedelta = timedelta(hours=1)
     access_restrictions: List[str] = field(default_factory=list)
     requires_venue_selection: bool = False
+
+    def __post_init__(self):
+        self.venue_id = intern_label(self.venue_id)
+        self.venue_name = intern_label(self.venue_name)
+        self.venue_type = intern_label(self.venue_type)
@@ -0,0 +1,192 @@
+"""
+Dependency Graph for Task Management Agent
+
+Contains the dependency DAG of a consolidated task list:
+- DependencyGraph: Topological order and adjacency lists of the tasks
+- build_dependency_graph: Builds it with one iterative Tarjan SCC pass
+
+The DataConsolidator builds the graph once and attaches it to the
+ConsolidatedTaskData, so the tools that need dependency order (timeline
+calculation, incremental rescheduling) reuse it instead of rebuilding it.
+
+Every strongly connected component of more than one task, or of a task that
+depends on itself, is a dependency cycle and is reported with all of its
+members. A cycle is broken by dropping the edges inside it that point
+backwards in task list order, so its members are scheduled in the order the
+sub-agents listed them, and the tasks depending on a cycle still come after
+all of its members.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+from .data_models import SLOTTED
+
+
+@dataclass(**SLOTTED)
+class DependencyGraph:
+    """
+    Dependency DAG of a task list, indexed by position in topological order.
+
+    task_ids[i] is the i-th task in dependency order; predecessors[i] and
+    successors[i] are the positions of its prerequisites and dependents,
+    both ascending. Edges that closed a cycle are not included.
+    """
+    task_ids: List[str] = field(default_factory=list)
+    predecessors: List[List[int]] = field(default_factory=list)
+    successors: List[List[int]] = field(default_factory=list)
+    cycles: List[List[str]] = field(default_factory=list)  # Members of each dependency cycle, in task list order
+    unknown_dependencies: List[Tuple[str, str]] = field(default_factory=list)  # (task_id, missing dependency)
+
+    def describes(self, tasks: Sequence) -> bool:
+        """Whether the graph was built for exactly these task IDs"""
+        return len(tasks) == len(self.task_ids) and {t.task_id for t in tasks} == set(self.task_ids)
+
+    def sorted_tasks(self, tasks: Sequence) -> List:
+        """The tasks in the graph's topological order"""
+        task_map = {task.task_id: task for task in tasks}
+        return [task_map[task_id] for task_id in self.task_ids]
+
+
+def _strongly_connected_components(edges: List[List[int]]) -> List[List[int]]:
+    """
+    Tarjan's algorithm with an explicit stack, so deep chains cannot hit the
+    recursion limit.
+
+    Args:
+        edges: Successor nodes of each node
+
+    Returns:
+        Components, each listed before any component that has an edge into it
+    """
+    count = len(edges)
+    index = [-1] * count
+    low = [0] * count
+    next_edge = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [root]
+
+        while work:
+            v = work[-1]
+            i = next_edge[v]
+            if i < len(edges[v]):
+                next_edge[v] = i + 1
+                w = edges[v][i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append(w)
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+
+            work.pop()
+            if work and low[v] < low[work[-1]]:
+                low[work[-1]] = low[v]
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+
+    return components
+
+
+def build_dependency_graph(tasks: Sequence) -> DependencyGraph:
+    """
+    Build the dependency DAG of a task list in linear time.
+
+    Tasks in no dependency relation keep their task list order (Kahn's
+    algorithm over the DAG, first-in first-out), so an acyclic task list is
+    ordered exactly as a plain topological sort would order it.
+
+    Args:
+        tasks: Tasks with task_id and dependencies
+
+    Returns:
+        DependencyGraph of the tasks
+    """
+    node_of: Dict[str, int] = {}
+    for task in tasks:
+        node_of.setdefault(task.task_id, len(node_of))
+    task_ids = list(node_of)
+    count = len(task_ids)
+
+    # Node -> prerequisite nodes; a task ID listed twice keeps its last dependencies
+    requires: List[List[int]] = [[]] * count
+    unknown_dependencies: List[Tuple[str, str]] = []
+    for task in tasks:
+        known = []
+        for dependency_id in task.dependencies:
+            dependency = node_of.get(dependency_id)
+            if dependency is None:
+                unknown_dependencies.append((task.task_id, dependency_id))
+            else:
+                known.append(dependency)
+        requires[node_of[task.task_id]] = list(dict.fromkeys(known)) if len(known) > 1 else known
+
+    component_of = [0] * count
+    cycles: List[List[str]] = []
+    for c, component in enumerate(_strongly_connected_components(requires)):
+        for node in component:
+            component_of[node] = c
+        if len(component) > 1 or component[0] in requires[component[0]]:
+            cycles.append([task_ids[node] for node in sorted(component)])
+            # Drop the edges inside the cycle that point backwards in task list order
+            for node in component:
+                requires[node] = [
+                    dependency for dependency in requires[node]
+                    if component_of[dependency] != c or dependency < node
+                ]
+
+    dependents: List[List[int]] = [[] for _ in range(count)]
+    in_degree = [0] * count
+    for node in range(count):
+        in_degree[node] = len(requires[node])
+        for dependency in requires[node]:
+            dependents[dependency].append(node)
+
+    queue = deque(node for node in range(count) if not in_degree[node])
+    order: List[int] = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for dependent in dependents[node]:
+            in_degree[dependent] -= 1
+            if not in_degree[dependent]:
+                queue.append(dependent)
+
+    position = [0] * count
+    for i, node in enumerate(order):
+        position[node] = i
+    predecessors = [sorted(position[dependency] for dependency in requires[node]) for node in order]
+    successors: List[List[int]] = [[] for _ in range(count)]
+    for i, task_predecessors in enumerate(predecessors):
+        for p in task_predecessors:
+            successors[p].append(i)
+
+    return DependencyGraph(
+        task_ids=[task_ids[node] for node in order],
+        predecessors=predecessors,
+        successors=successors,
+        cycles=cycles,
+        unknown_dependencies=unknown_dependencies
+    )
@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import List, Optional, Dict
 from .data_models import (
+    SLOTTED,
+    intern_label,
     Resource,
     TaskTimeline,
     VendorAssignment,
@@ -20,7 +22,7 @@ from .data_models import (
 )
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class ExtendedTask:
     """
     Complete task with all data from sub-agents and tool enhancements.
@@ -53,8 +55,11 @@ class ExtendedTask:
     error_messages: List[str] = field(default_factory=list)
     warning_messages: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.priority_level = intern_label(self.priority_level)
 
-@dataclass
+
+@dataclass(**SLOTTED)
 class ProcessingSummary:
     """Summary of task processing results"""
     total_tasks: int
@@ -65,7 +70,7 @@ class ProcessingSummary:
     tool_execution_status: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class ExtendedTaskList:
     """
     Final output structure containing all processed tasks with summary.
@@ -10,10 +10,10 @@ Contains models for task analysis by sub-agents:
 from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import List, Optional
-from .data_models import Resource
+from .data_models import SLOTTED, Resource, intern_label
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class PrioritizedTask:
     """Task with priority information from Prioritization Agent"""
     task_id: str
@@ -22,8 +22,11 @@ class PrioritizedTask:
     priority_score: float
     priority_rationale: str
 
+    def __post_init__(self):
+        self.priority_level = intern_label(self.priority_level)
 
-@dataclass
+
+@dataclass(**SLOTTED)
 class GranularTask:
     """Task with granularity breakdown from Granularity Agent"""
     task_id: str
@@ -35,7 +38,7 @@ class GranularTask:
     sub_tasks: List[str] = field(default_factory=list)  # IDs of child tasks
 
 
-@dataclass
+@dataclass(**SLOTTED)
 class TaskWithDependencies:
     """Task with dependencies and resources from Resource & Dependency Agent"""
     task_id: str
@@ -0,0 +1,141 @@
+"""
+Dependency index for the Resource & Dependency Agent
+
+Rule-based dependency detection used to rescan the whole task list for every
+task (parent lookup, siblings, task names mentioned in the description,
+logical prerequisites), which is quadratic in the number of tasks. The index
+here is built once per task list:
+
+- parent -> early-stage children map, for sibling ordering
+- an Aho-Corasick automaton over lower-cased task names, so the names a
+  description mentions are found in one pass over the description
+- keyword -> task IDs for the logical prerequisite keywords
+
+Resolving a task's dependencies then costs time proportional to its
+description and to the number of dependencies found.
+"""
+
+from collections import defaultdict, deque
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Sequence, Set
+
+from ..models.task_models import GranularTask
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of phrases.
+
+    ``find`` reports every phrase that occurs as a substring of a text, with
+    the same result as testing ``phrase in text`` for each phrase.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        # An empty phrase is not a mention of anything
+        self.phrases: List[str] = list(dict.fromkeys(p for p in phrases if p))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, phrase in enumerate(self.phrases):
+            state = 0
+            for char in phrase:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Breadth-first pass to set failure links; depth-1 states fail to the root
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[str]:
+        """Phrases occurring in ``text``"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return {self.phrases[i] for i in found}
+
+
+class DependencyIndex:
+    """
+    Lookup tables for rule-based dependency detection over one task list.
+
+    Built once by the agent and shared by every task's analysis.
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[GranularTask],
+        early_stage_keywords: Sequence[str],
+        logical_rules: Mapping[str, Sequence[str]]
+    ):
+        """
+        Args:
+            tasks: All granular tasks of the plan
+            early_stage_keywords: Keywords marking a sub-task as an early step
+            logical_rules: Task keyword -> keywords of its prerequisite tasks
+        """
+        self.task_ids: Set[str] = set()
+        self.early_stage_children: Dict[str, List[str]] = defaultdict(list)
+        self.tasks_by_name: Dict[str, List[str]] = defaultdict(list)
+        self.tasks_by_keyword: Dict[str, Set[str]] = defaultdict(set)
+        self.logical_rules = logical_rules
+        self._prerequisites_cache: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+        prerequisite_keywords = {k for keywords in logical_rules.values() for k in keywords}
+
+        for task in tasks:
+            name_lower = task.task_name.lower()
+            desc_lower = task.task_description.lower()
+
+            self.task_ids.add(task.task_id)
+            self.tasks_by_name[name_lower].append(task.task_id)
+
+            if task.parent_task_id:
+                if any(k in name_lower or k in desc_lower for k in early_stage_keywords):
+                    self.early_stage_children[task.parent_task_id].append(task.task_id)
+
+            for keyword in prerequisite_keywords:
+                if keyword in name_lower or keyword in desc_lower:
+                    self.tasks_by_keyword[keyword].add(task.task_id)
+
+        self.name_matcher = PhraseMatcher(self.tasks_by_name)
+
+    def mentioned_tasks(self, text_lower: str) -> List[str]:
+        """IDs of tasks whose lower-cased name occurs in ``text_lower``"""
+        return [
+            task_id
+            for name in self.name_matcher.find(text_lower)
+            for task_id in self.tasks_by_name[name]
+        ]
+
+    def logical_prerequisites(self, rules: FrozenSet[str]) -> FrozenSet[str]:
+        """IDs of tasks matching a prerequisite keyword of any of ``rules``"""
+        prerequisites = self._prerequisites_cache.get(rules)
+        if prerequisites is None:
+            prerequisites = frozenset().union(*(
+                self.tasks_by_keyword[keyword]
+                for rule in rules
+                for keyword in self.logical_rules[rule]
+            ))
+            self._prerequisites_cache[rules] = prerequisites
+        return prerequisites
@@ -10,17 +10,26 @@ Breaks down high-level tasks into detailed, actionable sub-tasks based on:
 Uses Ollama LLM (gemma:2b or tinyllama) for intelligent task decomposition.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from datetime import timedelta
 import re
 
 from ..models.task_models import PrioritizedTask, GranularTask
 from ..exceptions import SubAgentDataError
-from ....workflows.state_models import EventPlanningState
+from ....llm.fanout import gather_bounded
 from ....llm.optimized_manager import get_llm_manager
+from ....llm.packing import plan_packs, split_packed_response
+from ....llm.priority import LLMPriority
+from ....llm.routing import LLMTaskClass
 from ....config.settings import get_settings
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +56,9 @@ class GranularityAgentCore:
         'default': 2.0
     }
     
+    # Answer tokens budgeted per task when several tasks share one prompt
+    PACKED_ANSWER_TOKENS = 300
+    
     def __init__(self, llm_model: Optional[str] = None):
         """
         Initialize Granularity Agent with Ollama LLM.
@@ -97,17 +109,37 @@ class GranularityAgentCore:
             # Extract event context
             event_context = self._extract_event_context(state)
             
-            # Decompose each task
-            granular_tasks = []
-            for task in tasks:
-                try:
-                    decomposed = await self._decompose_single_task(task, event_context, state)
-                    granular_tasks.extend(decomposed)
-                except Exception as e:
-                    logger.error(f"Error decomposing task {task.task_id}: {e}")
-                    # Create a default granular task to continue processing
-                    default_task = self._create_default_granular_task(task, str(e))
-                    granular_tasks.append(default_task)
+            # The deadline covers the packed prompts and the per-task pass
+            llm_settings = self.settings.llm
+            deadline_at = time.monotonic() + llm_settings.task_fanout_deadline
+            
+            # Send the tasks that need an LLM breakdown several per prompt;
+            # any task without a usable packed answer is decomposed on its own
+            packed_sub_tasks = {}
+            if llm_settings.enable_prompt_packing:
+                to_decompose = [t for t in tasks if self._determine_granularity_level(t) > 0]
+                if len(to_decompose) > 1:
+                    packed_sub_tasks = await self._decompose_packed(
+                        to_decompose, event_context, llm_settings.task_fanout_deadline
+                    )
+            
+            async def decompose(task: PrioritizedTask) -> List[GranularTask]:
+                if task.task_id in packed_sub_tasks:
+                    return self._build_granular_tasks(task, packed_sub_tasks[task.task_id], event_context)
+                return await self._decompose_single_task(task, event_context, state)
+            
+            def on_error(task: PrioritizedTask, error: BaseException) -> List[GranularTask]:
+                logger.error(f"Error decomposing task {task.task_id}: {error}")
+                # Create a default granular task to continue processing
+                return [self._create_default_granular_task(task, str(error))]
+            
+            # Decompose tasks concurrently, keeping their order
+            decomposed = await gather_bounded(
+                tasks, decompose, on_error,
+                limit=llm_settings.task_fanout_concurrency,
+                deadline=max(0.0, deadline_at - time.monotonic())
+            )
+            granular_tasks = [granular for group in decomposed for granular in group]
             
             logger.info(f"Successfully decomposed into {len(granular_tasks)} granular tasks")
             return granular_tasks
@@ -186,7 +218,9 @@ class GranularityAgentCore:
                 prompt=prompt,
                 model=self.llm_model,
                 temperature=0.4,  # Moderate temperature for creative but consistent decomposition
-                max_tokens=500
+                max_tokens=500,
+                priority=LLMPriority.BACKGROUND,  # Bulk per-task work with a rule-based fallback
+                task_class=LLMTaskClass.GENERATION  # Open-ended breakdown; stays on the requested model
             )
             
             # Parse LLM response to extract sub-tasks
@@ -197,6 +231,92 @@ class GranularityAgentCore:
             # Fallback to rule-based decomposition
             sub_tasks_data = self._fallback_decomposition(task, event_context)
         
+        return self._build_granular_tasks(task, sub_tasks_data, event_context)
+    
+    async def _decompose_packed(
+        self,
+        tasks: List[PrioritizedTask],
+        event_context: Dict[str, Any],
+        deadline: float
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Decompose tasks several per LLM prompt, running the packs concurrently.
+        
+        Pack size is bounded by the model's context window and
+        ``max_tasks_per_prompt``.
+        
+        Args:
+            tasks: Tasks that need an LLM breakdown
+            event_context: Event context information
+            deadline: Seconds allowed for all packs
+            
+        Returns:
+            Sub-task dictionaries per task ID, for the tasks whose packed
+            answer parsed; the rest are left to the single-task path
+        """
+        llm_settings = self.settings.llm
+        packs = plan_packs(
+            tasks,
+            self._format_packed_task,
+            self._create_packed_decomposition_prompt([], event_context),
+            llm_settings.context_window_for(self.llm_model),
+            self.PACKED_ANSWER_TOKENS,
+            llm_settings.max_tasks_per_prompt
+        )
+        
+        async def decompose_pack(pack: List[PrioritizedTask]) -> Dict[str, List[Dict[str, str]]]:
+            if len(pack) < 2:
+                return {}
+            
+            llm_response = await self.llm_manager.generate_response(
+                prompt=self._create_packed_decomposition_prompt(pack, event_context),
+                model=self.llm_model,
+                temperature=0.4,
+                max_tokens=self.PACKED_ANSWER_TOKENS * len(pack),
+                priority=LLMPriority.BACKGROUND,
+                task_class=LLMTaskClass.GENERATION
+            )
+            
+            pack_results = {}
+            parsed = split_packed_response(llm_response, [t.task_id for t in pack])
+            for task_id, entry in parsed.items():
+                sub_tasks = self._sub_tasks_from_entry(entry)
+                if sub_tasks:
+                    pack_results[task_id] = sub_tasks
+            return pack_results
+        
+        def on_pack_error(pack: List[PrioritizedTask], error: BaseException) -> Dict[str, List[Dict[str, str]]]:
+            logger.warning(f"Packed decomposition failed for {len(pack)} tasks: {error}")
+            return {}
+        
+        results = {}
+        for pack_results in await gather_bounded(
+            packs, decompose_pack, on_pack_error,
+            limit=llm_settings.task_fanout_concurrency,
+            deadline=deadline
+        ):
+            results.update(pack_results)
+        
+        logger.info(f"Packed decomposition covered {len(results)} of {len(tasks)} tasks in {len(packs)} prompts")
+        return results
+    
+    def _build_granular_tasks(
+        self,
+        task: PrioritizedTask,
+        sub_tasks_data: List[Dict[str, str]],
+        event_context: Dict[str, Any]
+    ) -> List[GranularTask]:
+        """
+        Create the parent task and its sub-tasks from parsed sub-task data.
+        
+        Args:
+            task: Task being decomposed
+            sub_tasks_data: Sub-task dictionaries with 'name' and 'description'
+            event_context: Event context information
+            
+        Returns:
+            List of GranularTask objects (parent + children)
+        """
         # Create GranularTask objects
         granular_tasks = []
         
@@ -323,6 +443,81 @@ Description: [Brief description]
         
         return prompt
     
+    def _format_packed_task(self, task: PrioritizedTask) -> str:
+        """Format one task's section of a packed decomposition prompt"""
+        return f"""
+Task ID: {task.task_id}
+- Task Name: {task.task_name}
+- Priority: {task.priority_level}
+- Rationale: {task.priority_rationale}
+"""
+    
+    def _create_packed_decomposition_prompt(
+        self,
+        tasks: List[PrioritizedTask],
+        event_context: Dict[str, Any]
+    ) -> str:
+        """
+        Generate one LLM prompt that decomposes several tasks.
+        
+        Args:
+            tasks: Tasks to decompose
+            event_context: Event context
+            
+        Returns:
+            Formatted prompt string asking for a JSON array answer
+        """
+        task_sections = "".join(self._format_packed_task(task) for task in tasks)
+        
+        prompt = f"""You are an expert event planning assistant. Break down each of the tasks below into actionable sub-tasks.
+
+Event Context:
+- Event Type: {event_context.get('event_type')}
+- Guest Count: {event_context.get('guest_count')}
+- Budget: ${event_context.get('budget', 0):,.2f}
+
+Tasks to Decompose:
+{task_sections}
+Break each task into 3-5 specific, actionable sub-tasks. Each sub-task should:
+- Be concrete and measurable
+- Have a clear deliverable
+- Be completable independently
+- Take between 30 minutes to 4 hours
+
+Respond with only a JSON array containing one object per task, in the order given:
+[
+  {{
+    "task_id": "Task ID from above",
+    "sub_tasks": [
+      {{"name": "Sub-task name", "description": "Brief description"}}
+    ]
+  }}
+]"""
+        
+        return prompt
+    
+    def _sub_tasks_from_entry(self, entry: Dict[str, Any]) -> List[Dict[str, str]]:
+        """
+        Extract sub-task dictionaries from one task's packed answer.
+        
+        Returns:
+            Sub-tasks with 'name' and 'description' keys; empty if the entry
+            has no usable sub-tasks
+        """
+        sub_tasks = []
+        raw_sub_tasks = entry.get('sub_tasks')
+        if not isinstance(raw_sub_tasks, list):
+            return sub_tasks
+        
+        for item in raw_sub_tasks:
+            if isinstance(item, dict) and str(item.get('name', '')).strip():
+                sub_tasks.append({
+                    'name': str(item['name']).strip(),
+                    'description': str(item.get('description', '')).strip()
+                })
+        
+        return sub_tasks
+    
     def _parse_decomposition_response(
         self,
         llm_response: str,
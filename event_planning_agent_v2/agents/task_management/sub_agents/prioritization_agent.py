@@ -10,17 +10,24 @@ Analyzes tasks from EventPlanningState and assigns priority levels based on:
 Uses Ollama LLM (gemma:2b or tinyllama) for intelligent prioritization.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime, timedelta
 import json
 
 from ..models.task_models import PrioritizedTask
 from ..exceptions import SubAgentDataError
-from ....workflows.state_models import EventPlanningState
 from ....llm.optimized_manager import get_llm_manager
+from ....llm.packing import chunked, plan_packs, split_packed_response
+from ....llm.priority import LLMPriority
+from ....llm.routing import LLMTaskClass
 from ....config.settings import get_settings
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +51,9 @@ class PrioritizationAgentCore:
     SCORE_HIGH_MIN = 0.65
     SCORE_MEDIUM_MIN = 0.40
     
+    # Answer tokens budgeted per task when several tasks share one prompt
+    PACKED_ANSWER_TOKENS = 80
+    
     def __init__(self, llm_model: Optional[str] = None):
         """
         Initialize Prioritization Agent with Ollama LLM.
@@ -92,16 +102,18 @@ class PrioritizationAgentCore:
             # Extract event context
             event_context = self._extract_event_context(state)
             
+            # Send tasks several per prompt; any task without a usable packed
+            # answer is prioritized on its own
+            packed_priorities = {}
+            if self.settings.llm.enable_prompt_packing and len(tasks) > 1:
+                packed_priorities = await self._prioritize_packed(tasks, event_context)
+            
             # Prioritize each task
             prioritized_tasks = []
             for task in tasks:
-                try:
-                    prioritized_task = await self._prioritize_single_task(task, event_context, state)
-                    prioritized_tasks.append(prioritized_task)
-                except Exception as e:
-                    logger.error(f"Error prioritizing task {task.get('task_id', 'unknown')}: {e}")
-                    # Create a default priority task to continue processing
-                    prioritized_tasks.append(self._create_default_priority_task(task, str(e)))
+                prioritized_tasks.append(
+                    await self._prioritize_task(task, packed_priorities, event_context, state)
+                )
             
             logger.info(f"Successfully prioritized {len(prioritized_tasks)} tasks")
             return prioritized_tasks
@@ -115,6 +127,87 @@ class PrioritizationAgentCore:
                 details={"error": str(e)}
             )
     
+    async def prioritize_tasks_stream(self, state: EventPlanningState) -> AsyncIterator[PrioritizedTask]:
+        """
+        Prioritize tasks from EventPlanningState, yielding them as they are ready.
+        
+        Tasks are packed in groups of at most max_tasks_per_prompt, so the
+        first group reaches the next sub-agent after one prompt instead of
+        after the whole list. Tasks are yielded in the same order and with
+        the same fallbacks as prioritize_tasks.
+        
+        Args:
+            state: Current event planning workflow state
+            
+        Yields:
+            PrioritizedTask objects with priority information
+            
+        Raises:
+            SubAgentDataError: If required task data is missing or invalid
+        """
+        try:
+            await self._ensure_llm_manager()
+            tasks = self._extract_tasks_from_state(state)
+            event_context = self._extract_event_context(state)
+        except Exception as e:
+            error_msg = f"Failed to prioritize tasks: {str(e)}"
+            logger.error(error_msg)
+            raise SubAgentDataError(
+                sub_agent_name="PrioritizationAgent",
+                message=error_msg,
+                details={"error": str(e)}
+            )
+        
+        if not tasks:
+            logger.warning("No tasks found in state for prioritization")
+            return
+        
+        llm_settings = self.settings.llm
+        packing = llm_settings.enable_prompt_packing and len(tasks) > 1
+        group_size = max(1, llm_settings.max_tasks_per_prompt) if packing else 1
+        
+        for group in chunked(tasks, group_size):
+            packed_priorities = {}
+            if len(group) > 1:
+                packed_priorities = await self._prioritize_packed(group, event_context)
+            for task in group:
+                yield await self._prioritize_task(task, packed_priorities, event_context, state)
+    
+    async def _prioritize_task(
+        self,
+        task: Dict[str, Any],
+        packed_priorities: Dict[str, tuple[str, float, str]],
+        event_context: Dict[str, Any],
+        state: EventPlanningState
+    ) -> PrioritizedTask:
+        """
+        Prioritize one task from its packed answer, or on its own.
+        
+        Args:
+            task: Task dictionary
+            packed_priorities: Packed answers by task ID
+            event_context: Event context information
+            state: Event planning state
+            
+        Returns:
+            PrioritizedTask, or a default one if prioritization failed
+        """
+        try:
+            packed = packed_priorities.get(str(task['task_id']))
+            if packed:
+                return PrioritizedTask(
+                    task_id=task['task_id'],
+                    task_name=task['task_name'],
+                    priority_level=packed[0],
+                    priority_score=packed[1],
+                    priority_rationale=packed[2]
+                )
+            return await self._prioritize_single_task(task, event_context, state)
+        except Exception as e:
+            logger.error(f"Error prioritizing task {task.get('task_id', 'unknown')}: {e}")
+            # Create a default priority task to continue processing
+            return self._create_default_priority_task(task, str(e))
+    
     def _extract_tasks_from_state(self, state: EventPlanningState) -> List[Dict[str, Any]]:
         """
         Extract tasks from EventPlanningState.
@@ -293,7 +386,10 @@ class PrioritizationAgentCore:
                 prompt=prompt,
                 model=self.llm_model,
                 temperature=0.3,  # Lower temperature for more consistent prioritization
-                max_tokens=200
+                max_tokens=200,
+                priority=LLMPriority.STANDARD,  # Task ordering gates the rest of the plan
+                task_class=LLMTaskClass.CLASSIFICATION,
+                validate=self._is_valid_priority_response
             )
             
             # Parse LLM response
@@ -313,6 +409,72 @@ class PrioritizationAgentCore:
             priority_rationale=rationale
         )
     
+    async def _prioritize_packed(
+        self,
+        tasks: List[Dict[str, Any]],
+        event_context: Dict[str, Any]
+    ) -> Dict[str, tuple[str, float, str]]:
+        """
+        Prioritize tasks several per LLM prompt.
+        
+        Pack size is bounded by the model's context window and
+        ``max_tasks_per_prompt``.
+        
+        Args:
+            tasks: Task dictionaries
+            event_context: Event context information
+            
+        Returns:
+            (priority_level, priority_score, rationale) per task ID, for the
+            tasks whose packed answer parsed; the rest are left to the
+            single-task path
+        """
+        scored = [(task, self._calculate_priority_score(task, event_context)) for task in tasks]
+        llm_settings = self.settings.llm
+        # Size packs for the model the router tries first
+        routed_model = self.llm_manager.select_model(LLMTaskClass.CLASSIFICATION, self.llm_model)
+        packs = plan_packs(
+            scored,
+            self._format_packed_task,
+            self._create_packed_prioritization_prompt([], event_context),
+            llm_settings.context_window_for(routed_model),
+            self.PACKED_ANSWER_TOKENS,
+            llm_settings.max_tasks_per_prompt
+        )
+        
+        results = {}
+        for pack in packs:
+            if len(pack) < 2:
+                continue
+            
+            scores = {str(task['task_id']): score for task, score in pack}
+            try:
+                llm_response = await self.llm_manager.generate_response(
+                    prompt=self._create_packed_prioritization_prompt(pack, event_context),
+                    model=self.llm_model,
+                    temperature=0.3,
+                    max_tokens=self.PACKED_ANSWER_TOKENS * len(pack),
+                    priority=LLMPriority.STANDARD,
+                    task_class=LLMTaskClass.CLASSIFICATION,
+                    validate=lambda response: self._is_valid_packed_response(response, list(scores))
+                )
+            except Exception as e:
+                logger.warning(f"Packed prioritization failed for {len(pack)} tasks: {e}")
+                continue
+            
+            parsed = split_packed_response(llm_response, list(scores))
+            for task_id, entry in parsed.items():
+                priority_level = self._match_priority_level(str(entry.get('priority', '')))
+                if not priority_level:
+                    continue
+                rationale = str(entry.get('rationale') or '').strip() or (
+                    f"Priority determined by analysis (score: {scores[task_id]:.2f})"
+                )
+                results[task_id] = (priority_level, scores[task_id], rationale)
+        
+        logger.info(f"Packed prioritization covered {len(results)} of {len(tasks)} tasks in {len(packs)} prompts")
+        return results
+    
     def _calculate_priority_score(
         self,
         task: Dict[str, Any],
@@ -489,6 +651,81 @@ Rationale: [One sentence explaining why]"""
         
         return prompt
     
+    def _format_packed_task(self, scored_task: tuple[Dict[str, Any], float]) -> str:
+        """Format one (task, calculated score) section of a packed prioritization prompt"""
+        task, calculated_score = scored_task
+        return f"""
+Task ID: {task.get('task_id')}
+- Task Name: {task.get('task_name')}
+- Description: {task.get('description', 'N/A')}
+- Vendor Type: {task.get('vendor_type', 'N/A')}
+- Estimated Duration: {task.get('estimated_duration', 'N/A')}
+- Calculated Score: {calculated_score:.2f}
+"""
+    
+    def _create_packed_prioritization_prompt(
+        self,
+        scored_tasks: List[tuple[Dict[str, Any], float]],
+        event_context: Dict[str, Any]
+    ) -> str:
+        """
+        Generate one LLM prompt that prioritizes several tasks.
+        
+        Args:
+            scored_tasks: (task, calculated score) pairs
+            event_context: Event context
+            
+        Returns:
+            Formatted prompt string asking for a JSON array answer
+        """
+        days_until_event = event_context.get('days_until_event', 'unknown')
+        task_sections = "".join(self._format_packed_task(scored) for scored in scored_tasks)
+        
+        prompt = f"""You are an expert event planning assistant. Analyze each of the tasks below and provide a priority level and brief rationale.
+
+Event Context:
+- Event Type: {event_context.get('event_type')}
+- Days Until Event: {days_until_event}
+- Guest Count: {event_context.get('guest_count')}
+- Budget: ${event_context.get('budget', 0):,.2f}
+
+Tasks:
+{task_sections}
+Based on each task's calculated score and the event context, assign a priority level:
+- Critical (0.85-1.0): Must be done immediately, blocks other tasks
+- High (0.65-0.84): Important, should be done soon
+- Medium (0.40-0.64): Normal priority, can be scheduled flexibly
+- Low (0.0-0.39): Can be deferred if needed
+
+Respond with only a JSON array containing one object per task, in the order given:
+[
+  {{"task_id": "Task ID from above", "priority": "Critical/High/Medium/Low", "rationale": "One sentence explaining why"}}
+]"""
+        
+        return prompt
+    
+    def _match_priority_level(self, priority_text: str) -> Optional[str]:
+        """Find the priority level named in LLM output, if any"""
+        for level in [self.PRIORITY_CRITICAL, self.PRIORITY_HIGH,
+                      self.PRIORITY_MEDIUM, self.PRIORITY_LOW]:
+            if level.lower() in priority_text.lower():
+                return level
+        return None
+    
+    def _is_valid_priority_response(self, llm_response: str) -> bool:
+        """Whether a single-task answer names a priority level"""
+        return any(
+            line.strip().startswith('Priority:') and self._match_priority_level(line)
+            for line in llm_response.split('\n')
+        )
+    
+    def _is_valid_packed_response(self, llm_response: str, task_ids: List[str]) -> bool:
+        """Whether a packed answer names a priority level for every task"""
+        parsed = split_packed_response(llm_response, task_ids)
+        return len(parsed) == len(task_ids) and all(
+            self._match_priority_level(str(entry.get('priority', ''))) for entry in parsed.values()
+        )
+    
     def _parse_llm_response(
         self,
         llm_response: str,
@@ -514,11 +751,7 @@ Rationale: [One sentence explaining why]"""
                 if line.startswith('Priority:'):
                     priority_text = line.replace('Priority:', '').strip()
                     # Extract priority level
-                    for level in [self.PRIORITY_CRITICAL, self.PRIORITY_HIGH, 
-                                 self.PRIORITY_MEDIUM, self.PRIORITY_LOW]:
-                        if level.lower() in priority_text.lower():
-                            priority_level = level
-                            break
+                    priority_level = self._match_priority_level(priority_text) or priority_level
                 elif line.startswith('Rationale:'):
                     rationale = line.replace('Rationale:', '').strip()
             
@@ -10,19 +10,30 @@ Identifies task dependencies and resource requirements based on:
 Uses Ollama LLM (gemma:2b or tinyllama) for intelligent dependency analysis.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Dict, Any, Optional, Set
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set
 import re
 
 from ..models.task_models import GranularTask, TaskWithDependencies
 from ..models.data_models import Resource
+from .dependency_index import DependencyIndex
 from ..exceptions import SubAgentDataError
-from ....workflows.state_models import EventPlanningState
+from ....llm.fanout import gather_bounded
 from ....llm.optimized_manager import get_llm_manager
+from ....llm.priority import LLMPriority
+from ....llm.routing import LLMTaskClass
 from ....config.settings import get_settings
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
+# An answer in the requested format has at least one "Equipment N:" or "Equipment:" line
+_EQUIPMENT_LINE = re.compile(r'^\s*Equipment(\s+\d+)?:', re.IGNORECASE | re.MULTILINE)
+
 
 class ResourceDependencyAgentCore:
     """
@@ -46,6 +57,29 @@ class ResourceDependencyAgentCore:
         'blocking': ['blocks', 'prevents', 'must complete before']
     }
     
+    # Sub-tasks that typically come later in a sequence
+    LATER_STAGE_KEYWORDS = [
+        'finalize', 'confirm', 'verify', 'review', 'complete',
+        'execute', 'deliver', 'wrap up', 'close out'
+    ]
+    
+    # Sub-tasks that typically come earlier
+    EARLY_STAGE_KEYWORDS = [
+        'plan', 'schedule', 'book', 'reserve', 'initiate',
+        'setup', 'prepare', 'coordinate', 'arrange'
+    ]
+    
+    # Logical dependency rules: task keyword -> keywords of prerequisite tasks
+    LOGICAL_DEPENDENCY_RULES = {
+        # Coordination tasks depend on booking/contract tasks
+        'coordinate': ['book', 'contract', 'confirm', 'reserve'],
+        'setup': ['book', 'contract', 'plan', 'coordinate'],
+        'execute': ['plan', 'coordinate', 'setup', 'prepare'],
+        'deliver': ['execute', 'setup', 'prepare'],
+        'verify': ['execute', 'deliver', 'complete'],
+        'finalize': ['coordinate', 'confirm', 'review']
+    }
+    
     def __init__(self, llm_model: Optional[str] = None):
         """
         Initialize Resource & Dependency Agent with Ollama LLM.
@@ -96,17 +130,24 @@ class ResourceDependencyAgentCore:
             # Extract event context and available resources
             event_context = self._extract_event_context(state)
             
-            # Analyze each task
-            tasks_with_dependencies = []
-            for task in tasks:
-                try:
-                    analyzed_task = await self._analyze_single_task(task, tasks, event_context, state)
-                    tasks_with_dependencies.append(analyzed_task)
-                except Exception as e:
-                    logger.error(f"Error analyzing task {task.task_id}: {e}")
-                    # Create a default task to continue processing
-                    default_task = self._create_default_task_with_dependencies(task, str(e))
-                    tasks_with_dependencies.append(default_task)
+            # Index the task list once instead of rescanning it for every task
+            index = self._build_dependency_index(tasks)
+            
+            async def analyze(task: GranularTask) -> TaskWithDependencies:
+                return await self._analyze_single_task(task, tasks, event_context, state, index)
+            
+            def on_error(task: GranularTask, error: BaseException) -> TaskWithDependencies:
+                logger.error(f"Error analyzing task {task.task_id}: {error}")
+                # Create a default task to continue processing
+                return self._create_default_task_with_dependencies(task, str(error))
+            
+            # Analyze tasks concurrently, keeping their order
+            llm_settings = self.settings.llm
+            tasks_with_dependencies = await gather_bounded(
+                tasks, analyze, on_error,
+                limit=llm_settings.task_fanout_concurrency,
+                deadline=llm_settings.task_fanout_deadline
+            )
             
             logger.info(f"Successfully analyzed dependencies for {len(tasks_with_dependencies)} tasks")
             return tasks_with_dependencies
@@ -120,6 +161,83 @@ class ResourceDependencyAgentCore:
                 details={"error": str(e)}
             )
     
+    async def identify_task_resources(
+        self,
+        tasks: List[GranularTask],
+        state: EventPlanningState
+    ) -> List[Optional[List[Resource]]]:
+        """
+        Identify the resources of a group of tasks, without dependency analysis.
+        
+        Resource identification only looks at the task itself, so a pipeline
+        can run it on each decomposed subtree as soon as it is ready and link
+        dependencies across the whole plan afterwards with link_dependencies.
+        
+        Args:
+            tasks: Granular tasks to analyze
+            state: Current event planning workflow state
+            
+        Returns:
+            Resources per task, in input order; None where identification failed
+        """
+        if not tasks:
+            return []
+        
+        await self._ensure_llm_manager()
+        event_context = self._extract_event_context(state)
+        
+        async def identify(task: GranularTask) -> Optional[List[Resource]]:
+            return await self._identify_resources(task, event_context, state)
+        
+        def on_error(task: GranularTask, error: BaseException) -> Optional[List[Resource]]:
+            logger.error(f"Error identifying resources for task {task.task_id}: {error}")
+            return None
+        
+        llm_settings = self.settings.llm
+        return await gather_bounded(
+            tasks, identify, on_error,
+            limit=llm_settings.task_fanout_concurrency,
+            deadline=llm_settings.task_fanout_deadline
+        )
+    
+    def link_dependencies(
+        self,
+        tasks: List[GranularTask],
+        resources: List[Optional[List[Resource]]]
+    ) -> List[TaskWithDependencies]:
+        """
+        Detect dependencies and resource conflicts across all tasks.
+        
+        Args:
+            tasks: All granular tasks of the plan
+            resources: Resources per task from identify_task_resources
+            
+        Returns:
+            List of TaskWithDependencies objects, in task order
+        """
+        index = self._build_dependency_index(tasks)
+        
+        tasks_with_dependencies = []
+        for task, task_resources in zip(tasks, resources):
+            if task_resources is None:
+                tasks_with_dependencies.append(
+                    self._create_default_task_with_dependencies(task, "Resource identification failed")
+                )
+                continue
+            try:
+                tasks_with_dependencies.append(TaskWithDependencies(
+                    task_id=task.task_id,
+                    task_name=task.task_name,
+                    dependencies=self._detect_dependencies(task, tasks, index),
+                    resources_required=task_resources,
+                    resource_conflicts=self._detect_resource_conflicts(task, task_resources, tasks)
+                ))
+            except Exception as e:
+                logger.error(f"Error analyzing task {task.task_id}: {e}")
+                tasks_with_dependencies.append(self._create_default_task_with_dependencies(task, str(e)))
+        
+        return tasks_with_dependencies
+    
     def _extract_event_context(self, state: EventPlanningState) -> Dict[str, Any]:
         """
         Extract relevant event context for dependency analysis.
@@ -150,7 +268,8 @@ class ResourceDependencyAgentCore:
         task: GranularTask,
         all_tasks: List[GranularTask],
         event_context: Dict[str, Any],
-        state: EventPlanningState
+        state: EventPlanningState,
+        index: Optional[DependencyIndex] = None
     ) -> TaskWithDependencies:
         """
         Analyze a single task for dependencies and resources.
@@ -160,12 +279,13 @@ class ResourceDependencyAgentCore:
             all_tasks: All tasks for dependency detection
             event_context: Event context information
             state: Event planning state
+            index: Prebuilt dependency index over all_tasks
             
         Returns:
             TaskWithDependencies object
         """
         # Detect dependencies
-        dependencies = self._detect_dependencies(task, all_tasks)
+        dependencies = self._detect_dependencies(task, all_tasks, index)
         
         # Identify required resources
         resources = await self._identify_resources(task, event_context, state)
@@ -181,10 +301,23 @@ class ResourceDependencyAgentCore:
             resource_conflicts=resource_conflicts
         )
     
+    def _build_dependency_index(self, all_tasks: List[GranularTask]) -> DependencyIndex:
+        """
+        Build the lookup tables used by rule-based dependency detection.
+        
+        Args:
+            all_tasks: All tasks for relationship analysis
+            
+        Returns:
+            DependencyIndex over all_tasks
+        """
+        return DependencyIndex(all_tasks, self.EARLY_STAGE_KEYWORDS, self.LOGICAL_DEPENDENCY_RULES)
+    
     def _detect_dependencies(
         self,
         task: GranularTask,
-        all_tasks: List[GranularTask]
+        all_tasks: List[GranularTask],
+        index: Optional[DependencyIndex] = None
     ) -> List[str]:
         """
         Analyze task relationships and determine prerequisite tasks.
@@ -198,45 +331,47 @@ class ResourceDependencyAgentCore:
         Args:
             task: Task to analyze
             all_tasks: All tasks for relationship analysis
+            index: Prebuilt dependency index over all_tasks; built here if omitted
             
         Returns:
             List of task IDs that are prerequisites
         """
+        if index is None:
+            index = self._build_dependency_index(all_tasks)
+        
         dependencies = []
         
-        # Strategy 1: Parent-child relationships
-        # Sub-tasks implicitly depend on their parent being started
         if task.parent_task_id:
-            # Check if parent exists in task list
-            parent_exists = any(t.task_id == task.parent_task_id for t in all_tasks)
-            if parent_exists:
+            # Strategy 1: Parent-child relationships
+            # Sub-tasks implicitly depend on their parent being started
+            if task.parent_task_id in index.task_ids:
                 dependencies.append(task.parent_task_id)
-        
-        # Strategy 2: Sibling dependencies (sub-tasks of same parent)
-        # Some sub-tasks naturally come before others
-        if task.parent_task_id:
-            siblings = [t for t in all_tasks 
-                       if t.parent_task_id == task.parent_task_id 
-                       and t.task_id != task.task_id]
             
-            # Detect logical ordering among siblings
-            sibling_deps = self._detect_sibling_dependencies(task, siblings)
-            dependencies.extend(sibling_deps)
+            # Strategy 2: Sibling dependencies (sub-tasks of same parent)
+            # A later-stage sub-task depends on its early-stage siblings
+            if self._is_later_stage(task):
+                dependencies.extend(index.early_stage_children.get(task.parent_task_id, []))
         
         # Strategy 3: Keyword-based dependency detection
-        keyword_deps = self._detect_keyword_dependencies(task, all_tasks)
+        keyword_deps = self._detect_keyword_dependencies(task, all_tasks, index)
         dependencies.extend(keyword_deps)
         
         # Strategy 4: Logical task ordering
-        logical_deps = self._detect_logical_dependencies(task, all_tasks)
+        logical_deps = self._detect_logical_dependencies(task, all_tasks, index)
         dependencies.extend(logical_deps)
         
         # Remove duplicates and self-references
-        dependencies = list(set(dependencies))
-        if task.task_id in dependencies:
-            dependencies.remove(task.task_id)
+        dependencies = set(dependencies)
+        dependencies.discard(task.task_id)
         
-        return dependencies
+        return list(dependencies)
+    
+    def _is_later_stage(self, task: GranularTask) -> bool:
+        """Whether a task's name or description marks it as a later step"""
+        task_name_lower = task.task_name.lower()
+        task_desc_lower = task.task_description.lower()
+        return any(keyword in task_name_lower or keyword in task_desc_lower
+                   for keyword in self.LATER_STAGE_KEYWORDS)
     
     def _detect_sibling_dependencies(
         self,
@@ -254,33 +389,16 @@ class ResourceDependencyAgentCore:
             List of sibling task IDs that are prerequisites
         """
         dependencies = []
-        task_name_lower = task.task_name.lower()
-        task_desc_lower = task.task_description.lower()
-        
-        # Tasks that typically come later in a sequence
-        later_stage_keywords = [
-            'finalize', 'confirm', 'verify', 'review', 'complete',
-            'execute', 'deliver', 'wrap up', 'close out'
-        ]
-        
-        # Tasks that typically come earlier
-        early_stage_keywords = [
-            'plan', 'schedule', 'book', 'reserve', 'initiate',
-            'setup', 'prepare', 'coordinate', 'arrange'
-        ]
         
         # If current task is a later-stage task, it depends on earlier tasks
-        is_later_stage = any(keyword in task_name_lower or keyword in task_desc_lower 
-                            for keyword in later_stage_keywords)
-        
-        if is_later_stage:
+        if self._is_later_stage(task):
             for sibling in siblings:
                 sibling_name_lower = sibling.task_name.lower()
                 sibling_desc_lower = sibling.task_description.lower()
                 
                 # Check if sibling is an early-stage task
                 is_early_stage = any(keyword in sibling_name_lower or keyword in sibling_desc_lower
-                                    for keyword in early_stage_keywords)
+                                    for keyword in self.EARLY_STAGE_KEYWORDS)
                 
                 if is_early_stage:
                     dependencies.append(sibling.task_id)
@@ -290,44 +408,45 @@ class ResourceDependencyAgentCore:
     def _detect_keyword_dependencies(
         self,
         task: GranularTask,
-        all_tasks: List[GranularTask]
+        all_tasks: List[GranularTask],
+        index: Optional[DependencyIndex] = None
     ) -> List[str]:
         """
         Detect dependencies using keyword analysis in task descriptions.
         
+        A task depends on every other task whose name its description
+        mentions, provided the description also uses a dependency keyword.
+        
         Args:
             task: Current task
             all_tasks: All tasks
+            index: Prebuilt dependency index over all_tasks; built here if omitted
             
         Returns:
             List of task IDs that are prerequisites based on keywords
         """
-        dependencies = []
         task_desc_lower = task.task_description.lower()
         
         # Look for explicit dependency keywords
-        for other_task in all_tasks:
-            if other_task.task_id == task.task_id:
-                continue
-            
-            other_name_lower = other_task.task_name.lower()
-            
-            # Check if other task is mentioned in current task's description
-            if other_name_lower in task_desc_lower:
-                # Check for dependency keywords
-                for keyword_type, keywords in self.DEPENDENCY_KEYWORDS.items():
-                    for keyword in keywords:
-                        if keyword in task_desc_lower:
-                            # This suggests a dependency
-                            dependencies.append(other_task.task_id)
-                            break
+        has_dependency_keyword = any(
+            keyword in task_desc_lower
+            for keywords in self.DEPENDENCY_KEYWORDS.values()
+            for keyword in keywords
+        )
+        if not has_dependency_keyword:
+            return []
         
-        return dependencies
+        if index is None:
+            index = self._build_dependency_index(all_tasks)
+        
+        # Other tasks mentioned by name in the current task's description
+        return [task_id for task_id in index.mentioned_tasks(task_desc_lower) if task_id != task.task_id]
     
     def _detect_logical_dependencies(
         self,
         task: GranularTask,
-        all_tasks: List[GranularTask]
+        all_tasks: List[GranularTask],
+        index: Optional[DependencyIndex] = None
     ) -> List[str]:
         """
         Detect logical dependencies based on task types and event flow.
@@ -340,43 +459,27 @@ class ResourceDependencyAgentCore:
         Args:
             task: Current task
             all_tasks: All tasks
+            index: Prebuilt dependency index over all_tasks; built here if omitted
             
         Returns:
             List of task IDs that are logical prerequisites
         """
-        dependencies = []
         task_name_lower = task.task_name.lower()
         task_desc_lower = task.task_description.lower()
         
-        # Define logical dependency rules
-        dependency_rules = {
-            # Coordination tasks depend on booking/contract tasks
-            'coordinate': ['book', 'contract', 'confirm', 'reserve'],
-            'setup': ['book', 'contract', 'plan', 'coordinate'],
-            'execute': ['plan', 'coordinate', 'setup', 'prepare'],
-            'deliver': ['execute', 'setup', 'prepare'],
-            'verify': ['execute', 'deliver', 'complete'],
-            'finalize': ['coordinate', 'confirm', 'review']
-        }
-        
         # Check if current task matches any rule
-        for task_keyword, prerequisite_keywords in dependency_rules.items():
-            if task_keyword in task_name_lower or task_keyword in task_desc_lower:
-                # Find tasks that match prerequisite keywords
-                for other_task in all_tasks:
-                    if other_task.task_id == task.task_id:
-                        continue
-                    
-                    other_name_lower = other_task.task_name.lower()
-                    other_desc_lower = other_task.task_description.lower()
-                    
-                    # Check if other task matches any prerequisite keyword
-                    for prereq_keyword in prerequisite_keywords:
-                        if prereq_keyword in other_name_lower or prereq_keyword in other_desc_lower:
-                            dependencies.append(other_task.task_id)
-                            break
+        matched_rules = frozenset(
+            task_keyword for task_keyword in self.LOGICAL_DEPENDENCY_RULES
+            if task_keyword in task_name_lower or task_keyword in task_desc_lower
+        )
+        if not matched_rules:
+            return []
         
-        return dependencies
+        if index is None:
+            index = self._build_dependency_index(all_tasks)
+        
+        # Tasks matching any prerequisite keyword of the matched rules
+        return [task_id for task_id in index.logical_prerequisites(matched_rules) if task_id != task.task_id]
     
     async def _identify_resources(
         self,
@@ -509,7 +612,10 @@ class ResourceDependencyAgentCore:
             prompt=prompt,
             model=self.llm_model,
             temperature=0.3,
-            max_tokens=300
+            max_tokens=300,
+            priority=LLMPriority.BACKGROUND,  # Optional equipment enrichment, run per task
+            task_class=LLMTaskClass.EXTRACTION,
+            validate=lambda response: bool(_EQUIPMENT_LINE.search(response))
         )
         
         # Parse equipment from response
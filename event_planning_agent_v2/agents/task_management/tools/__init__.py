@@ -8,6 +8,8 @@ Contains specialized tools for task processing:
 - LogisticsCheckTool: Verifies logistics feasibility
 - ConflictCheckTool: Detects conflicts
 - VenueLookupTool: Retrieves venue information
+- IncrementalScheduler: Reschedules a loaded plan after single-task changes
+- LogisticsContext: Venue and vendor facts of a plan, shared by the logistics and venue tools
 """
 
 from .timeline_calculation_tool import TimelineCalculationTool
@@ -15,6 +17,8 @@ from .api_llm_tool import APILLMTool
 from .vendor_task_tool import VendorTaskTool
 from .logistics_check_tool import LogisticsCheckTool
 from .conflict_check_tool import ConflictCheckTool
+from .incremental_scheduler import IncrementalScheduler
+from .logistics_context import LogisticsContext
 
 __all__ = [
     'TimelineCalculationTool',
@@ -22,4 +26,6 @@ __all__ = [
     'VendorTaskTool',
     'LogisticsCheckTool',
     'ConflictCheckTool',
+    'IncrementalScheduler',
+    'LogisticsContext',
 ]
@@ -24,14 +24,20 @@ try:
     from ..models.consolidated_models import ConsolidatedTaskData, ConsolidatedTask
     from ..models.data_models import EnhancedTask
     from ..exceptions import ToolExecutionError
+    from ....llm.fanout import gather_bounded
     from ....llm.optimized_manager import get_llm_manager
+    from ....llm.packing import plan_packs, split_packed_response
+    from ....llm.priority import LLMPriority
     from ....config.settings import get_settings
 except ImportError:
     # Fall back to absolute imports (when running tests directly)
     from agents.task_management.models.consolidated_models import ConsolidatedTaskData, ConsolidatedTask
     from agents.task_management.models.data_models import EnhancedTask
     from agents.task_management.exceptions import ToolExecutionError
+    from llm.fanout import gather_bounded
     from llm.optimized_manager import get_llm_manager
+    from llm.packing import plan_packs, split_packed_response
+    from llm.priority import LLMPriority
     from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -52,6 +58,9 @@ class APILLMTool:
     BACKOFF_MULTIPLIER = 2.0
     MAX_BACKOFF = 30.0  # seconds
     
+    # Answer tokens budgeted per task when several tasks share one prompt
+    PACKED_ANSWER_TOKENS = 350
+    
     def __init__(self, llm_model: Optional[str] = None):
         """
         Initialize API/LLM Tool with Ollama LLM infrastructure.
@@ -100,17 +109,35 @@ class APILLMTool:
             if event_context:
                 full_context.update(event_context)
             
-            # Enhance each task
-            enhanced_tasks = []
-            for task in consolidated_data.tasks:
-                try:
+            # The deadline covers the packed prompts and the per-task pass
+            llm_settings = self.settings.llm
+            deadline_at = time.monotonic() + llm_settings.task_fanout_deadline
+            
+            # Send tasks several per prompt; any task without a usable packed
+            # answer is enhanced on its own, with retries
+            packed_enhancements = {}
+            if llm_settings.enable_prompt_packing and len(consolidated_data.tasks) > 1:
+                packed_enhancements = await self._enhance_packed(
+                    consolidated_data.tasks, full_context, llm_settings.task_fanout_deadline
+                )
+            
+            async def enhance(task: ConsolidatedTask) -> EnhancedTask:
+                enhanced_task = packed_enhancements.get(task.task_id)
+                if enhanced_task is None:
                     enhanced_task = await self._enhance_single_task(task, full_context)
-                    enhanced_tasks.append(enhanced_task)
-                except Exception as e:
-                    logger.error(f"Error enhancing task {task.task_id}: {e}")
-                    # Create fallback enhanced task
-                    fallback_task = self._create_fallback_enhanced_task(task, str(e))
-                    enhanced_tasks.append(fallback_task)
+                return enhanced_task
+            
+            def on_error(task: ConsolidatedTask, error: BaseException) -> EnhancedTask:
+                logger.error(f"Error enhancing task {task.task_id}: {error}")
+                # Create fallback enhanced task
+                return self._create_fallback_enhanced_task(task, str(error))
+            
+            # Enhance tasks concurrently, keeping their order
+            enhanced_tasks = await gather_bounded(
+                consolidated_data.tasks, enhance, on_error,
+                limit=llm_settings.task_fanout_concurrency,
+                deadline=max(0.0, deadline_at - time.monotonic())
+            )
             
             logger.info(f"Successfully enhanced {len(enhanced_tasks)} tasks")
             return enhanced_tasks
@@ -182,6 +209,74 @@ class APILLMTool:
             )
             return self._create_fallback_enhanced_task(task, str(last_error))
     
+    async def _enhance_packed(
+        self,
+        tasks: List[ConsolidatedTask],
+        event_context: Dict[str, Any],
+        deadline: float
+    ) -> Dict[str, EnhancedTask]:
+        """
+        Enhance tasks several per LLM prompt, running the packs concurrently.
+        
+        Pack size is bounded by the model's context window and
+        ``max_tasks_per_prompt``. Each pack gets one attempt; tasks it
+        doesn't cover go through the single-task path and its retries.
+        
+        Args:
+            tasks: Consolidated tasks to enhance
+            event_context: Event context information
+            deadline: Seconds allowed for all packs
+            
+        Returns:
+            EnhancedTask per task ID, for the tasks whose packed answer parsed
+        """
+        llm_settings = self.settings.llm
+        packs = plan_packs(
+            tasks,
+            self._format_packed_task,
+            self._generate_packed_enhancement_prompt([], event_context),
+            llm_settings.context_window_for(self.llm_model),
+            self.PACKED_ANSWER_TOKENS,
+            llm_settings.max_tasks_per_prompt
+        )
+        
+        async def enhance_pack(pack: List[ConsolidatedTask]) -> Dict[str, EnhancedTask]:
+            if len(pack) < 2:
+                return {}
+            
+            prompt = self._generate_packed_enhancement_prompt(pack, event_context)
+            llm_response = await asyncio.wait_for(
+                self._stream_enhancement(prompt, max_tokens=self.PACKED_ANSWER_TOKENS * len(pack)),
+                timeout=llm_settings.model_timeout
+            )
+            
+            pack_results = {}
+            tasks_by_id = {task.task_id: task for task in pack}
+            parsed = split_packed_response(llm_response, list(tasks_by_id))
+            for task_id, entry in parsed.items():
+                if not entry.get('enhanced_description'):
+                    continue
+                try:
+                    pack_results[task_id] = self._build_enhanced_task(tasks_by_id[task_id], entry, event_context)
+                except Exception as e:
+                    logger.warning(f"Unusable packed enhancement for task {task_id}: {e}")
+            return pack_results
+        
+        def on_pack_error(pack: List[ConsolidatedTask], error: BaseException) -> Dict[str, EnhancedTask]:
+            logger.warning(f"Packed enhancement failed for {len(pack)} tasks: {error}")
+            return {}
+        
+        results = {}
+        for pack_results in await gather_bounded(
+            packs, enhance_pack, on_pack_error,
+            limit=llm_settings.task_fanout_concurrency,
+            deadline=deadline
+        ):
+            results.update(pack_results)
+        
+        logger.info(f"Packed enhancement covered {len(results)} of {len(tasks)} tasks in {len(packs)} prompts")
+        return results
+    
     async def _call_llm_with_timeout(
         self,
         prompt: str,
@@ -204,16 +299,7 @@ class APILLMTool:
         timeout = self.settings.llm.model_timeout
         
         try:
-            response = await asyncio.wait_for(
-                self.llm_manager.generate_response(
-                    prompt=prompt,
-                    model=self.llm_model,
-                    temperature=0.4,  # Lower temperature for more consistent enhancements
-                    max_tokens=500,
-                    use_batch=False  # Direct execution for task enhancement
-                ),
-                timeout=timeout
-            )
+            response = await asyncio.wait_for(self._stream_enhancement(prompt), timeout=timeout)
             return response
         except asyncio.TimeoutError:
             logger.warning(f"LLM call timed out after {timeout} seconds (attempt {attempt + 1})")
@@ -222,6 +308,25 @@ class APILLMTool:
             logger.error(f"LLM call failed (attempt {attempt + 1}): {e}")
             raise
     
+    async def _stream_enhancement(self, prompt: str, max_tokens: int = 500) -> str:
+        """
+        Stream the enhancement from the LLM, stopping at the end of the JSON answer.
+        
+        Chunks are forwarded to the plan's progress stream as they arrive.
+        """
+        chunks = []
+        async for chunk in self.llm_manager.generate_stream(
+            prompt=prompt,
+            model=self.llm_model,
+            temperature=0.4,  # Lower temperature for more consistent enhancements
+            max_tokens=max_tokens,
+            stop_at_json=True,
+            progress_event="task_enhancement",
+            priority=LLMPriority.BACKGROUND  # Enrichment only; unenhanced tasks are a valid fallback
+        ):
+            chunks.append(chunk)
+        return "".join(chunks)
+    
     def _generate_enhancement_prompt(
         self,
         task: ConsolidatedTask,
@@ -302,6 +407,78 @@ Set "requires_manual_review" to true if critical information is missing or if th
         
         return prompt
     
+    def _format_packed_task(self, task: ConsolidatedTask) -> str:
+        """Format one task's section of a packed enhancement prompt"""
+        dependencies_str = ", ".join(task.dependencies) if task.dependencies else "None"
+        resources_str = "None specified"
+        if task.resources_required:
+            resources_str = ", ".join(
+                f"{r.resource_name} ({r.resource_type})" for r in task.resources_required
+            )
+        subtasks_str = ", ".join(task.sub_tasks) if task.sub_tasks else "None"
+        
+        return f"""
+Task ID: {task.task_id}
+- Task Name: {task.task_name}
+- Description: {task.task_description}
+- Priority: {task.priority_level} (Score: {task.priority_score:.2f})
+- Estimated Duration: {task.estimated_duration}
+- Dependencies: {dependencies_str}
+- Required Resources: {resources_str}
+- Sub-tasks: {subtasks_str}
+"""
+    
+    def _generate_packed_enhancement_prompt(
+        self,
+        tasks: List[ConsolidatedTask],
+        event_context: Dict[str, Any]
+    ) -> str:
+        """
+        Create one prompt that enhances several tasks.
+        
+        The event context is stated once for all tasks in the pack.
+        
+        Args:
+            tasks: Consolidated tasks to enhance
+            event_context: Event context information
+            
+        Returns:
+            Formatted prompt string asking for a JSON array answer
+        """
+        task_sections = "".join(self._format_packed_task(task) for task in tasks)
+        
+        prompt = f"""You are an expert event planning assistant. Enhance each of the tasks below with detailed insights, suggestions, and best practices.
+
+Event Context:
+- Event Type: {event_context.get('event_type', 'unknown')}
+- Guest Count: {event_context.get('guest_count', 0)}
+- Budget: ${event_context.get('budget', 0):,.2f}
+- Days Until Event: {event_context.get('days_until_event', 'unknown')}
+
+Tasks:
+{task_sections}
+For each task, provide:
+1. Enhanced Description: A more detailed, actionable description of what needs to be done
+2. Suggestions: 2-3 specific suggestions to improve task execution
+3. Potential Issues: 2-3 potential problems or challenges to watch for
+4. Best Practices: 2-3 industry best practices for this type of task
+
+Respond with only a JSON array containing one object per task, in the order given:
+[
+  {{
+    "task_id": "Task ID from above",
+    "enhanced_description": "Detailed description here",
+    "suggestions": ["Suggestion 1", "Suggestion 2"],
+    "potential_issues": ["Issue 1", "Issue 2"],
+    "best_practices": ["Practice 1", "Practice 2"],
+    "requires_manual_review": false
+  }}
+]
+
+Set "requires_manual_review" to true for a task if critical information is missing or if it requires special attention."""
+        
+        return prompt
+    
     def _parse_llm_response(
         self,
         task: ConsolidatedTask,
@@ -328,48 +505,19 @@ Set "requires_manual_review" to true if critical information is missing or if th
             response_text = llm_response.strip()
             
             # Find JSON block (might be wrapped in markdown code blocks)
+            # A stream stopped at the end of the JSON has no closing fence
             if "```json" in response_text:
                 start = response_text.find("```json") + 7
                 end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
+                response_text = response_text[start:end if end != -1 else None].strip()
             elif "```" in response_text:
                 start = response_text.find("```") + 3
                 end = response_text.find("```", start)
-                response_text = response_text[start:end].strip()
+                response_text = response_text[start:end if end != -1 else None].strip()
             
             # Parse JSON
             parsed_data = json.loads(response_text)
-            
-            # Extract fields with defaults
-            enhanced_description = parsed_data.get(
-                'enhanced_description',
-                task.task_description
-            )
-            suggestions = parsed_data.get('suggestions', [])
-            potential_issues = parsed_data.get('potential_issues', [])
-            best_practices = parsed_data.get('best_practices', [])
-            requires_manual_review = parsed_data.get('requires_manual_review', False)
-            
-            # Validate and clean data
-            if not isinstance(suggestions, list):
-                suggestions = [str(suggestions)]
-            if not isinstance(potential_issues, list):
-                potential_issues = [str(potential_issues)]
-            if not isinstance(best_practices, list):
-                best_practices = [str(best_practices)]
-            
-            # Check if manual review is needed based on content
-            if self._flag_for_manual_review(task, parsed_data, event_context):
-                requires_manual_review = True
-            
-            return EnhancedTask(
-                task_id=task.task_id,
-                enhanced_description=enhanced_description,
-                suggestions=suggestions[:5],  # Limit to 5 suggestions
-                potential_issues=potential_issues[:5],  # Limit to 5 issues
-                best_practices=best_practices[:5],  # Limit to 5 practices
-                requires_manual_review=requires_manual_review
-            )
+            return self._build_enhanced_task(task, parsed_data, event_context)
             
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON from LLM response for task {task.task_id}: {e}")
@@ -379,6 +527,54 @@ Set "requires_manual_review" to true if critical information is missing or if th
             logger.error(f"Error parsing LLM response for task {task.task_id}: {e}")
             raise
     
+    def _build_enhanced_task(
+        self,
+        task: ConsolidatedTask,
+        parsed_data: Dict[str, Any],
+        event_context: Dict[str, Any]
+    ) -> EnhancedTask:
+        """
+        Build an EnhancedTask from one task's parsed JSON enhancement.
+        
+        Args:
+            task: Original consolidated task
+            parsed_data: Parsed enhancement fields
+            event_context: Event context for validation
+            
+        Returns:
+            EnhancedTask object
+        """
+        # Extract fields with defaults
+        enhanced_description = parsed_data.get(
+            'enhanced_description',
+            task.task_description
+        )
+        suggestions = parsed_data.get('suggestions', [])
+        potential_issues = parsed_data.get('potential_issues', [])
+        best_practices = parsed_data.get('best_practices', [])
+        requires_manual_review = parsed_data.get('requires_manual_review', False)
+        
+        # Validate and clean data
+        if not isinstance(suggestions, list):
+            suggestions = [str(suggestions)]
+        if not isinstance(potential_issues, list):
+            potential_issues = [str(potential_issues)]
+        if not isinstance(best_practices, list):
+            best_practices = [str(best_practices)]
+        
+        # Check if manual review is needed based on content
+        if self._flag_for_manual_review(task, parsed_data, event_context):
+            requires_manual_review = True
+        
+        return EnhancedTask(
+            task_id=task.task_id,
+            enhanced_description=enhanced_description,
+            suggestions=suggestions[:5],  # Limit to 5 suggestions
+            potential_issues=potential_issues[:5],  # Limit to 5 issues
+            best_practices=best_practices[:5],  # Limit to 5 practices
+            requires_manual_review=requires_manual_review
+        )
+    
     def _parse_unstructured_response(
         self,
         task: ConsolidatedTask,
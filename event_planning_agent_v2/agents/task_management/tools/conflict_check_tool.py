@@ -14,18 +14,23 @@ Integrates with:
 - ConsolidatedTaskData for task information
 """
 
+from __future__ import annotations
+
 import logging
 import hashlib
-from typing import List, Optional, Dict, Any, Set, Tuple
+import heapq
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 from ..models.data_models import Conflict, Resource, TaskTimeline
 from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
 from ..exceptions import ToolExecutionError
-from ....workflows.state_models import EventPlanningState
 from ....tools.timeline_tools import ConflictDetectionTool
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
 
@@ -504,6 +509,9 @@ class ConflictCheckTool:
         """
         Check for direct timeline overlaps between tasks
         
+        Overlapping pairs come from a sweep over start times, so the cost is
+        O(n log n + overlaps) rather than a comparison of every pair.
+        
         Args:
             tasks: List of consolidated tasks
             
@@ -521,39 +529,100 @@ class ConflictCheckTool:
         # Sort by start time
         sorted_tasks = sorted(tasks_with_timeline, key=lambda t: t.timeline.start_time)
         
-        # Check for overlaps
-        for i in range(len(sorted_tasks)):
-            for j in range(i + 1, len(sorted_tasks)):
-                task1 = sorted_tasks[i]
-                task2 = sorted_tasks[j]
-                
-                # Check if tasks overlap
-                if self._tasks_overlap(task1, task2):
-                    # Check if overlap is problematic (not intentional parallel execution)
-                    if self._is_problematic_overlap(task1, task2):
-                        conflict = Conflict(
-                            conflict_id=self._generate_conflict_id(
-                                'timeline',
-                                [task1.task_id, task2.task_id],
-                                'overlap'
-                            ),
-                            conflict_type='timeline',
-                            severity=self._determine_overlap_severity(task1, task2),
-                            affected_tasks=[task1.task_id, task2.task_id],
-                            conflict_description=(
-                                f"Timeline overlap: '{task1.task_name}' "
-                                f"({task1.timeline.start_time.strftime('%H:%M')}-"
-                                f"{task1.timeline.end_time.strftime('%H:%M')}) overlaps with "
-                                f"'{task2.task_name}' "
-                                f"({task2.timeline.start_time.strftime('%H:%M')}-"
-                                f"{task2.timeline.end_time.strftime('%H:%M')})"
-                            )
-                        )
-                        conflict.suggested_resolutions = self._suggest_resolutions(conflict)
-                        conflicts.append(conflict)
+        # "HH:MM-HH:MM" per task, formatted only for tasks that end up in a conflict
+        spans: Dict[str, str] = {}
+        
+        for i, j in self._overlapping_pairs(sorted_tasks):
+            task1 = sorted_tasks[i]
+            task2 = sorted_tasks[j]
+            
+            # Check if overlap is problematic (not intentional parallel execution)
+            if self._is_problematic_overlap(task1, task2):
+                conflicts.append(self._create_overlap_conflict(task1, task2, spans))
         
         return conflicts
     
+    def _create_overlap_conflict(
+        self,
+        task1: ConsolidatedTask,
+        task2: ConsolidatedTask,
+        spans: Optional[Dict[str, str]] = None
+    ) -> Conflict:
+        """
+        Create a timeline overlap conflict object
+        
+        Args:
+            task1: Task starting first
+            task2: Task starting second
+            spans: Cache of formatted "HH:MM-HH:MM" spans by task ID
+            
+        Returns:
+            Conflict object
+        """
+        spans = {} if spans is None else spans
+        
+        def span(task: ConsolidatedTask) -> str:
+            if task.task_id not in spans:
+                spans[task.task_id] = (
+                    f"{task.timeline.start_time.strftime('%H:%M')}-"
+                    f"{task.timeline.end_time.strftime('%H:%M')}"
+                )
+            return spans[task.task_id]
+        
+        conflict = Conflict(
+            conflict_id=self._generate_conflict_id(
+                'timeline',
+                [task1.task_id, task2.task_id],
+                'overlap'
+            ),
+            conflict_type='timeline',
+            severity=self._determine_overlap_severity(task1, task2),
+            affected_tasks=[task1.task_id, task2.task_id],
+            conflict_description=(
+                f"Timeline overlap: '{task1.task_name}' ({span(task1)}) overlaps with "
+                f"'{task2.task_name}' ({span(task2)})"
+            )
+        )
+        conflict.suggested_resolutions = self._suggest_resolutions(conflict)
+        return conflict
+    
+    def _overlapping_pairs(
+        self,
+        sorted_tasks: List[ConsolidatedTask]
+    ) -> List[Tuple[int, int]]:
+        """
+        Find all overlapping task pairs with a sweep line
+        
+        Walks the tasks in start-time order keeping a min-heap of the tasks
+        still running (by end time). Each task overlaps exactly the running
+        tasks that have not ended by its start.
+        
+        Args:
+            sorted_tasks: Tasks with timelines, sorted by start time
+            
+        Returns:
+            Index pairs (i, j), i < j, in the order a pairwise scan would find them
+        """
+        pairs = []
+        active: List[Tuple[datetime, int]] = []  # (end_time, index) of running tasks
+        
+        for j, task in enumerate(sorted_tasks):
+            start_time = task.timeline.start_time
+            
+            # Tasks ending at or before this start can't overlap it or any later task
+            while active and active[0][0] <= start_time:
+                heapq.heappop(active)
+            
+            for _, i in active:
+                # Still checked, so zero-length tasks behave as before
+                if self._tasks_overlap(sorted_tasks[i], task):
+                    pairs.append((i, j))
+            
+            heapq.heappush(active, (task.timeline.end_time, j))
+        
+        pairs.sort()
+        return pairs
+    
     def _tasks_overlap(
         self,
         task1: ConsolidatedTask,
@@ -577,6 +646,10 @@ class ConflictCheckTool:
         """
         Determine if overlap is problematic or intentional parallel execution
         
+        The Timeline Calculation Tool runs independent tasks in parallel, so
+        an overlap is only a problem when one task depends on the other or
+        both hold the same resource.
+        
         Args:
             task1: First task
             task2: Second task
@@ -595,11 +668,7 @@ class ConflictCheckTool:
         if task1_resources & task2_resources:  # Intersection
             return True
         
-        # Check if both tasks are high priority (might need sequential execution)
-        if task1.priority_level in ['Critical', 'High'] and task2.priority_level in ['Critical', 'High']:
-            return True
-        
-        # Otherwise, overlap might be intentional parallel execution
+        # Otherwise, overlap is intentional parallel execution
         return False
     
     def _determine_overlap_severity(
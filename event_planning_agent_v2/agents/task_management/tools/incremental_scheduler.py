@@ -0,0 +1,596 @@
+"""
+Incremental Scheduler for Task Management Agent
+
+Keeps a plan's dependency DAG, leveled schedule and timeline-overlap
+conflicts in memory so a single change (a status update, a duration edit, a
+resolved conflict) doesn't rerun the Task Management Agent or every tool:
+
+- Only the downstream cone of the changed tasks is re-placed, following
+  dependency edges and resource hand-overs, and propagation stops at
+  tasks whose times did not change
+- Overlap conflicts are re-checked only for tasks whose interval moved,
+  against the tasks whose intervals intersect the new one
+- Slack and the critical path are recomputed with one backward pass
+
+Tasks keep the placement order of the full schedule, so a change never
+reorders who gets a shared resource first; a full TimelineCalculationTool
+run can.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.data_models import Conflict, Resource, TaskTimeline
+from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
+from .timeline_calculation_tool import SchedulePlan, TimelineCalculationTool
+from .conflict_check_tool import ConflictCheckTool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduleUpdate:
+    """Result of applying one change to a loaded schedule"""
+    moved_timelines: List[TaskTimeline] = field(default_factory=list)
+    new_conflicts: List[Conflict] = field(default_factory=list)
+    cleared_conflicts: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
+class IncrementalScheduler:
+    """
+    In-memory schedule of one plan that applies task changes incrementally.
+
+    Load it once from consolidated task data (or a serialized extended task
+    list); afterwards update_duration, update_task_status and
+    resolve_conflict return only what changed.
+    """
+
+    TASK_STATUSES = ("pending", "in_progress", "completed", "blocked")
+
+    def __init__(
+        self,
+        timeline_tool: Optional[TimelineCalculationTool] = None,
+        conflict_tool: Optional[ConflictCheckTool] = None
+    ):
+        """
+        Initialize Incremental Scheduler
+
+        Args:
+            timeline_tool: Tool used for the full schedule and task placement
+            conflict_tool: Tool used for overlap detection and conflict objects
+        """
+        self.timeline_tool = timeline_tool or TimelineCalculationTool()
+        self.conflict_tool = conflict_tool or ConflictCheckTool()
+
+        self.plan: Optional[SchedulePlan] = None
+        self.start_time: Optional[datetime] = None
+        self.statuses: Dict[str, str] = {}
+        self.resolved_conflicts: Set[str] = set()
+
+        self._positions: Dict[str, int] = {}
+        self._ranks: List[int] = []                       # Position -> index in placement order
+        self._by_start: List[Tuple[timedelta, int]] = []  # (start offset, position), sorted
+        self._max_duration = timedelta(0)
+        self._conflicts: Dict[str, Conflict] = {}
+        self._conflicts_by_task: Dict[str, Set[str]] = {}
+        self._stored_conflicts: Set[str] = set()          # Every conflict of a loaded extended task list
+
+    def load(self, consolidated_data: ConsolidatedTaskData, state: Dict) -> List[TaskTimeline]:
+        """
+        Build the full schedule and overlap conflicts for a plan.
+
+        Args:
+            consolidated_data: Consolidated task data
+            state: EventPlanningState with event date and baseline timeline
+
+        Returns:
+            TaskTimeline per task, in dependency order
+        """
+        tool = self.timeline_tool
+        event_date = tool._extract_event_date(state)
+        self.start_time = tool._get_event_start_time(event_date, state.get('timeline_data') or {})
+
+        graph = tool._dependency_graph(consolidated_data)
+        plan = tool._plan_schedule(graph.sorted_tasks(consolidated_data.tasks), graph)
+        self.plan = plan
+        self._positions = {task.task_id: i for i, task in enumerate(plan.tasks)}
+        self._ranks = [0] * len(plan.tasks)
+        for rank, i in enumerate(plan.placement_order):
+            self._ranks[i] = rank
+
+        for i, task in enumerate(plan.tasks):
+            task.timeline = tool._timeline_from_plan(plan, i, self.start_time)
+            self.statuses.setdefault(task.task_id, "pending")
+
+        self._by_start = sorted((plan.starts[i], i) for i in range(len(plan.tasks)))
+        self._max_duration = max(plan.durations, default=timedelta(0))
+
+        self._conflicts = {}
+        self._conflicts_by_task = {}
+        for conflict in self.conflict_tool._check_direct_timeline_overlaps(plan.tasks):
+            self._add_conflict(conflict)
+
+        logger.info(
+            f"Loaded incremental schedule with {len(plan.tasks)} tasks and {len(self._conflicts)} overlap conflicts"
+        )
+        return self.timelines()
+
+    def load_extended_task_list(self, extended_task_list: Dict[str, Any], state: Dict) -> List[TaskTimeline]:
+        """
+        Load from a serialized extended task list, as stored in EventPlanningState.
+
+        Task durations come from the stored timelines (in seconds); statuses
+        and resolved conflicts stored with the tasks are kept. Stored
+        conflicts of every kind (resource, venue, timeline) can be resolved,
+        not only the overlaps this scheduler tracks.
+
+        Args:
+            extended_task_list: Serialized ExtendedTaskList
+            state: EventPlanningState with event date and baseline timeline
+
+        Returns:
+            TaskTimeline per task, in dependency order
+        """
+        tasks = []
+        for data in extended_task_list.get('tasks', []):
+            timeline = data.get('timeline') or {}
+            tasks.append(ConsolidatedTask(
+                task_id=data['task_id'],
+                task_name=data.get('task_name', data['task_id']),
+                priority_level=data.get('priority_level', 'Medium'),
+                priority_score=data.get('priority_score', 0.5),
+                priority_rationale='',
+                parent_task_id=data.get('parent_task_id'),
+                task_description=data.get('task_description', ''),
+                granularity_level=data.get('granularity_level', 0),
+                estimated_duration=timedelta(seconds=float(timeline.get('duration') or 3600)),
+                sub_tasks=list(data.get('sub_tasks') or []),
+                dependencies=list(data.get('dependencies') or []),
+                resources_required=[Resource(**r) for r in data.get('resources_required') or []]
+            ))
+            if data.get('status'):
+                self.statuses[data['task_id']] = data['status']
+            for conflict in data.get('conflicts') or []:
+                if conflict.get('conflict_id'):
+                    self._stored_conflicts.add(conflict['conflict_id'])
+                if conflict.get('resolution_status') == 'resolved':
+                    self.resolved_conflicts.add(conflict['conflict_id'])
+
+        return self.load(ConsolidatedTaskData(tasks=tasks), state)
+
+    def timelines(self) -> List[TaskTimeline]:
+        """Current TaskTimeline per task, in dependency order"""
+        return [task.timeline for task in self.plan.tasks]
+
+    def conflicts(self) -> List[Conflict]:
+        """Current unresolved timeline overlap conflicts"""
+        return [c for cid, c in self._conflicts.items() if cid not in self.resolved_conflicts]
+
+    def critical_path(self) -> List[str]:
+        """Tasks with no slack, in start order"""
+        timelines = sorted(self.timelines(), key=lambda t: t.start_time)
+        return [t.task_id for t in timelines if t.is_critical]
+
+    def update_duration(self, task_id: str, duration: timedelta) -> ScheduleUpdate:
+        """
+        Change a task's duration and reschedule what depends on it.
+
+        Args:
+            task_id: Task to change
+            duration: New duration
+
+        Returns:
+            ScheduleUpdate with the moved timelines and conflict changes
+
+        Raises:
+            KeyError: If the task is not in the schedule
+        """
+        return self._apply({self._position(task_id): duration})
+
+    def update_task_status(
+        self,
+        task_id: str,
+        status: str,
+        completed_at: Optional[datetime] = None,
+        duration: Optional[timedelta] = None
+    ) -> ScheduleUpdate:
+        """
+        Record a task's status, optionally with a revised duration.
+
+        A task completed at a known time gets its actual duration, which moves
+        its dependents earlier or later; an explicit duration takes precedence.
+        Other status changes don't move anything. Nothing is changed unless
+        the whole update is valid.
+
+        Args:
+            task_id: Task to update
+            status: One of TASK_STATUSES
+            completed_at: When a completed task finished; timezone-aware
+                values are converted to naive UTC, like the schedule
+            duration: Revised duration of the task
+
+        Returns:
+            ScheduleUpdate with the moved timelines and conflict changes
+
+        Raises:
+            KeyError: If the task is not in the schedule
+            ValueError: If the status is unknown
+        """
+        if status not in self.TASK_STATUSES:
+            raise ValueError(f"Unknown task status '{status}', expected one of {', '.join(self.TASK_STATUSES)}")
+        i = self._position(task_id)
+        if completed_at is not None and completed_at.tzinfo is not None:
+            completed_at = completed_at.astimezone(timezone.utc).replace(tzinfo=None)
+        if duration is None and status == "completed" and completed_at is not None:
+            duration = max(completed_at - (self.start_time + self.plan.starts[i]), timedelta(0))
+
+        self.statuses[task_id] = status
+        if duration is not None:
+            return self._apply({i: duration})
+        return ScheduleUpdate()
+
+    def resolve_conflict(self, conflict_id: str, resolution: Optional[Dict[str, Any]] = None) -> ScheduleUpdate:
+        """
+        Mark a conflict resolved, applying any duration changes it carries.
+
+        Any conflict of the plan can be resolved: a timeline overlap this
+        scheduler tracks, or any conflict stored in the loaded extended task
+        list. The schedule only changes when the resolution revises task
+        durations.
+
+        Args:
+            conflict_id: Conflict to resolve
+            resolution: Resolution data; "task_durations" maps task IDs to new
+                durations in minutes
+
+        Returns:
+            ScheduleUpdate with the moved timelines and conflict changes
+
+        Raises:
+            KeyError: If the conflict or a task in the resolution is unknown
+            ValueError: If a revised duration is not positive
+        """
+        if conflict_id not in self._conflicts and conflict_id not in self._stored_conflicts:
+            raise KeyError(conflict_id)
+        # Validate every task and duration before changing anything
+        durations = {
+            self._position(task_id): timedelta(minutes=float(minutes))
+            for task_id, minutes in ((resolution or {}).get('task_durations') or {}).items()
+        }
+        if any(duration <= timedelta(0) for duration in durations.values()):
+            raise ValueError("Revised task durations must be greater than 0 minutes")
+
+        self.resolved_conflicts.add(conflict_id)
+        update = self._apply(durations) if durations else ScheduleUpdate()
+        update.cleared_conflicts.append(conflict_id)
+        return update
+
+    def patch_extended_task_list(self, extended_task_list: Dict[str, Any], update: ScheduleUpdate) -> None:
+        """
+        Write an update back into a serialized extended task list.
+
+        Moved tasks get their new timeline, every task its current slack and
+        status, and task conflict lists follow the new and cleared conflicts.
+
+        Args:
+            extended_task_list: Serialized ExtendedTaskList the schedule was loaded from
+            update: Result of the change being written back
+        """
+        moved = {timeline.task_id: timeline for timeline in update.moved_timelines}
+        new_by_task: Dict[str, List[Conflict]] = {}
+        for conflict in update.new_conflicts:
+            for task_id in conflict.affected_tasks:
+                new_by_task.setdefault(task_id, []).append(conflict)
+        cleared = set(update.cleared_conflicts)
+
+        for data in extended_task_list.get('tasks', []):
+            task_id = data['task_id']
+            if task_id not in self._positions:
+                continue
+            timeline = self.plan.tasks[self._positions[task_id]].timeline
+            data['status'] = self.statuses.get(task_id, 'pending')
+
+            if task_id in moved or not data.get('timeline'):
+                data['timeline'] = _serialize_timeline(timeline)
+            else:
+                data['timeline']['slack'] = timeline.slack.total_seconds()
+                data['timeline']['is_critical'] = timeline.is_critical
+
+            conflicts = data.setdefault('conflicts', [])
+            for conflict in conflicts:
+                if conflict.get('conflict_id') in self.resolved_conflicts:
+                    conflict['resolution_status'] = 'resolved'
+            conflicts[:] = [
+                c for c in conflicts
+                if c.get('conflict_id') not in cleared or c.get('conflict_id') in self.resolved_conflicts
+            ]
+            conflicts.extend(asdict(c) for c in new_by_task.get(task_id, []))
+
+    def _position(self, task_id: str) -> int:
+        if self.plan is None:
+            raise KeyError(task_id)
+        return self._positions[task_id]
+
+    def _apply(self, durations: Dict[int, timedelta]) -> ScheduleUpdate:
+        """Set new durations, reschedule their downstream cone and re-check moved intervals"""
+        started = time.perf_counter()
+        plan = self.plan
+
+        for i, duration in durations.items():
+            plan.durations[i] = duration
+            plan.tasks[i].estimated_duration = duration
+            self._max_duration = max(self._max_duration, duration)
+
+        old_starts = {}
+        moved = self._reschedule(durations, old_starts)
+        update = ScheduleUpdate()
+
+        if moved:
+            self.timeline_tool._compute_slack(plan)
+            for i, task in enumerate(plan.tasks):
+                task.timeline.slack = plan.slack[i]
+                task.timeline.is_critical = plan.slack[i] == timedelta(0)
+
+            for i in moved:
+                task = plan.tasks[i]
+                task.timeline = self.timeline_tool._timeline_from_plan(plan, i, self.start_time)
+                self._by_start.pop(bisect_left(self._by_start, (old_starts[i], i)))
+                insort(self._by_start, (plan.starts[i], i))
+
+            update.moved_timelines = [plan.tasks[i].timeline for i in moved]
+            update.cleared_conflicts, update.new_conflicts = self._recheck_conflicts(moved)
+
+        update.elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.debug(f"Incremental update moved {len(moved)} tasks in {update.elapsed_ms:.2f}ms")
+        return update
+
+    def _reschedule(self, changed: Iterable[int], old_starts: Dict[int, timedelta]) -> List[int]:
+        """
+        Re-place changed tasks and, transitively, the successors of any that moved.
+
+        Tasks are re-placed in the original placement order, so every
+        predecessor is final before a task is placed.
+
+        Args:
+            changed: Positions of tasks whose duration changed
+            old_starts: Filled with the previous start of every moved task
+
+        Returns:
+            Positions of tasks whose start or finish changed
+        """
+        plan = self.plan
+        queue = [(self._ranks[i], i) for i in set(changed)]
+        heapq.heapify(queue)
+        queued = {i for _, i in queue}
+        moved = []
+
+        while queue:
+            _, i = heapq.heappop(queue)
+            before = (plan.starts[i], plan.finishes[i])
+            self.timeline_tool._place_task(plan, i)
+            if (plan.starts[i], plan.finishes[i]) == before:
+                continue
+
+            old_starts[i] = before[0]
+            moved.append(i)
+            for s in plan.successors[i] + plan.resource_successors[i]:
+                if s not in queued:
+                    queued.add(s)
+                    heapq.heappush(queue, (self._ranks[s], s))
+
+        return moved
+
+    def _recheck_conflicts(self, moved: List[int]) -> Tuple[List[str], List[Conflict]]:
+        """
+        Replace the overlap conflicts of moved tasks.
+
+        Args:
+            moved: Positions of tasks whose interval changed
+
+        Returns:
+            (IDs of conflicts that no longer apply, newly detected conflicts)
+        """
+        plan = self.plan
+        previous: Set[str] = set()
+        for i in moved:
+            previous |= self._conflicts_by_task.get(plan.tasks[i].task_id, set())
+        for conflict_id in previous:
+            self._remove_conflict(conflict_id)
+
+        spans: Dict[str, str] = {}
+        found: Dict[str, Conflict] = {}
+        for i in moved:
+            for j in self._overlapping(i):
+                # Same pair order as a full check: earlier start first
+                first, second = sorted((i, j), key=lambda k: (plan.starts[k], k))
+                task1, task2 = plan.tasks[first], plan.tasks[second]
+                if self.conflict_tool._is_problematic_overlap(task1, task2):
+                    conflict = self.conflict_tool._create_overlap_conflict(task1, task2, spans)
+                    found.setdefault(conflict.conflict_id, conflict)
+
+        for conflict in found.values():
+            self._add_conflict(conflict)
+
+        cleared = [cid for cid in previous if cid not in found and cid not in self.resolved_conflicts]
+        new = [c for cid, c in found.items() if cid not in previous and cid not in self.resolved_conflicts]
+        return cleared, new
+
+    def _overlapping(self, i: int) -> List[int]:
+        """Positions of tasks whose interval overlaps task i's"""
+        plan = self.plan
+        task = plan.tasks[i]
+        low = bisect_left(self._by_start, (plan.starts[i] - self._max_duration, -1))
+        high = bisect_left(self._by_start, (plan.finishes[i], -1))
+        return [
+            j for _, j in self._by_start[low:high]
+            if j != i and self.conflict_tool._tasks_overlap(task, plan.tasks[j])
+        ]
+
+    def _add_conflict(self, conflict: Conflict) -> None:
+        self._conflicts[conflict.conflict_id] = conflict
+        for task_id in conflict.affected_tasks:
+            self._conflicts_by_task.setdefault(task_id, set()).add(conflict.conflict_id)
+
+    def _remove_conflict(self, conflict_id: str) -> None:
+        conflict = self._conflicts.pop(conflict_id, None)
+        if conflict:
+            for task_id in conflict.affected_tasks:
+                self._conflicts_by_task.get(task_id, set()).discard(conflict_id)
+
+
+def _serialize_timeline(timeline: TaskTimeline) -> Dict[str, Any]:
+    """TaskTimeline as stored in EventPlanningState, with timedeltas in seconds"""
+    data = asdict(timeline)
+    for key in ('duration', 'buffer_time', 'slack'):
+        if data.get(key) is not None:
+            data[key] = data[key].total_seconds()
+    return data
+
+
+@dataclass
+class _CachedSchedule:
+    """A loaded plan schedule and the database revision its state matches"""
+    scheduler: IncrementalScheduler
+    state: Dict
+    revision: Optional[int]
+
+
+class PlanScheduleCache:
+    """
+    Loaded incremental schedules of recently edited plans.
+
+    Holds each plan's scheduler with the workflow state it was loaded from,
+    evicting the least recently used plan beyond max_plans. Every API worker
+    has its own cache, so an entry is only reused while the plan's revision
+    in the database is the one it was loaded at (plus the saves it made
+    itself); a plan saved by another worker or by the workflow is reloaded
+    before it is edited.
+
+    Each edit is numbered when its snapshot is taken. A plan's snapshots are
+    saved one at a time, and a snapshot older than one already saved is
+    skipped, so saves finishing out of order never overwrite a newer state.
+    """
+
+    def __init__(self, max_plans: int = 32):
+        self.max_plans = max_plans
+        self._entries: "OrderedDict[str, _CachedSchedule]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_locks: Dict[str, threading.Lock] = {}
+        self._edits: Dict[str, int] = {}        # plan_id -> number of the latest edit
+        self._saved_edits: Dict[str, int] = {}  # plan_id -> number of the latest saved edit
+
+    def get(
+        self,
+        plan_id: str,
+        load_state: Callable[[str], Optional[Dict]],
+        load_revision: Callable[[str], Optional[int]]
+    ) -> Optional[Tuple[IncrementalScheduler, Dict]]:
+        """
+        Scheduler and workflow state of a plan, (re)loading them when the
+        cached ones are missing or stale.
+
+        Args:
+            plan_id: Plan identifier
+            load_state: Loads a plan's workflow state, or returns None
+            load_revision: Gets a plan's current revision, or returns None
+
+        Returns:
+            (scheduler, state), or None if the plan has no extended task list
+        """
+        # Read before the state, so a save landing in between makes the entry stale, not wrong
+        revision = load_revision(plan_id)
+        entry = self._entries.get(plan_id)
+        if entry is not None and revision is not None and entry.revision == revision:
+            self._entries.move_to_end(plan_id)
+            return entry.scheduler, entry.state
+
+        self._entries.pop(plan_id, None)
+        state = load_state(plan_id)
+        if not state or not state.get('extended_task_list'):
+            return None
+
+        scheduler = IncrementalScheduler()
+        scheduler.load_extended_task_list(state['extended_task_list'], state)
+        self._entries[plan_id] = _CachedSchedule(scheduler, state, revision)
+        while len(self._entries) > self.max_plans:
+            self._entries.popitem(last=False)
+        return scheduler, state
+
+    def record_edit(self, plan_id: str) -> int:
+        """
+        Number an edit of a plan, when the snapshot to save is taken.
+
+        Args:
+            plan_id: Plan identifier
+
+        Returns:
+            Edit number, increasing per plan
+        """
+        with self._lock:
+            edit = self._edits.get(plan_id, 0) + 1
+            self._edits[plan_id] = edit
+            return edit
+
+    def save(
+        self,
+        plan_id: str,
+        state: Dict,
+        snapshot: Dict,
+        edit: int,
+        save_state: Callable[[Dict], bool]
+    ) -> bool:
+        """
+        Save a snapshot of a cached state unless a newer edit is already saved.
+
+        A successful save bumps the plan's revision by one, which the cached
+        entry follows; a failed one drops the entry so the next edit reloads.
+
+        Args:
+            plan_id: Plan identifier
+            state: The cached state the snapshot was taken from
+            snapshot: Copy of the state to save
+            edit: Number of the edit, from record_edit
+            save_state: Saves a workflow state, returning whether it succeeded
+
+        Returns:
+            False if the save failed, True otherwise
+        """
+        with self._lock:
+            save_lock = self._save_locks.setdefault(plan_id, threading.Lock())
+
+        with save_lock:
+            if edit <= self._saved_edits.get(plan_id, 0):
+                return True
+
+            if not save_state(snapshot):
+                self.invalidate(plan_id)
+                return False
+
+            self._saved_edits[plan_id] = edit
+            entry = self._entries.get(plan_id)
+            if entry is not None and entry.state is state and entry.revision is not None:
+                entry.revision += 1
+            return True
+
+    def invalidate(self, plan_id: str) -> None:
+        """Drop a plan's schedule so the next edit reloads it"""
+        self._entries.pop(plan_id, None)
+
+
+_plan_schedule_cache: Optional[PlanScheduleCache] = None
+
+
+def get_plan_schedule_cache() -> PlanScheduleCache:
+    """Get the process-wide plan schedule cache"""
+    global _plan_schedule_cache
+    if _plan_schedule_cache is None:
+        _plan_schedule_cache = PlanScheduleCache()
+    return _plan_schedule_cache
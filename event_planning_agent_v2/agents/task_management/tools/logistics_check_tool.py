@@ -11,18 +11,26 @@ Integrates with:
 - Database for venue and vendor details
 - EventPlanningState for selected combination data
 - Resource requirements from consolidated task data
+
+Venue and vendor records are loaded once per run into a LogisticsContext,
+which the agent shares with the Venue Lookup Tool; per-task checks only
+look facts up in it.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from datetime import timedelta
 
 from ..models.data_models import LogisticsStatus, Resource
 from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
 from ..exceptions import ToolExecutionError
-from ....workflows.state_models import EventPlanningState
+from .logistics_context import LogisticsContext, load_logistics_context
 from ....database.connection import get_connection_manager
-from ....database.models import Venue, Caterer, Photographer, MakeupArtist
+
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,14 @@ class LogisticsCheckTool:
     5. Flags tasks with logistical issues
     """
     
+    TRANSPORTATION_KEYWORDS = (
+        'transport', 'delivery', 'pickup', 'travel', 'move', 'ship',
+        'logistics', 'arrival', 'departure'
+    )
+    SETUP_KEYWORDS = ('setup', 'install', 'arrange', 'prepare', 'configure', 'decorate')
+    # Setups that typically need several hours
+    LONG_SETUP_KEYWORDS = ('decoration', 'stage', 'lighting', 'sound')
+    
     def __init__(self, db_connection=None):
         """
         Initialize Logistics Check Tool
@@ -52,7 +68,8 @@ class LogisticsCheckTool:
     def verify_logistics(
         self,
         consolidated_data: ConsolidatedTaskData,
-        state: EventPlanningState
+        state: EventPlanningState,
+        context: Optional[LogisticsContext] = None
     ) -> List[LogisticsStatus]:
         """
         Verify logistics feasibility for all tasks
@@ -60,6 +77,7 @@ class LogisticsCheckTool:
         Args:
             consolidated_data: Consolidated task data from sub-agents
             state: Current EventPlanningState with selected_combination
+            context: Plan's venue and vendor context (loaded here if None)
             
         Returns:
             List of LogisticsStatus objects
@@ -76,18 +94,16 @@ class LogisticsCheckTool:
                 logger.warning("No selected_combination found in state")
                 return self._create_missing_data_statuses(consolidated_data.tasks)
             
-            # Get venue details
-            venue_info = self._get_venue_info(selected_combination)
-            
-            # Get vendor details
-            vendor_info = self._get_vendor_info(selected_combination)
+            # Get venue and vendor details
+            if context is None:
+                context = load_logistics_context(self.db_manager, selected_combination)
+            if not context.venue:
+                logger.warning("No venue details available for selected_combination")
             
             # Verify logistics for each task
             logistics_statuses = []
             for task in consolidated_data.tasks:
-                status = self._verify_task_logistics(
-                    task, venue_info, vendor_info, state
-                )
+                status = self._verify_task_logistics(task, context)
                 logistics_statuses.append(status)
             
             logger.info(
@@ -107,181 +123,29 @@ class LogisticsCheckTool:
                 details={'error_type': type(e).__name__}
             )
     
-    def _get_venue_info(self, selected_combination: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """
-        Extract venue information from selected combination
-        
-        Args:
-            selected_combination: Selected vendor combination from state
-            
-        Returns:
-            Venue information dictionary or None
-        """
-        venue_data = selected_combination.get('venue')
-        if not venue_data:
-            logger.warning("No venue found in selected_combination")
-            return None
-        
-        venue_id = venue_data.get('vendor_id') or venue_data.get('id')
-        if not venue_id:
-            logger.warning("Venue ID not found in venue data")
-            return None
-        
-        # Query database for detailed venue information
-        try:
-            with self.db_manager.get_sync_session() as session:
-                venue = session.query(Venue).filter(
-                    Venue.vendor_id == venue_id
-                ).first()
-                
-                if not venue:
-                    logger.warning(f"Venue {venue_id} not found in database")
-                    return None
-                
-                return {
-                    'vendor_id': str(venue.vendor_id),
-                    'name': venue.name,
-                    'location_city': venue.location_city,
-                    'location_full': venue.location_full,
-                    'max_seating_capacity': venue.max_seating_capacity,
-                    'ideal_capacity': venue.ideal_capacity,
-                    'room_count': venue.room_count,
-                    'decor_options': venue.decor_options or {},
-                    'attributes': venue.attributes or {},
-                    'policies': venue.policies or {}
-                }
-        except Exception as e:
-            logger.error(f"Failed to query venue details: {e}")
-            return None
-    
-    def _get_vendor_info(self, selected_combination: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-        """
-        Extract vendor information from selected combination
-        
-        Args:
-            selected_combination: Selected vendor combination from state
-            
-        Returns:
-            Dictionary mapping vendor types to vendor information
-        """
-        vendors = {}
-        
-        # Extract caterer
-        caterer_data = selected_combination.get('caterer')
-        if caterer_data:
-            caterer_id = caterer_data.get('vendor_id') or caterer_data.get('id')
-            if caterer_id:
-                vendors['caterer'] = self._query_caterer_details(caterer_id)
-        
-        # Extract photographer
-        photographer_data = selected_combination.get('photographer')
-        if photographer_data:
-            photographer_id = photographer_data.get('vendor_id') or photographer_data.get('id')
-            if photographer_id:
-                vendors['photographer'] = self._query_photographer_details(photographer_id)
-        
-        # Extract makeup artist
-        makeup_data = selected_combination.get('makeup_artist')
-        if makeup_data:
-            makeup_id = makeup_data.get('vendor_id') or makeup_data.get('id')
-            if makeup_id:
-                vendors['makeup_artist'] = self._query_makeup_artist_details(makeup_id)
-        
-        return vendors
-    
-    def _query_caterer_details(self, caterer_id: str) -> Optional[Dict[str, Any]]:
-        """Query database for caterer details"""
-        try:
-            with self.db_manager.get_sync_session() as session:
-                caterer = session.query(Caterer).filter(
-                    Caterer.vendor_id == caterer_id
-                ).first()
-                
-                if not caterer:
-                    return None
-                
-                return {
-                    'vendor_id': str(caterer.vendor_id),
-                    'name': caterer.name,
-                    'location_city': caterer.location_city,
-                    'max_guest_capacity': caterer.max_guest_capacity,
-                    'attributes': caterer.attributes or {}
-                }
-        except Exception as e:
-            logger.error(f"Failed to query caterer details: {e}")
-            return None
-    
-    def _query_photographer_details(self, photographer_id: str) -> Optional[Dict[str, Any]]:
-        """Query database for photographer details"""
-        try:
-            with self.db_manager.get_sync_session() as session:
-                photographer = session.query(Photographer).filter(
-                    Photographer.vendor_id == photographer_id
-                ).first()
-                
-                if not photographer:
-                    return None
-                
-                return {
-                    'vendor_id': str(photographer.vendor_id),
-                    'name': photographer.name,
-                    'location_city': photographer.location_city,
-                    'video_available': photographer.video_available,
-                    'attributes': photographer.attributes or {}
-                }
-        except Exception as e:
-            logger.error(f"Failed to query photographer details: {e}")
-            return None
-    
-    def _query_makeup_artist_details(self, makeup_id: str) -> Optional[Dict[str, Any]]:
-        """Query database for makeup artist details"""
-        try:
-            with self.db_manager.get_sync_session() as session:
-                makeup_artist = session.query(MakeupArtist).filter(
-                    MakeupArtist.vendor_id == makeup_id
-                ).first()
-                
-                if not makeup_artist:
-                    return None
-                
-                return {
-                    'vendor_id': str(makeup_artist.vendor_id),
-                    'name': makeup_artist.name,
-                    'location_city': makeup_artist.location_city,
-                    'on_site_service': makeup_artist.on_site_service,
-                    'attributes': makeup_artist.attributes or {}
-                }
-        except Exception as e:
-            logger.error(f"Failed to query makeup artist details: {e}")
-            return None
-    
     def _verify_task_logistics(
         self,
         task: ConsolidatedTask,
-        venue_info: Optional[Dict[str, Any]],
-        vendor_info: Dict[str, Dict[str, Any]],
-        state: EventPlanningState
+        context: LogisticsContext
     ) -> LogisticsStatus:
         """
         Verify logistics for a single task
         
         Args:
             task: Task to verify
-            venue_info: Venue information
-            vendor_info: Vendor information
-            state: Current EventPlanningState
+            context: Plan's venue and vendor context
             
         Returns:
             LogisticsStatus object
         """
         # Check transportation
-        transportation_result = self._check_transportation(task, venue_info)
+        transportation_result = self._check_transportation(task, context)
         
         # Check equipment
-        equipment_result = self._check_equipment(task, venue_info, vendor_info)
+        equipment_result = self._check_equipment(task, context)
         
         # Check setup requirements
-        setup_result = self._check_setup_requirements(task, venue_info)
+        setup_result = self._check_setup_requirements(task, context)
         
         # Calculate overall feasibility
         feasibility_score = self._calculate_feasibility_score(
@@ -317,14 +181,14 @@ class LogisticsCheckTool:
     def _check_transportation(
         self,
         task: ConsolidatedTask,
-        venue_info: Optional[Dict[str, Any]]
+        context: LogisticsContext
     ) -> Dict[str, Any]:
         """
         Verify transportation requirements and availability based on venue location
         
         Args:
             task: Task to check
-            venue_info: Venue information
+            context: Plan's venue and vendor context
             
         Returns:
             Dictionary with status, notes, and issues
@@ -332,7 +196,7 @@ class LogisticsCheckTool:
         issues = []
         
         # Check if venue information is available
-        if not venue_info:
+        if not context.venue:
             return {
                 'status': 'missing_data',
                 'notes': 'Venue information not available for transportation check',
@@ -341,12 +205,7 @@ class LogisticsCheckTool:
         
         # Analyze task for transportation needs
         task_text = f"{task.task_name} {task.task_description}".lower()
-        transportation_keywords = [
-            'transport', 'delivery', 'pickup', 'travel', 'move', 'ship',
-            'logistics', 'arrival', 'departure'
-        ]
-        
-        needs_transportation = any(keyword in task_text for keyword in transportation_keywords)
+        needs_transportation = any(keyword in task_text for keyword in self.TRANSPORTATION_KEYWORDS)
         
         if not needs_transportation:
             return {
@@ -356,8 +215,7 @@ class LogisticsCheckTool:
             }
         
         # Check venue location accessibility
-        venue_location = venue_info.get('location_city', '')
-        venue_full_location = venue_info.get('location_full', '')
+        venue_location = context.venue_location
         
         if not venue_location:
             issues.append('Venue location not specified')
@@ -386,16 +244,14 @@ class LogisticsCheckTool:
     def _check_equipment(
         self,
         task: ConsolidatedTask,
-        venue_info: Optional[Dict[str, Any]],
-        vendor_info: Dict[str, Dict[str, Any]]
+        context: LogisticsContext
     ) -> Dict[str, Any]:
         """
         Verify equipment availability from vendor and venue resources
         
         Args:
             task: Task to check
-            venue_info: Venue information
-            vendor_info: Vendor information
+            context: Plan's venue and vendor context
             
         Returns:
             Dictionary with status, notes, and issues
@@ -415,47 +271,12 @@ class LogisticsCheckTool:
                 'issues': []
             }
         
-        # Check venue equipment availability
-        venue_equipment = []
-        if venue_info:
-            decor_options = venue_info.get('decor_options', {})
-            attributes = venue_info.get('attributes', {})
-            
-            # Extract available equipment from venue
-            if isinstance(decor_options, dict):
-                venue_equipment.extend(decor_options.keys())
-            if isinstance(attributes, dict):
-                venue_equipment.extend(attributes.keys())
-        
-        # Check each equipment requirement
+        # Check each equipment requirement against the venue, then the vendors
         for equipment in equipment_resources:
-            equipment_name = equipment.resource_name.lower()
-            
-            # Check if venue provides this equipment
-            venue_has_equipment = any(
-                equip.lower() in equipment_name or equipment_name in equip.lower()
-                for equip in venue_equipment
-            )
-            
-            if not venue_has_equipment:
-                # Check if any vendor can provide it
-                vendor_has_equipment = False
-                
-                for vendor_type, vendor_data in vendor_info.items():
-                    if vendor_data:
-                        vendor_attrs = vendor_data.get('attributes', {})
-                        if isinstance(vendor_attrs, dict):
-                            vendor_has_equipment = any(
-                                equip.lower() in equipment_name or equipment_name in equip.lower()
-                                for equip in vendor_attrs.keys()
-                            )
-                            if vendor_has_equipment:
-                                break
-                
-                if not vendor_has_equipment:
-                    issues.append(
-                        f"Equipment '{equipment.resource_name}' not available from venue or vendors"
-                    )
+            if context.equipment_source(equipment.resource_name) is None:
+                issues.append(
+                    f"Equipment '{equipment.resource_name}' not available from venue or vendors"
+                )
         
         # Determine status
         if issues:
@@ -474,21 +295,21 @@ class LogisticsCheckTool:
     def _check_setup_requirements(
         self,
         task: ConsolidatedTask,
-        venue_info: Optional[Dict[str, Any]]
+        context: LogisticsContext
     ) -> Dict[str, Any]:
         """
         Verify setup time, space requirements, and venue constraints
         
         Args:
             task: Task to check
-            venue_info: Venue information
+            context: Plan's venue and vendor context
             
         Returns:
             Dictionary with status, notes, and issues
         """
         issues = []
         
-        if not venue_info:
+        if not context.venue:
             return {
                 'status': 'missing_data',
                 'notes': 'Venue information not available for setup verification',
@@ -497,9 +318,7 @@ class LogisticsCheckTool:
         
         # Analyze task for setup requirements
         task_text = f"{task.task_name} {task.task_description}".lower()
-        setup_keywords = ['setup', 'install', 'arrange', 'prepare', 'configure', 'decorate']
-        
-        needs_setup = any(keyword in task_text for keyword in setup_keywords)
+        needs_setup = any(keyword in task_text for keyword in self.SETUP_KEYWORDS)
         
         if not needs_setup:
             return {
@@ -509,20 +328,16 @@ class LogisticsCheckTool:
             }
         
         # Check venue capacity constraints
-        max_capacity = venue_info.get('max_seating_capacity', 0)
-        ideal_capacity = venue_info.get('ideal_capacity', 0)
-        
         # Check if task mentions guest count or capacity
         if 'guest' in task_text or 'seating' in task_text or 'capacity' in task_text:
-            if max_capacity == 0:
+            if context.max_capacity == 0:
                 issues.append('Venue capacity not specified, cannot verify space requirements')
         
         # Check setup time requirements
         estimated_duration = task.estimated_duration
         
         # Tasks requiring significant setup time
-        if any(keyword in task_text for keyword in ['decoration', 'stage', 'lighting', 'sound']):
-            # These typically need several hours
+        if any(keyword in task_text for keyword in self.LONG_SETUP_KEYWORDS):
             if estimated_duration < timedelta(hours=2):
                 issues.append(
                     f"Task may require more setup time than estimated "
@@ -530,20 +345,16 @@ class LogisticsCheckTool:
                 )
         
         # Check venue policies and restrictions
-        venue_policies = venue_info.get('policies', {})
-        if isinstance(venue_policies, dict):
-            # Check for restrictive policies
-            if venue_policies.get('no_outside_decorators'):
-                if 'decor' in task_text or 'decoration' in task_text:
-                    issues.append('Venue does not allow outside decorators')
-            
-            if venue_policies.get('limited_setup_time'):
-                issues.append('Venue has limited setup time restrictions')
+        if context.policies.get('no_outside_decorators'):
+            if 'decor' in task_text or 'decoration' in task_text:
+                issues.append('Venue does not allow outside decorators')
+        
+        if context.policies.get('limited_setup_time'):
+            issues.append('Venue has limited setup time restrictions')
         
         # Check room availability for multi-room setups
-        room_count = venue_info.get('room_count', 1)
         if 'multiple room' in task_text or 'different room' in task_text:
-            if room_count < 2:
+            if context.room_count < 2:
                 issues.append('Task requires multiple rooms but venue has limited rooms')
         
         # Determine status
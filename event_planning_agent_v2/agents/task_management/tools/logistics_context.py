@@ -0,0 +1,237 @@
+"""
+Logistics Context for Task Management Tools
+
+Plan-scoped venue and vendor facts shared by the Logistics Check Tool and
+the Venue Lookup Tool. The records of the selected combination (venue,
+caterer, photographer, makeup artist) are loaded in one database session,
+and everything the per-task checks derive from them is computed once per
+run:
+- Equipment vocabularies of the venue and of the vendors, normalized
+  (lowercase, '_' and '-' read as spaces) into sets
+- Transportation facts (venue location)
+- Setup facts (capacity, room count, venue policies)
+
+Each task check is then a set or dictionary lookup instead of re-reading
+the records. Equipment matches are remembered per equipment name, since a
+plan asks for the same few items many times.
+"""
+
+import logging
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from ....database.models import Venue, Caterer, Photographer, MakeupArtist
+
+logger = logging.getLogger(__name__)
+
+# selected_combination key -> model of the vendor records used by logistics checks
+VENDOR_MODELS = {
+    'caterer': Caterer,
+    'photographer': Photographer,
+    'makeup_artist': MakeupArtist,
+}
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def normalize_equipment(name: str) -> str:
+    """Lowercase an equipment name, reading '_' and '-' as spaces"""
+    return _SEPARATORS.sub(" ", name.lower()).strip()
+
+
+def selected_vendor_id(selected_combination: Dict[str, Any], key: str) -> Optional[str]:
+    """ID of the vendor selected for key, None if none is selected"""
+    vendor_data = selected_combination.get(key)
+    if not vendor_data:
+        return None
+    return vendor_data.get('vendor_id') or vendor_data.get('id')
+
+
+def venue_record(venue: Venue) -> Dict[str, Any]:
+    """Venue fields used by the logistics and venue tools"""
+    return {
+        'vendor_id': str(venue.vendor_id),
+        'name': venue.name,
+        'area_type': venue.area_type,
+        'location_city': venue.location_city,
+        'location_full': venue.location_full,
+        'max_seating_capacity': venue.max_seating_capacity,
+        'ideal_capacity': venue.ideal_capacity,
+        'room_count': venue.room_count,
+        'rental_cost': venue.rental_cost,
+        'room_cost': venue.room_cost,
+        'decor_options': venue.decor_options or {},
+        'attributes': venue.attributes or {},
+        'policies': venue.policies or {}
+    }
+
+
+def vendor_record(vendor_type: str, vendor: Any) -> Dict[str, Any]:
+    """Vendor fields used by the logistics checks"""
+    record = {
+        'vendor_id': str(vendor.vendor_id),
+        'name': vendor.name,
+        'location_city': vendor.location_city,
+        'attributes': vendor.attributes or {}
+    }
+    if vendor_type == 'caterer':
+        record['max_guest_capacity'] = vendor.max_guest_capacity
+    elif vendor_type == 'photographer':
+        record['video_available'] = vendor.video_available
+    elif vendor_type == 'makeup_artist':
+        record['on_site_service'] = vendor.on_site_service
+    return record
+
+
+def load_logistics_context(db_manager, selected_combination: Dict[str, Any]) -> "LogisticsContext":
+    """
+    Load the selected venue and vendors in one session.
+
+    Records that are not selected or not found are None. A database error
+    is logged and yields a context without records, as the tools did when
+    querying them one by one.
+
+    Args:
+        db_manager: Database connection manager
+        selected_combination: Selected vendor combination from state
+
+    Returns:
+        LogisticsContext for the combination
+    """
+    venue = None
+    vendors: Dict[str, Optional[Dict[str, Any]]] = {}
+    try:
+        with db_manager.get_sync_session() as session:
+            venue_id = selected_vendor_id(selected_combination, 'venue')
+            if venue_id:
+                row = session.query(Venue).filter(Venue.vendor_id == venue_id).first()
+                if row:
+                    venue = venue_record(row)
+                else:
+                    logger.warning(f"Venue {venue_id} not found in database")
+
+            for vendor_type, model in VENDOR_MODELS.items():
+                vendor_id = selected_vendor_id(selected_combination, vendor_type)
+                if vendor_id:
+                    row = session.query(model).filter(model.vendor_id == vendor_id).first()
+                    vendors[vendor_type] = vendor_record(vendor_type, row) if row else None
+    except Exception as e:
+        logger.error(f"Failed to load venue and vendor records: {e}")
+
+    return LogisticsContext(venue, vendors)
+
+
+def _equipment_keys(*sources: Any) -> Iterable[str]:
+    """Keys of the dictionaries among sources (decor options, attributes)"""
+    for source in sources:
+        if isinstance(source, dict):
+            yield from source.keys()
+
+
+class LogisticsContext:
+    """
+    Venue and vendor facts of one plan, derived once for all task checks.
+
+    Built from record dictionaries, so it works the same for records
+    loaded by load_logistics_context and for records a caller already has.
+    """
+
+    def __init__(
+        self,
+        venue: Optional[Dict[str, Any]],
+        vendors: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+    ):
+        """
+        Initialize Logistics Context
+
+        Args:
+            venue: Venue record, None if unavailable
+            vendors: Vendor type -> vendor record (None if not found)
+        """
+        self.venue = venue
+        self.vendors = vendors or {}
+        record = venue or {}
+
+        # Transportation facts
+        self.venue_location = record.get('location_city', '')
+
+        # Setup facts
+        self.max_capacity = record.get('max_seating_capacity', 0)
+        self.room_count = record.get('room_count', 1)
+        policies = record.get('policies', {})
+        self.policies: Dict[str, Any] = policies if isinstance(policies, dict) else {}
+
+        # Equipment vocabularies
+        self.venue_equipment: FrozenSet[str] = frozenset(
+            normalize_equipment(key)
+            for key in _equipment_keys(record.get('decor_options'), record.get('attributes'))
+        )
+        self.vendor_equipment: FrozenSet[str] = frozenset(
+            normalize_equipment(key)
+            for vendor in self.vendors.values() if vendor
+            for key in _equipment_keys(vendor.get('attributes'))
+        )
+        self._equipment_sources: Dict[str, Optional[str]] = {}
+
+    def equipment_source(self, equipment_name: str) -> Optional[str]:
+        """
+        Find who provides a piece of equipment.
+
+        An equipment key matches when either name contains the other, so
+        'projector' covers 'HD Projector' and 'sound system' covers 'sound'.
+
+        Args:
+            equipment_name: Name of the required equipment
+
+        Returns:
+            'venue', 'vendor', or None if neither provides it
+        """
+        name = normalize_equipment(equipment_name)
+        if name not in self._equipment_sources:
+            if self._provides(self.venue_equipment, name):
+                source = 'venue'
+            elif self._provides(self.vendor_equipment, name):
+                source = 'vendor'
+            else:
+                source = None
+            self._equipment_sources[name] = source
+        return self._equipment_sources[name]
+
+    @staticmethod
+    def _provides(vocabulary: FrozenSet[str], name: str) -> bool:
+        return name in vocabulary or any(key in name or name in key for key in vocabulary)
+
+
+class SharedLogisticsContext:
+    """
+    Loads a plan's LogisticsContext on first use and hands the same one to
+    every tool of the run, including tools running in parallel threads.
+    """
+
+    def __init__(self, db_manager, selected_combination: Optional[Dict[str, Any]]):
+        """
+        Initialize Shared Logistics Context
+
+        Args:
+            db_manager: Database connection manager
+            selected_combination: Selected vendor combination from state
+        """
+        self.db_manager = db_manager
+        self.selected_combination = selected_combination
+        self._context: Optional[LogisticsContext] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[LogisticsContext]:
+        """
+        Get the plan's context, loading it on the first call.
+
+        Returns:
+            LogisticsContext, or None without a selected combination
+        """
+        if not self.selected_combination:
+            return None
+        with self._lock:
+            if self._context is None:
+                self._context = load_logistics_context(self.db_manager, self.selected_combination)
+            return self._context
@@ -73,6 +73,7 @@ def test_transportation_check():
         from event_planning_agent_v2.agents.task_management.tools.logistics_check_tool import (
             LogisticsCheckTool
         )
+        from event_planning_agent_v2.agents.task_management.tools.logistics_context import LogisticsContext
         
         tool = LogisticsCheckTool(db_connection=None)
         
@@ -109,7 +110,7 @@ def test_transportation_check():
             'max_seating_capacity': 500
         }
         
-        result = tool._check_transportation(task, venue_info)
+        result = tool._check_transportation(task, LogisticsContext(venue_info))
         
         print(f"Status: {result['status']}")
         print(f"Notes: {result['notes']}")
@@ -122,7 +123,7 @@ def test_transportation_check():
         print("\n✓ Transportation check returned valid structure")
         
         # Test without venue info
-        result_no_venue = tool._check_transportation(task, None)
+        result_no_venue = tool._check_transportation(task, LogisticsContext(None))
         assert result_no_venue['status'] == 'missing_data', "Should return missing_data without venue"
         print("✓ Correctly handles missing venue information")
         
@@ -146,6 +147,7 @@ def test_equipment_check():
         from event_planning_agent_v2.agents.task_management.tools.logistics_check_tool import (
             LogisticsCheckTool
         )
+        from event_planning_agent_v2.agents.task_management.tools.logistics_context import LogisticsContext
         
         tool = LogisticsCheckTool(db_connection=None)
         
@@ -188,7 +190,7 @@ def test_equipment_check():
         
         vendor_info = {}
         
-        result = tool._check_equipment(task, venue_info, vendor_info)
+        result = tool._check_equipment(task, LogisticsContext(venue_info, vendor_info))
         
         print(f"Status: {result['status']}")
         print(f"Notes: {result['notes']}")
@@ -217,7 +219,7 @@ def test_equipment_check():
             resource_conflicts=[]
         )
         
-        result_no_equipment = tool._check_equipment(task_no_equipment, venue_info, vendor_info)
+        result_no_equipment = tool._check_equipment(task_no_equipment, LogisticsContext(venue_info, vendor_info))
         assert result_no_equipment['status'] == 'verified', "Should verify when no equipment needed"
         print("✓ Correctly handles tasks without equipment requirements")
         
@@ -241,6 +243,7 @@ def test_setup_requirements_check():
         from event_planning_agent_v2.agents.task_management.tools.logistics_check_tool import (
             LogisticsCheckTool
         )
+        from event_planning_agent_v2.agents.task_management.tools.logistics_context import LogisticsContext
         
         tool = LogisticsCheckTool(db_connection=None)
         
@@ -274,7 +277,7 @@ def test_setup_requirements_check():
             }
         }
         
-        result = tool._check_setup_requirements(task, venue_info)
+        result = tool._check_setup_requirements(task, LogisticsContext(venue_info))
         
         print(f"Status: {result['status']}")
         print(f"Notes: {result['notes']}")
@@ -287,7 +290,7 @@ def test_setup_requirements_check():
         print("\n✓ Setup requirements check returned valid structure")
         
         # Test without venue info
-        result_no_venue = tool._check_setup_requirements(task, None)
+        result_no_venue = tool._check_setup_requirements(task, LogisticsContext(None))
         assert result_no_venue['status'] == 'missing_data', "Should return missing_data without venue"
         print("✓ Correctly handles missing venue information")
         
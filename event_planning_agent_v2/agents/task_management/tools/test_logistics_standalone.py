@@ -98,6 +98,7 @@ logistics_module = import_from_file(
 )
 
 LogisticsCheckTool = logistics_module.LogisticsCheckTool
+LogisticsContext = logistics_module.LogisticsContext
 
 print("✓ LogisticsCheckTool imported successfully")
 
@@ -158,7 +159,7 @@ def test_transportation():
         'location_full': 'Andheri, Mumbai'
     }
     
-    result = tool._check_transportation(task, venue_info)
+    result = tool._check_transportation(task, LogisticsContext(venue_info))
     
     assert 'status' in result
     assert 'notes' in result
@@ -209,7 +210,7 @@ def test_equipment():
     
     vendor_info = {}
     
-    result = tool._check_equipment(task, venue_info, vendor_info)
+    result = tool._check_equipment(task, LogisticsContext(venue_info, vendor_info))
     
     assert 'status' in result
     assert 'notes' in result
@@ -255,7 +256,7 @@ def test_setup():
         'policies': {}
     }
     
-    result = tool._check_setup_requirements(task, venue_info)
+    result = tool._check_setup_requirements(task, LogisticsContext(venue_info))
     
     assert 'status' in result
     assert 'notes' in result
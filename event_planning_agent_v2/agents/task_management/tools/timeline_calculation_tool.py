@@ -6,34 +6,66 @@ This tool calculates start and end times for all tasks based on:
 - Task durations and priorities
 - Scheduling constraints
 - Buffer times between dependent tasks
+- Shared vendors, venues, equipment and personnel (resource leveling)
+
+Independent tasks run in parallel. Each task's slack and whether it lies on
+the critical path are reported with its timeline.
 
 Integrates with existing Timeline Agent tools:
 - TimelineGenerationTool: For baseline timeline data
 - ConflictDetectionTool: For schedule validation
 """
 
+import heapq
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set, Tuple
-from collections import defaultdict, deque
 
 from ..models.data_models import TaskTimeline
 from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
+from ..models.dependency_graph import DependencyGraph, build_dependency_graph
 from ..exceptions import ToolExecutionError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SchedulePlan:
+    """
+    Leveled schedule of a task list, indexed by position in dependency order.
+    
+    Times are offsets from the event start. Kept after scheduling so a single
+    task change can be rescheduled without recomputing the whole plan.
+    """
+    tasks: List[ConsolidatedTask]
+    durations: List[timedelta]
+    buffers: List[timedelta]
+    predecessors: List[List[int]]
+    successors: List[List[int]]
+    resource_keys: List[Set[str]]
+    placement_order: List[int] = field(default_factory=list)
+    starts: List[timedelta] = field(default_factory=list)
+    finishes: List[timedelta] = field(default_factory=list)
+    resource_predecessors: List[List[int]] = field(default_factory=list)  # Previous user of each resource
+    resource_successors: List[List[int]] = field(default_factory=list)    # Next user of each resource
+    waits_for: Dict[int, str] = field(default_factory=dict)               # Resource that delayed a task's start
+    slack: List[timedelta] = field(default_factory=list)
+
+
 class TimelineCalculationTool:
     """
     Calculates task timelines based on dependencies, durations, and constraints.
     
     This tool:
     1. Performs topological sort on tasks to respect dependencies
-    2. Schedules tasks sequentially based on dependency order
+    2. Schedules tasks with the critical path method, in parallel where
+       dependencies allow
     3. Adds buffer time between dependent tasks
-    4. Validates schedules against existing timeline data
-    5. Detects and reports circular dependencies
+    4. Levels shared resources so their tasks never overlap
+    5. Reports slack per task and the critical path
+    6. Validates schedules against existing timeline data
+    7. Detects and reports circular dependencies
     
     Integrates with existing Timeline Agent tools for validation and conflict detection.
     """
@@ -81,16 +113,25 @@ class TimelineCalculationTool:
             event_date = self._extract_event_date(state)
             baseline_timeline = state.get('timeline_data', {})
             
-            # Perform topological sort to order tasks by dependencies
-            sorted_tasks = self._topological_sort(consolidated_data.tasks)
+            # Order tasks by dependencies, reusing the consolidator's graph
+            graph = self._dependency_graph(consolidated_data)
+            sorted_tasks = graph.sorted_tasks(consolidated_data.tasks)
             
             # Schedule tasks based on dependency order
             task_timelines = self._schedule_tasks(
                 sorted_tasks,
                 event_date,
-                baseline_timeline
+                baseline_timeline,
+                graph
             )
             
+            # Tasks with no slack, in start order
+            critical_path = [
+                t.task_id for t in sorted(task_timelines, key=lambda t: t.start_time) if t.is_critical
+            ]
+            consolidated_data.processing_metadata['critical_path'] = critical_path
+            logger.info(f"Critical path has {len(critical_path)} of {len(task_timelines)} tasks")
+            
             # Validate schedules if conflict detection tool is available
             if self.conflict_detection_tool:
                 self._validate_schedules(task_timelines, state)
@@ -144,137 +185,289 @@ class TimelineCalculationTool:
             logger.warning(f"Error parsing event date: {e}, using today's date")
             return datetime.now()
     
+    def _dependency_graph(self, consolidated_data: ConsolidatedTaskData) -> DependencyGraph:
+        """
+        Get the dependency graph of the consolidated tasks.
+        
+        The graph built by the DataConsolidator is reused when it still
+        covers the same tasks; otherwise (data built elsewhere, tasks added
+        or removed since) it is rebuilt.
+        
+        Args:
+            consolidated_data: Consolidated task data
+        
+        Returns:
+            DependencyGraph of consolidated_data.tasks
+        """
+        graph = consolidated_data.dependency_graph
+        if graph is not None and graph.describes(consolidated_data.tasks):
+            return graph
+        
+        graph = build_dependency_graph(consolidated_data.tasks)
+        for task_id, dependency_id in graph.unknown_dependencies:
+            logger.warning(f"Task {task_id} has unknown dependency: {dependency_id}")
+        for members in graph.cycles:
+            logger.warning(
+                f"Circular dependency broken among tasks {members}; "
+                "they will be scheduled in task list order"
+            )
+        return graph
+    
     def _topological_sort(self, tasks: List[ConsolidatedTask]) -> List[ConsolidatedTask]:
         """
-        Sort tasks by dependencies using Kahn's algorithm (topological sort).
+        Sort tasks by dependencies.
         
         This ensures that prerequisite tasks are scheduled before dependent tasks.
-        Detects circular dependencies and handles them gracefully.
+        Circular dependencies are broken so that every task is returned.
         
         Args:
             tasks: List of consolidated tasks
         
         Returns:
             List of tasks in dependency order
-        
-        Raises:
-            ToolExecutionError: If circular dependencies are detected
-        """
-        # Build task lookup map
-        task_map = {task.task_id: task for task in tasks}
-        
-        # Build adjacency list and in-degree count
-        adjacency = defaultdict(list)  # task_id -> list of dependent task_ids
-        in_degree = defaultdict(int)   # task_id -> count of dependencies
-        
-        # Initialize in-degree for all tasks
-        for task in tasks:
-            if task.task_id not in in_degree:
-                in_degree[task.task_id] = 0
-        
-        # Build graph
-        for task in tasks:
-            for dependency_id in task.dependencies:
-                if dependency_id in task_map:
-                    adjacency[dependency_id].append(task.task_id)
-                    in_degree[task.task_id] += 1
-                else:
-                    logger.warning(
-                        f"Task {task.task_id} has unknown dependency: {dependency_id}"
-                    )
-        
-        # Kahn's algorithm: start with tasks that have no dependencies
-        queue = deque([task_id for task_id in in_degree if in_degree[task_id] == 0])
-        sorted_task_ids = []
-        
-        while queue:
-            # Process task with no remaining dependencies
-            current_id = queue.popleft()
-            sorted_task_ids.append(current_id)
-            
-            # Reduce in-degree for dependent tasks
-            for dependent_id in adjacency[current_id]:
-                in_degree[dependent_id] -= 1
-                if in_degree[dependent_id] == 0:
-                    queue.append(dependent_id)
-        
-        # Check for circular dependencies
-        if len(sorted_task_ids) != len(tasks):
-            # Find tasks involved in circular dependencies
-            circular_tasks = [
-                task_id for task_id in in_degree 
-                if in_degree[task_id] > 0
-            ]
-            
-            logger.error(f"Circular dependencies detected: {circular_tasks}")
-            
-            # Add remaining tasks to sorted list (breaking circular dependencies)
-            for task_id in circular_tasks:
-                sorted_task_ids.append(task_id)
-            
-            logger.warning(
-                f"Circular dependencies broken for {len(circular_tasks)} tasks. "
-                "These tasks will be scheduled in arbitrary order."
-            )
-        
-        # Return tasks in sorted order
-        return [task_map[task_id] for task_id in sorted_task_ids if task_id in task_map]
+        """
+        return self._dependency_graph(ConsolidatedTaskData(tasks=tasks)).sorted_tasks(tasks)
     
     def _schedule_tasks(
         self,
         sorted_tasks: List[ConsolidatedTask],
         event_date: datetime,
-        baseline_timeline: Dict
+        baseline_timeline: Dict,
+        graph: Optional[DependencyGraph] = None
     ) -> List[TaskTimeline]:
         """
-        Schedule tasks based on dependency order and durations.
+        Schedule tasks with the critical path method and resource leveling.
         
         Args:
             sorted_tasks: Tasks sorted by dependencies
             event_date: Event date
             baseline_timeline: Baseline timeline from Timeline Agent
+            graph: Dependency graph whose order sorted_tasks follows, if any
         
         Returns:
-            List of TaskTimeline objects
+            List of TaskTimeline objects, in the order of sorted_tasks
         """
-        task_timelines = []
-        scheduled_tasks = {}  # task_id -> TaskTimeline
-        
-        # Determine event start time
         start_time = self._get_event_start_time(event_date, baseline_timeline)
-        current_time = start_time
-        
-        for task in sorted_tasks:
-            # Calculate task start time based on dependencies
-            task_start_time = self._calculate_task_start_time(
-                task,
-                scheduled_tasks,
-                current_time
+        plan = self._plan_schedule(sorted_tasks, graph)
+        return [self._timeline_from_plan(plan, i, start_time) for i in range(len(sorted_tasks))]
+    
+    def _plan_schedule(
+        self,
+        sorted_tasks: List[ConsolidatedTask],
+        graph: Optional[DependencyGraph] = None
+    ) -> SchedulePlan:
+        """
+        Compute the leveled schedule of a task list.
+        
+        1. A forward and backward pass over the dependencies gives each task's
+           latest start; tasks with less slack are placed first
+        2. Each task starts once its prerequisites (plus their buffer) are done
+           and every resource it needs has been released
+        3. Slack is computed on the leveled schedule, so a task whose delay
+           would push a dependent task or the next user of a resource
+           has less slack
+        
+        Tasks are placed in dependency order and none waits for anything but
+        an earlier-placed task, so the schedule never ends later than running
+        every task back to back.
+        
+        Args:
+            sorted_tasks: Tasks sorted by dependencies
+            graph: Dependency graph whose order sorted_tasks follows; its
+                adjacency lists are used instead of rebuilding them
+        
+        Returns:
+            SchedulePlan with start, finish and slack per task
+        """
+        count = len(sorted_tasks)
+        if graph is not None:
+            predecessors, successors = graph.predecessors, graph.successors
+        else:
+            predecessors, successors = self._build_dependency_graph(sorted_tasks)
+        plan = SchedulePlan(
+            tasks=list(sorted_tasks),
+            durations=[task.estimated_duration for task in sorted_tasks],
+            buffers=[self._calculate_buffer_time(task) for task in sorted_tasks],
+            predecessors=predecessors,
+            successors=successors,
+            resource_keys=[self._leveled_resources(task) for task in sorted_tasks],
+            starts=[timedelta(0)] * count,
+            finishes=[timedelta(0)] * count,
+            resource_predecessors=[[] for _ in range(count)],
+            resource_successors=[[] for _ in range(count)]
+        )
+        if not count:
+            return plan
+        durations, buffers = plan.durations, plan.buffers
+        
+        # CPM on dependencies alone
+        earliest_finish = [timedelta(0)] * count
+        for i in range(count):
+            earliest_start = max(
+                (earliest_finish[p] + buffers[p] for p in predecessors[i]), default=timedelta(0)
+            )
+            earliest_finish[i] = earliest_start + durations[i]
+        
+        horizon = max(earliest_finish)
+        latest_start = [timedelta(0)] * count
+        for i in reversed(range(count)):
+            latest_finish = min(
+                (latest_start[s] - buffers[i] for s in successors[i]), default=horizon
             )
+            latest_start[i] = latest_finish - durations[i]
+        
+        # Place ready tasks, least slack first; ties keep dependency order
+        remaining = [len(predecessors[i]) for i in range(count)]
+        ready = [(latest_start[i], i) for i in range(count) if not remaining[i]]
+        heapq.heapify(ready)
+        last_user: Dict[str, int] = {}  # resource key -> last task placed on it
+        
+        while ready:
+            _, i = heapq.heappop(ready)
             
-            # Calculate task end time
-            task_end_time = task_start_time + task.estimated_duration
+            for key in plan.resource_keys[i]:
+                holder = last_user.get(key)
+                if holder is not None:
+                    plan.resource_predecessors[i].append(holder)
+                    plan.resource_successors[holder].append(i)
+                last_user[key] = i
             
-            # Add buffer time
-            buffer_time = self._calculate_buffer_time(task)
+            self._place_task(plan, i)
+            plan.placement_order.append(i)
             
-            # Create TaskTimeline object
-            timeline = TaskTimeline(
-                task_id=task.task_id,
-                start_time=task_start_time,
-                end_time=task_end_time,
-                duration=task.estimated_duration,
-                buffer_time=buffer_time,
-                scheduling_constraints=self._extract_constraints(task)
+            for s in successors[i]:
+                remaining[s] -= 1
+                if not remaining[s]:
+                    heapq.heappush(ready, (latest_start[s], s))
+        
+        self._compute_slack(plan)
+        return plan
+    
+    def _place_task(self, plan: SchedulePlan, i: int) -> None:
+        """
+        Set a task's start and finish from its prerequisites and resource predecessors.
+        
+        Args:
+            plan: Schedule being built or updated; predecessors must be placed
+            i: Position of the task
+        """
+        task_start = max(
+            (plan.finishes[p] + plan.buffers[p] for p in plan.predecessors[i]), default=timedelta(0)
+        )
+        plan.waits_for.pop(i, None)
+        for holder in plan.resource_predecessors[i]:
+            if plan.finishes[holder] > task_start:
+                task_start = plan.finishes[holder]
+                plan.waits_for[i] = next(iter(plan.resource_keys[i] & plan.resource_keys[holder]))
+        
+        plan.starts[i] = task_start
+        plan.finishes[i] = task_start + plan.durations[i]
+    
+    def _compute_slack(self, plan: SchedulePlan) -> None:
+        """
+        Compute each task's slack on the leveled schedule.
+        
+        Dependency edges carry the buffer; handing a resource to its next
+        task does not.
+        
+        Args:
+            plan: Placed schedule; plan.slack is replaced
+        """
+        count = len(plan.tasks)
+        makespan = max(plan.finishes, default=timedelta(0))
+        latest_start = [timedelta(0)] * count
+        for i in reversed(plan.placement_order):
+            latest_finish = min(
+                [latest_start[s] - plan.buffers[i] for s in plan.successors[i]] +
+                [latest_start[s] for s in plan.resource_successors[i]],
+                default=makespan
             )
-            
-            task_timelines.append(timeline)
-            scheduled_tasks[task.task_id] = timeline
-            
-            # Update current time for next task (including buffer)
-            current_time = task_end_time + buffer_time
+            latest_start[i] = latest_finish - plan.durations[i]
+        
+        plan.slack = [max(latest_start[i] - plan.starts[i], timedelta(0)) for i in range(count)]
+    
+    def _timeline_from_plan(
+        self,
+        plan: SchedulePlan,
+        i: int,
+        start_time: datetime
+    ) -> TaskTimeline:
+        """
+        Build the TaskTimeline of one planned task.
+        
+        Args:
+            plan: Placed schedule with slack
+            i: Position of the task
+            start_time: Event start the plan's offsets are relative to
+        
+        Returns:
+            TaskTimeline object
+        """
+        task = plan.tasks[i]
+        constraints = self._extract_constraints(task)
+        if i in plan.waits_for:
+            constraints.append(f"Waits for {plan.waits_for[i]}")
+        
+        return TaskTimeline(
+            task_id=task.task_id,
+            start_time=start_time + plan.starts[i],
+            end_time=start_time + plan.finishes[i],
+            duration=plan.durations[i],
+            buffer_time=plan.buffers[i],
+            scheduling_constraints=constraints,
+            slack=plan.slack[i],
+            is_critical=plan.slack[i] == timedelta(0)
+        )
+    
+    def _build_dependency_graph(
+        self,
+        sorted_tasks: List[ConsolidatedTask]
+    ) -> Tuple[List[List[int]], List[List[int]]]:
+        """
+        Build predecessor and successor lists by position in sorted_tasks.
+        
+        Only edges pointing forward in the order are kept, which drops the
+        edges of dependency cycles the topological sort had to break.
+        
+        Args:
+            sorted_tasks: Tasks sorted by dependencies
         
-        return task_timelines
+        Returns:
+            (predecessors, successors), one list of positions per task
+        """
+        position = {task.task_id: i for i, task in enumerate(sorted_tasks)}
+        predecessors: List[List[int]] = []
+        successors: List[List[int]] = [[] for _ in sorted_tasks]
+        
+        for i, task in enumerate(sorted_tasks):
+            task_predecessors = sorted({
+                position[dependency_id] for dependency_id in task.dependencies
+                if position.get(dependency_id, i) < i
+            })
+            predecessors.append(task_predecessors)
+            for p in task_predecessors:
+                successors[p].append(i)
+        
+        return predecessors, successors
+    
+    def _leveled_resources(self, task: ConsolidatedTask) -> Set[str]:
+        """
+        Resources a task occupies while it runs.
+        
+        Every resource is held by one task at a time, the same way the
+        Conflict Check Tool treats a resource shared by overlapping tasks as
+        double-booked.
+        
+        Args:
+            task: Task to check
+        
+        Returns:
+            Set of "type:id" resource keys
+        """
+        return {
+            f"{resource.resource_type}:{resource.resource_id}"
+            for resource in task.resources_required
+        }
     
     def _get_event_start_time(
         self,
@@ -311,41 +504,6 @@ class TimelineCalculationTool:
             default_time = datetime.strptime(self.DEFAULT_START_TIME, "%H:%M").time()
             return datetime.combine(event_date.date(), default_time)
     
-    def _calculate_task_start_time(
-        self,
-        task: ConsolidatedTask,
-        scheduled_tasks: Dict[str, TaskTimeline],
-        current_time: datetime
-    ) -> datetime:
-        """
-        Calculate start time for a task based on its dependencies.
-        
-        Args:
-            task: Task to schedule
-            scheduled_tasks: Already scheduled tasks
-            current_time: Current scheduling time
-        
-        Returns:
-            Task start time
-        """
-        # If task has no dependencies, start at current time
-        if not task.dependencies:
-            return current_time
-        
-        # Find latest end time among dependencies
-        latest_dependency_end = current_time
-        
-        for dependency_id in task.dependencies:
-            if dependency_id in scheduled_tasks:
-                dep_timeline = scheduled_tasks[dependency_id]
-                dep_end_with_buffer = dep_timeline.end_time + dep_timeline.buffer_time
-                
-                if dep_end_with_buffer > latest_dependency_end:
-                    latest_dependency_end = dep_end_with_buffer
-        
-        # Task starts after all dependencies complete
-        return max(latest_dependency_end, current_time)
-    
     def _calculate_buffer_time(self, task: ConsolidatedTask) -> timedelta:
         """
         Calculate buffer time to add after task completion.
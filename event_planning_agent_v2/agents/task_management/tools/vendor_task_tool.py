@@ -13,17 +13,21 @@ Integrates with:
 - MCP vendor server (if available) for enhanced information
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from datetime import datetime
 
 from ..models.data_models import VendorAssignment, Resource
 from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
 from ..exceptions import ToolExecutionError
-from ....workflows.state_models import EventPlanningState
 from ....database.connection import get_connection_manager
 from ....database.models import Venue, Caterer, Photographer, MakeupArtist
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
 
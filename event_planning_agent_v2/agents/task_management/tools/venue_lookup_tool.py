@@ -11,19 +11,27 @@ Integrates with:
 - EventPlanningState.selected_combination for venue data
 - Database for detailed venue information
 - MCP vendor server (if available) for enhanced information
+
+When the agent passes the plan's LogisticsContext, the venue record it
+already holds is used instead of querying the database again.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from datetime import timedelta
 
 from ..models.data_models import VenueInfo
 from ..models.consolidated_models import ConsolidatedTask, ConsolidatedTaskData
 from ..exceptions import ToolExecutionError
-from ....workflows.state_models import EventPlanningState
+from .logistics_context import LogisticsContext, venue_record
 from ....database.connection import get_connection_manager
 from ....database.models import Venue
 
+if TYPE_CHECKING:
+    from ....workflows.state_models import EventPlanningState
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +47,12 @@ class VenueLookupTool:
     5. Flags tasks requiring venue selection
     """
     
+    VENUE_KEYWORDS = (
+        'venue', 'location', 'space', 'hall', 'room', 'setup', 'decoration',
+        'seating', 'layout', 'floor plan', 'site visit', 'capacity',
+        'equipment', 'facility', 'premises', 'site', 'place'
+    )
+    
     def __init__(self, db_connection=None, use_mcp: bool = True):
         """
         Initialize Venue Lookup Tool
@@ -72,7 +86,8 @@ class VenueLookupTool:
     def lookup_venues(
         self,
         consolidated_data: ConsolidatedTaskData,
-        state: EventPlanningState
+        state: EventPlanningState,
+        context: Optional[LogisticsContext] = None
     ) -> List[VenueInfo]:
         """
         Retrieve venue information for tasks
@@ -80,6 +95,7 @@ class VenueLookupTool:
         Args:
             consolidated_data: Consolidated task data from sub-agents
             state: Current EventPlanningState with selected_combination
+            context: Plan's venue and vendor context (venue queried here if None)
             
         Returns:
             List of VenueInfo objects
@@ -97,8 +113,11 @@ class VenueLookupTool:
                 logger.warning("No venue found in selected_combination")
                 return self._create_missing_venue_info(consolidated_data.tasks)
             
-            # Get detailed venue information from database
-            venue_details = self._get_venue_details(venue_data['vendor_id'])
+            # Get detailed venue information from the plan's context or the database
+            if context is not None:
+                venue_details = self._venue_details(context.venue) if context.venue else None
+            else:
+                venue_details = self._get_venue_details(venue_data['vendor_id'])
             
             if not venue_details:
                 logger.warning(f"Venue {venue_data['vendor_id']} not found in database")
@@ -195,83 +214,95 @@ class VenueLookupTool:
                     logger.warning(f"Venue {venue_id} not found in database")
                     return None
                 
-                # Extract venue details
-                details = {
-                    'vendor_id': str(venue.vendor_id),
-                    'name': venue.name,
-                    'venue_type': venue.area_type or 'General',
-                    'location_city': venue.location_city,
-                    'location_full': venue.location_full,
-                    'capacity': venue.max_seating_capacity or 0,
-                    'ideal_capacity': venue.ideal_capacity or 0,
-                    'room_count': venue.room_count or 1,
-                    'rental_cost': venue.rental_cost or 0,
-                    'room_cost': venue.room_cost or 0,
-                    'decor_options': venue.decor_options or {},
-                    'attributes': venue.attributes or {},
-                    'policies': venue.policies or {}
-                }
-                
-                # Extract available equipment from decor options and attributes
-                available_equipment = []
-                
-                # Add equipment from decor options
-                if isinstance(details['decor_options'], dict):
-                    available_equipment.extend(details['decor_options'].keys())
-                
-                # Add equipment from attributes
-                if isinstance(details['attributes'], dict):
-                    available_equipment.extend(details['attributes'].keys())
-                
-                details['available_equipment'] = list(set(available_equipment))
-                
-                # Extract setup/teardown times from policies or use defaults
-                policies = details['policies']
-                if isinstance(policies, dict):
-                    # Look for setup/teardown time information in policies
-                    setup_hours = policies.get('setup_time_hours', 2)
-                    teardown_hours = policies.get('teardown_time_hours', 1)
-                else:
-                    # Default values
-                    setup_hours = 2
-                    teardown_hours = 1
-                
-                details['setup_time_required'] = timedelta(hours=setup_hours)
-                details['teardown_time_required'] = timedelta(hours=teardown_hours)
-                
-                # Extract access restrictions from policies
-                access_restrictions = []
-                if isinstance(policies, dict):
-                    if policies.get('no_outside_decorators'):
-                        access_restrictions.append('No outside decorators allowed')
-                    if policies.get('no_outside_catering'):
-                        access_restrictions.append('No outside catering allowed')
-                    if policies.get('limited_setup_time'):
-                        access_restrictions.append('Limited setup time')
-                    if policies.get('noise_restrictions'):
-                        access_restrictions.append('Noise restrictions apply')
-                    if policies.get('parking_limited'):
-                        access_restrictions.append('Limited parking available')
-                    
-                    # Add any other restriction fields
-                    for key, value in policies.items():
-                        if 'restriction' in key.lower() and value:
-                            access_restrictions.append(f"{key.replace('_', ' ').title()}")
-                
-                details['access_restrictions'] = access_restrictions
-                
-                logger.debug(
-                    f"Retrieved venue details: {details['name']} "
-                    f"(capacity: {details['capacity']}, "
-                    f"equipment: {len(details['available_equipment'])})"
-                )
-                
-                return details
+                return self._venue_details(venue_record(venue))
                 
         except Exception as e:
             logger.error(f"Failed to query venue details: {e}")
             return None
     
+    def _venue_details(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive venue details (equipment, setup/teardown times, restrictions)
+        from a venue record
+        
+        Args:
+            record: Venue record (see logistics_context.venue_record)
+            
+        Returns:
+            Dictionary with detailed venue information
+        """
+        details = {
+            'vendor_id': record['vendor_id'],
+            'name': record['name'],
+            'venue_type': record.get('area_type') or 'General',
+            'location_city': record.get('location_city'),
+            'location_full': record.get('location_full'),
+            'capacity': record.get('max_seating_capacity') or 0,
+            'ideal_capacity': record.get('ideal_capacity') or 0,
+            'room_count': record.get('room_count') or 1,
+            'rental_cost': record.get('rental_cost') or 0,
+            'room_cost': record.get('room_cost') or 0,
+            'decor_options': record.get('decor_options') or {},
+            'attributes': record.get('attributes') or {},
+            'policies': record.get('policies') or {}
+        }
+        
+        # Extract available equipment from decor options and attributes
+        available_equipment = []
+        
+        # Add equipment from decor options
+        if isinstance(details['decor_options'], dict):
+            available_equipment.extend(details['decor_options'].keys())
+        
+        # Add equipment from attributes
+        if isinstance(details['attributes'], dict):
+            available_equipment.extend(details['attributes'].keys())
+        
+        details['available_equipment'] = list(set(available_equipment))
+        
+        # Extract setup/teardown times from policies or use defaults
+        policies = details['policies']
+        if isinstance(policies, dict):
+            # Look for setup/teardown time information in policies
+            setup_hours = policies.get('setup_time_hours', 2)
+            teardown_hours = policies.get('teardown_time_hours', 1)
+        else:
+            # Default values
+            setup_hours = 2
+            teardown_hours = 1
+        
+        details['setup_time_required'] = timedelta(hours=setup_hours)
+        details['teardown_time_required'] = timedelta(hours=teardown_hours)
+        
+        # Extract access restrictions from policies
+        access_restrictions = []
+        if isinstance(policies, dict):
+            if policies.get('no_outside_decorators'):
+                access_restrictions.append('No outside decorators allowed')
+            if policies.get('no_outside_catering'):
+                access_restrictions.append('No outside catering allowed')
+            if policies.get('limited_setup_time'):
+                access_restrictions.append('Limited setup time')
+            if policies.get('noise_restrictions'):
+                access_restrictions.append('Noise restrictions apply')
+            if policies.get('parking_limited'):
+                access_restrictions.append('Limited parking available')
+            
+            # Add any other restriction fields
+            for key, value in policies.items():
+                if 'restriction' in key.lower() and value:
+                    access_restrictions.append(f"{key.replace('_', ' ').title()}")
+        
+        details['access_restrictions'] = access_restrictions
+        
+        logger.debug(
+            f"Retrieved venue details: {details['name']} "
+            f"(capacity: {details['capacity']}, "
+            f"equipment: {len(details['available_equipment'])})"
+        )
+        
+        return details
+    
     def _check_mcp_vendor_server(
         self,
         venue_id: str,
@@ -326,13 +357,7 @@ class VenueLookupTool:
         # Check task name and description for venue-related keywords
         task_text = f"{task.task_name} {task.task_description}".lower()
         
-        venue_keywords = [
-            'venue', 'location', 'space', 'hall', 'room', 'setup', 'decoration',
-            'seating', 'layout', 'floor plan', 'site visit', 'capacity',
-            'equipment', 'facility', 'premises', 'site', 'place'
-        ]
-        
-        if any(keyword in task_text for keyword in venue_keywords):
+        if any(keyword in task_text for keyword in self.VENUE_KEYWORDS):
             return True
         
         # Check resource requirements
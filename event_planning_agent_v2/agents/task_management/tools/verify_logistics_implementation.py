@@ -25,6 +25,7 @@ def verify_implementation():
         from event_planning_agent_v2.agents.task_management.tools.logistics_check_tool import (
             LogisticsCheckTool
         )
+        from event_planning_agent_v2.agents.task_management.tools.logistics_context import LogisticsContext
         from event_planning_agent_v2.agents.task_management.models.data_models import (
             LogisticsStatus, Resource
         )
@@ -138,7 +139,7 @@ def verify_implementation():
             'max_seating_capacity': 500
         }
         
-        transport_result = tool._check_transportation(test_task, venue_info)
+        transport_result = tool._check_transportation(test_task, LogisticsContext(venue_info))
         assert 'status' in transport_result, "Missing status in transportation result"
         assert 'notes' in transport_result, "Missing notes in transportation result"
         assert 'issues' in transport_result, "Missing issues in transportation result"
@@ -146,14 +147,14 @@ def verify_implementation():
         
         # Test _check_equipment
         vendor_info = {}
-        equipment_result = tool._check_equipment(test_task, venue_info, vendor_info)
+        equipment_result = tool._check_equipment(test_task, LogisticsContext(venue_info, vendor_info))
         assert 'status' in equipment_result, "Missing status in equipment result"
         assert 'notes' in equipment_result, "Missing notes in equipment result"
         assert 'issues' in equipment_result, "Missing issues in equipment result"
         print("✓ _check_equipment() works correctly")
         
         # Test _check_setup_requirements
-        setup_result = tool._check_setup_requirements(test_task, venue_info)
+        setup_result = tool._check_setup_requirements(test_task, LogisticsContext(venue_info))
         assert 'status' in setup_result, "Missing status in setup result"
         assert 'notes' in setup_result, "Missing notes in setup result"
         assert 'issues' in setup_result, "Missing issues in setup result"
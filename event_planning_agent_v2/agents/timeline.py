@@ -13,6 +13,9 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+from ..config.settings import get_settings
+from ..llm.routing import LLMTaskClass, default_model_for
+
 # Import existing timeline tools
 from ..tools.timeline_tools import ConflictDetectionTool, TimelineGenerationTool
 
@@ -28,7 +31,7 @@ def create_timeline_agent() -> Agent:
         Agent: Configured CrewAI Timeline Agent
     """
     # Initialize Gemma-2B LLM for timeline planning
-    llm = OllamaLLM(model="gemma:2b")
+    llm = OllamaLLM(model=default_model_for(LLMTaskClass.GENERATION, get_settings().llm))
     
     # Initialize timeline tools (preserving existing logic)
     conflict_detection_tool = ConflictDetectionTool()
@@ -529,7 +532,7 @@ class TimelineAgentCoordinator:
         """
         return {
             'agent_type': 'timeline',
-            'llm_model': 'gemma:2b',
+            'llm_model': default_model_for(LLMTaskClass.GENERATION, get_settings().llm),
             'tools_available': ['ConflictDetectionTool', 'TimelineGenerationTool'],
             'timeline_cache_size': len(self.timeline_cache),
             'capabilities': [
@@ -6,9 +6,11 @@ from .routes import router
 from .middleware import (
     ErrorHandlingMiddleware, ObservabilityMiddleware, MetricsMiddleware,
     RateLimitingMiddleware, AuthenticationMiddleware, AuthorizationMiddleware,
-    RequestValidationMiddleware, HealthCheckMiddleware,
+    RequestValidationMiddleware, HealthCheckMiddleware, CompressionMiddleware,
+    RequestPipelineMiddleware,
     RateLimitConfig, AuthConfig,
-    add_cors_middleware, add_security_middleware, add_observability_middleware, add_all_middleware
+    add_cors_middleware, add_security_middleware, add_observability_middleware,
+    add_compression_middleware, add_all_middleware
 )
 from .schemas import (
     EventPlanRequest, EventPlanResponse, CombinationSelection,
@@ -29,6 +31,8 @@ __all__ = [
     "AuthorizationMiddleware",
     "RequestValidationMiddleware",
     "HealthCheckMiddleware",
+    "CompressionMiddleware",
+    "RequestPipelineMiddleware",
     
     # Middleware configuration
     "RateLimitConfig",
@@ -38,6 +42,7 @@ __all__ = [
     "add_cors_middleware",
     "add_security_middleware",
     "add_observability_middleware",
+    "add_compression_middleware",
     "add_all_middleware",
     
     # Schemas
@@ -68,21 +68,28 @@ def create_app() -> FastAPI:
         token_expiry_hours=getattr(settings, 'token_expiry_hours', 24)
     )
     
+    security_settings = getattr(settings, 'security', None)
     rate_limit_config = RateLimitConfig(
         enabled=getattr(settings, 'rate_limiting_enabled', True),
         requests_per_minute=getattr(settings, 'rate_limit_per_minute', 60),
         requests_per_hour=getattr(settings, 'rate_limit_per_hour', 1000),
-        burst_limit=getattr(settings, 'rate_limit_burst', 10)
+        burst_limit=getattr(settings, 'rate_limit_burst', 10),
+        backend=getattr(security_settings, 'rate_limit_backend', 'memory'),
+        redis_url=getattr(security_settings, 'rate_limit_redis_url', None)
     )
     
     cors_origins = getattr(settings, 'cors_origins', ["*"])
+    api_settings = getattr(settings, 'api', None)
     
     # Add all middleware
     add_all_middleware(
         app=app,
         auth_config=auth_config,
         rate_limit_config=rate_limit_config,
-        cors_origins=cors_origins
+        cors_origins=cors_origins,
+        compression_enabled=getattr(api_settings, 'compression_enabled', True),
+        compression_minimum_size=getattr(api_settings, 'compression_minimum_size', 1024),
+        compression_gzip_level=getattr(api_settings, 'compression_gzip_level', 6)
     )
     
     # Include routers
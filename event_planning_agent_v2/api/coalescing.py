@@ -0,0 +1,142 @@
+"""
+Single-flight coalescing of duplicate plan creation requests.
+
+Double-submitted forms and client retries after timeouts would otherwise start
+several identical planning workflows for the same client. The coalescer tracks
+in-flight plans by a canonical request fingerprint (or an explicit
+``Idempotency-Key`` header) so duplicates attach to the running plan instead.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..observability.logging import get_logger
+from ..observability.metrics import get_metrics_collector
+
+logger = get_logger(__name__, component="api_coalescing")
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+def fingerprint_request(client_request: Dict[str, Any]) -> str:
+    """
+    Build a canonical fingerprint for a plan request
+
+    Key order and whitespace do not affect the fingerprint, so the same form
+    submitted twice always maps to the same value.
+    """
+    canonical = json.dumps(client_request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_coalescing_key(
+    client_name: str,
+    client_request: Dict[str, Any],
+    idempotency_key: Optional[str] = None
+) -> str:
+    """
+    Build the key used to detect duplicate plan requests
+
+    An explicit idempotency key overrides the request fingerprint.
+    """
+    if idempotency_key:
+        return f"idempotency:{idempotency_key.strip()}"
+    return f"fingerprint:{client_name.strip().lower()}:{fingerprint_request(client_request)}"
+
+
+@dataclass
+class InflightPlan:
+    """A plan workflow currently running for a coalescing key"""
+    key: str
+    plan_id: str
+    future: asyncio.Future
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    subscribers: int = 0
+
+
+class PlanRequestCoalescer:
+    """
+    Tracks in-flight plan workflows so duplicate requests share one run.
+
+    State is per process; all access happens on the event loop, so no lock
+    is required.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, InflightPlan] = {}
+        self.metrics_collector = get_metrics_collector()
+
+    def get(self, key: str) -> Optional[InflightPlan]:
+        """Get the in-flight plan for a key, if any"""
+        return self._inflight.get(key)
+
+    def register(self, key: str, plan_id: str) -> InflightPlan:
+        """Register a new leader plan for a key"""
+        loop = asyncio.get_running_loop()
+        inflight = InflightPlan(key=key, plan_id=plan_id, future=loop.create_future())
+        self._inflight[key] = inflight
+        return inflight
+
+    def record_coalesced(self, inflight: InflightPlan, mode: str):
+        """Record that a duplicate request was attached to an in-flight plan"""
+        inflight.subscribers += 1
+        reason = "idempotency_key" if inflight.key.startswith("idempotency:") else "fingerprint"
+
+        self.metrics_collector.record_counter(
+            "api_plan_requests_coalesced",
+            1.0,
+            labels={"reason": reason, "mode": mode}
+        )
+
+        logger.info(
+            f"Coalesced duplicate plan request into running plan {inflight.plan_id}",
+            operation="plan_request_coalesced",
+            metadata={
+                "plan_id": inflight.plan_id,
+                "reason": reason,
+                "mode": mode,
+                "subscribers": inflight.subscribers
+            }
+        )
+
+    async def wait(self, inflight: InflightPlan, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for an in-flight plan to finish
+
+        The leader's future is shielded so a follower giving up never cancels
+        the shared run.
+        """
+        return await asyncio.wait_for(asyncio.shield(inflight.future), timeout)
+
+    def complete(self, key: str, result: Any = None, error: Optional[BaseException] = None):
+        """Resolve subscribers and release the key"""
+        inflight = self._inflight.pop(key, None)
+        if inflight is None or inflight.future.done():
+            return
+
+        if error is not None:
+            inflight.future.set_exception(error)
+            # Avoid "exception was never retrieved" warnings when nobody waited
+            inflight.future.exception()
+        else:
+            inflight.future.set_result(result)
+
+    def inflight_count(self) -> int:
+        """Number of plan workflows currently tracked"""
+        return len(self._inflight)
+
+
+# Global coalescer instance
+_plan_coalescer: Optional[PlanRequestCoalescer] = None
+
+
+def get_plan_coalescer() -> PlanRequestCoalescer:
+    """Get global plan request coalescer"""
+    global _plan_coalescer
+    if _plan_coalescer is None:
+        _plan_coalescer = PlanRequestCoalescer()
+    return _plan_coalescer
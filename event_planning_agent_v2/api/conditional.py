@@ -0,0 +1,96 @@
+"""
+Conditional GET support for plan resources.
+
+Dashboards poll plan status every few seconds and almost always receive the
+same payload back. Plans carry a monotonically increasing ``revision`` that is
+bumped on every save, so a weak ETag can be derived from
+``(plan_id, updated_at, revision)`` without loading or serializing the plan.
+Clients echo it back in ``If-None-Match`` and get an empty ``304`` when nothing
+changed.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+
+from ..observability.metrics import get_metrics_collector
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+CACHE_CONTROL_VALUE = "no-cache"
+
+
+def compute_etag(
+    plan_id: str,
+    updated_at: Optional[datetime],
+    revision: int,
+    variant: Optional[str] = None,
+    live_status: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Compute a weak ETag for a plan representation
+
+    Args:
+        plan_id: Plan identifier
+        updated_at: Last modification time of the plan row
+        revision: Plan revision counter
+        variant: Representation variant (e.g. query options)
+        live_status: In-memory workflow status included in the response, if any
+
+    Returns:
+        Weak entity tag, quoted
+    """
+    stamp = updated_at.isoformat() if updated_at else ""
+    parts = [plan_id, stamp, str(revision), variant or ""]
+    if live_status is not None:
+        parts.append(json.dumps(live_status, sort_keys=True, default=str))
+
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag
+
+    Uses weak comparison, as required for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = _opaque(etag)
+    return any(_opaque(candidate) == target for candidate in if_none_match.split(","))
+
+
+def not_modified_response(etag: str, endpoint: str) -> Response:
+    """Build an empty 304 response and record the cache hit"""
+    get_metrics_collector().record_counter(
+        "api_conditional_requests",
+        1.0,
+        labels={"endpoint": endpoint, "result": "not_modified"}
+    )
+    return Response(
+        status_code=304,
+        headers={ETAG_HEADER: etag, "Cache-Control": CACHE_CONTROL_VALUE}
+    )
+
+
+def set_etag_headers(response: Response, etag: str, endpoint: str):
+    """Attach validator headers to a full response and record the miss"""
+    get_metrics_collector().record_counter(
+        "api_conditional_requests",
+        1.0,
+        labels={"endpoint": endpoint, "result": "full"}
+    )
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL_VALUE
@@ -1,19 +1,22 @@
 """
 FastAPI middleware for Event Planning Agent v2 with comprehensive observability,
 authentication, authorization, rate limiting, and CORS support
+
+All middleware are raw ASGI callables, so stacking them costs a function call
+per layer rather than a task and memory stream per layer, and streaming
+responses pass through unbuffered.
 """
 
 import time
 import uuid
 import json
 import hashlib
-from typing import Callable, Dict, Optional, Set
-from datetime import datetime, timedelta
-from collections import defaultdict
+import zlib
+from typing import Dict, Optional, Set
 from fastapi import Request, Response, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 import jwt
 from pydantic import BaseModel
 
@@ -26,21 +29,35 @@ from ..error_handling.handlers import ErrorHandlerFactory, ErrorContext
 from ..error_handling.exceptions import EventPlanningError
 from ..error_handling.monitoring import get_error_monitor
 from ..config.settings import get_settings
+from .rate_limiting import create_rate_limiter
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
 
 logger = get_logger(__name__, component="api_middleware")
 security = HTTPBearer(auto_error=False)
 
 
-class ObservabilityMiddleware(BaseHTTPMiddleware):
+class ObservabilityMiddleware:
     """Comprehensive observability middleware with tracing, logging, and metrics"""
     
     def __init__(self, app):
-        super().__init__(app)
+        self.app = app
         self.tracer = get_tracer()
         self.metrics_collector = get_metrics_collector()
         self.error_monitor = get_error_monitor()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        
         # Extract or generate correlation ID
         correlation_id = request.headers.get("X-Correlation-Id")
         if not correlation_id:
@@ -86,59 +103,13 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                     }
                 )
                 
-                # Process request
-                response = await call_next(request)
-                
-                # Calculate response time
-                response_time_ms = (time.time() - start_time) * 1000
-                
-                # Add observability headers
-                response.headers["X-Correlation-Id"] = correlation_id
-                response.headers["X-Response-Time"] = f"{response_time_ms:.2f}ms"
-                
-                # Inject trace context into response headers
-                inject_trace_context(dict(response.headers))
-                
-                # Set span tags
-                span.set_tag("http.status_code", response.status_code)
-                span.set_tag("response_time_ms", response_time_ms)
-                
-                # Record metrics
-                self.metrics_collector.record_timer(
-                    "api_request_duration",
-                    response_time_ms,
-                    labels={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": str(response.status_code)
-                    }
-                )
-                
-                self.metrics_collector.record_counter(
-                    "api_requests_total",
-                    1.0,
-                    labels={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": str(response.status_code)
-                    }
-                )
-                
-                # Log request completion
-                logger.info(
-                    f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-                    operation="request_complete",
-                    performance={
-                        "duration_ms": response_time_ms,
-                        "success": response.status_code < 400
-                    },
-                    metadata={
-                        "status_code": response.status_code,
-                        "response_size": response.headers.get("content-length", "unknown")
-                    }
-                )
+                async def send_wrapper(message):
+                    if message["type"] == "http.response.start":
+                        self._on_response_start(request, message, span, correlation_id, start_time)
+                    await send(message)
                 
-                return response
+                # Process request
+                await self.app(scope, receive, send_wrapper)
                 
             except Exception as exc:
                 response_time_ms = (time.time() - start_time) * 1000
@@ -184,22 +155,93 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
                 
                 # Re-raise to be handled by error middleware
                 raise
+    
+    def _on_response_start(self, request: Request, message, span, correlation_id: str, start_time: float):
+        """Add observability headers and record metrics once the response status is known"""
+        status_code = message["status"]
+        
+        # Calculate response time
+        response_time_ms = (time.time() - start_time) * 1000
+        
+        # Add observability headers
+        headers = MutableHeaders(scope=message)
+        headers["X-Correlation-Id"] = correlation_id
+        headers["X-Response-Time"] = f"{response_time_ms:.2f}ms"
+        
+        # Inject trace context into response headers
+        inject_trace_context(dict(headers))
+        
+        # Set span tags
+        span.set_tag("http.status_code", status_code)
+        span.set_tag("response_time_ms", response_time_ms)
+        
+        # Record metrics
+        self.metrics_collector.record_timer(
+            "api_request_duration",
+            response_time_ms,
+            labels={
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": str(status_code)
+            }
+        )
+        
+        self.metrics_collector.record_counter(
+            "api_requests_total",
+            1.0,
+            labels={
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": str(status_code)
+            }
+        )
+        
+        # Log request completion
+        logger.info(
+            f"Request completed: {request.method} {request.url.path} - {status_code}",
+            operation="request_complete",
+            performance={
+                "duration_ms": response_time_ms,
+                "success": status_code < 400
+            },
+            metadata={
+                "status_code": status_code,
+                "response_size": headers.get("content-length", "unknown")
+            }
+        )
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Enhanced error handling middleware with recovery strategies"""
     
     def __init__(self, app):
-        super().__init__(app)
+        self.app = app
         self.error_handler = ErrorHandlerFactory.create_default_chain()
         self.error_monitor = get_error_monitor()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
             
         except Exception as exc:
+            # Headers already went out; nothing sensible can be sent any more
+            if response_started:
+                raise
+            
+            request = Request(scope)
+            
             # Create error context
             correlation_id = getattr(request.state, 'correlation_id', None) or ensure_correlation_id()
             
@@ -256,7 +298,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             # Add observability headers
             response.headers["X-Correlation-Id"] = correlation_id
             
-            return response
+            await response(scope, receive, send)
     
     def _get_status_code_for_error(self, error: EventPlanningError) -> int:
         """Map error types to HTTP status codes"""
@@ -279,84 +321,86 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             return 500
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """Middleware for collecting API metrics"""
     
     def __init__(self, app):
-        super().__init__(app)
+        self.app = app
         self.metrics_collector = get_metrics_collector()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        labels = {"method": scope["method"], "path": scope["path"]}
+        
         # Record request start
-        self.metrics_collector.record_counter(
-            "api_requests_in_progress",
-            1.0,
-            labels={"method": request.method, "path": request.url.path}
-        )
+        self.metrics_collector.record_counter("api_requests_in_progress", 1.0, labels=labels)
         
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
         finally:
             # Record request end
-            self.metrics_collector.record_counter(
-                "api_requests_in_progress",
-                -1.0,
-                labels={"method": request.method, "path": request.url.path}
-            )
+            self.metrics_collector.record_counter("api_requests_in_progress", -1.0, labels=labels)
+
+
+HEALTH_CHECK_PATHS = frozenset({"/health", "/healthz", "/health/live", "/health/ready"})
 
 
-class HealthCheckMiddleware(BaseHTTPMiddleware):
+class HealthCheckMiddleware:
     """Middleware for health check endpoints"""
     
     def __init__(self, app):
-        super().__init__(app)
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
         # Handle health check endpoints directly
-        if request.url.path in ["/health", "/healthz", "/health/live", "/health/ready"]:
-            from ..observability.health import get_health_checker
-            
-            health_checker = get_health_checker()
-            
-            if request.url.path in ["/health", "/healthz"]:
-                # Full health check
-                system_health = health_checker.get_system_health()
-                
-                status_code = 200 if system_health.overall_status.value in ["healthy", "warning"] else 503
-                
-                return Response(
-                    content=system_health.to_json(),
-                    status_code=status_code,
-                    media_type="application/json"
-                )
-            
-            elif request.url.path == "/health/live":
-                # Liveness check - just return OK if service is running
-                return Response(
-                    content='{"status": "alive"}',
-                    status_code=200,
-                    media_type="application/json"
-                )
-            
-            elif request.url.path == "/health/ready":
-                # Readiness check - check if service is ready to handle requests
-                system_health = health_checker.get_system_health()
-                
-                ready = system_health.overall_status.value != "critical"
-                status_code = 200 if ready else 503
-                
-                return Response(
-                    content=json.dumps({
-                        "status": "ready" if ready else "not_ready",
-                        "overall_status": system_health.overall_status.value
-                    }),
-                    status_code=status_code,
-                    media_type="application/json"
-                )
+        if scope["type"] == "http" and scope["path"] in HEALTH_CHECK_PATHS:
+            response = self.health_response(scope["path"])
+            await response(scope, receive, send)
+            return
         
         # Continue with normal request processing
-        return await call_next(request)
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    def health_response(path: str) -> Response:
+        """Build the response for a health check path"""
+        if path == "/health/live":
+            # Liveness check - just return OK if service is running
+            return Response(
+                content='{"status": "alive"}',
+                status_code=200,
+                media_type="application/json"
+            )
+        
+        from ..observability.health import get_health_checker
+        
+        system_health = get_health_checker().get_system_health()
+        
+        if path == "/health/ready":
+            # Readiness check - check if service is ready to handle requests
+            ready = system_health.overall_status.value != "critical"
+            status_code = 200 if ready else 503
+            
+            return Response(
+                content=json.dumps({
+                    "status": "ready" if ready else "not_ready",
+                    "overall_status": system_health.overall_status.value
+                }),
+                status_code=status_code,
+                media_type="application/json"
+            )
+        
+        # Full health check
+        status_code = 200 if system_health.overall_status.value in ["healthy", "warning"] else 503
+        
+        return Response(
+            content=system_health.to_json(),
+            status_code=status_code,
+            media_type="application/json"
+        )
 
 
 class RateLimitConfig(BaseModel):
@@ -365,6 +409,8 @@ class RateLimitConfig(BaseModel):
     requests_per_hour: int = 1000
     burst_limit: int = 10
     enabled: bool = True
+    backend: str = "memory"  # "memory" (per process) or "redis" (shared across workers)
+    redis_url: Optional[str] = None
 
 
 class AuthConfig(BaseModel):
@@ -377,25 +423,34 @@ class AuthConfig(BaseModel):
     public_paths: Set[str] = {"/", "/health", "/healthz", "/health/live", "/health/ready", "/docs", "/openapi.json"}
 
 
-class RateLimitingMiddleware(BaseHTTPMiddleware):
+class RateLimitingMiddleware:
     """Rate limiting middleware with sliding window algorithm"""
     
     def __init__(self, app, config: Optional[RateLimitConfig] = None):
-        super().__init__(app)
+        self.app = app
         self.config = config or RateLimitConfig()
-        self.request_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        self.request_times: Dict[str, list] = defaultdict(list)
+        self.limiter = create_rate_limiter(
+            self.config.requests_per_minute,
+            self.config.requests_per_hour,
+            self.config.burst_limit,
+            backend=self.config.backend,
+            redis_url=self.config.redis_url
+        )
         self.metrics_collector = get_metrics_collector()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not self.config.enabled:
-            return await call_next(request)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.config.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
         
         # Get client identifier (IP address or authenticated user)
         client_id = self._get_client_id(request)
         
-        # Check rate limits
-        if self._is_rate_limited(client_id, request):
+        # Check rate limits and record the request if allowed
+        decision = await self.limiter.acquire(client_id)
+        if not decision.allowed:
             # Record rate limit hit
             self.metrics_collector.record_counter(
                 "api_rate_limit_hits",
@@ -403,7 +458,8 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
                 labels={
                     "client_id": client_id,
                     "path": request.url.path,
-                    "method": request.method
+                    "method": request.method,
+                    "window": decision.exceeded_window
                 }
             )
             
@@ -417,7 +473,7 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
                 }
             )
             
-            return Response(
+            response = Response(
                 content=json.dumps({
                     "error": {
                         "type": "RateLimitExceeded",
@@ -433,19 +489,19 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
                 },
                 media_type="application/json"
             )
+            await response(scope, receive, send)
+            return
         
-        # Record request
-        self._record_request(client_id)
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Add rate limit headers
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self.config.requests_per_minute)
+                headers["X-RateLimit-Remaining"] = str(decision.remaining)
+            await send(message)
         
         # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        remaining = self._get_remaining_requests(client_id)
-        response.headers["X-RateLimit-Limit"] = str(self.config.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        
-        return response
+        await self.app(scope, receive, send_wrapper)
     
     def _get_client_id(self, request: Request) -> str:
         """Get client identifier for rate limiting"""
@@ -467,96 +523,23 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
             client_ip = forwarded_for.split(",")[0].strip()
         
         return f"ip:{client_ip}"
-    
-    def _is_rate_limited(self, client_id: str, request: Request) -> bool:
-        """Check if client is rate limited"""
-        now = datetime.utcnow()
-        
-        # Clean old entries
-        self._cleanup_old_entries(client_id, now)
-        
-        # Check minute limit
-        minute_key = now.strftime("%Y-%m-%d-%H-%M")
-        minute_count = self.request_counts[client_id][minute_key]
-        
-        if minute_count >= self.config.requests_per_minute:
-            return True
-        
-        # Check hour limit
-        hour_key = now.strftime("%Y-%m-%d-%H")
-        hour_count = sum(
-            count for key, count in self.request_counts[client_id].items()
-            if key.startswith(hour_key)
-        )
-        
-        if hour_count >= self.config.requests_per_hour:
-            return True
-        
-        # Check burst limit
-        recent_requests = [
-            t for t in self.request_times[client_id]
-            if (now - t).total_seconds() < 10  # Last 10 seconds
-        ]
-        
-        if len(recent_requests) >= self.config.burst_limit:
-            return True
-        
-        return False
-    
-    def _record_request(self, client_id: str):
-        """Record a request for rate limiting"""
-        now = datetime.utcnow()
-        
-        # Record in minute bucket
-        minute_key = now.strftime("%Y-%m-%d-%H-%M")
-        self.request_counts[client_id][minute_key] += 1
-        
-        # Record timestamp for burst detection
-        self.request_times[client_id].append(now)
-        
-        # Keep only recent timestamps
-        cutoff = now - timedelta(seconds=10)
-        self.request_times[client_id] = [
-            t for t in self.request_times[client_id] if t > cutoff
-        ]
-    
-    def _cleanup_old_entries(self, client_id: str, now: datetime):
-        """Clean up old rate limiting entries"""
-        # Remove entries older than 1 hour
-        cutoff = now - timedelta(hours=1)
-        cutoff_key = cutoff.strftime("%Y-%m-%d-%H-%M")
-        
-        keys_to_remove = [
-            key for key in self.request_counts[client_id].keys()
-            if key < cutoff_key
-        ]
-        
-        for key in keys_to_remove:
-            del self.request_counts[client_id][key]
-    
-    def _get_remaining_requests(self, client_id: str) -> int:
-        """Get remaining requests for client"""
-        now = datetime.utcnow()
-        minute_key = now.strftime("%Y-%m-%d-%H-%M")
-        used = self.request_counts[client_id][minute_key]
-        return max(0, self.config.requests_per_minute - used)
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+class AuthenticationMiddleware:
     """JWT-based authentication middleware"""
     
     def __init__(self, app, config: Optional[AuthConfig] = None):
-        super().__init__(app)
+        self.app = app
         self.config = config or AuthConfig()
         self.metrics_collector = get_metrics_collector()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not self.config.enabled:
-            return await call_next(request)
-        
+    async def __call__(self, scope, receive, send):
         # Check if path requires authentication
-        if not self._requires_auth(request.url.path):
-            return await call_next(request)
+        if scope["type"] != "http" or not self.config.enabled or not self._requires_auth(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
         
         # Extract and validate token
         auth_result = self._authenticate_request(request)
@@ -580,7 +563,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 }
             )
             
-            return Response(
+            response = Response(
                 content=json.dumps({
                     "error": {
                         "type": "AuthenticationError",
@@ -591,6 +574,8 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 headers={"WWW-Authenticate": "Bearer"},
                 media_type="application/json"
             )
+            await response(scope, receive, send)
+            return
         
         # Add user info to request state
         request.state.user = auth_result["user"]
@@ -602,7 +587,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             labels={"path": request.url.path}
         )
         
-        return await call_next(request)
+        await self.app(scope, receive, send)
     
     def _requires_auth(self, path: str) -> bool:
         """Check if path requires authentication"""
@@ -689,11 +674,11 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             }
 
 
-class AuthorizationMiddleware(BaseHTTPMiddleware):
+class AuthorizationMiddleware:
     """Role-based authorization middleware"""
     
     def __init__(self, app):
-        super().__init__(app)
+        self.app = app
         self.metrics_collector = get_metrics_collector()
         
         # Define path permissions
@@ -712,11 +697,13 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
             "viewer": ["read:plans"]
         }
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
         # Skip authorization if no user (authentication middleware handles this)
-        if not hasattr(request.state, "user"):
-            return await call_next(request)
+        if scope["type"] != "http" or "user" not in scope.get("state", {}):
+            await self.app(scope, receive, send)
+            return
         
+        request = Request(scope)
         user = request.state.user
         
         # Check if user has required permissions
@@ -742,7 +729,7 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
                 }
             )
             
-            return Response(
+            response = Response(
                 content=json.dumps({
                     "error": {
                         "type": "AuthorizationError",
@@ -752,8 +739,10 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
                 status_code=403,
                 media_type="application/json"
             )
+            await response(scope, receive, send)
+            return
         
-        return await call_next(request)
+        await self.app(scope, receive, send)
     
     def _is_authorized(self, request: Request, user: Dict[str, any]) -> bool:
         """Check if user is authorized for the request"""
@@ -788,14 +777,27 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
         return set()
 
 
-class RequestValidationMiddleware(BaseHTTPMiddleware):
+class RequestValidationMiddleware:
     """Request validation middleware using Pydantic models"""
     
     def __init__(self, app):
-        super().__init__(app)
+        self.app = app
         self.metrics_collector = get_metrics_collector()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response = self._validate(Request(scope))
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
+    
+    def _validate(self, request: Request) -> Optional[Response]:
+        """Return an error response if the request is invalid, None otherwise"""
         # Validate request size
         content_length = request.headers.get("content-length")
         if content_length:
@@ -831,7 +833,212 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
                     media_type="application/json"
                 )
         
-        return await call_next(request)
+        return None
+
+
+class CompressionMiddleware:
+    """
+    Response compression middleware (gzip, and brotli when installed)
+    
+    Implemented as a raw ASGI middleware so streamed responses are compressed
+    chunk by chunk instead of being buffered. Bodies smaller than
+    ``minimum_size``, already-encoded responses, 304s and server-sent events
+    are passed through untouched.
+    """
+    
+    COMPRESSIBLE_TYPES = (
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "application/x-ndjson",
+        "text/",
+    )
+    
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.metrics_collector = get_metrics_collector()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = self._select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        compressor = None
+        passthrough = False
+        raw_bytes = 0
+        sent_bytes = 0
+        
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough, raw_bytes, sent_bytes
+            
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message.get("headers", []))
+                passthrough = (
+                    message["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or not self._is_compressible(headers.get("content-type", ""))
+                )
+                if passthrough:
+                    await send(message)
+                return
+            
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    # Small single-chunk body: not worth compressing
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                
+                compressor = self._create_compressor(encoding)
+                headers = MutableHeaders(raw=start_message.setdefault("headers", []))
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "content-length" in headers:
+                    del headers["content-length"]
+                
+                if not more_body:
+                    compressed = compressor.compress(body) + compressor.flush()
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    self._record(encoding, len(body), len(compressed))
+                    return
+                
+                await send(start_message)
+            
+            raw_bytes += len(body)
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.flush()
+            sent_bytes += len(chunk)
+            
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            if not more_body:
+                self._record(encoding, raw_bytes, sent_bytes)
+        
+        await self.app(scope, receive, send_wrapper)
+    
+    def _select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """Pick the preferred supported encoding from an Accept-Encoding header"""
+        accepted = {}
+        for part in accept_encoding.lower().split(","):
+            token, _, params = part.strip().partition(";")
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            if token:
+                accepted[token] = quality
+        
+        if BROTLI_AVAILABLE and accepted.get("br", 0) > 0:
+            return "br"
+        if accepted.get("gzip", 0) > 0:
+            return "gzip"
+        return None
+    
+    def _is_compressible(self, content_type: str) -> bool:
+        """Check whether a content type is worth compressing"""
+        content_type = content_type.lower()
+        if content_type.startswith("text/event-stream"):
+            return False
+        return content_type.startswith(self.COMPRESSIBLE_TYPES)
+    
+    def _create_compressor(self, encoding: str):
+        """Create an incremental compressor for the selected encoding"""
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    
+    def _record(self, encoding: str, raw_size: int, compressed_size: int):
+        """Record bytes before and after compression"""
+        labels = {"encoding": encoding}
+        self.metrics_collector.record_counter("api_response_bytes_uncompressed", float(raw_size), labels=labels)
+        self.metrics_collector.record_counter("api_response_bytes_sent", float(compressed_size), labels=labels)
+
+
+class _BrotliCompressor:
+    """Adapts brotli's streaming compressor to the zlib compressobj interface"""
+    
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+STATIC_PATHS = frozenset({"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json", "/favicon.ico"})
+STATIC_PATH_PREFIXES = ("/static/",)
+
+
+class RequestPipelineMiddleware:
+    """
+    Single composed middleware running the full request pipeline
+    
+    Stages run in the same order as when they were added one by one:
+    rate limiting, authentication, authorization, request validation,
+    observability, error handling, metrics and health checks. Health checks
+    and static documentation routes are answered on a fast path that skips
+    every other stage.
+    """
+    
+    def __init__(
+        self,
+        app,
+        auth_config: Optional[AuthConfig] = None,
+        rate_limit_config: Optional[RateLimitConfig] = None
+    ):
+        self.app = app
+        
+        # Compose from the innermost stage outwards
+        pipeline = HealthCheckMiddleware(app)
+        pipeline = MetricsMiddleware(pipeline)
+        pipeline = ErrorHandlingMiddleware(pipeline)
+        pipeline = ObservabilityMiddleware(pipeline)
+        pipeline = RequestValidationMiddleware(pipeline)
+        pipeline = AuthorizationMiddleware(pipeline)
+        pipeline = AuthenticationMiddleware(pipeline, auth_config)
+        pipeline = RateLimitingMiddleware(pipeline, rate_limit_config)
+        self.pipeline = pipeline
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            
+            if path in HEALTH_CHECK_PATHS:
+                response = HealthCheckMiddleware.health_response(path)
+                await response(scope, receive, send)
+                return
+            
+            if path in STATIC_PATHS or path.startswith(STATIC_PATH_PREFIXES):
+                await self.app(scope, receive, send)
+                return
+        
+        await self.pipeline(scope, receive, send)
 
 
 # Convenience functions to add middleware
@@ -876,21 +1083,37 @@ def add_observability_middleware(app):
     logger.info("Added observability middleware to FastAPI app")
 
 
+def add_compression_middleware(app, minimum_size: int = 1024, gzip_level: int = 6):
+    """Add response compression middleware to FastAPI app"""
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size, gzip_level=gzip_level)
+    
+    encodings = "br, gzip" if BROTLI_AVAILABLE else "gzip"
+    logger.info(f"Added compression middleware ({encodings}, minimum size {minimum_size} bytes)")
+
+
 def add_all_middleware(
     app,
     auth_config: Optional[AuthConfig] = None,
     rate_limit_config: Optional[RateLimitConfig] = None,
-    cors_origins: Optional[list] = None
+    cors_origins: Optional[list] = None,
+    compression_enabled: bool = True,
+    compression_minimum_size: int = 1024,
+    compression_gzip_level: int = 6
 ):
     """Add all middleware to FastAPI app in correct order"""
     
     # Add CORS first (outermost)
     add_cors_middleware(app, cors_origins)
     
-    # Add observability middleware
-    add_observability_middleware(app)
+    # Add security and observability middleware as one pipeline
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        auth_config=auth_config,
+        rate_limit_config=rate_limit_config
+    )
     
-    # Add security middleware (innermost)
-    add_security_middleware(app, auth_config, rate_limit_config)
+    # Add compression last so it wraps every response, including errors
+    if compression_enabled:
+        add_compression_middleware(app, compression_minimum_size, compression_gzip_level)
     
     logger.info("Added all middleware to FastAPI app")
\ No newline at end of file
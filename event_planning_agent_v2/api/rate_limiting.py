@@ -0,0 +1,267 @@
+"""
+Sliding-window rate limiting backends for the API.
+
+Every client is checked against three windows at once: a short burst window,
+a per-minute window and a per-hour window. Each window is a fixed-size ring
+of time buckets, so a check costs the same regardless of traffic and the
+memory per client never grows.
+
+The in-memory backend is per process. The Redis backend runs the same
+algorithm in one atomic Lua script, so limits hold across all workers.
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BURST_WINDOW_SECONDS = 10
+
+
+@dataclass(frozen=True)
+class WindowSpec:
+    """A sliding window split into equal buckets"""
+    name: str
+    window_seconds: int
+    bucket_seconds: int
+    limit: int
+
+    @property
+    def bucket_count(self) -> int:
+        return max(1, self.window_seconds // self.bucket_seconds)
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of a rate limit check"""
+    allowed: bool
+    remaining: int
+    exceeded_window: Optional[str] = None
+
+
+def build_window_specs(requests_per_minute: int, requests_per_hour: int, burst_limit: int) -> List[WindowSpec]:
+    """
+    Build the window specs for a rate limit configuration
+
+    The minute window is the first spec; its count drives X-RateLimit-Remaining.
+    """
+    return [
+        WindowSpec("minute", 60, 1, requests_per_minute),
+        WindowSpec("hour", 3600, 60, requests_per_hour),
+        WindowSpec("burst", BURST_WINDOW_SECONDS, 1, burst_limit),
+    ]
+
+
+class SlidingWindowCounter:
+    """
+    Ring buffer of per-bucket counts covering one sliding window
+
+    A running total is maintained, so counting and recording are O(1);
+    advancing the clock clears at most ``bucket_count`` expired buckets.
+    """
+
+    __slots__ = ("bucket_seconds", "bucket_count", "counts", "current_bucket", "total")
+
+    def __init__(self, window_seconds: int, bucket_seconds: int):
+        self.bucket_seconds = bucket_seconds
+        self.bucket_count = max(1, window_seconds // bucket_seconds)
+        self.counts = [0] * self.bucket_count
+        self.current_bucket: Optional[int] = None
+        self.total = 0
+
+    def _advance(self, now: float):
+        """Expire buckets that have slid out of the window"""
+        bucket = int(now // self.bucket_seconds)
+        if self.current_bucket is None:
+            self.current_bucket = bucket
+            return
+
+        elapsed = bucket - self.current_bucket
+        if elapsed <= 0:
+            return
+
+        if elapsed >= self.bucket_count:
+            self.counts = [0] * self.bucket_count
+            self.total = 0
+        else:
+            for step in range(1, elapsed + 1):
+                index = (self.current_bucket + step) % self.bucket_count
+                self.total -= self.counts[index]
+                self.counts[index] = 0
+        self.current_bucket = bucket
+
+    def count(self, now: float) -> int:
+        """Number of events inside the window ending at ``now``"""
+        self._advance(now)
+        return self.total
+
+    def record(self, now: float):
+        """Record one event at ``now``"""
+        self._advance(now)
+        self.counts[self.current_bucket % self.bucket_count] += 1
+        self.total += 1
+
+
+class InMemoryRateLimiter:
+    """Per-process sliding-window rate limiter"""
+
+    def __init__(self, windows: List[WindowSpec], max_clients: int = 10000, clock=time.time):
+        self.windows = windows
+        self.max_clients = max_clients
+        self.clock = clock
+        self._clients: "OrderedDict[str, List[SlidingWindowCounter]]" = OrderedDict()
+
+    def _counters(self, client_id: str) -> List[SlidingWindowCounter]:
+        """Get the counters for a client, evicting the least recently seen client if full"""
+        counters = self._clients.get(client_id)
+        if counters is None:
+            counters = [SlidingWindowCounter(w.window_seconds, w.bucket_seconds) for w in self.windows]
+            self._clients[client_id] = counters
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client_id)
+        return counters
+
+    def hit(self, client_id: str) -> RateLimitDecision:
+        """Check the limits for a client and record the request if allowed"""
+        now = self.clock()
+        counters = self._counters(client_id)
+
+        for window, counter in zip(self.windows, counters):
+            if counter.count(now) >= window.limit:
+                return RateLimitDecision(allowed=False, remaining=0, exceeded_window=window.name)
+
+        for counter in counters:
+            counter.record(now)
+
+        return RateLimitDecision(allowed=True, remaining=max(0, self.windows[0].limit - counters[0].total))
+
+    async def acquire(self, client_id: str) -> RateLimitDecision:
+        """Async entry point shared with the Redis backend"""
+        return self.hit(client_id)
+
+    def client_count(self) -> int:
+        """Number of clients currently tracked"""
+        return len(self._clients)
+
+
+# Checks every window, then records in all of them only if none is exhausted.
+# KEYS: one hash per window. ARGV: now, then (window_seconds, bucket_seconds,
+# limit) per window. Hash fields are bucket indexes, values are counts.
+SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local totals = {}
+for i = 1, #KEYS do
+    local base = 2 + (i - 1) * 3
+    local window = tonumber(ARGV[base])
+    local bucket = tonumber(ARGV[base + 1])
+    local limit = tonumber(ARGV[base + 2])
+    local current = math.floor(now / bucket)
+    local oldest = current - math.floor(window / bucket) + 1
+    local entries = redis.call('HGETALL', KEYS[i])
+    local total = 0
+    for j = 1, #entries, 2 do
+        if tonumber(entries[j]) < oldest then
+            redis.call('HDEL', KEYS[i], entries[j])
+        else
+            total = total + tonumber(entries[j + 1])
+        end
+    end
+    if total >= limit then
+        return {0, i, total}
+    end
+    totals[i] = total
+end
+for i = 1, #KEYS do
+    local base = 2 + (i - 1) * 3
+    local window = tonumber(ARGV[base])
+    local bucket = tonumber(ARGV[base + 1])
+    redis.call('HINCRBY', KEYS[i], math.floor(now / bucket), 1)
+    redis.call('EXPIRE', KEYS[i], window + bucket)
+end
+return {1, 0, totals[1] + 1}
+"""
+
+
+class RedisRateLimiter:
+    """
+    Sliding-window rate limiter shared by all workers through Redis
+
+    If Redis is unreachable the request is checked against a local
+    in-memory limiter instead, so an outage degrades to per-worker limits
+    rather than rejecting or admitting everything.
+    """
+
+    KEY_PREFIX = "api:ratelimit:"
+
+    def __init__(self, windows: List[WindowSpec], redis_url: str, client=None, clock=time.time):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis package is required for the Redis rate limit backend")
+            client = redis_asyncio.from_url(redis_url)
+
+        self.windows = windows
+        self.client = client
+        self.clock = clock
+        self.script = client.register_script(SLIDING_WINDOW_LUA)
+        self.fallback = InMemoryRateLimiter(windows, clock=clock)
+
+    def _keys_and_args(self, client_id: str) -> Tuple[List[str], List]:
+        keys = [f"{self.KEY_PREFIX}{client_id}:{w.name}" for w in self.windows]
+        args: List = [self.clock()]
+        for window in self.windows:
+            args.extend([window.window_seconds, window.bucket_seconds, window.limit])
+        return keys, args
+
+    async def acquire(self, client_id: str) -> RateLimitDecision:
+        """Atomically check and record a request for a client"""
+        keys, args = self._keys_and_args(client_id)
+
+        try:
+            allowed, window_index, count = await self.script(keys=keys, args=args)
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, using local limits: {e}")
+            return self.fallback.hit(client_id)
+
+        if not int(allowed):
+            return RateLimitDecision(
+                allowed=False,
+                remaining=0,
+                exceeded_window=self.windows[int(window_index) - 1].name
+            )
+
+        return RateLimitDecision(allowed=True, remaining=max(0, self.windows[0].limit - int(count)))
+
+
+def create_rate_limiter(
+    requests_per_minute: int,
+    requests_per_hour: int,
+    burst_limit: int,
+    backend: str = "memory",
+    redis_url: Optional[str] = None
+):
+    """
+    Create a rate limiter for the configured backend
+
+    Falls back to the in-memory backend when Redis is requested but not
+    configured or not installed.
+    """
+    windows = build_window_specs(requests_per_minute, requests_per_hour, burst_limit)
+
+    if backend == "redis":
+        if redis_url and REDIS_AVAILABLE:
+            return RedisRateLimiter(windows, redis_url)
+        logger.warning("Redis rate limit backend requested but unavailable, using in-memory limits")
+
+    return InMemoryRateLimiter(windows)
@@ -3,25 +3,32 @@ FastAPI routes for Event Planning Agent v2
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Header, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import uuid4
 import asyncio
+import copy
 
 from .schemas import (
     EventPlanRequest, EventPlanResponse, CombinationSelection,
     ErrorResponse, HealthResponse, PlanListResponse, AsyncTaskResponse,
-    PlanStatus, WorkflowStatus, EventCombination
+    PlanStatus, WorkflowStatus, EventCombination, TaskStatusUpdate, ConflictResolution
 )
 from ..workflows.execution_engine import (
     get_execution_engine, ExecutionConfig, ExecutionMode,
     execute_event_planning_workflow, get_workflow_status,
     resume_event_planning_workflow, cancel_workflow
 )
-from ..database.state_manager import get_state_manager
+from ..database.state_manager import get_state_manager, encode_plan_cursor, decode_plan_cursor
+from ..agents.task_management.tools.incremental_scheduler import get_plan_schedule_cache
 from ..config.settings import get_settings
+from ..observability.progress import get_progress_broker, progress_channel, publish_progress
+from .coalescing import get_plan_coalescer, build_coalescing_key, IDEMPOTENCY_KEY_HEADER
+from .conditional import (
+    compute_etag, etag_matches, not_modified_response, set_etag_headers, IF_NONE_MATCH_HEADER
+)
 from .crew_integration import (
     execute_event_planning, generate_event_blueprint,
     get_planning_workflow_status, cancel_planning_workflow,
@@ -31,6 +38,9 @@ from .crew_integration import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Idle interval after which plan event streams send a keep-alive comment
+SSE_HEARTBEAT_SECONDS = 15.0
+
 # Dependency to get settings
 def get_app_settings():
     return get_settings()
@@ -107,6 +117,11 @@ async def create_plan(
     request: EventPlanRequest,
     background_tasks: BackgroundTasks,
     async_execution: bool = Query(False, description="Execute workflow asynchronously"),
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        description="Explicit key for deduplicating retried plan requests"
+    ),
     settings = Depends(get_app_settings),
     state_manager = Depends(get_db_state_manager)
 ):
@@ -115,16 +130,38 @@ async def create_plan(
     
     Maintains compatibility with existing request/response format while
     integrating with CrewAI and LangGraph workflow execution.
+    
+    Duplicate requests (same client and canonical request, or the same
+    Idempotency-Key header) attach to the plan already running instead of
+    starting another workflow.
     """
     try:
+        # Convert request to internal format
+        client_request = request.dict()
+        
+        # Coalesce with an identical in-flight plan if there is one
+        coalescer = get_plan_coalescer()
+        coalescing_key = build_coalescing_key(request.clientName, client_request, idempotency_key)
+        inflight = coalescer.get(coalescing_key)
+        
+        if inflight:
+            coalescer.record_coalesced(inflight, "async" if async_execution else "sync")
+            
+            if not async_execution:
+                try:
+                    result = await coalescer.wait(inflight, timeout=300.0)
+                    if isinstance(result, EventPlanResponse):
+                        return result
+                except asyncio.TimeoutError:
+                    logger.warning(f"Timed out waiting for coalesced plan {inflight.plan_id}")
+            
+            return _build_inflight_plan_response(inflight.plan_id, state_manager)
+        
         # Generate plan ID
         plan_id = str(uuid4())
         
         logger.info(f"Creating event plan {plan_id} for client {request.clientName}")
         
-        # Convert request to internal format
-        client_request = request.dict()
-        
         # Create initial plan record
         initial_plan = {
             "plan_id": plan_id,
@@ -147,6 +184,7 @@ async def create_plan(
         
         # Save initial state
         state_manager.save_plan(initial_plan)
+        coalescer.register(coalescing_key, plan_id)
         
         if async_execution:
             # Execute workflow asynchronously
@@ -162,7 +200,8 @@ async def create_plan(
                 client_request,
                 plan_id,
                 execution_config,
-                state_manager
+                state_manager,
+                coalescing_key
             )
             
             # Return immediate response
@@ -188,15 +227,29 @@ async def create_plan(
                 enable_checkpointing=True
             )
             
-            # Execute workflow using CrewAI integration
-            result = execute_event_planning(
-                client_request=client_request,
-                plan_id=plan_id,
-                async_execution=False
-            )
+            response = None
+            error = None
+            try:
+                # Execute workflow using CrewAI integration off the event loop
+                # so duplicate requests can be coalesced while it runs
+                result = await asyncio.to_thread(
+                    execute_event_planning,
+                    client_request=client_request,
+                    plan_id=plan_id,
+                    async_execution=False
+                )
+                
+                # Convert result to response format
+                response = _convert_execution_result_to_response(result, state_manager)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                # Also reached when the client disconnects and this request is
+                # cancelled; followers then read the stored plan state
+                coalescer.complete(coalescing_key, response, error=error)
             
-            # Convert result to response format
-            return _convert_execution_result_to_response(result, state_manager)
+            return response
             
     except Exception as e:
         logger.error(f"Failed to create plan: {e}")
@@ -213,7 +266,13 @@ async def create_plan(
 @router.get("/v1/plans/{plan_id}", response_model=EventPlanResponse)
 async def get_plan(
     plan_id: str,
+    response: Response,
     include_workflow_details: bool = Query(False, description="Include detailed workflow status"),
+    if_none_match: Optional[str] = Header(
+        None,
+        alias=IF_NONE_MATCH_HEADER,
+        description="ETag from a previous response; returns 304 if the plan is unchanged"
+    ),
     state_manager = Depends(get_db_state_manager)
 ):
     """
@@ -221,10 +280,26 @@ async def get_plan(
     
     Provides comprehensive plan status including workflow execution details,
     agent performance metrics, and real-time progress updates.
+    
+    Responses carry a weak ETag derived from the plan revision. Pollers that
+    send it back in If-None-Match get an empty 304 while the plan is unchanged,
+    without the plan being loaded or serialized.
     """
     try:
         logger.info(f"Retrieving plan {plan_id}")
         
+        variant = "details" if include_workflow_details else "plan"
+        execution_status = get_planning_workflow_status(plan_id) if include_workflow_details else None
+        
+        # Cheap version check before loading the full plan
+        version = state_manager.get_plan_version(plan_id)
+        etag = None
+        if isinstance(version, tuple):
+            updated_at, revision = version
+            etag = compute_etag(plan_id, updated_at, revision, variant, execution_status)
+            if etag_matches(if_none_match, etag):
+                return not_modified_response(etag, "get_plan")
+        
         # Load plan from database
         plan_data = state_manager.load_plan(plan_id)
         if not plan_data:
@@ -236,10 +311,16 @@ async def get_plan(
                 ).dict()
             )
         
+        if etag is None and "revision" in plan_data:
+            etag = compute_etag(
+                plan_id, plan_data.get("updated_at"), plan_data["revision"], variant, execution_status
+            )
+        if etag is not None:
+            set_etag_headers(response, etag, "get_plan")
+        
         # Get workflow status if available
         workflow_status = None
         if include_workflow_details:
-            execution_status = get_planning_workflow_status(plan_id)
             if execution_status:
                 workflow_status = WorkflowStatus(
                     current_step=execution_status.get("status", "unknown"),
@@ -283,6 +364,45 @@ async def get_plan(
         )
 
 
+@router.get("/v1/plans/{plan_id}/events")
+async def stream_plan_events(
+    plan_id: str,
+    request: Request,
+    state_manager = Depends(get_db_state_manager)
+):
+    """
+    Stream plan progress as server-sent events
+    
+    Emits streamed LLM output (task and timeline enhancement), blueprint
+    sections as they are generated, and plan status changes, so clients can
+    render previews without polling the plan.
+    """
+    if state_manager.get_plan_version(plan_id) is None:
+        raise HTTPException(
+            status_code=404,
+            detail=ErrorResponse(
+                error="plan_not_found",
+                message=f"Event plan {plan_id} not found"
+            ).dict()
+        )
+    
+    broker = get_progress_broker()
+    
+    async def event_stream():
+        with broker.subscribe(plan_id) as subscription:
+            yield ": connected\n\n"
+            async for event in subscription.events(heartbeat=SSE_HEARTBEAT_SECONDS):
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n" if event is None else event.to_sse()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/v1/plans/{plan_id}/select-combination", response_model=EventPlanResponse)
 async def select_combination(
     plan_id: str,
@@ -395,9 +515,27 @@ async def list_plans(
     page_size: int = Query(10, ge=1, le=100, description="Page size"),
     status: Optional[PlanStatus] = Query(None, description="Filter by status"),
     client_name: Optional[str] = Query(None, description="Filter by client name"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page (overrides page)"),
     state_manager = Depends(get_db_state_manager)
 ):
-    """List event plans with pagination and filtering"""
+    """
+    List event plans with pagination and filtering
+    
+    Served from the plan summary projection; pass the returned next_cursor
+    to page with keyset pagination instead of offsets.
+    """
+    if cursor:
+        try:
+            decode_plan_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=ErrorResponse(
+                    error="invalid_cursor",
+                    message=str(e)
+                ).dict()
+            )
+    
     try:
         # Build filters
         filters = {}
@@ -410,7 +548,8 @@ async def list_plans(
         plans_data, total_count = state_manager.list_plans(
             page=page,
             page_size=page_size,
-            filters=filters
+            filters=filters,
+            cursor=cursor
         )
         
         # Convert to response format
@@ -432,11 +571,17 @@ async def list_plans(
                 updated_at=plan_data.get("updated_at", datetime.utcnow())
             ))
         
+        # Keyset cursor for the next page
+        next_cursor = None
+        if len(plans_data) == page_size and isinstance(plans_data[-1].get("created_at"), datetime):
+            next_cursor = encode_plan_cursor(plans_data[-1]["created_at"], plans_data[-1]["plan_id"])
+        
         return PlanListResponse(
             plans=plans,
             total_count=total_count,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor
         )
         
     except Exception as e:
@@ -566,16 +711,193 @@ async def cancel_plan(
         )
 
 
+@router.post("/api/task-management/plans/{plan_id}/tasks/{task_id}/status")
+async def update_task_status(
+    plan_id: str,
+    task_id: str,
+    update: TaskStatusUpdate,
+    background_tasks: BackgroundTasks,
+    state_manager = Depends(get_db_state_manager)
+):
+    """
+    Update a task's status in the plan's extended task list
+    
+    Completing a task (with completed_at) or revising its duration
+    reschedules only the tasks downstream of it and re-checks overlaps only
+    for the tasks that moved.
+    """
+    scheduler, state = _load_plan_schedule(plan_id, state_manager)
+    try:
+        result = scheduler.update_task_status(
+            task_id,
+            update.status,
+            update.completed_at,
+            duration=timedelta(minutes=update.duration_minutes) if update.duration_minutes is not None else None
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail=ErrorResponse(
+                error="task_not_found",
+                message=f"Task {task_id} not found in plan {plan_id}"
+            ).dict()
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                error="invalid_task_status",
+                message=str(e),
+                details={"plan_id": plan_id, "task_id": task_id}
+            ).dict()
+        )
+    
+    scheduler.patch_extended_task_list(state['extended_task_list'], result)
+    edit = get_plan_schedule_cache().record_edit(plan_id)
+    background_tasks.add_task(_save_plan_schedule_state, plan_id, state, copy.deepcopy(state), edit, state_manager)
+    
+    response = _schedule_update_response(plan_id, scheduler, result)
+    response.update({"task_id": task_id, "status": update.status})
+    return response
+
+
+@router.post("/api/task-management/plans/{plan_id}/conflicts/{conflict_id}/resolve")
+async def resolve_conflict(
+    plan_id: str,
+    conflict_id: str,
+    resolution: ConflictResolution,
+    background_tasks: BackgroundTasks,
+    state_manager = Depends(get_db_state_manager)
+):
+    """
+    Resolve any conflict stored in the plan's extended task list
+    
+    Resource, venue and timeline conflicts are marked resolved. Revised task
+    durations carried by the resolution reschedule only the tasks downstream
+    of them.
+    """
+    scheduler, state = _load_plan_schedule(plan_id, state_manager)
+    try:
+        result = scheduler.resolve_conflict(conflict_id, resolution.dict())
+    except KeyError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=ErrorResponse(
+                error="conflict_not_found",
+                message=f"Conflict or task {e} not found in plan {plan_id}",
+                details={"plan_id": plan_id, "conflict_id": conflict_id}
+            ).dict()
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                error="invalid_conflict_resolution",
+                message=str(e),
+                details={"plan_id": plan_id, "conflict_id": conflict_id}
+            ).dict()
+        )
+    
+    scheduler.patch_extended_task_list(state['extended_task_list'], result)
+    edit = get_plan_schedule_cache().record_edit(plan_id)
+    background_tasks.add_task(_save_plan_schedule_state, plan_id, state, copy.deepcopy(state), edit, state_manager)
+    
+    response = _schedule_update_response(plan_id, scheduler, result)
+    response.update({"conflict_id": conflict_id, "resolution_status": "resolved"})
+    return response
+
+
+def _load_plan_schedule(plan_id: str, state_manager):
+    """Scheduler and workflow state of a plan with an extended task list, or 404"""
+    entry = get_plan_schedule_cache().get(
+        plan_id, state_manager.load_workflow_state, lambda pid: _plan_revision(pid, state_manager)
+    )
+    if entry is None:
+        raise HTTPException(
+            status_code=404,
+            detail=ErrorResponse(
+                error="task_list_not_found",
+                message=f"No extended task list found for plan {plan_id}"
+            ).dict()
+        )
+    return entry
+
+
+def _plan_revision(plan_id: str, state_manager) -> Optional[int]:
+    """Current revision of a plan, or None if it cannot be read"""
+    version = state_manager.get_plan_version(plan_id)
+    return version[1] if version else None
+
+
+def _schedule_update_response(plan_id: str, scheduler, result) -> Dict[str, Any]:
+    """JSON body describing what an incremental schedule update changed"""
+    return {
+        "plan_id": plan_id,
+        "moved_tasks": [
+            {
+                "task_id": t.task_id,
+                "start_time": t.start_time.isoformat(),
+                "end_time": t.end_time.isoformat(),
+                "slack_minutes": t.slack.total_seconds() / 60 if t.slack is not None else None,
+                "is_critical": t.is_critical
+            }
+            for t in result.moved_timelines
+        ],
+        "new_conflicts": [
+            {
+                "conflict_id": c.conflict_id,
+                "conflict_type": c.conflict_type,
+                "severity": c.severity,
+                "affected_tasks": c.affected_tasks,
+                "conflict_description": c.conflict_description
+            }
+            for c in result.new_conflicts
+        ],
+        "cleared_conflicts": result.cleared_conflicts,
+        "critical_path": scheduler.critical_path(),
+        "elapsed_ms": round(result.elapsed_ms, 3)
+    }
+
+
+def _save_plan_schedule_state(
+    plan_id: str,
+    cached_state: Dict[str, Any],
+    snapshot: Dict[str, Any],
+    edit: int,
+    state_manager
+):
+    """
+    Persist an incrementally updated workflow state
+    
+    Saves a snapshot taken when the request finished, since later edits keep
+    mutating the cached state while this runs in the threadpool. The cache
+    saves a plan's snapshots one at a time and skips any older than one
+    already saved.
+    """
+    def save_state(state: Dict[str, Any]) -> bool:
+        try:
+            return bool(state_manager.save_workflow_state(state))
+        except Exception as e:
+            logger.error(f"Failed to save updated task list for plan {plan_id}: {e}")
+            return False
+    
+    get_plan_schedule_cache().save(plan_id, cached_state, snapshot, edit, save_state)
+
+
 # Background task functions
 async def _execute_workflow_background(
     client_request: Dict[str, Any],
     plan_id: str,
     config: ExecutionConfig,
-    state_manager
+    state_manager,
+    coalescing_key: Optional[str] = None
 ):
     """Execute workflow in background"""
     try:
-        result = execute_event_planning(client_request, plan_id, async_execution=True)
+        with progress_channel(plan_id):
+            result = await asyncio.to_thread(
+                execute_event_planning, client_request, plan_id, async_execution=True
+            )
         
         # Update plan with results
         plan_data = state_manager.load_plan(plan_id)
@@ -589,6 +911,7 @@ async def _execute_workflow_background(
             
             plan_data["updated_at"] = datetime.utcnow()
             state_manager.save_plan(plan_data)
+            publish_progress("plan_status", {"status": plan_data["status"]}, channel=plan_id)
             
     except Exception as e:
         logger.error(f"Background workflow execution failed for plan {plan_id}: {e}")
@@ -599,6 +922,11 @@ async def _execute_workflow_background(
             plan_data["error_message"] = str(e)
             plan_data["updated_at"] = datetime.utcnow()
             state_manager.save_plan(plan_data)
+        publish_progress("plan_status", {"status": PlanStatus.FAILED.value}, channel=plan_id)
+    finally:
+        # Release coalesced followers; they read the stored plan state
+        if coalescing_key:
+            get_plan_coalescer().complete(coalescing_key)
 
 
 async def _resume_workflow_background(
@@ -634,8 +962,10 @@ async def _generate_blueprint_background(
 ):
     """Generate blueprint in background"""
     try:
-        # Use CrewAI Blueprint Agent to generate blueprint
-        blueprint = generate_event_blueprint(plan_id, selected_combination)
+        # Use CrewAI Blueprint Agent to generate blueprint; sections are
+        # streamed to the plan's event stream as they are produced
+        with progress_channel(plan_id):
+            blueprint = await asyncio.to_thread(generate_event_blueprint, plan_id, selected_combination)
         
         # Fallback to simple blueprint if agent fails
         if not blueprint:
@@ -661,11 +991,48 @@ Generated on: {datetime.utcnow().isoformat()}
             plan_data["status"] = PlanStatus.COMPLETED.value
             plan_data["updated_at"] = datetime.utcnow()
             state_manager.save_plan(plan_data)
+            publish_progress("plan_status", {"status": plan_data["status"], "blueprint_ready": True}, channel=plan_id)
             
     except Exception as e:
         logger.error(f"Blueprint generation failed for plan {plan_id}: {e}")
 
 
+def _build_inflight_plan_response(plan_id: str, state_manager) -> EventPlanResponse:
+    """Build a response for a coalesced request from the stored plan state"""
+    plan_data = state_manager.load_plan(plan_id) or {}
+    
+    try:
+        status = PlanStatus(plan_data.get("status") or PlanStatus.PROCESSING.value)
+    except ValueError:
+        status = PlanStatus.PROCESSING
+    if status == PlanStatus.PENDING:
+        status = PlanStatus.PROCESSING
+    
+    workflow_status = None
+    if status == PlanStatus.PROCESSING:
+        workflow_status = WorkflowStatus(
+            current_step="in_progress",
+            progress_percentage=5.0,
+            steps_completed=["plan_created"]
+        )
+    
+    selected_combination = None
+    if plan_data.get("selected_combination"):
+        selected_combination = EventCombination(**plan_data["selected_combination"])
+    
+    return EventPlanResponse(
+        plan_id=plan_id,
+        status=status,
+        client_name=plan_data.get("client_name", "Unknown"),
+        combinations=[EventCombination(**c) for c in plan_data.get("combinations", [])],
+        selected_combination=selected_combination,
+        final_blueprint=plan_data.get("final_blueprint"),
+        workflow_status=workflow_status,
+        created_at=plan_data.get("created_at", datetime.utcnow()),
+        updated_at=plan_data.get("updated_at", datetime.utcnow())
+    )
+
+
 def _convert_execution_result_to_response(result, state_manager) -> EventPlanResponse:
     """Convert execution result to API response"""
     plan_data = state_manager.load_plan(result.plan_id)
@@ -145,6 +145,31 @@ class CombinationSelection(BaseModel):
     client_feedback: Optional[Dict[str, Any]] = Field(None, description="Client feedback")
 
 
+class TaskStatusUpdate(BaseModel):
+    """Schema for updating a task's status in an extended task list"""
+    status: str = Field(..., description="New status: pending, in_progress, completed or blocked")
+    completed_at: Optional[datetime] = Field(None, description="When a completed task finished")
+    duration_minutes: Optional[float] = Field(None, gt=0, description="Revised task duration in minutes")
+
+
+class ConflictResolution(BaseModel):
+    """Schema for resolving a task management conflict"""
+    title: Optional[str] = Field(None, description="Resolution title")
+    description: Optional[str] = Field(None, description="Resolution description")
+    steps: List[str] = Field(default_factory=list, description="Resolution steps")
+    task_durations: Dict[str, float] = Field(
+        default_factory=dict, description="Revised task durations in minutes, by task ID"
+    )
+    
+    @validator('task_durations')
+    def validate_task_durations(cls, v):
+        """Revised durations must be positive"""
+        for task_id, minutes in v.items():
+            if minutes <= 0:
+                raise ValueError(f"Duration of task {task_id} must be greater than 0 minutes")
+        return v
+
+
 class ErrorResponse(BaseModel):
     """Error response schema"""
     error: str = Field(..., description="Error type")
@@ -167,6 +192,7 @@ class PlanListResponse(BaseModel):
     total_count: int = Field(..., description="Total number of plans")
     page: int = Field(default=1, description="Current page number")
     page_size: int = Field(default=10, description="Page size")
+    next_cursor: Optional[str] = Field(None, description="Keyset cursor for the next page")
 
 
 class AsyncTaskResponse(BaseModel):
@@ -98,6 +98,11 @@ class APISettings(BaseSettings):
         env="CORS_HEADERS"
     )
     
+    # Response compression
+    compression_enabled: bool = Field(default=True, env="API_COMPRESSION_ENABLED")
+    compression_minimum_size: int = Field(default=1024, env="API_COMPRESSION_MINIMUM_SIZE", ge=0)
+    compression_gzip_level: int = Field(default=6, env="API_COMPRESSION_GZIP_LEVEL", ge=1, le=9)
+    
     @field_validator('cors_origins', mode='before')
     @classmethod
     def parse_cors_origins(cls, v):
@@ -122,6 +127,8 @@ class SecuritySettings(BaseSettings):
     rate_limit_per_minute: int = Field(default=60, env="RATE_LIMIT_PER_MINUTE", ge=1)
     rate_limit_per_hour: int = Field(default=1000, env="RATE_LIMIT_PER_HOUR", ge=1)
     rate_limit_burst: int = Field(default=10, env="RATE_LIMIT_BURST", ge=1)
+    rate_limit_backend: str = Field(default="memory", env="RATE_LIMIT_BACKEND")  # memory or redis
+    rate_limit_redis_url: Optional[str] = Field(default=None, env="RATE_LIMIT_REDIS_URL")
     
     # Security Headers
     enable_security_headers: bool = Field(default=True, env="ENABLE_SECURITY_HEADERS")
@@ -151,6 +158,7 @@ class LLMSettings(BaseSettings):
     ollama_base_url: AnyHttpUrl = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
     gemma_model: str = Field(default="gemma:2b", env="GEMMA_MODEL")
     tinyllama_model: str = Field(default="tinyllama", env="TINYLLAMA_MODEL")
+    enable_model_routing: bool = Field(default=True, env="LLM_ENABLE_MODEL_ROUTING")  # Short classification/extraction tries tinyllama first
     
     # Model loading and caching optimizations
     model_timeout: int = Field(default=180, env="MODEL_TIMEOUT", ge=30, le=1800)  # Reduced from 300s
@@ -162,11 +170,33 @@ class LLMSettings(BaseSettings):
     enable_response_cache: bool = Field(default=True, env="LLM_ENABLE_RESPONSE_CACHE")
     response_cache_size: int = Field(default=2000, env="LLM_RESPONSE_CACHE_SIZE", ge=100, le=10000)
     response_cache_ttl: int = Field(default=1800, env="LLM_RESPONSE_CACHE_TTL", ge=300, le=7200)  # 30 minutes
+    enable_disk_cache: bool = Field(default=True, env="LLM_ENABLE_DISK_CACHE")
+    disk_cache_path: str = Field(default="cache/llm_responses.sqlite3", env="LLM_DISK_CACHE_PATH")
+    disk_cache_max_entries: int = Field(default=20000, env="LLM_DISK_CACHE_MAX_ENTRIES", ge=100)
+    disk_cache_warm_entries: int = Field(default=500, env="LLM_DISK_CACHE_WARM_ENTRIES", ge=0)  # Loaded into memory at startup
     
     # Batch processing
     enable_batch_processing: bool = Field(default=True, env="LLM_ENABLE_BATCH_PROCESSING")
     batch_size: int = Field(default=5, env="LLM_BATCH_SIZE", ge=1, le=20)
     batch_timeout: int = Field(default=60, env="LLM_BATCH_TIMEOUT", ge=10, le=300)
+    model_concurrency: int = Field(default=4, env="LLM_MODEL_CONCURRENCY", ge=1, le=32)  # Initial in-flight requests per model
+    
+    # Adaptive concurrency (AIMD on latency and errors, per model)
+    adaptive_concurrency: bool = Field(default=True, env="LLM_ADAPTIVE_CONCURRENCY")
+    concurrency_min_limit: int = Field(default=1, env="LLM_CONCURRENCY_MIN_LIMIT", ge=1, le=32)
+    concurrency_max_limit: int = Field(default=16, env="LLM_CONCURRENCY_MAX_LIMIT", ge=1, le=128)
+    concurrency_latency_tolerance: float = Field(default=2.0, env="LLM_CONCURRENCY_LATENCY_TOLERANCE", ge=1.1, le=10.0)
+    priority_starvation_timeout: float = Field(default=10.0, env="LLM_PRIORITY_STARVATION_TIMEOUT", ge=0.1, le=600.0)  # Max wait before any class is served
+    
+    # Multi-task prompt packing (several tasks per prompt, JSON array back)
+    enable_prompt_packing: bool = Field(default=True, env="LLM_ENABLE_PROMPT_PACKING")
+    max_tasks_per_prompt: int = Field(default=8, env="LLM_MAX_TASKS_PER_PROMPT", ge=1, le=50)
+    gemma_context_window: int = Field(default=8192, env="GEMMA_CONTEXT_WINDOW", ge=512, le=131072)  # Tokens, sent as num_ctx
+    tinyllama_context_window: int = Field(default=2048, env="TINYLLAMA_CONTEXT_WINDOW", ge=512, le=131072)
+    
+    # Per-task fan-out in the task-management sub-agents and tools
+    task_fanout_concurrency: int = Field(default=8, env="LLM_TASK_FANOUT_CONCURRENCY", ge=1, le=64)
+    task_fanout_deadline: float = Field(default=600.0, env="LLM_TASK_FANOUT_DEADLINE", ge=1.0, le=7200.0)  # Whole batch, seconds
     
     # Connection optimization
     max_connections: int = Field(default=10, env="LLM_MAX_CONNECTIONS", ge=1, le=50)
@@ -177,6 +207,12 @@ class LLMSettings(BaseSettings):
     use_gpu: bool = Field(default=True, env="LLM_USE_GPU")
     gpu_memory_fraction: float = Field(default=0.8, env="LLM_GPU_MEMORY_FRACTION", ge=0.1, le=1.0)
     
+    def context_window_for(self, model: str) -> int:
+        """Context window in tokens for a model name"""
+        if model == self.tinyllama_model:
+            return self.tinyllama_context_window
+        return self.gemma_context_window
+    
     class Config:
         env_prefix = "LLM_"
 
@@ -43,7 +43,9 @@ class TaskManagementConfig:
     enable_timeline_calculation: bool = True
     
     # Processing Settings
-    parallel_tool_execution: bool = False  # Sequential by default
+    parallel_tool_execution: bool = True  # Independent tools run concurrently
+    pipeline_sub_agents: bool = True  # Stream tasks through the sub-agents instead of whole-list passes
+    sub_agent_queue_size: int = 32  # Bound on tasks buffered between pipelined sub-agents
     
     # Logging Configuration
     log_level: str = LogLevel.INFO.value
@@ -84,6 +86,8 @@ class TaskManagementConfig:
             "enable_vendor_assignment": self.enable_vendor_assignment,
             "enable_timeline_calculation": self.enable_timeline_calculation,
             "parallel_tool_execution": self.parallel_tool_execution,
+            "pipeline_sub_agents": self.pipeline_sub_agents,
+            "sub_agent_queue_size": self.sub_agent_queue_size,
             "log_level": self.log_level,
             "enable_debug_logging": self.enable_debug_logging,
             "enable_performance_logging": self.enable_performance_logging,
@@ -129,6 +133,10 @@ class TaskManagementConfig:
         if self.cache_ttl_seconds < 0:
             raise ValueError("cache_ttl_seconds must be non-negative")
         
+        # Validate pipeline buffer
+        if self.sub_agent_queue_size < 1:
+            raise ValueError("sub_agent_queue_size must be at least 1")
+        
         return True
 
 
@@ -170,7 +178,7 @@ PRODUCTION_CONFIG = TaskManagementConfig(
     enable_venue_lookup=True,
     enable_vendor_assignment=True,
     enable_timeline_calculation=True,
-    parallel_tool_execution=False,
+    parallel_tool_execution=True,
     log_level=LogLevel.INFO.value,
     enable_debug_logging=False,
     enable_performance_logging=True,
@@ -239,6 +247,8 @@ def load_config_from_env() -> TaskManagementConfig:
         TASK_MGMT_ENABLE_LOGISTICS_CHECK: Enable logistics check (true/false)
         TASK_MGMT_ENABLE_VENUE_LOOKUP: Enable venue lookup (true/false)
         TASK_MGMT_PARALLEL_EXECUTION: Enable parallel tool execution (true/false)
+        TASK_MGMT_PIPELINE_SUB_AGENTS: Enable pipelined sub-agent execution (true/false)
+        TASK_MGMT_SUB_AGENT_QUEUE_SIZE: Tasks buffered between pipelined sub-agents
         TASK_MGMT_LOG_LEVEL: Logging level (DEBUG/INFO/WARNING/ERROR/CRITICAL)
     
     Returns:
@@ -275,6 +285,12 @@ def load_config_from_env() -> TaskManagementConfig:
     if os.getenv("TASK_MGMT_PARALLEL_EXECUTION"):
         config.parallel_tool_execution = os.getenv("TASK_MGMT_PARALLEL_EXECUTION", "false").lower() == "true"
     
+    if os.getenv("TASK_MGMT_PIPELINE_SUB_AGENTS"):
+        config.pipeline_sub_agents = os.getenv("TASK_MGMT_PIPELINE_SUB_AGENTS", "true").lower() == "true"
+    
+    if os.getenv("TASK_MGMT_SUB_AGENT_QUEUE_SIZE"):
+        config.sub_agent_queue_size = int(os.getenv("TASK_MGMT_SUB_AGENT_QUEUE_SIZE", "32"))
+    
     # Logging
     if os.getenv("TASK_MGMT_LOG_LEVEL"):
         config.log_level = os.getenv("TASK_MGMT_LOG_LEVEL", LogLevel.INFO.value)
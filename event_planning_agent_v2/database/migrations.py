@@ -417,6 +417,96 @@ class DatabaseMigration:
             self.record_migration(version, description, success=False, error=str(e))
             return False
     
+    def migrate_plan_summaries_v1_4_0(self) -> bool:
+        """
+        Migration to v1.4.0: Add plan_summaries projection table
+        - Create plan_summaries table for plan listing
+        - Add keyset pagination and filter indexes
+        - Backfill summaries from existing event plans
+        """
+        version = "1.4.0"
+        description = "Add plan_summaries projection table"
+        
+        try:
+            logger.info(f"🔄 Applying migration {version}: {description}")
+            
+            # Read SQL migration file
+            migration_file = Path(__file__).parent / "migrations" / "add_plan_summaries_table.sql"
+            
+            if not migration_file.exists():
+                raise FileNotFoundError(f"Migration file not found: {migration_file}")
+            
+            with open(migration_file, 'r', encoding='utf-8') as f:
+                migration_sql = f.read()
+            
+            logger.info("   Executing plan summaries migration...")
+            
+            with self.get_session() as session:
+                # Execute the entire SQL migration script
+                session.execute(text(migration_sql))
+            
+            # Record successful migration
+            self.record_migration(version, description, success=True)
+            logger.info(f"✅ Migration {version} completed successfully")
+            return True
+            
+        except FileNotFoundError as e:
+            error_msg = f"Migration {version} failed: {e}"
+            logger.error(f"❌ {error_msg}")
+            logger.error("   Please ensure the migration SQL file exists at: database/migrations/add_plan_summaries_table.sql")
+            self.record_migration(version, description, success=False, error=str(e))
+            return False
+            
+        except Exception as e:
+            error_msg = f"Migration {version} failed: {e}"
+            logger.error(f"❌ {error_msg}")
+            self.record_migration(version, description, success=False, error=str(e))
+            return False
+    
+    def migrate_event_plan_revision_v1_5_0(self) -> bool:
+        """
+        Migration to v1.5.0: Add event plan revision counter
+        - Add revision column to event_plans for ETag generation
+        """
+        version = "1.5.0"
+        description = "Add event plan revision counter"
+        
+        try:
+            logger.info(f"🔄 Applying migration {version}: {description}")
+            
+            # Read SQL migration file
+            migration_file = Path(__file__).parent / "migrations" / "add_event_plan_revision.sql"
+            
+            if not migration_file.exists():
+                raise FileNotFoundError(f"Migration file not found: {migration_file}")
+            
+            with open(migration_file, 'r', encoding='utf-8') as f:
+                migration_sql = f.read()
+            
+            logger.info("   Executing event plan revision migration...")
+            
+            with self.get_session() as session:
+                # Execute the entire SQL migration script
+                session.execute(text(migration_sql))
+            
+            # Record successful migration
+            self.record_migration(version, description, success=True)
+            logger.info(f"✅ Migration {version} completed successfully")
+            return True
+            
+        except FileNotFoundError as e:
+            error_msg = f"Migration {version} failed: {e}"
+            logger.error(f"❌ {error_msg}")
+            logger.error("   Please ensure the migration SQL file exists at: database/migrations/add_event_plan_revision.sql")
+            self.record_migration(version, description, success=False, error=str(e))
+            return False
+            
+        except Exception as e:
+            error_msg = f"Migration {version} failed: {e}"
+            logger.error(f"❌ {error_msg}")
+            self.record_migration(version, description, success=False, error=str(e))
+            return False
+    
     def run_all_migrations(self) -> bool:
         """Run all pending migrations"""
         logger.info("🚀 Starting database migrations...")
@@ -434,6 +524,8 @@ class DatabaseMigration:
             ("1.1.0", self.migrate_vendor_tables_v1_1_0),
             ("1.2.0", self.migrate_task_management_tables_v1_2_0),
             ("1.3.0", self.migrate_crm_tables_v1_3_0),
+            ("1.4.0", self.migrate_plan_summaries_v1_4_0),
+            ("1.5.0", self.migrate_event_plan_revision_v1_5_0),
         ]
         
         success = True
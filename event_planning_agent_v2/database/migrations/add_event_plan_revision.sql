@@ -0,0 +1,10 @@
+-- Migration: Add Event Plan Revision Counter
+-- Version: 1.5.0
+-- Description: Adds a revision counter to event_plans that is bumped on every
+--              save, so API responses can carry cheap ETags
+
+ALTER TABLE event_plans
+    ADD COLUMN IF NOT EXISTS revision INTEGER NOT NULL DEFAULT 0;
+
+COMMENT ON COLUMN event_plans.revision IS
+    'Monotonic state revision, incremented on every plan save; combined with updated_at for ETags';
@@ -0,0 +1,101 @@
+-- Migration: Add Plan Summaries Projection Table
+-- Version: 1.4.0
+-- Description: Creates a narrow plan_summaries projection of event_plans so that
+--              plan listing never reads the workflow_state JSONB, and backfills it
+--              from existing plans
+
+-- ============================================================================
+-- Plan Summaries Table
+-- ============================================================================
+-- One row per event plan, kept in sync by the application on every plan save
+CREATE TABLE IF NOT EXISTS plan_summaries (
+    plan_id UUID PRIMARY KEY,
+    client_id VARCHAR(255),
+    status VARCHAR(50) NOT NULL,
+    best_score FLOAT,
+    combination_count INTEGER DEFAULT 0,
+    top_combinations JSONB,
+    selected_combination_id VARCHAR(255),
+    has_blueprint BOOLEAN DEFAULT false,
+    created_at TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL,
+
+    -- Foreign key constraint to event_plans
+    CONSTRAINT fk_plan_summaries_event
+        FOREIGN KEY (plan_id)
+        REFERENCES event_plans(plan_id)
+        ON DELETE CASCADE
+);
+
+-- ============================================================================
+-- Performance Indexes
+-- ============================================================================
+
+-- Keyset pagination on (created_at, plan_id), newest first
+CREATE INDEX IF NOT EXISTS idx_plan_summaries_created
+    ON plan_summaries(created_at DESC, plan_id DESC);
+
+-- Status-filtered listing
+CREATE INDEX IF NOT EXISTS idx_plan_summaries_status_created
+    ON plan_summaries(status, created_at DESC);
+
+-- Client-filtered listing
+CREATE INDEX IF NOT EXISTS idx_plan_summaries_client
+    ON plan_summaries(client_id);
+
+-- ============================================================================
+-- Backfill from existing event plans
+-- ============================================================================
+INSERT INTO plan_summaries (
+    plan_id, client_id, status, best_score, combination_count, top_combinations,
+    selected_combination_id, has_blueprint, created_at, updated_at
+)
+SELECT
+    ep.plan_id,
+    ep.client_id,
+    ep.status,
+    scores.best_score,
+    CASE WHEN jsonb_typeof(ep.workflow_state->'beam_candidates') = 'array'
+         THEN jsonb_array_length(ep.workflow_state->'beam_candidates')
+         ELSE 0 END,
+    COALESCE(scores.top_combinations, '[]'::jsonb),
+    ep.selected_combination->>'combination_id',
+    ep.final_blueprint IS NOT NULL,
+    COALESCE(ep.created_at, NOW()),
+    COALESCE(ep.updated_at, ep.created_at, NOW())
+FROM event_plans ep
+LEFT JOIN LATERAL (
+    SELECT
+        MAX(ranked.score) AS best_score,
+        jsonb_agg(ranked.compact ORDER BY ranked.score DESC NULLS LAST)
+            FILTER (WHERE ranked.rank <= 5) AS top_combinations
+    FROM (
+        SELECT
+            COALESCE((c->>'total_score')::float, (c->>'fitness_score')::float) AS score,
+            jsonb_strip_nulls(jsonb_build_object(
+                'combination_id', c->>'combination_id',
+                'total_score', COALESCE((c->>'total_score')::float, (c->>'fitness_score')::float),
+                'estimated_cost', (c->>'estimated_cost')::float,
+                'feasibility_score', (c->>'feasibility_score')::float
+            )) AS compact,
+            ROW_NUMBER() OVER (
+                ORDER BY COALESCE((c->>'total_score')::float, (c->>'fitness_score')::float) DESC NULLS LAST
+            ) AS rank
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(ep.workflow_state->'beam_candidates') = 'array'
+                 THEN ep.workflow_state->'beam_candidates'
+                 ELSE '[]'::jsonb END
+        ) AS c
+    ) ranked
+) scores ON true
+ON CONFLICT (plan_id) DO NOTHING;
+
+-- ============================================================================
+-- Comments for documentation
+-- ============================================================================
+
+COMMENT ON TABLE plan_summaries IS
+    'Narrow projection of event_plans for O(1) plan listing, updated on every plan save';
+
+COMMENT ON COLUMN plan_summaries.top_combinations IS
+    'JSONB array of the top-k beam candidates: combination_id, total_score, estimated_cost, feasibility_score';
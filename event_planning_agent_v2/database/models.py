@@ -131,6 +131,7 @@ class EventPlan(Base):
     selected_combination = Column(JSONB)  # Final selected vendor combination
     
     # Metadata
+    revision = Column(Integer, nullable=False, default=0)  # Bumped on every save, used for ETags
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -146,6 +147,36 @@ class EventPlan(Base):
     )
 
 
+class PlanSummary(Base):
+    """
+    Narrow projection of event_plans used for plan listing.
+    Kept in sync on every plan save so listing never touches workflow_state.
+    """
+    __tablename__ = "plan_summaries"
+    
+    plan_id = Column(
+        PG_UUID(as_uuid=True),
+        ForeignKey('event_plans.plan_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    client_id = Column(String(255))
+    status = Column(String(50), nullable=False)
+    best_score = Column(Float)
+    combination_count = Column(Integer, default=0)
+    top_combinations = Column(JSONB)  # Compact top-k combinations (ids and scores)
+    selected_combination_id = Column(String(255))
+    has_blueprint = Column(Boolean, default=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    
+    # Indexes for keyset pagination and filtered listing
+    __table_args__ = (
+        Index('idx_plan_summaries_created', 'created_at', 'plan_id'),
+        Index('idx_plan_summaries_status_created', 'status', 'created_at'),
+        Index('idx_plan_summaries_client', 'client_id'),
+    )
+
+
 class AgentPerformance(Base):
     """
     Agent performance tracking for monitoring and optimization.
@@ -3,16 +3,18 @@ LangGraph state persistence layer for workflow checkpointing and state managemen
 Provides state serialization, persistence, and recovery for event planning workflows.
 """
 
+import base64
 import json
 import logging
-from typing import Dict, Any, Optional, List, TypedDict, Union
+from typing import Dict, Any, Optional, List, Tuple, TypedDict, Union
 from datetime import datetime
 from uuid import UUID, uuid4
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from .connection import get_sync_session, get_async_session
-from .models import EventPlan, AgentPerformance, WorkflowMetrics
+from .models import EventPlan, AgentPerformance, WorkflowMetrics, PlanSummary
 from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,114 @@ class EventPlanningState(TypedDict, total=False):
     retry_count: int
 
 
+# Number of beam candidates kept in a plan summary
+PLAN_SUMMARY_TOP_K = 5
+
+
+def _combination_score(combination: Dict[str, Any]) -> Optional[float]:
+    """Get the ranking score of a beam candidate"""
+    score = combination.get('total_score')
+    if score is None:
+        score = combination.get('fitness_score')
+    try:
+        return float(score) if score is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def build_plan_summary(event_plan: EventPlan, top_k: int = PLAN_SUMMARY_TOP_K) -> Dict[str, Any]:
+    """
+    Build the plan_summaries projection for an event plan
+    
+    Args:
+        event_plan: Event plan row
+        top_k: Number of best combinations to keep
+    
+    Returns:
+        Column values for the plan_summaries row
+    """
+    candidates = []
+    if event_plan.workflow_state and isinstance(event_plan.workflow_state.get('beam_candidates'), list):
+        candidates = [c for c in event_plan.workflow_state['beam_candidates'] if isinstance(c, dict)]
+    
+    scored = sorted(
+        candidates,
+        key=lambda c: (_combination_score(c) is not None, _combination_score(c) or 0.0),
+        reverse=True
+    )
+    
+    top_combinations = []
+    for combination in scored[:top_k]:
+        compact = {
+            'combination_id': combination.get('combination_id'),
+            'total_score': _combination_score(combination),
+            'estimated_cost': combination.get('estimated_cost'),
+            'feasibility_score': combination.get('feasibility_score')
+        }
+        top_combinations.append({k: v for k, v in compact.items() if v is not None})
+    
+    scores = [score for score in (_combination_score(c) for c in candidates) if score is not None]
+    selected = event_plan.selected_combination or {}
+    now = datetime.utcnow()
+    
+    return {
+        'plan_id': event_plan.plan_id,
+        'client_id': event_plan.client_id,
+        'status': event_plan.status or 'pending',
+        'best_score': max(scores) if scores else None,
+        'combination_count': len(candidates),
+        'top_combinations': top_combinations,
+        'selected_combination_id': selected.get('combination_id') if isinstance(selected, dict) else None,
+        'has_blueprint': bool(event_plan.final_blueprint),
+        'created_at': event_plan.created_at or now,
+        'updated_at': event_plan.updated_at or now
+    }
+
+
+def upsert_plan_summary(session, event_plan: EventPlan) -> None:
+    """
+    Insert or update the plan_summaries row for an event plan
+    
+    Runs in the caller's session so the summary commits atomically
+    with the plan itself.
+    """
+    # Make sure the event plan row (and its defaults) exist for the foreign key
+    session.flush()
+    
+    values = build_plan_summary(event_plan)
+    stmt = pg_insert(PlanSummary).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PlanSummary.plan_id],
+        set_={
+            column: stmt.excluded[column]
+            for column in values
+            if column not in ('plan_id', 'created_at')
+        }
+    )
+    session.execute(stmt)
+
+
+def encode_plan_cursor(created_at: datetime, plan_id: Union[str, UUID]) -> str:
+    """Encode a keyset pagination cursor for plan listing"""
+    raw = f"{created_at.isoformat()}|{plan_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_plan_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a keyset pagination cursor
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        created_at, plan_id = raw.split('|', 1)
+        return datetime.fromisoformat(created_at), UUID(plan_id)
+    except Exception as e:
+        raise ValueError(f"Invalid plan cursor: {cursor}") from e
+
+
 class WorkflowStateManager:
     """
     Manages LangGraph workflow state persistence and recovery.
@@ -134,6 +244,7 @@ class WorkflowStateManager:
                     # Update existing plan
                     existing_plan.workflow_state = state
                     existing_plan.status = state['workflow_status']
+                    existing_plan.revision = (existing_plan.revision or 0) + 1
                     existing_plan.updated_at = datetime.utcnow()
                     
                     # Update beam history if we have beam candidates
@@ -146,6 +257,8 @@ class WorkflowStateManager:
                     
                     if state.get('final_blueprint'):
                         existing_plan.final_blueprint = state['final_blueprint']
+                    
+                    upsert_plan_summary(session, existing_plan)
                 
                 else:
                     # Create new event plan
@@ -161,6 +274,7 @@ class WorkflowStateManager:
                         final_blueprint=state.get('final_blueprint')
                     )
                     session.add(new_plan)
+                    upsert_plan_summary(session, new_plan)
                 
                 session.commit()
                 logger.debug(f"Saved workflow state for plan {plan_id}")
@@ -338,9 +452,10 @@ class WorkflowStateManager:
             plan_uuid = UUID(plan_id)
             
             with get_sync_session() as session:
-                # Delete associated performance and metrics data
+                # Delete associated performance, metrics and summary data
                 session.execute(delete(AgentPerformance).where(AgentPerformance.plan_id == plan_uuid))
                 session.execute(delete(WorkflowMetrics).where(WorkflowMetrics.plan_id == plan_uuid))
+                session.execute(delete(PlanSummary).where(PlanSummary.plan_id == plan_uuid))
                 
                 # Delete event plan
                 session.execute(delete(EventPlan).where(EventPlan.plan_id == plan_uuid))
@@ -469,6 +584,7 @@ class PlanManager:
                     existing_plan.plan_data = plan_data.get('client_request', existing_plan.plan_data)
                     existing_plan.selected_combination = plan_data.get('selected_combination')
                     existing_plan.final_blueprint = plan_data.get('final_blueprint')
+                    existing_plan.revision = (existing_plan.revision or 0) + 1
                     existing_plan.updated_at = datetime.utcnow()
                     
                     # Store additional metadata
@@ -477,6 +593,8 @@ class PlanManager:
                             existing_plan.workflow_state = {}
                         existing_plan.workflow_state['beam_candidates'] = plan_data['combinations']
                     
+                    upsert_plan_summary(session, existing_plan)
+                    
                 else:
                     # Create new plan
                     new_plan = EventPlan(
@@ -493,6 +611,7 @@ class PlanManager:
                         updated_at=datetime.utcnow()
                     )
                     session.add(new_plan)
+                    upsert_plan_summary(session, new_plan)
                 
                 session.commit()
                 logger.debug(f"Saved plan data for {plan_id}")
@@ -527,6 +646,7 @@ class PlanManager:
                         'combinations': [],
                         'selected_combination': event_plan.selected_combination,
                         'final_blueprint': event_plan.final_blueprint,
+                        'revision': event_plan.revision or 0,
                         'created_at': event_plan.created_at,
                         'updated_at': event_plan.updated_at
                     }
@@ -545,75 +665,90 @@ class PlanManager:
             logger.error(f"Failed to load plan data for {plan_id}: {e}")
             return None
     
+    def get_plan_version(self, plan_id: str) -> Optional[Tuple[datetime, int]]:
+        """
+        Get the version of an event plan without loading its payload
+        
+        Args:
+            plan_id: Plan identifier
+        
+        Returns:
+            Tuple of (updated_at, revision) if found, None otherwise
+        """
+        try:
+            plan_uuid = UUID(plan_id)
+            
+            with get_sync_session() as session:
+                row = session.execute(
+                    select(EventPlan.updated_at, EventPlan.revision).where(EventPlan.plan_id == plan_uuid)
+                ).first()
+                
+                if row is None:
+                    return None
+                return row[0], row[1] or 0
+                
+        except Exception as e:
+            logger.error(f"Failed to get plan version for {plan_id}: {e}")
+            return None
+    
     def list_plans(
         self,
         page: int = 1,
         page_size: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None
     ) -> tuple[List[Dict[str, Any]], int]:
         """
         List event plans with pagination and filtering
         
+        Reads only the narrow plan_summaries projection. When a cursor is
+        given, keyset pagination on (created_at, plan_id) replaces the
+        page offset.
+        
         Args:
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when cursor is given
             page_size: Number of items per page
             filters: Optional filters (status, client_name, etc.)
+            cursor: Optional keyset cursor from encode_plan_cursor
         
         Returns:
             Tuple of (plans_list, total_count)
         """
         try:
             with get_sync_session() as session:
-                # Build query
-                query = select(EventPlan)
-                
-                # Apply filters
+                # Build filter conditions
+                conditions = []
                 if filters:
                     if 'status' in filters:
-                        query = query.where(EventPlan.status == filters['status'])
+                        conditions.append(PlanSummary.status == filters['status'])
                     if 'client_name' in filters:
-                        query = query.where(EventPlan.client_id.ilike(f"%{filters['client_name']}%"))
+                        conditions.append(PlanSummary.client_id.ilike(f"%{filters['client_name']}%"))
                 
                 # Get total count
-                count_query = select(EventPlan.plan_id)
-                if filters:
-                    if 'status' in filters:
-                        count_query = count_query.where(EventPlan.status == filters['status'])
-                    if 'client_name' in filters:
-                        count_query = count_query.where(EventPlan.client_id.ilike(f"%{filters['client_name']}%"))
+                count_query = select(func.count()).select_from(PlanSummary).where(*conditions)
+                total_count = session.execute(count_query).scalar_one()
                 
-                total_count = len(session.execute(count_query).scalars().all())
+                # Order by creation date (newest first) with a stable tie-breaker
+                query = select(PlanSummary).where(*conditions).order_by(
+                    PlanSummary.created_at.desc(),
+                    PlanSummary.plan_id.desc()
+                )
                 
                 # Apply pagination
-                offset = (page - 1) * page_size
-                query = query.offset(offset).limit(page_size)
-                
-                # Order by creation date (newest first)
-                query = query.order_by(EventPlan.created_at.desc())
+                if cursor:
+                    cursor_created_at, cursor_plan_id = decode_plan_cursor(cursor)
+                    query = query.where(
+                        tuple_(PlanSummary.created_at, PlanSummary.plan_id) < (cursor_created_at, cursor_plan_id)
+                    )
+                else:
+                    query = query.offset((page - 1) * page_size)
+                query = query.limit(page_size)
                 
                 # Execute query
                 result = session.execute(query).scalars().all()
                 
                 # Convert to plan data format
-                plans = []
-                for event_plan in result:
-                    plan_data = {
-                        'plan_id': str(event_plan.plan_id),
-                        'status': event_plan.status,
-                        'client_name': event_plan.client_id,
-                        'client_request': event_plan.plan_data or {},
-                        'combinations': [],
-                        'selected_combination': event_plan.selected_combination,
-                        'final_blueprint': event_plan.final_blueprint,
-                        'created_at': event_plan.created_at,
-                        'updated_at': event_plan.updated_at
-                    }
-                    
-                    # Extract combinations from workflow state
-                    if event_plan.workflow_state and 'beam_candidates' in event_plan.workflow_state:
-                        plan_data['combinations'] = event_plan.workflow_state['beam_candidates']
-                    
-                    plans.append(plan_data)
+                plans = [self._summary_to_plan_data(summary) for summary in result]
                 
                 logger.debug(f"Listed {len(plans)} plans (page {page}, total {total_count})")
                 return plans, total_count
@@ -622,6 +757,26 @@ class PlanManager:
             logger.error(f"Failed to list plans: {e}")
             return [], 0
     
+    def _summary_to_plan_data(self, summary: PlanSummary) -> Dict[str, Any]:
+        """Convert a plan summary row to the plan data format used by the API"""
+        selected_combination = None
+        if summary.selected_combination_id:
+            selected_combination = {'combination_id': summary.selected_combination_id}
+        
+        return {
+            'plan_id': str(summary.plan_id),
+            'status': summary.status,
+            'client_name': summary.client_id,
+            'combinations': summary.top_combinations or [],
+            'selected_combination': selected_combination,
+            'final_blueprint': None,
+            'best_score': summary.best_score,
+            'combination_count': summary.combination_count or 0,
+            'has_blueprint': bool(summary.has_blueprint),
+            'created_at': summary.created_at,
+            'updated_at': summary.updated_at
+        }
+    
     def health_check(self) -> bool:
         """
         Check database connectivity
@@ -655,14 +810,19 @@ class ExtendedStateManager(WorkflowStateManager):
         """Load event plan data"""
         return self.plan_manager.load_plan(plan_id)
     
+    def get_plan_version(self, plan_id: str) -> Optional[Tuple[datetime, int]]:
+        """Get (updated_at, revision) of an event plan"""
+        return self.plan_manager.get_plan_version(plan_id)
+    
     def list_plans(
         self,
         page: int = 1,
         page_size: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None
     ) -> tuple[List[Dict[str, Any]], int]:
         """List event plans with pagination"""
-        return self.plan_manager.list_plans(page, page_size, filters)
+        return self.plan_manager.list_plans(page, page_size, filters, cursor)
     
     def health_check(self) -> bool:
         """Check database connectivity"""
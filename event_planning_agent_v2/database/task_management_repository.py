@@ -16,6 +16,13 @@ from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from .connection import get_sync_session, DatabaseConnectionManager
 from .models import Base
 from ..error_handling.recovery import RecoveryManager, RecoveryStrategy, RecoveryContext
@@ -29,6 +36,13 @@ from ..agents.task_management.models.data_models import Conflict
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Any) -> str:
+    """Serialize data for a JSONB column, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
 class TaskManagementRepository:
     """
     Repository for persisting Task Management Agent data.
@@ -39,6 +53,18 @@ class TaskManagementRepository:
     - Conflict data
     
     Implements retry logic with exponential backoff for transient database errors.
+    Tasks and conflicts are written with multi-row INSERT statements, so a
+    plan's task list takes a handful of round-trips instead of one per row.
+    """
+    
+    # Rows per multi-row INSERT; keeps bind parameters well under PostgreSQL's 65535 limit
+    BULK_INSERT_BATCH_SIZE = 1000
+    
+    EXTENDED_TASK_UPSERT = """
+        ON CONFLICT (task_management_run_id, task_id)
+        DO UPDATE SET
+            task_data = EXCLUDED.task_data,
+            updated_at = EXCLUDED.updated_at
     """
     
     def __init__(self, db_manager: Optional[DatabaseConnectionManager] = None):
@@ -223,7 +249,7 @@ class TaskManagementRepository:
                     {
                         'event_id': event_id,
                         'run_timestamp': datetime.utcnow(),
-                        'processing_summary': json.dumps(summary_dict),
+                        'processing_summary': _dumps(summary_dict),
                         'status': status,
                         'error_log': error_log
                     }
@@ -271,35 +297,9 @@ class TaskManagementRepository:
             extended_task_list: ExtendedTaskList
         ) -> int:
             with self._get_session() as session:
-                saved_count = 0
-                
-                for task in extended_task_list.tasks:
-                    # Convert ExtendedTask to dict for JSONB storage
-                    task_dict = self._serialize_extended_task(task)
-                    
-                    # Insert extended task
-                    query = text("""
-                        INSERT INTO extended_tasks 
-                        (task_management_run_id, task_id, task_data, created_at, updated_at)
-                        VALUES (:run_id, :task_id, :task_data, :created_at, :updated_at)
-                        ON CONFLICT (task_management_run_id, task_id) 
-                        DO UPDATE SET 
-                            task_data = EXCLUDED.task_data,
-                            updated_at = EXCLUDED.updated_at
-                    """)
-                    
-                    session.execute(
-                        query,
-                        {
-                            'run_id': task_management_run_id,
-                            'task_id': task.task_id,
-                            'task_data': json.dumps(task_dict),
-                            'created_at': datetime.utcnow(),
-                            'updated_at': datetime.utcnow()
-                        }
-                    )
-                    
-                    saved_count += 1
+                saved_count = self._insert_extended_tasks(
+                    session, task_management_run_id, extended_task_list.tasks
+                )
                 
                 session.commit()
                 
@@ -339,37 +339,7 @@ class TaskManagementRepository:
             conflicts: List[Conflict]
         ) -> int:
             with self._get_session() as session:
-                saved_count = 0
-                
-                for conflict in conflicts:
-                    # Convert Conflict to dict for JSONB storage
-                    conflict_dict = {
-                        'conflict_id': conflict.conflict_id,
-                        'conflict_type': conflict.conflict_type,
-                        'severity': conflict.severity,
-                        'affected_tasks': conflict.affected_tasks,
-                        'conflict_description': conflict.conflict_description,
-                        'suggested_resolutions': conflict.suggested_resolutions
-                    }
-                    
-                    # Insert conflict
-                    query = text("""
-                        INSERT INTO task_conflicts 
-                        (task_management_run_id, conflict_id, conflict_data, resolution_status)
-                        VALUES (:run_id, :conflict_id, :conflict_data, :resolution_status)
-                    """)
-                    
-                    session.execute(
-                        query,
-                        {
-                            'run_id': task_management_run_id,
-                            'conflict_id': conflict.conflict_id,
-                            'conflict_data': json.dumps(conflict_dict),
-                            'resolution_status': 'unresolved'
-                        }
-                    )
-                    
-                    saved_count += 1
+                saved_count = self._insert_conflicts(session, task_management_run_id, conflicts)
                 
                 session.commit()
                 
@@ -516,6 +486,123 @@ class TaskManagementRepository:
         )
 
     
+    def _insert_extended_tasks(
+        self,
+        session: Session,
+        task_management_run_id: int,
+        tasks: List[ExtendedTask]
+    ) -> int:
+        """
+        Upsert extended tasks of a run with multi-row INSERT statements.
+        
+        A task ID repeated in the list keeps its last version, as it would
+        with one upsert per task.
+        
+        Args:
+            session: Open database session
+            task_management_run_id: ID of task management run
+            tasks: Extended tasks to persist
+            
+        Returns:
+            Number of task rows written
+        """
+        now = datetime.utcnow()
+        rows = {
+            task.task_id: {
+                'run_id': task_management_run_id,
+                'task_id': task.task_id,
+                'task_data': _dumps(self._serialize_extended_task(task)),
+                'created_at': now,
+                'updated_at': now
+            }
+            for task in tasks
+        }
+        return self._insert_rows(
+            session,
+            "extended_tasks (task_management_run_id, task_id, task_data, created_at, updated_at)",
+            ['run_id', 'task_id', 'task_data', 'created_at', 'updated_at'],
+            list(rows.values()),
+            self.EXTENDED_TASK_UPSERT
+        )
+    
+    def _insert_conflicts(
+        self,
+        session: Session,
+        task_management_run_id: int,
+        conflicts: List[Conflict]
+    ) -> int:
+        """
+        Insert conflicts of a run with multi-row INSERT statements.
+        
+        Args:
+            session: Open database session
+            task_management_run_id: ID of task management run
+            conflicts: Conflicts to persist
+            
+        Returns:
+            Number of conflict rows written
+        """
+        rows = [
+            {
+                'run_id': task_management_run_id,
+                'conflict_id': conflict.conflict_id,
+                'conflict_data': _dumps({
+                    'conflict_id': conflict.conflict_id,
+                    'conflict_type': conflict.conflict_type,
+                    'severity': conflict.severity,
+                    'affected_tasks': conflict.affected_tasks,
+                    'conflict_description': conflict.conflict_description,
+                    'suggested_resolutions': conflict.suggested_resolutions
+                }),
+                'resolution_status': 'unresolved'
+            }
+            for conflict in conflicts
+        ]
+        return self._insert_rows(
+            session,
+            "task_conflicts (task_management_run_id, conflict_id, conflict_data, resolution_status)",
+            ['run_id', 'conflict_id', 'conflict_data', 'resolution_status'],
+            rows
+        )
+    
+    def _insert_rows(
+        self,
+        session: Session,
+        target: str,
+        columns: List[str],
+        rows: List[Dict[str, Any]],
+        suffix: str = ""
+    ) -> int:
+        """
+        Insert rows with one multi-row VALUES statement per batch.
+        
+        Args:
+            session: Open database session
+            target: Table and column list, e.g. "t (a, b)"
+            columns: Row keys, in the order of the target's columns
+            rows: Parameter dictionaries, one per row
+            suffix: Clause appended to each statement, e.g. ON CONFLICT
+            
+        Returns:
+            Number of rows inserted
+        """
+        batch_size = max(1, self.BULK_INSERT_BATCH_SIZE)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            params = {}
+            values = []
+            for i, row in enumerate(batch):
+                values.append("(" + ", ".join(f":{column}_{i}" for column in columns) + ")")
+                for column in columns:
+                    params[f"{column}_{i}"] = row[column]
+            
+            session.execute(
+                text(f"INSERT INTO {target} VALUES {', '.join(values)} {suffix}"),
+                params
+            )
+        
+        return len(rows)
+    
     def _serialize_extended_task(self, task: ExtendedTask) -> Dict[str, Any]:
         """
         Serialize ExtendedTask to dictionary for JSONB storage.
@@ -588,7 +675,9 @@ class TaskManagementRepository:
                 'end_time': task.timeline.end_time.isoformat(),
                 'duration': task.timeline.duration.total_seconds(),
                 'buffer_time': task.timeline.buffer_time.total_seconds(),
-                'scheduling_constraints': task.timeline.scheduling_constraints
+                'scheduling_constraints': task.timeline.scheduling_constraints,
+                'slack': task.timeline.slack.total_seconds() if task.timeline.slack is not None else None,
+                'is_critical': task.timeline.is_critical
             }
         
         # Serialize logistics status if present
@@ -677,7 +766,7 @@ class TaskManagementRepository:
                         {
                             'event_id': event_id,
                             'run_timestamp': datetime.utcnow(),
-                            'processing_summary': json.dumps(summary_dict),
+                            'processing_summary': _dumps(summary_dict),
                             'status': status,
                             'error_log': error_log
                         }
@@ -686,35 +775,9 @@ class TaskManagementRepository:
                     run_id = result.scalar()
                     
                     # Save tasks
-                    tasks_saved = 0
-                    for task in extended_task_list.tasks:
-                        task_dict = self._serialize_extended_task(task)
-                        
-                        task_query = text("""
-                            INSERT INTO extended_tasks 
-                            (task_management_run_id, task_id, task_data, created_at, updated_at)
-                            VALUES (:run_id, :task_id, :task_data, :created_at, :updated_at)
-                            ON CONFLICT (task_management_run_id, task_id) 
-                            DO UPDATE SET 
-                                task_data = EXCLUDED.task_data,
-                                updated_at = EXCLUDED.updated_at
-                        """)
-                        
-                        session.execute(
-                            task_query,
-                            {
-                                'run_id': run_id,
-                                'task_id': task.task_id,
-                                'task_data': json.dumps(task_dict),
-                                'created_at': datetime.utcnow(),
-                                'updated_at': datetime.utcnow()
-                            }
-                        )
-                        
-                        tasks_saved += 1
+                    tasks_saved = self._insert_extended_tasks(session, run_id, extended_task_list.tasks)
                     
                     # Save conflicts
-                    conflicts_saved = 0
                     all_conflicts = []
                     
                     # Collect all conflicts from tasks
@@ -722,35 +785,8 @@ class TaskManagementRepository:
                         all_conflicts.extend(task.conflicts)
                     
                     # Remove duplicates based on conflict_id
-                    unique_conflicts = {c.conflict_id: c for c in all_conflicts}.values()
-                    
-                    for conflict in unique_conflicts:
-                        conflict_dict = {
-                            'conflict_id': conflict.conflict_id,
-                            'conflict_type': conflict.conflict_type,
-                            'severity': conflict.severity,
-                            'affected_tasks': conflict.affected_tasks,
-                            'conflict_description': conflict.conflict_description,
-                            'suggested_resolutions': conflict.suggested_resolutions
-                        }
-                        
-                        conflict_query = text("""
-                            INSERT INTO task_conflicts 
-                            (task_management_run_id, conflict_id, conflict_data, resolution_status)
-                            VALUES (:run_id, :conflict_id, :conflict_data, :resolution_status)
-                        """)
-                        
-                        session.execute(
-                            conflict_query,
-                            {
-                                'run_id': run_id,
-                                'conflict_id': conflict.conflict_id,
-                                'conflict_data': json.dumps(conflict_dict),
-                                'resolution_status': 'unresolved'
-                            }
-                        )
-                        
-                        conflicts_saved += 1
+                    unique_conflicts = list({c.conflict_id: c for c in all_conflicts}.values())
+                    conflicts_saved = self._insert_conflicts(session, run_id, unique_conflicts)
                     
                     # Commit transaction
                     session.commit()
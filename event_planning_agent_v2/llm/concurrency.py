@@ -0,0 +1,232 @@
+"""
+Adaptive concurrency limiting for Ollama calls.
+
+A fixed connection limit is wrong for most hosts: too high and a CPU-only
+Ollama host thrashes, so every request slows down; too low and a GPU host
+sits idle. The limiter here tunes the number of in-flight requests per model
+with AIMD (additive increase, multiplicative decrease), the scheme TCP and
+Netflix's concurrency-limits use:
+
+- While requests are using the whole limit and latency stays within
+  ``latency_tolerance`` times the no-load baseline, the limit grows by about
+  one per round trip.
+- When latency exceeds that, or a request fails, the limit is cut by
+  ``backoff_ratio``. Only one cut is made per round trip, so a burst of slow
+  responses caused by the same overload counts once.
+
+The baseline is the lowest latency seen. A request that ran with no more
+than ``min_limit`` requests in flight is uncontended by definition, so its
+latency replaces the baseline; this re-probes a host that has become
+permanently slower (e.g. a bigger model) once the limit has backed off.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..observability.metrics import get_metrics_collector
+from .priority import LLMPriority, WeightedFairQueue
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for one model, with a weighted-fair wait queue
+
+    Callers waiting for a slot are served by priority class (see
+    WeightedFairQueue). With ``adaptive=False`` it behaves like a fixed semaphore of
+    ``initial_limit`` slots.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.75,
+        adaptive: bool = True,
+        starvation_timeout: Optional[float] = 10.0
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.adaptive = adaptive
+
+        self._limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.in_flight = 0
+        self._waiters: WeightedFairQueue[asyncio.Future] = WeightedFairQueue(starvation_timeout=starvation_timeout)
+        self.baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+        self.errors = 0
+        self._release_listeners: List[Callable[[], None]] = []
+        self.metrics_collector = get_metrics_collector()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot"""
+        return len(self._waiters)
+
+    async def acquire(self, priority: LLMPriority = LLMPriority.STANDARD) -> Tuple[float, int]:
+        """
+        Wait for a slot
+
+        Returns:
+            A token (start time and in-flight count) to pass back to ``release``
+        """
+        if self.in_flight >= self.limit or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.push(waiter, priority)
+            self._record_gauges()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over just as we were cancelled; pass it on
+                    self.in_flight -= 1
+                    self._wake()
+                else:
+                    self._waiters.remove(waiter)
+                self._record_gauges()
+                raise
+        else:
+            self.in_flight += 1
+
+        self._record_gauges()
+        return time.monotonic(), self.in_flight
+
+    def try_acquire(self) -> Optional[Tuple[float, int]]:
+        """
+        Take a slot without waiting
+
+        Fails while callers are queued, so it never jumps ahead of them.
+
+        Returns:
+            A token for ``release``, or None if no slot is free
+        """
+        if self.in_flight >= self.limit or self._waiters:
+            return None
+        self.in_flight += 1
+        self._record_gauges()
+        return time.monotonic(), self.in_flight
+
+    def on_release(self, callback: Callable[[], None]):
+        """Call ``callback`` whenever a slot is left free after waking waiters"""
+        self._release_listeners.append(callback)
+
+    def release(self, token: Tuple[float, int], success: Optional[bool] = True):
+        """
+        Free a slot and update the limit from the request's outcome
+
+        Args:
+            token: Value returned by ``acquire``
+            success: True for a completed request, False for a failure, None to
+                release without a sample (e.g. the caller gave up)
+        """
+        started, in_flight_at_start = token
+        now = time.monotonic()
+        in_flight_at_release = self.in_flight
+        self.in_flight -= 1
+
+        if self.adaptive and success is not None:
+            uncontended = max(in_flight_at_start, in_flight_at_release) <= self.min_limit
+            self._update_limit(now - started, started, now, success, in_flight_at_release, uncontended)
+
+        self._wake()
+        self._record_gauges()
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: LLMPriority = LLMPriority.STANDARD, token: Optional[Tuple[float, int]] = None
+    ):
+        """
+        Hold a slot for the duration of the context, sampling its outcome
+
+        Args:
+            priority: Priority class to wait in
+            token: Slot already taken with ``try_acquire``; held instead of
+                waiting for another one
+        """
+        if token is None:
+            token = await self.acquire(priority)
+        success: Optional[bool] = True
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            success = None
+            raise
+        except Exception:
+            success = False
+            raise
+        finally:
+            self.release(token, success)
+
+    def _wake(self):
+        """Hand free slots to waiters in arrival order"""
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.pop()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+        if self.in_flight < self.limit:
+            for callback in self._release_listeners:
+                callback()
+
+    def _update_limit(
+        self, latency: float, started: float, now: float, success: bool, in_flight: int, uncontended: bool
+    ):
+        """Apply one AIMD step"""
+        if success:
+            if self.baseline_latency is None or latency < self.baseline_latency or uncontended:
+                self.baseline_latency = latency
+            congested = latency > self.baseline_latency * self.latency_tolerance
+        else:
+            self.errors += 1
+            congested = True
+
+        if congested:
+            # One decrease per round trip: ignore requests that started
+            # before the last cut took effect
+            if started >= self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                self._last_decrease = now
+                self.decreases += 1
+                logger.debug(f"Concurrency limit for {self.name} decreased to {self.limit} (latency {latency:.3f}s)")
+        elif in_flight >= self.limit:
+            # Only grow while the current limit is actually being used
+            previous = self.limit
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            if self.limit > previous:
+                self.increases += 1
+                logger.debug(f"Concurrency limit for {self.name} increased to {self.limit}")
+
+    def _record_gauges(self):
+        labels = {"model": self.name}
+        self.metrics_collector.record_gauge("llm_concurrency_limit", float(self.limit), labels=labels)
+        self.metrics_collector.record_gauge("llm_concurrency_queue_depth", float(self.queue_depth), labels=labels)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "queue_depth_by_priority": self._waiters.depth_by_priority(),
+            "baseline_latency": round(self.baseline_latency, 4) if self.baseline_latency is not None else None,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "errors": self.errors,
+            "adaptive": self.adaptive
+        }
@@ -0,0 +1,144 @@
+"""
+Persistent SQLite tier for the LLM response cache.
+
+The in-memory TTL cache is lost on every deploy or crash. This tier keeps
+completions on disk, keyed by the same cache key, so recurring prompts (task
+decomposition templates, blueprint sections) survive restarts. Entries are
+tagged with the model version they were generated by and are ignored once the
+model changes.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentResponseCache:
+    """
+    Size-bounded, LRU-evicted SQLite store of LLM responses
+
+    All methods are blocking; callers on the event loop should run them in a
+    worker thread.
+    """
+
+    def __init__(self, path: str, max_entries: int = 20000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses(last_access)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_hits ON llm_responses(hits DESC)")
+        self._entry_count = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def get(self, cache_key: str, model_version: str) -> Optional[str]:
+        """
+        Get a cached response generated by the given model version
+
+        Entries from another model version are deleted and reported as a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, model_version FROM llm_responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            response, stored_version = row
+            if stored_version != model_version:
+                self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                self._entry_count -= 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ?, hits = hits + 1 WHERE cache_key = ?",
+                (time.time(), cache_key)
+            )
+            return response
+
+    def put(self, cache_key: str, model: str, model_version: str, response: str):
+        """Store a response, evicting least recently used entries over the size bound"""
+        now = time.time()
+        with self._lock:
+            existed = self._conn.execute(
+                "SELECT 1 FROM llm_responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone() is not None
+
+            self._conn.execute(
+                """
+                INSERT INTO llm_responses (cache_key, model, model_version, response, created_at, last_access, hits)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    model = excluded.model,
+                    model_version = excluded.model_version,
+                    response = excluded.response,
+                    last_access = excluded.last_access
+                """,
+                (cache_key, model, model_version, response, now, now)
+            )
+            if not existed:
+                self._entry_count += 1
+
+            if self._entry_count > self.max_entries:
+                self._evict(self._entry_count - self.max_entries)
+
+    def _evict(self, count: int):
+        """Delete the ``count`` least recently used entries"""
+        self._conn.execute(
+            """
+            DELETE FROM llm_responses WHERE cache_key IN (
+                SELECT cache_key FROM llm_responses ORDER BY last_access ASC LIMIT ?
+            )
+            """,
+            (count,)
+        )
+        self._entry_count -= count
+        logger.debug(f"Evicted {count} entries from persistent LLM cache")
+
+    def hot_entries(self, limit: int) -> List[Tuple[str, str, str, str]]:
+        """
+        Get the most frequently hit entries for warming the memory cache
+
+        Returns:
+            List of (cache_key, model, model_version, response) tuples
+        """
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT cache_key, model, model_version, response FROM llm_responses
+                ORDER BY hits DESC, last_access DESC LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
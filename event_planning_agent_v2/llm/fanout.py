@@ -0,0 +1,78 @@
+"""
+Bounded-concurrency fan-out for per-task LLM work.
+
+Sub-agents and tools that make one LLM call per task used to await them one
+after another, so a plan took the sum of its task latencies. ``gather_bounded``
+runs them concurrently with a cap on how many are in flight, keeps results in
+input order, and turns a failure of one task into that task's fallback value
+instead of failing the whole batch. The LLM manager still applies its own
+per-model limits underneath; the cap here only stops thousands of coroutines
+from queueing on it at once.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_bounded(
+    items: Sequence[T],
+    worker: Callable[[T], Awaitable[R]],
+    fallback: Callable[[T, BaseException], R],
+    limit: int,
+    deadline: Optional[float] = None
+) -> List[R]:
+    """
+    Run ``worker`` for every item with at most ``limit`` running at once
+
+    Args:
+        items: Inputs, one coroutine each
+        worker: Coroutine function producing an item's result
+        fallback: Called with the item and the error when its worker raises,
+            ends cancelled, or is still running at the deadline
+        limit: Maximum number of workers in flight
+        deadline: Seconds after which unfinished workers are cancelled and
+            fall back with an asyncio.TimeoutError; None for no deadline
+
+    Returns:
+        One result per item, in input order
+    """
+    if not items:
+        return []
+
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await worker(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=deadline)
+    finally:
+        # Also reached when the caller itself is cancelled
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.warning(f"{len(pending)} of {len(tasks)} tasks did not finish within {deadline}s")
+
+    results = []
+    for item, task in zip(items, tasks):
+        if task in pending:
+            results.append(fallback(item, asyncio.TimeoutError(f"Not finished within {deadline}s")))
+        elif task.cancelled():
+            # Cancelled from inside the worker (e.g. a nested wait_for), not by us
+            results.append(fallback(item, asyncio.CancelledError()))
+        elif task.exception() is not None:
+            results.append(fallback(item, task.exception()))
+        else:
+            results.append(task.result())
+    return results
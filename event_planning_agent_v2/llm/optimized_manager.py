@@ -7,16 +7,25 @@ import asyncio
 import hashlib
 import json
 import logging
+import statistics
 import time
-from typing import Dict, List, Optional, Any, Union, Tuple
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Any, Set, Union, Tuple
 from functools import lru_cache
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
 import aiohttp
 from cachetools import TTLCache
 import httpx
 
 from ..config.settings import get_settings
+from ..observability.metrics import get_metrics_collector
+from ..observability.progress import get_progress_channel, publish_progress
+from .concurrency import AdaptiveConcurrencyLimiter
+from .disk_cache import PersistentResponseCache
+from .priority import LLMPriority, WeightedFairQueue
+from .routing import LLMTaskClass, RouteMetrics, select_model
+from .streaming import JSONCompletionDetector
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +39,12 @@ class LLMRequest:
     temperature: float = 0.7
     max_tokens: Optional[int] = None
     system_prompt: Optional[str] = None
+    priority: LLMPriority = LLMPriority.STANDARD
+    # Resolved with the LLMResponse once processed; cancelled if the caller gives up
+    future: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
+    enqueued_at: float = field(default_factory=time.time, compare=False)
+    # Concurrency slot taken by the dispatcher, handed to the model call
+    slot_token: Optional[Tuple[float, int]] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -41,14 +56,143 @@ class LLMResponse:
     execution_time: float
     cached: bool = False
     error: Optional[str] = None
+    queue_time: float = 0.0
+
+
+@dataclass
+class _InFlightGeneration:
+    """A model call shared by identical concurrent requests"""
+    task: asyncio.Task
+    waiters: int = 0
+
+
+def _release_slot(limiter: AdaptiveConcurrencyLimiter, request: LLMRequest):
+    """Free the slot a dispatched request still holds, without a latency sample"""
+    token, request.slot_token = request.slot_token, None
+    if token is not None:
+        limiter.release(token, None)
+
+
+class ModelDispatcher:
+    """
+    Runs queued requests for one model concurrently, up to a limit
+    
+    Requests start immediately while the model has free slots; under load they
+    wait in the pending queue and are drained as slots free up, by priority
+    class with weighted-fair lanes. Slots are those of the model's adaptive
+    concurrency limiter, shared with direct calls: the dispatcher takes one
+    per request when it starts it and pumps again whenever the limiter frees
+    one, so a dispatched request never queues a second time in the limiter.
+    Effective parallelism is the
+    time-weighted average number of in-flight requests while the model is busy.
+    """
+    
+    def __init__(
+        self,
+        model: str,
+        limiter: AdaptiveConcurrencyLimiter,
+        execute: Callable[[LLMRequest], Awaitable[None]],
+        starvation_timeout: Optional[float] = 10.0
+    ):
+        self.model = model
+        self.limiter = limiter
+        self._execute = execute
+        self.pending: WeightedFairQueue[LLMRequest] = WeightedFairQueue(starvation_timeout=starvation_timeout)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.dispatched = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._busy_time = 0.0
+        self._weighted_in_flight = 0.0
+        self._last_change = time.monotonic()
+        self.metrics_collector = get_metrics_collector()
+        limiter.on_release(self._pump)
+    
+    @property
+    def limit(self) -> int:
+        return self.limiter.limit
+    
+    def submit(self, request: LLMRequest):
+        """Queue a request and start it right away if a slot is free"""
+        self.pending.push(request, request.priority)
+        self._pump()
+    
+    def _pump(self):
+        """Start pending requests while both the dispatcher and the limiter have free slots"""
+        while self.pending and self.in_flight < self.limit:
+            token = self.limiter.try_acquire()
+            if token is None:
+                break
+            request = self.pending.pop()
+            request.slot_token = token
+            self._set_in_flight(self.in_flight + 1)
+            self.dispatched += 1
+            task = asyncio.ensure_future(self._run(request))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_done)
+    
+    async def _run(self, request: LLMRequest):
+        """Execute a request, freeing its slot if the model call did not take it over"""
+        try:
+            await self._execute(request)
+        finally:
+            # Cache hits and requests cancelled while queued never call the model
+            _release_slot(self.limiter, request)
+    
+    def _on_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Request dispatch failed for model {self.model}: {task.exception()}")
+        self._set_in_flight(self.in_flight - 1)
+        self._pump()
+    
+    def _set_in_flight(self, value: int):
+        """Update the in-flight count and accumulate parallelism statistics"""
+        now = time.monotonic()
+        if self.in_flight > 0:
+            elapsed = now - self._last_change
+            self._busy_time += elapsed
+            self._weighted_in_flight += elapsed * self.in_flight
+        self._last_change = now
+        self.in_flight = value
+        self.peak_in_flight = max(self.peak_in_flight, value)
+        self.metrics_collector.record_gauge("llm_requests_in_flight", float(value), labels={"model": self.model})
+    
+    def effective_parallelism(self) -> float:
+        """Average number of concurrent requests while the model was busy"""
+        return self._weighted_in_flight / self._busy_time if self._busy_time > 0 else 0.0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "pending": len(self.pending),
+            "pending_by_priority": self.pending.depth_by_priority(),
+            "peak_in_flight": self.peak_in_flight,
+            "dispatched": self.dispatched,
+            "effective_parallelism": round(self.effective_parallelism(), 2)
+        }
+    
+    async def cancel_all(self):
+        """Cancel running requests and fail pending ones"""
+        while self.pending:
+            request = self.pending.pop()
+            if request.future is not None and not request.future.done():
+                request.future.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 class OptimizedLLMManager:
     """
     Optimized LLM Manager with performance enhancements:
-    - Response caching with TTL
-    - Connection pooling
+    - Response caching with TTL, backed by a persistent on-disk tier
+    - Single-flight deduplication of identical concurrent requests
+    - Connection pooling with adaptive per-model concurrency limits
     - Batch processing
+    - Streaming generation with early stop for JSON answers
     - Model warmup and keep-alive
     - GPU optimization
     """
@@ -64,15 +208,28 @@ class OptimizedLLMManager:
                 maxsize=self.llm_settings.response_cache_size,
                 ttl=self.llm_settings.response_cache_ttl
             )
+        self._disk_cache: Optional[PersistentResponseCache] = None
+        self._model_versions: Dict[str, str] = {}
         
-        # Connection pool
+        # Connection pool, with an adaptive concurrency limit per model
         self._http_client = None
-        self._connection_semaphore = asyncio.Semaphore(self.llm_settings.max_connections)
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
         
         # Batch processing
         self._batch_queue = asyncio.Queue()
         self._batch_processor_task = None
-        self._batch_results = {}
+        self._dispatchers: Dict[str, ModelDispatcher] = {}
+        
+        # Recent queue waits per priority class, for p50/p95 reporting
+        self._queue_waits: Dict[LLMPriority, Deque[float]] = {
+            priority: deque(maxlen=1000) for priority in LLMPriority
+        }
+        
+        # Single-flight table of generations in progress, by cache key
+        self._inflight: Dict[str, _InFlightGeneration] = {}
+        
+        # Latency and fallback rate per model route
+        self._route_metrics = RouteMetrics()
         
         # Model status tracking
         self._model_status = {}
@@ -81,7 +238,16 @@ class OptimizedLLMManager:
         # Performance metrics
         self._request_count = 0
         self._cache_hits = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
         self._total_execution_time = 0.0
+        self._total_queue_time = 0.0
+        self._cancelled_requests = 0
+        self._deduplicated_requests = 0
+        self._streamed_requests = 0
+        self._stream_early_stops = 0
+        self._total_first_chunk_time = 0.0
+        self.metrics_collector = get_metrics_collector()
     
     async def initialize(self):
         """Initialize the LLM manager with optimizations"""
@@ -107,6 +273,11 @@ class OptimizedLLMManager:
             http2=True  # Enable HTTP/2 for better performance
         )
         
+        # Open the persistent cache tier and warm the memory cache from it
+        if self._response_cache is not None and self.llm_settings.enable_disk_cache:
+            await self._refresh_model_versions()
+            await self._open_disk_cache()
+        
         # Start batch processor if enabled
         if self.llm_settings.enable_batch_processing:
             self._batch_processor_task = asyncio.create_task(self._batch_processor())
@@ -129,10 +300,20 @@ class OptimizedLLMManager:
             except asyncio.CancelledError:
                 pass
         
+        # Cancel in-flight and pending requests
+        for dispatcher in self._dispatchers.values():
+            await dispatcher.cancel_all()
+        for inflight in list(self._inflight.values()):
+            inflight.task.cancel()
+        
         # Close HTTP client
         if self._http_client:
             await self._http_client.aclose()
         
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+        
         # Log performance metrics
         self._log_performance_metrics()
         
@@ -156,6 +337,7 @@ class OptimizedLLMManager:
         cached_response = self._response_cache.get(cache_key)
         if cached_response:
             self._cache_hits += 1
+            self._memory_hits += 1
             logger.debug(f"Cache hit for key: {cache_key[:8]}...")
             return cached_response
         
@@ -163,10 +345,86 @@ class OptimizedLLMManager:
     
     def _cache_response(self, cache_key: str, response: str):
         """Cache response with TTL"""
-        if self._response_cache:
+        if self._response_cache is not None:
             self._response_cache[cache_key] = response
             logger.debug(f"Cached response for key: {cache_key[:8]}...")
     
+    def _model_version(self, model: str) -> str:
+        """Version tag for cache entries generated by a model"""
+        return self._model_versions.get(model, "unknown")
+    
+    async def _refresh_model_versions(self):
+        """Fetch model digests from Ollama so cached responses can be tagged by model version"""
+        try:
+            response = await self._http_client.get(f"{self.llm_settings.ollama_base_url}/api/tags")
+            if response.status_code != 200:
+                return
+            
+            for entry in response.json().get("models", []):
+                name, digest = entry.get("name"), entry.get("digest")
+                if not name or not digest:
+                    continue
+                self._model_versions[name] = digest
+                if name.endswith(":latest"):
+                    self._model_versions[name[:-len(":latest")]] = digest
+        except Exception as e:
+            logger.warning(f"Could not fetch model versions, cached responses will be tagged 'unknown': {e}")
+    
+    async def _open_disk_cache(self):
+        """Open the persistent cache and load its hottest entries into memory"""
+        try:
+            self._disk_cache = await asyncio.to_thread(
+                PersistentResponseCache,
+                self.llm_settings.disk_cache_path,
+                self.llm_settings.disk_cache_max_entries
+            )
+            hot_entries = await asyncio.to_thread(
+                self._disk_cache.hot_entries, self.llm_settings.disk_cache_warm_entries
+            )
+        except Exception as e:
+            logger.warning(f"Persistent LLM cache unavailable: {e}")
+            self._disk_cache = None
+            return
+        
+        warmed = 0
+        for cache_key, model, model_version, response in hot_entries:
+            if model_version == self._model_version(model):
+                self._cache_response(cache_key, response)
+                warmed += 1
+        
+        logger.info(
+            f"Persistent LLM cache opened with {len(self._disk_cache)} entries, "
+            f"{warmed} loaded into memory"
+        )
+    
+    async def _get_disk_cached_response(self, cache_key: str, model: str) -> Optional[str]:
+        """Get a response from the persistent tier and promote it to memory"""
+        if self._disk_cache is None:
+            return None
+        
+        try:
+            cached_response = await asyncio.to_thread(self._disk_cache.get, cache_key, self._model_version(model))
+        except Exception as e:
+            logger.warning(f"Persistent LLM cache read failed: {e}")
+            return None
+        
+        if cached_response:
+            self._cache_hits += 1
+            self._disk_hits += 1
+            self._cache_response(cache_key, cached_response)
+            logger.debug(f"Disk cache hit for key: {cache_key[:8]}...")
+        return cached_response
+    
+    async def _persist_response(self, cache_key: str, model: str, response: str):
+        """Write a response through to the persistent tier"""
+        if self._disk_cache is None:
+            return
+        
+        try:
+            await asyncio.to_thread(self._disk_cache.put, cache_key, model, self._model_version(model), response)
+        except Exception as e:
+            logger.warning(f"Persistent LLM cache write failed: {e}")
+    
     async def _warmup_models(self):
         """Warm up models to improve first-request performance"""
         logger.info("Starting model warmup...")
@@ -193,7 +451,7 @@ class OptimizedLLMManager:
         try:
             warmup_prompt = "Hello, this is a warmup request."
             
-            async with self._connection_semaphore:
+            async with self._get_limiter(model).slot(LLMPriority.BACKGROUND):
                 response = await self._http_client.post(
                     f"{self.llm_settings.ollama_base_url}/api/generate",
                     json={
@@ -214,81 +472,131 @@ class OptimizedLLMManager:
             logger.error(f"Error warming up model {model}: {e}")
     
     async def _batch_processor(self):
-        """Process LLM requests in batches for improved efficiency"""
+        """Hand queued LLM requests to their model's dispatcher as soon as they arrive"""
         logger.info("Starting batch processor...")
         
         while True:
             try:
-                batch = []
-                
-                # Collect requests for batch processing
-                try:
-                    # Wait for first request
-                    first_request = await asyncio.wait_for(
-                        self._batch_queue.get(),
-                        timeout=self.llm_settings.batch_timeout
-                    )
-                    batch.append(first_request)
-                    
-                    # Collect additional requests up to batch size
-                    for _ in range(self.llm_settings.batch_size - 1):
-                        try:
-                            request = await asyncio.wait_for(
-                                self._batch_queue.get(),
-                                timeout=0.1  # Short timeout for additional requests
-                            )
-                            batch.append(request)
-                        except asyncio.TimeoutError:
-                            break
-                            
-                except asyncio.TimeoutError:
-                    continue  # No requests to process
-                
-                # Process batch
-                if batch:
-                    await self._process_batch(batch)
+                request = await self._batch_queue.get()
+                self._get_dispatcher(request.model).submit(request)
                     
             except asyncio.CancelledError:
                 logger.info("Batch processor cancelled")
                 break
             except Exception as e:
                 logger.error(f"Error in batch processor: {e}")
-                await asyncio.sleep(1)  # Brief pause before retrying
+    
+    def _get_dispatcher(self, model: str) -> ModelDispatcher:
+        """Get or create the dispatcher for a model"""
+        dispatcher = self._dispatchers.get(model)
+        if dispatcher is None:
+            dispatcher = ModelDispatcher(
+                model,
+                self._get_limiter(model),
+                self._process_request,
+                starvation_timeout=self.llm_settings.priority_starvation_timeout
+            )
+            self._dispatchers[model] = dispatcher
+        return dispatcher
+    
+    def _get_limiter(self, model: str) -> AdaptiveConcurrencyLimiter:
+        """Get or create the concurrency limiter for a model"""
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(
+                model,
+                initial_limit=self.llm_settings.model_concurrency,
+                min_limit=self.llm_settings.concurrency_min_limit,
+                max_limit=self.llm_settings.concurrency_max_limit,
+                latency_tolerance=self.llm_settings.concurrency_latency_tolerance,
+                adaptive=self.llm_settings.adaptive_concurrency,
+                starvation_timeout=self.llm_settings.priority_starvation_timeout
+            )
+            self._limiters[model] = limiter
+        return limiter
     
     async def _process_batch(self, batch: List[LLMRequest]):
-        """Process a batch of LLM requests"""
+        """Process a batch of LLM requests concurrently, bounded per model"""
         logger.debug(f"Processing batch of {len(batch)} requests")
         
-        # Group requests by model for efficiency
-        model_groups = {}
+        loop = asyncio.get_running_loop()
         for request in batch:
-            if request.model not in model_groups:
-                model_groups[request.model] = []
-            model_groups[request.model].append(request)
+            if request.future is None:
+                request.future = loop.create_future()
+            self._get_dispatcher(request.model).submit(request)
         
-        # Process each model group
-        tasks = []
-        for model, requests in model_groups.items():
-            task = asyncio.create_task(self._process_model_batch(model, requests))
-            tasks.append(task)
+        await asyncio.gather(*(request.future for request in batch), return_exceptions=True)
+    
+    async def _process_request(self, request: LLMRequest):
+        """
+        Execute a queued request and resolve its future
+        
+        If the caller cancels while the request is still queued it is skipped;
+        if it cancels mid-flight the HTTP call is cancelled as well.
+        """
+        if request.future is not None and request.future.done():
+            self._record_cancelled(request, "queued")
+            return
+        
+        queue_time = time.time() - request.enqueued_at
+        self._record_queue_wait(request, queue_time)
+        
+        execution = asyncio.ensure_future(self._execute_single_request(request))
+        if request.future is not None:
+            request.future.add_done_callback(
+                lambda future: execution.cancel() if future.cancelled() else None
+            )
+        
+        try:
+            response = await execution
+        except asyncio.CancelledError:
+            if request.future is not None and request.future.cancelled():
+                self._record_cancelled(request, "in_flight")
+                return
+            raise
+        except Exception as e:
+            response = LLMResponse(
+                request_id=request.request_id,
+                content="",
+                model=request.model,
+                execution_time=0.0,
+                error=str(e)
+            )
         
-        await asyncio.gather(*tasks, return_exceptions=True)
+        response.queue_time = queue_time
+        if request.future is not None and not request.future.done():
+            request.future.set_result(response)
     
-    async def _process_model_batch(self, model: str, requests: List[LLMRequest]):
-        """Process requests for a specific model"""
-        for request in requests:
-            try:
-                response = await self._execute_single_request(request)
-                self._batch_results[request.request_id] = response
-            except Exception as e:
-                error_response = LLMResponse(
-                    request_id=request.request_id,
-                    content="",
-                    model=model,
-                    execution_time=0.0,
-                    error=str(e)
-                )
-                self._batch_results[request.request_id] = error_response
+    def _record_queue_wait(self, request: LLMRequest, queue_time: float):
+        """Record how long a request waited before being started, by priority class"""
+        self._total_queue_time += queue_time
+        self._queue_waits[LLMPriority(request.priority)].append(queue_time)
+        self.metrics_collector.record_timer(
+            "llm_queue_wait_duration",
+            queue_time * 1000,
+            labels={"model": request.model, "priority": LLMPriority(request.priority).value}
+        )
+    
+    def _queue_wait_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """p50/p95 queue wait per priority class over recent requests"""
+        percentiles = {}
+        for priority, waits in self._queue_waits.items():
+            values = list(waits)
+            if not values:
+                continue
+            percentiles[priority.value] = {
+                "count": len(values),
+                "p50": statistics.median(values),
+                "p95": statistics.quantiles(values, n=20)[18] if len(values) >= 20 else max(values)
+            }
+        return percentiles
+    
+    def _record_cancelled(self, request: LLMRequest, stage: str):
+        """Record a request abandoned by its caller"""
+        self._cancelled_requests += 1
+        self.metrics_collector.record_counter(
+            "llm_requests_cancelled", 1.0, labels={"model": request.model, "stage": stage}
+        )
     
     async def _execute_single_request(self, request: LLMRequest) -> LLMResponse:
         """Execute a single LLM request"""
@@ -304,6 +612,8 @@ class OptimizedLLMManager:
         )
         
         cached_response = self._get_cached_response(cache_key)
+        if not cached_response:
+            cached_response = await self._get_disk_cached_response(cache_key, request.model)
         if cached_response:
             return LLMResponse(
                 request_id=request.request_id,
@@ -313,16 +623,76 @@ class OptimizedLLMManager:
                 cached=True
             )
         
-        # Execute request
+        content = await self._single_flight(cache_key, request)
+        return LLMResponse(
+            request_id=request.request_id,
+            content=content,
+            model=request.model,
+            execution_time=time.time() - start_time
+        )
+    
+    async def _single_flight(self, cache_key: str, request: LLMRequest) -> str:
+        """
+        Run one generation per cache key, shared by all concurrent callers
+        
+        The first caller for a key starts the generation; identical requests
+        arriving before it completes await the same task instead of calling
+        the model again. The shared task is only cancelled once every caller
+        waiting on it has been cancelled.
+        """
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            task = asyncio.create_task(self._generate(cache_key, request))
+            inflight = _InFlightGeneration(task)
+            self._inflight[cache_key] = inflight
+            task.add_done_callback(lambda t, key=cache_key: self._finish_inflight(key, t))
+        else:
+            self._deduplicated_requests += 1
+            self.metrics_collector.record_counter(
+                "llm_requests_deduplicated", 1.0, labels={"model": request.model}
+            )
+            # Waiting on another request's generation does not use a model slot
+            _release_slot(self._get_limiter(request.model), request)
+        
+        inflight.waiters += 1
         try:
-            async with self._connection_semaphore:
+            return await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            if not inflight.task.done():
+                inflight.waiters -= 1
+                if inflight.waiters == 0:
+                    inflight.task.cancel()
+            raise
+    
+    def _finish_inflight(self, cache_key: str, task: asyncio.Task):
+        """Drop a completed generation from the in-flight table"""
+        if self._inflight.get(cache_key) is not None and self._inflight[cache_key].task is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Mark the exception retrieved; waiters have already received it
+            task.exception()
+    
+    async def _generate(self, cache_key: str, request: LLMRequest) -> str:
+        """Call the model for a request and cache the result"""
+        start_time = time.time()
+        
+        # Dispatched requests arrive holding a slot; only direct calls wait for one here
+        token, request.slot_token = request.slot_token, None
+        
+        try:
+            async with self._get_limiter(request.model).slot(request.priority, token=token):
+                if request.future is None:
+                    # Direct calls queue only for a concurrency slot
+                    self._record_queue_wait(request, time.time() - request.enqueued_at)
+                
                 payload = {
                     "model": request.model,
                     "prompt": request.prompt,
                     "stream": False,
                     "keep_alive": f"{self.llm_settings.model_keep_alive}s",
                     "options": {
-                        "temperature": request.temperature
+                        "temperature": request.temperature,
+                        "num_ctx": self.llm_settings.context_window_for(request.model)
                     }
                 }
                 
@@ -344,16 +714,15 @@ class OptimizedLLMManager:
                     
                     # Cache successful response
                     self._cache_response(cache_key, content)
+                    await self._persist_response(cache_key, request.model, content)
                     
                     execution_time = time.time() - start_time
                     self._total_execution_time += execution_time
-                    
-                    return LLMResponse(
-                        request_id=request.request_id,
-                        content=content,
-                        model=request.model,
-                        execution_time=execution_time
+                    self.metrics_collector.record_timer(
+                        "llm_model_duration", execution_time * 1000, labels={"model": request.model}
                     )
+                    
+                    return content
                 else:
                     raise Exception(f"LLM request failed with status {response.status_code}: {response.text}")
                     
@@ -368,7 +737,10 @@ class OptimizedLLMManager:
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         system_prompt: Optional[str] = None,
-        use_batch: bool = True
+        use_batch: bool = True,
+        priority: LLMPriority = LLMPriority.STANDARD,
+        task_class: Optional[LLMTaskClass] = None,
+        validate: Optional[Callable[[str], bool]] = None
     ) -> str:
         """
         Generate LLM response with optimizations
@@ -380,15 +752,71 @@ class OptimizedLLMManager:
             max_tokens: Maximum tokens to generate
             system_prompt: System prompt for context
             use_batch: Whether to use batch processing
+            priority: Scheduling class while waiting for the model
+            task_class: Kind of work; short classification and extraction
+                requests are tried on the small model first
+            validate: Check on a small-model answer; if it returns False
+                the request is re-run on ``model``
             
         Returns:
             Generated response content
         """
-        self._request_count += 1
-        
         if not model:
             model = self.llm_settings.gemma_model
         
+        def generate(on_model: str) -> Awaitable[str]:
+            return self._generate_with_model(
+                prompt, on_model, temperature, max_tokens, system_prompt, use_batch, priority
+            )
+        
+        if task_class is None:
+            return await generate(model)
+        
+        routed_model = select_model(self.llm_settings, model, task_class, prompt, max_tokens)
+        labels = {"route": LLMTaskClass(task_class).value, "model": routed_model}
+        start_time = time.time()
+        fell_back = False
+        try:
+            try:
+                content = await generate(routed_model)
+                if routed_model != model and validate is not None and not validate(content):
+                    raise ValueError("answer failed validation")
+            except Exception as e:
+                if routed_model == model:
+                    raise
+                logger.info(f"{labels['route']} request on {routed_model} falling back to {model}: {e}")
+                fell_back = True
+                self.metrics_collector.record_counter("llm_route_fallbacks", 1, labels=labels)
+                content = await generate(model)
+            return content
+        finally:
+            latency = time.time() - start_time
+            self._route_metrics.record(task_class, routed_model, latency, fell_back)
+            self.metrics_collector.record_timer("llm_route_duration", latency * 1000, labels=labels)
+    
+    def select_model(
+        self,
+        task_class: Optional[LLMTaskClass],
+        model: Optional[str] = None,
+        prompt: str = "",
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Model a routed request would be tried on first (e.g. to size prompts for it)"""
+        return select_model(self.llm_settings, model or self.llm_settings.gemma_model, task_class, prompt, max_tokens)
+    
+    async def _generate_with_model(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        system_prompt: Optional[str],
+        use_batch: bool,
+        priority: LLMPriority
+    ) -> str:
+        """Run one request on a specific model, through the batch queue or directly"""
+        self._request_count += 1
+        
         request_id = f"req_{int(time.time() * 1000)}_{self._request_count}"
         
         llm_request = LLMRequest(
@@ -397,24 +825,26 @@ class OptimizedLLMManager:
             request_id=request_id,
             temperature=temperature,
             max_tokens=max_tokens,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            priority=priority
         )
         
         if use_batch and self.llm_settings.enable_batch_processing:
-            # Add to batch queue
+            # Add to batch queue; the batch processor resolves the future
+            llm_request.future = asyncio.get_running_loop().create_future()
             await self._batch_queue.put(llm_request)
             
-            # Wait for result
+            # Wait for result. A timeout or caller cancellation cancels the
+            # future, which drops the queued request or cancels its HTTP call.
             max_wait_time = self.llm_settings.batch_timeout + self.llm_settings.model_timeout
-            for _ in range(int(max_wait_time * 10)):  # Check every 100ms
-                if request_id in self._batch_results:
-                    response = self._batch_results.pop(request_id)
-                    if response.error:
-                        raise Exception(response.error)
-                    return response.content
-                await asyncio.sleep(0.1)
+            try:
+                response = await asyncio.wait_for(llm_request.future, timeout=max_wait_time)
+            except asyncio.TimeoutError:
+                raise Exception("Batch processing timeout")
             
-            raise Exception("Batch processing timeout")
+            if response.error:
+                raise Exception(response.error)
+            return response.content
         else:
             # Execute immediately
             response = await self._execute_single_request(llm_request)
@@ -422,6 +852,151 @@ class OptimizedLLMManager:
                 raise Exception(response.error)
             return response.content
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        stop_at_json: bool = False,
+        progress_event: Optional[str] = None,
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> AsyncIterator[str]:
+        """
+        Stream an LLM response as it is generated
+        
+        Uses Ollama's streaming NDJSON output, bypassing the batch queue so
+        the first chunk reaches the caller as soon as the model produces it.
+        Closing the iterator early closes the connection, which stops
+        generation on the server.
+        
+        Args:
+            prompt: Input prompt
+            model: Model name (defaults to gemma:2b)
+            temperature: Response randomness
+            max_tokens: Maximum tokens to generate
+            system_prompt: System prompt for context
+            stop_at_json: Stop once a complete JSON object or array has been
+                generated; text after it is not yielded
+            progress_event: If set, chunks are also published under this
+                event name to the current progress channel (SSE stream)
+            priority: Scheduling class while waiting for the model; streams
+                default to interactive since someone is usually watching
+            
+        Yields:
+            Response text chunks
+        """
+        self._request_count += 1
+        self._streamed_requests += 1
+        
+        if not model:
+            model = self.llm_settings.gemma_model
+        
+        publish = progress_event is not None and get_progress_channel() is not None
+        
+        cache_key = self._generate_cache_key(
+            prompt,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            **({"stop_at_json": True} if stop_at_json else {})
+        )
+        
+        cached_response = self._get_cached_response(cache_key)
+        if not cached_response:
+            cached_response = await self._get_disk_cached_response(cache_key, model)
+        if cached_response:
+            if publish:
+                publish_progress(progress_event, {"model": model, "text": cached_response, "done": True})
+            yield cached_response
+            return
+        
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": f"{self.llm_settings.model_keep_alive}s",
+            "options": {
+                "temperature": temperature,
+                "num_ctx": self.llm_settings.context_window_for(model)
+            }
+        }
+        if max_tokens:
+            payload["options"]["num_predict"] = max_tokens
+        if system_prompt:
+            payload["system"] = system_prompt
+        
+        detector = JSONCompletionDetector() if stop_at_json else None
+        parts: List[str] = []
+        finished = False
+        early_stopped = False
+        start_time = time.time()
+        
+        async with self._get_limiter(model).slot(priority):
+            async with self._http_client.stream(
+                "POST",
+                f"{self.llm_settings.ollama_base_url}/api/generate",
+                json=payload,
+                timeout=self.llm_settings.model_timeout
+            ) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    raise Exception(f"LLM stream failed with status {response.status_code}: {body.decode(errors='replace')}")
+                
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    
+                    data = json.loads(line)
+                    if data.get("error"):
+                        raise Exception(f"LLM stream failed: {data['error']}")
+                    
+                    chunk = data.get("response", "")
+                    if detector is not None and chunk:
+                        chunk = chunk[:detector.feed(chunk)]
+                    
+                    if chunk:
+                        if not parts:
+                            first_chunk_time = time.time() - start_time
+                            self._total_first_chunk_time += first_chunk_time
+                            self.metrics_collector.record_timer(
+                                "llm_stream_first_chunk_duration", first_chunk_time * 1000, labels={"model": model}
+                            )
+                        parts.append(chunk)
+                        if publish:
+                            publish_progress(progress_event, {"model": model, "text": chunk})
+                        yield chunk
+                    
+                    if detector is not None and detector.complete:
+                        early_stopped = not data.get("done", False)
+                        finished = True
+                        break
+                    
+                    if data.get("done"):
+                        finished = True
+                        break
+        
+        if not finished:
+            # Connection ended without a final chunk; don't cache a partial response
+            return
+        
+        content = "".join(parts)
+        execution_time = time.time() - start_time
+        self._total_execution_time += execution_time
+        self.metrics_collector.record_timer(
+            "llm_model_duration", execution_time * 1000, labels={"model": model}
+        )
+        if early_stopped:
+            self._stream_early_stops += 1
+            self.metrics_collector.record_counter("llm_stream_early_stops", 1, labels={"model": model})
+        if publish:
+            publish_progress(progress_event, {"model": model, "done": True})
+        
+        self._cache_response(cache_key, content)
+        await self._persist_response(cache_key, model, content)
+    
     async def generate_batch_responses(
         self,
         requests: List[Dict[str, Any]]
@@ -435,6 +1010,7 @@ class OptimizedLLMManager:
         Returns:
             List of LLM responses
         """
+        loop = asyncio.get_running_loop()
         llm_requests = []
         for i, req in enumerate(requests):
             request_id = f"batch_{int(time.time() * 1000)}_{i}"
@@ -444,7 +1020,9 @@ class OptimizedLLMManager:
                 request_id=request_id,
                 temperature=req.get("temperature", 0.7),
                 max_tokens=req.get("max_tokens"),
-                system_prompt=req.get("system_prompt")
+                system_prompt=req.get("system_prompt"),
+                priority=req.get("priority", LLMPriority.STANDARD),
+                future=loop.create_future()
             )
             llm_requests.append(llm_request)
         
@@ -454,9 +1032,8 @@ class OptimizedLLMManager:
         # Collect results
         responses = []
         for request in llm_requests:
-            if request.request_id in self._batch_results:
-                response = self._batch_results.pop(request.request_id)
-                responses.append(response)
+            if request.future.done() and not request.future.cancelled():
+                responses.append(request.future.result())
             else:
                 # Create error response for missing results
                 error_response = LLMResponse(
@@ -474,15 +1051,35 @@ class OptimizedLLMManager:
         """Get performance metrics for monitoring"""
         cache_hit_rate = (self._cache_hits / self._request_count) if self._request_count > 0 else 0
         avg_execution_time = (self._total_execution_time / self._request_count) if self._request_count > 0 else 0
+        avg_queue_time = (self._total_queue_time / self._request_count) if self._request_count > 0 else 0
         
         return {
             "total_requests": self._request_count,
             "cache_hits": self._cache_hits,
             "cache_hit_rate": cache_hit_rate,
+            "memory_cache_hits": self._memory_hits,
+            "memory_cache_hit_rate": (self._memory_hits / self._request_count) if self._request_count > 0 else 0,
+            "disk_cache_hits": self._disk_hits,
+            "disk_cache_hit_rate": (self._disk_hits / self._request_count) if self._request_count > 0 else 0,
+            "disk_cache_size": len(self._disk_cache) if self._disk_cache is not None else 0,
             "avg_execution_time": avg_execution_time,
             "total_execution_time": self._total_execution_time,
+            "avg_queue_time": avg_queue_time,
+            "queue_wait_by_priority": self._queue_wait_percentiles(),
+            "total_queue_time": self._total_queue_time,
+            "cancelled_requests": self._cancelled_requests,
+            "deduplicated_requests": self._deduplicated_requests,
+            "inflight_generations": len(self._inflight),
+            "streamed_requests": self._streamed_requests,
+            "stream_early_stops": self._stream_early_stops,
+            "avg_time_to_first_chunk": (
+                self._total_first_chunk_time / self._streamed_requests
+            ) if self._streamed_requests > 0 else 0,
             "warmup_completed": self._warmup_completed,
             "model_status": self._model_status.copy(),
+            "routing": self._route_metrics.get_stats(),
+            "dispatch": {model: d.get_stats() for model, d in self._dispatchers.items()},
+            "concurrency": {model: l.get_stats() for model, l in self._limiters.items()},
             "cache_size": len(self._response_cache) if self._response_cache else 0,
             "batch_queue_size": self._batch_queue.qsize() if self._batch_queue else 0
         }
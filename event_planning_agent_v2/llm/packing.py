@@ -0,0 +1,142 @@
+"""
+Multi-task prompt packing.
+
+Sub-agents that call the LLM once per task repeat the same event context in
+every prompt. Packing sends several tasks in one prompt, with the shared
+context stated once, and asks for a JSON array with one object per task.
+The helpers here size packs to the model's context window and split the
+array back into per-task results; tasks whose entry is missing or malformed
+are left out so the caller can re-run just those one at a time.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters per token for English prompts on the Llama/Gemma tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a prompt fragment"""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def pack_size(context_window: int, prefix_tokens: int, tokens_per_task: int, max_tasks: int) -> int:
+    """
+    Number of tasks that fit in one prompt
+
+    Args:
+        context_window: Model context window in tokens (prompt and answer)
+        prefix_tokens: Tokens of the shared instructions and event context
+        tokens_per_task: Tokens of one task's details plus its share of the answer
+        max_tasks: Configured upper bound
+
+    Returns:
+        Pack size, at least 1
+    """
+    available = context_window - prefix_tokens
+    return max(1, min(max_tasks, available // max(1, tokens_per_task)))
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """Split items into consecutive packs of at most ``size``"""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def plan_packs(
+    tasks: Sequence[T],
+    render_task: Callable[[T], str],
+    prefix: str,
+    context_window: int,
+    answer_tokens_per_task: int,
+    max_tasks: int
+) -> List[List[T]]:
+    """
+    Split tasks into packs sized for the model's context window
+
+    Args:
+        tasks: Tasks to pack, in order
+        render_task: Formats one task's section of the prompt
+        prefix: The prompt without any task sections
+        context_window: Model context window in tokens
+        answer_tokens_per_task: Tokens budgeted for one task's answer
+        max_tasks: Configured upper bound on the pack size
+    """
+    if not tasks:
+        return []
+    tokens_per_task = max(estimate_tokens(render_task(task)) for task in tasks) + answer_tokens_per_task
+    size = pack_size(context_window, estimate_tokens(prefix), tokens_per_task, max_tasks)
+    return list(chunked(tasks, size))
+
+
+def extract_json_array(llm_response: str) -> List[Any]:
+    """
+    Extract the first JSON array from an LLM response
+
+    Tolerates markdown fences and prose around the array.
+
+    Raises:
+        ValueError: If no JSON array can be decoded
+    """
+    decoder = json.JSONDecoder()
+    start = llm_response.find("[")
+    while start != -1:
+        try:
+            parsed, _ = decoder.raw_decode(llm_response, start)
+        except json.JSONDecodeError as e:
+            if llm_response[start + 1:].lstrip().startswith("{"):
+                # The answer array itself is malformed or truncated; don't
+                # fall through to an array nested inside it
+                raise ValueError(f"Malformed JSON array in response: {e}") from e
+            parsed = None
+        if isinstance(parsed, list):
+            return parsed
+        # A bracket in surrounding prose; try the next one
+        start = llm_response.find("[", start + 1)
+    raise ValueError("No JSON array in response")
+
+
+def split_packed_response(
+    llm_response: str,
+    task_ids: Sequence[str],
+    id_key: str = "task_id"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Map a packed JSON array answer back to task IDs
+
+    Entries are matched by their ``id_key``. If no entry carries a known ID
+    but the array has exactly one object per task, they are matched by
+    position instead (small models often drop the IDs).
+
+    Args:
+        llm_response: Raw LLM response
+        task_ids: IDs of the tasks in the pack, in prompt order
+        id_key: Field holding the task ID in each entry
+
+    Returns:
+        Parsed entry per task ID; tasks without a usable entry are absent
+    """
+    try:
+        entries = extract_json_array(llm_response)
+    except ValueError as e:
+        logger.warning(f"Could not parse packed response for {len(task_ids)} tasks: {e}")
+        return {}
+
+    wanted = set(task_ids)
+    results: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        if isinstance(entry, dict):
+            task_id = str(entry.get(id_key, ""))
+            if task_id in wanted and task_id not in results:
+                results[task_id] = entry
+
+    if not results and len(entries) == len(task_ids) and all(isinstance(e, dict) for e in entries):
+        results = dict(zip(task_ids, entries))
+
+    return results
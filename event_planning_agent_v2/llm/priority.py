@@ -0,0 +1,119 @@
+"""
+Priority classes and weighted-fair queuing for LLM requests.
+
+Requests carry a priority class. Waiting requests are kept in one FIFO lane
+per class and lanes are served by smooth weighted round-robin, so under load
+interactive work gets most of the model slots without background work
+stalling completely. Any request that has waited longer than the starvation
+timeout is served next regardless of its class.
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class LLMPriority(str, Enum):
+    """Scheduling class of an LLM request"""
+    INTERACTIVE = "interactive"  # A user is waiting on the result
+    STANDARD = "standard"        # Workflow steps on the planning critical path
+    BACKGROUND = "background"    # Bulk enrichment that has a fallback
+
+
+DEFAULT_PRIORITY_WEIGHTS: Dict[LLMPriority, int] = {
+    LLMPriority.INTERACTIVE: 8,
+    LLMPriority.STANDARD: 3,
+    LLMPriority.BACKGROUND: 1,
+}
+
+
+class WeightedFairQueue(Generic[T]):
+    """
+    Per-priority FIFO lanes served by smooth weighted round-robin
+
+    With weights 8/3/1 and all lanes busy, out of every 12 items popped 8 are
+    interactive, 3 standard and 1 background, interleaved rather than in runs.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[LLMPriority, int]] = None,
+        starvation_timeout: Optional[float] = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.weights = dict(weights or DEFAULT_PRIORITY_WEIGHTS)
+        self.starvation_timeout = starvation_timeout
+        self.clock = clock
+        self._lanes: Dict[LLMPriority, Deque[Tuple[float, T]]] = {p: deque() for p in self.weights}
+        self._current: Dict[LLMPriority, int] = {p: 0 for p in self.weights}
+        self._size = 0
+        self.starvation_promotions = 0
+
+    def push(self, item: T, priority: LLMPriority = LLMPriority.STANDARD):
+        """Append an item to its priority lane"""
+        self._lanes[LLMPriority(priority)].append((self.clock(), item))
+        self._size += 1
+
+    def pop(self) -> T:
+        """Remove and return the next item to serve"""
+        if not self._size:
+            raise IndexError("pop from an empty WeightedFairQueue")
+
+        lane = self._starved_lane()
+        if lane is None:
+            lane = self._next_weighted_lane()
+        else:
+            self.starvation_promotions += 1
+
+        self._size -= 1
+        item = self._lanes[lane].popleft()[1]
+        if not self._lanes[lane]:
+            # An idle lane doesn't bank credit for when it refills
+            self._current[lane] = 0
+        return item
+
+    def _starved_lane(self) -> Optional[LLMPriority]:
+        """The lane whose head has waited past the starvation timeout, oldest first"""
+        if self.starvation_timeout is None:
+            return None
+
+        deadline = self.clock() - self.starvation_timeout
+        starved, oldest = None, None
+        for priority, lane in self._lanes.items():
+            if lane and lane[0][0] <= deadline and (oldest is None or lane[0][0] < oldest):
+                starved, oldest = priority, lane[0][0]
+        return starved
+
+    def _next_weighted_lane(self) -> LLMPriority:
+        """Smooth weighted round-robin over the non-empty lanes"""
+        total = 0
+        best = None
+        for priority, lane in self._lanes.items():
+            if not lane:
+                continue
+            weight = self.weights[priority]
+            self._current[priority] += weight
+            total += weight
+            if best is None or self._current[priority] > self._current[best]:
+                best = priority
+        self._current[best] -= total
+        return best
+
+    def remove(self, item: T) -> bool:
+        """Remove a specific item (e.g. a cancelled waiter); O(n)"""
+        for lane in self._lanes.values():
+            for entry in lane:
+                if entry[1] is item:
+                    lane.remove(entry)
+                    self._size -= 1
+                    return True
+        return False
+
+    def depth_by_priority(self) -> Dict[str, int]:
+        return {priority.value: len(lane) for priority, lane in self._lanes.items()}
+
+    def __len__(self) -> int:
+        return self._size
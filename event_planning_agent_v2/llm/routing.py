@@ -0,0 +1,108 @@
+"""
+Cost-aware model routing between the small and large Ollama models.
+
+Callers name the model they would normally use and tag the request with a
+task class. Short classification and extraction requests that fit in the
+small model's context window are tried on the small model first. If the call
+fails, or its output fails the caller's validation, the request is re-run on
+the requested model. Latency and fallback rate are tracked per route, so a
+route whose fallback rate makes it slower than going straight to the large
+model is easy to spot.
+"""
+
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from ..config.settings import LLMSettings
+from .packing import estimate_tokens
+
+
+class LLMTaskClass(str, Enum):
+    """Kind of work a prompt asks for"""
+    CLASSIFICATION = "classification"  # Pick a label, with at most a short rationale
+    EXTRACTION = "extraction"          # Pull structured fields out of the prompt
+    GENERATION = "generation"          # Long-form or creative text
+
+
+# Classes the small model handles well enough to try first
+SMALL_MODEL_CLASSES = frozenset({LLMTaskClass.CLASSIFICATION, LLMTaskClass.EXTRACTION})
+
+# Answer length assumed when the caller sets no max_tokens
+DEFAULT_ANSWER_TOKENS = 256
+
+
+def default_model_for(task_class: LLMTaskClass, llm_settings: LLMSettings) -> str:
+    """Configured model for a task class, for callers that can't fall back (e.g. CrewAI agents)"""
+    if task_class in SMALL_MODEL_CLASSES:
+        return llm_settings.tinyllama_model
+    return llm_settings.gemma_model
+
+
+def select_model(
+    llm_settings: LLMSettings,
+    model: str,
+    task_class: Optional[LLMTaskClass],
+    prompt: str = "",
+    max_tokens: Optional[int] = None
+) -> str:
+    """
+    Model to try first for a request
+
+    Args:
+        llm_settings: LLM settings (routing flag, model names, context windows)
+        model: Model the caller asked for; also the fallback
+        task_class: Kind of work, or None for no routing
+        prompt: Prompt text, to check it fits the small model
+        max_tokens: Answer budget
+
+    Returns:
+        The small model for short classification/extraction, otherwise ``model``
+    """
+    small_model = llm_settings.tinyllama_model
+    if not llm_settings.enable_model_routing or task_class not in SMALL_MODEL_CLASSES or model == small_model:
+        return model
+
+    needed = estimate_tokens(prompt) + (max_tokens or DEFAULT_ANSWER_TOKENS)
+    if needed > llm_settings.context_window_for(small_model):
+        return model
+    return small_model
+
+
+@dataclass
+class RouteStats:
+    """Outcomes of one route (task class and first model tried)"""
+    requests: int = 0
+    fallbacks: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "fallbacks": self.fallbacks,
+            "fallback_rate": round(self.fallbacks / self.requests, 4) if self.requests else 0.0,
+            "latency_p50": round(statistics.median(samples), 4) if samples else None,
+            "latency_p95": round(
+                statistics.quantiles(samples, n=20)[-1] if len(samples) >= 20 else samples[-1], 4
+            ) if samples else None,
+        }
+
+
+class RouteMetrics:
+    """Per-route latency and fallback statistics"""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], RouteStats] = {}
+
+    def record(self, task_class: LLMTaskClass, model: str, latency: float, fell_back: bool):
+        """Record one routed request; ``latency`` includes any fallback call"""
+        stats = self._routes.setdefault((LLMTaskClass(task_class).value, model), RouteStats())
+        stats.requests += 1
+        stats.fallbacks += int(fell_back)
+        stats.latencies.append(latency)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {f"{task_class}:{model}": stats.summary() for (task_class, model), stats in self._routes.items()}
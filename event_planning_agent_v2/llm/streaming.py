@@ -0,0 +1,84 @@
+"""
+Helpers for consuming streamed LLM output.
+
+Prompts that ask for a JSON answer often keep generating after the closing
+brace (explanations, a second example, a closing code fence). Feeding the
+stream through a JSONCompletionDetector lets the caller stop as soon as the
+first complete JSON value has been produced, which ends generation early and
+saves the remaining tokens.
+"""
+
+from typing import Optional
+
+
+class JSONCompletionDetector:
+    """
+    Incrementally finds the end of the first top-level JSON object or array
+
+    Text before the opening bracket (prose, a ```json fence) is skipped.
+    Brackets inside string literals, including escaped quotes, are ignored.
+    """
+
+    __slots__ = ("_buffer", "_length", "_start", "_depth", "_in_string", "_escaped", "_end")
+
+    def __init__(self):
+        self._buffer: list = []
+        self._length = 0
+        self._start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._end: Optional[int] = None
+
+    @property
+    def complete(self) -> bool:
+        """Whether a complete JSON value has been seen"""
+        return self._end is not None
+
+    def feed(self, chunk: str) -> int:
+        """
+        Consume a chunk of streamed text
+
+        Returns:
+            The number of characters of ``chunk`` up to and including the end
+            of the JSON value, or ``len(chunk)`` if it has not ended yet.
+        """
+        if self._end is not None:
+            return 0
+
+        offset = self._length
+        self._buffer.append(chunk)
+        self._length += len(chunk)
+
+        for index, char in enumerate(chunk):
+            if self._start is None:
+                if char in "{[":
+                    self._start = offset + index
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = offset + index + 1
+                    return index + 1
+
+        return len(chunk)
+
+    @property
+    def json_text(self) -> Optional[str]:
+        """The complete JSON value, once detected"""
+        if self._end is None:
+            return None
+        return "".join(self._buffer)[self._start:self._end]
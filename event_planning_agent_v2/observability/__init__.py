@@ -6,12 +6,14 @@ This module provides comprehensive observability capabilities including:
 - Performance metrics collection for agents and workflows
 - Health check endpoints and monitoring dashboards
 - Distributed tracing and request tracking
+- Plan-scoped progress events for SSE streams
 """
 
 from .logging import *
 from .metrics import *
 from .tracing import *
 from .health import *
+from .progress import *
 
 __all__ = [
     # Logging
@@ -40,5 +42,13 @@ __all__ = [
     'HealthChecker',
     'HealthStatus',
     'ComponentHealth',
-    'get_health_checker'
+    'get_health_checker',
+    
+    # Progress
+    'ProgressBroker',
+    'ProgressEvent',
+    'get_progress_broker',
+    'progress_channel',
+    'get_progress_channel',
+    'publish_progress'
 ]
\ No newline at end of file
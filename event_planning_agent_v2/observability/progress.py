@@ -0,0 +1,171 @@
+"""
+Plan-scoped progress events for server-sent event (SSE) streams.
+
+Background workflows publish progress (streamed LLM tokens, blueprint
+sections) to a channel named after the plan; API clients subscribe to the
+channel and receive the events as they happen instead of polling the plan.
+The active channel is carried in a context variable, so code deep in the
+agent stack can publish without the plan ID being threaded through it.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Progress channel (normally the plan ID) for the current context
+progress_channel_context: ContextVar[Optional[str]] = ContextVar('progress_channel', default=None)
+
+
+@dataclass
+class ProgressEvent:
+    """A single progress event"""
+    event: str
+    data: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+    def to_sse(self) -> str:
+        """Encode as a server-sent event frame"""
+        payload = json.dumps({**self.data, "timestamp": self.timestamp}, default=str)
+        return f"event: {self.event}\ndata: {payload}\n\n"
+
+
+class ProgressSubscription:
+    """Bounded queue of events for one subscriber"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def deliver(self, event: ProgressEvent):
+        """Enqueue an event, dropping the oldest one if the subscriber is slow"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def events(self, heartbeat: Optional[float] = None) -> AsyncIterator[Optional[ProgressEvent]]:
+        """
+        Iterate over events as they arrive
+
+        With a heartbeat interval, ``None`` is yielded whenever no event
+        arrived within it, so SSE streams can send keep-alive comments.
+        """
+        while True:
+            try:
+                if heartbeat is None:
+                    yield await self.queue.get()
+                else:
+                    yield await asyncio.wait_for(self.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+
+class ProgressBroker:
+    """
+    Fan-out of progress events to channel subscribers
+
+    Publishing is thread-safe: events from worker threads (sync CrewAI tools
+    run through ``asyncio.to_thread``) are handed to each subscriber's event
+    loop. Publishing to a channel with no subscribers is a no-op.
+    """
+
+    def __init__(self, max_queue: int = 256):
+        self.max_queue = max_queue
+        self._subscribers: Dict[str, List[ProgressSubscription]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(self, channel: str):
+        """Subscribe to a channel for the duration of the context"""
+        subscription = ProgressSubscription(asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(channel, [])
+                if subscription in subscribers:
+                    subscribers.remove(subscription)
+                if not subscribers:
+                    self._subscribers.pop(channel, None)
+
+    def has_subscribers(self, channel: str) -> bool:
+        return bool(self._subscribers.get(channel))
+
+    def publish(self, channel: str, event: str, data: Dict[str, Any]):
+        """Publish an event to every subscriber of a channel"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        if not subscribers:
+            return
+
+        progress_event = ProgressEvent(event=event, data=data)
+        for subscription in subscribers:
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+
+            if running_loop is subscription.loop:
+                subscription.deliver(progress_event)
+            else:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.deliver, progress_event)
+                except RuntimeError:
+                    # Subscriber's loop has closed
+                    logger.debug(f"Dropping progress event for closed subscriber on {channel}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "channels": len(self._subscribers),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+            }
+
+
+# Global progress broker instance
+_progress_broker: Optional[ProgressBroker] = None
+
+
+def get_progress_broker() -> ProgressBroker:
+    """Get global progress broker instance"""
+    global _progress_broker
+    if _progress_broker is None:
+        _progress_broker = ProgressBroker()
+    return _progress_broker
+
+
+@contextmanager
+def progress_channel(channel: str):
+    """Route progress published in this context to ``channel``"""
+    token = progress_channel_context.set(channel)
+    try:
+        yield channel
+    finally:
+        progress_channel_context.reset(token)
+
+
+def get_progress_channel() -> Optional[str]:
+    """Get the progress channel for the current context"""
+    return progress_channel_context.get()
+
+
+def publish_progress(event: str, data: Dict[str, Any], channel: Optional[str] = None):
+    """
+    Publish a progress event to the given or current context's channel
+
+    Does nothing outside a progress channel context.
+    """
+    channel = channel or progress_channel_context.get()
+    if channel:
+        get_progress_broker().publish(channel, event, data)
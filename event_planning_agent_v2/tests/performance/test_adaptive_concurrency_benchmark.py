@@ -0,0 +1,109 @@
+"""
+Latency benchmark for adaptive LLM concurrency limits.
+
+Runs a local fake Ollama server that behaves like a CPU-only host: latency is
+flat up to its core count and grows linearly with concurrency beyond it, so
+throughput is capped. Compares a fixed, too-high limit with the adaptive
+limit under the same burst of requests.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+import pytest
+
+import httpx
+from aiohttp import web
+
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager
+
+logger = logging.getLogger(__name__)
+
+HOST_CORES = 2
+BASE_LATENCY = 0.02
+REQUESTS = 300
+FIXED_LIMIT = 16
+
+
+async def _start_fake_ollama(latencies: list):
+    active = 0
+
+    async def generate(request):
+        nonlocal active
+        payload = await request.json()
+        active += 1
+        latency = BASE_LATENCY * max(1.0, active / HOST_CORES)
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            active -= 1
+        latencies.append(latency)
+        return web.json_response({"model": payload["model"], "response": f"ok:{payload['prompt']}", "done": True})
+
+    app = web.Application()
+    app.router.add_post("/api/generate", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _run(base_url: str, latencies: list, adaptive: bool) -> dict:
+    manager = OptimizedLLMManager()
+    manager.llm_settings = manager.llm_settings.model_copy(update={
+        "model_concurrency": FIXED_LIMIT,
+        "adaptive_concurrency": adaptive,
+        "concurrency_max_limit": FIXED_LIMIT,
+        "ollama_base_url": base_url,
+        "enable_response_cache": False
+    })
+    manager._response_cache = None
+    manager._http_client = httpx.AsyncClient(limits=httpx.Limits(max_connections=FIXED_LIMIT * 2))
+    limiter = manager._get_limiter("tinyllama")
+    latencies.clear()
+
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            manager.generate_response(f"prompt {i}", model="tinyllama", use_batch=False) for i in range(REQUESTS)
+        ])
+        elapsed = time.perf_counter() - start
+    finally:
+        await manager.shutdown()
+
+    assert results == [f"ok:prompt {i}" for i in range(REQUESTS)]
+    return {
+        "requests_per_second": REQUESTS / elapsed,
+        "model_latency_p50": statistics.median(latencies),
+        "final_limit": limiter.limit
+    }
+
+
+@pytest.mark.load
+def test_adaptive_limit_keeps_latency_down_on_saturated_host():
+    async def run():
+        latencies = []
+        runner, base_url = await _start_fake_ollama(latencies)
+        try:
+            return {
+                "fixed": await _run(base_url, latencies, adaptive=False),
+                "adaptive": await _run(base_url, latencies, adaptive=True),
+            }
+        finally:
+            await runner.cleanup()
+
+    results = asyncio.run(run())
+
+    for name, result in results.items():
+        logger.info(
+            f"{name}: {result['requests_per_second']:.1f} req/s, "
+            f"p50 model latency {result['model_latency_p50'] * 1000:.1f} ms, final limit {result['final_limit']}"
+        )
+
+    fixed, adaptive = results["fixed"], results["adaptive"]
+    assert adaptive["final_limit"] < FIXED_LIMIT
+    assert adaptive["model_latency_p50"] < 0.7 * fixed["model_latency_p50"]
+    assert adaptive["requests_per_second"] > 0.8 * fixed["requests_per_second"]
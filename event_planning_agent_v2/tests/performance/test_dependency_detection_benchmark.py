@@ -0,0 +1,109 @@
+"""
+Benchmark for rule-based dependency detection in the Resource & Dependency Agent.
+
+Generates synthetic granular task lists (top-level tasks with sub-tasks whose
+descriptions mention other tasks by name) and times detecting every task's
+dependencies with the per-task rescans the agent used before the dependency
+index, against the indexed pass. The rescan is quadratic in the task count,
+so it is only timed on the smaller lists.
+"""
+
+import logging
+import time
+import pytest
+from datetime import timedelta
+
+from event_planning_agent_v2.agents.task_management.models.task_models import GranularTask
+from event_planning_agent_v2.agents.task_management.sub_agents.resource_dependency_agent import ResourceDependencyAgentCore
+
+logger = logging.getLogger(__name__)
+
+SUB_TASKS_PER_PARENT = 4
+VERBS = ["Plan", "Book", "Coordinate", "Setup", "Execute", "Confirm", "Review", "Deliver", "Arrange", "Finalize"]
+SUBJECTS = ["venue", "catering", "photography", "decor", "music", "transport", "guest list", "lighting"]
+
+
+def _synthetic_tasks(count: int):
+    tasks = []
+    parent = None
+    for i in range(count):
+        name = f"{VERBS[i % len(VERBS)]} {SUBJECTS[i % len(SUBJECTS)]} item {i}"
+        if i % (SUB_TASKS_PER_PARENT + 1) == 0:
+            parent = f"task_{i}"
+            tasks.append(GranularTask(parent, None, name, f"Own the {SUBJECTS[i % len(SUBJECTS)]} workstream", 0, timedelta(hours=4)))
+            continue
+        mentioned = tasks[(i * 7) % len(tasks)].task_name.lower()
+        description = f"Start once {mentioned} is done, then handle the {SUBJECTS[(i * 3) % len(SUBJECTS)]} details"
+        tasks.append(GranularTask(f"task_{i}", parent, name, description, 1, timedelta(hours=2)))
+    return tasks
+
+
+def _rescan_dependencies(agent, task, all_tasks):
+    """Dependency detection as it was before the index: every strategy rescans all_tasks"""
+    dependencies = []
+    if task.parent_task_id:
+        if any(t.task_id == task.parent_task_id for t in all_tasks):
+            dependencies.append(task.parent_task_id)
+        siblings = [t for t in all_tasks if t.parent_task_id == task.parent_task_id and t.task_id != task.task_id]
+        dependencies.extend(agent._detect_sibling_dependencies(task, siblings))
+
+    task_name_lower = task.task_name.lower()
+    task_desc_lower = task.task_description.lower()
+    for other in all_tasks:
+        if other.task_id != task.task_id and other.task_name.lower() in task_desc_lower:
+            if any(k in task_desc_lower for keywords in agent.DEPENDENCY_KEYWORDS.values() for k in keywords):
+                dependencies.append(other.task_id)
+
+    for task_keyword, prerequisites in agent.LOGICAL_DEPENDENCY_RULES.items():
+        if task_keyword in task_name_lower or task_keyword in task_desc_lower:
+            for other in all_tasks:
+                if other.task_id == task.task_id:
+                    continue
+                other_name_lower = other.task_name.lower()
+                other_desc_lower = other.task_description.lower()
+                if any(k in other_name_lower or k in other_desc_lower for k in prerequisites):
+                    dependencies.append(other.task_id)
+
+    return set(dependencies) - {task.task_id}
+
+
+def _time_rescan(agent, tasks):
+    start = time.perf_counter()
+    result = {t.task_id: _rescan_dependencies(agent, t, tasks) for t in tasks}
+    return time.perf_counter() - start, result
+
+
+def _time_indexed(agent, tasks):
+    start = time.perf_counter()
+    index = agent._build_dependency_index(tasks)
+    result = {t.task_id: set(agent._detect_dependencies(t, tasks, index)) for t in tasks}
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.load
+def test_dependency_detection_scaling():
+    agent = ResourceDependencyAgentCore()
+
+    rescan_times = {}
+    indexed_times = {}
+    for count in (500, 1000, 2000):
+        tasks = _synthetic_tasks(count)
+        rescan_times[count], expected = _time_rescan(agent, tasks)
+        indexed_times[count], actual = _time_indexed(agent, tasks)
+        assert actual == expected
+
+    tasks = _synthetic_tasks(5000)
+    indexed_times[5000], result = _time_indexed(agent, tasks)
+    assert len(result) == 5000
+
+    logger.info(
+        "Dependency detection benchmark: "
+        + ", ".join(
+            f"{n} tasks rescan {rescan_times[n]:.2f}s / indexed {indexed_times[n]:.2f}s" for n in rescan_times
+        )
+        + f", 5000 tasks indexed {indexed_times[5000]:.2f}s"
+    )
+
+    # The rescan roughly quadruples when the task count doubles; the index stays well ahead of it
+    assert indexed_times[2000] * 5 < rescan_times[2000]
+    assert indexed_times[5000] < rescan_times[2000]
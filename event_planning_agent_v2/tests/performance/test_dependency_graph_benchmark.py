@@ -0,0 +1,82 @@
+"""
+Benchmark for the consolidated dependency graph.
+
+Consolidates a 50k-task plan made of dependency chains (one of them 25k
+tasks deep, far past the recursion limit) with a cycle every 1000 tasks,
+then schedules it. Reports the time to build the graph during
+consolidation, and the time of the timeline calculation reusing that graph
+against rebuilding it.
+"""
+
+import logging
+import time
+import pytest
+from datetime import timedelta
+
+from event_planning_agent_v2.agents.task_management.core.data_consolidator import DataConsolidator
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import ConsolidatedTaskData
+from event_planning_agent_v2.agents.task_management.models.dependency_graph import build_dependency_graph
+from event_planning_agent_v2.agents.task_management.models.task_models import (
+    GranularTask, PrioritizedTask, TaskWithDependencies
+)
+from event_planning_agent_v2.agents.task_management.tools.timeline_calculation_tool import TimelineCalculationTool
+
+logger = logging.getLogger(__name__)
+
+TASKS = 50_000
+CYCLE_EVERY = 1000
+STATE = {"client_request": {"eventDate": "2024-12-14"}}
+
+
+def _sub_agent_outputs(count: int):
+    prioritized, granular, dependency = [], [], []
+    for i in range(count):
+        task_id = f"task_{i}"
+        if i % CYCLE_EVERY == 1:
+            dependencies = [f"task_{i - 1}", f"task_{i + 1}"]  # Closes a cycle with the next task
+        elif i and i % 10:
+            dependencies = [f"task_{i - 1}"]
+        else:
+            dependencies = []
+        if i % 10 == 0 and i >= count // 2:
+            dependencies = [f"task_{i - 1}"]  # Second half is one deep chain
+
+        prioritized.append(PrioritizedTask(task_id, f"Task {i}", "Medium", 0.5, ""))
+        granular.append(GranularTask(task_id, None, f"Task {i}", f"Complete task {i}", 0, timedelta(minutes=30)))
+        dependency.append(TaskWithDependencies(task_id, f"Task {i}", dependencies, []))
+    return prioritized, granular, dependency
+
+
+@pytest.mark.load
+def test_dependency_graph_at_50k_tasks():
+    outputs = _sub_agent_outputs(TASKS)
+    tool = TimelineCalculationTool()
+
+    started = time.perf_counter()
+    data = DataConsolidator().consolidate_sub_agent_data(*outputs)
+    consolidated = time.perf_counter() - started
+
+    started = time.perf_counter()
+    build_dependency_graph(data.tasks)
+    graph_build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rebuilt = tool.calculate_timelines(ConsolidatedTaskData(tasks=data.tasks), STATE)
+    rebuilding = time.perf_counter() - started
+
+    started = time.perf_counter()
+    reused = tool.calculate_timelines(data, STATE)
+    reusing = time.perf_counter() - started
+
+    graph = data.dependency_graph
+    assert len(graph.task_ids) == TASKS
+    assert len(graph.cycles) == TASKS // CYCLE_EVERY
+    assert reused == rebuilt
+
+    logger.info(
+        f"Dependency graph benchmark: {TASKS} tasks, {len(graph.cycles)} cycles, "
+        f"consolidation {consolidated * 1000:.0f}ms (graph {graph_build * 1000:.0f}ms), "
+        f"timelines rebuilding the graph {rebuilding * 1000:.0f}ms, reusing it {reusing * 1000:.0f}ms"
+    )
+
+    assert reusing < rebuilding
@@ -0,0 +1,89 @@
+"""
+Throughput benchmark for concurrent per-model LLM dispatch.
+
+Runs a local fake Ollama server whose /api/generate sleeps a fixed time per
+request, and measures how throughput scales with the per-model concurrency
+limit.
+"""
+
+import asyncio
+import logging
+import time
+import pytest
+
+import httpx
+from aiohttp import web
+
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager
+
+logger = logging.getLogger(__name__)
+
+REQUEST_DELAY = 0.1
+REQUESTS = 16
+
+
+async def _start_fake_ollama():
+    async def generate(request):
+        payload = await request.json()
+        await asyncio.sleep(REQUEST_DELAY)
+        return web.json_response({"model": payload["model"], "response": f"ok:{payload['prompt']}", "done": True})
+
+    app = web.Application()
+    app.router.add_post("/api/generate", generate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _throughput(base_url: str, concurrency: int) -> dict:
+    manager = OptimizedLLMManager()
+    manager.llm_settings = manager.llm_settings.model_copy(
+        update={
+            "model_concurrency": concurrency, "adaptive_concurrency": False,
+            "ollama_base_url": base_url, "enable_response_cache": False
+        }
+    )
+    manager._response_cache = None
+    manager._http_client = httpx.AsyncClient()
+    manager._batch_processor_task = asyncio.create_task(manager._batch_processor())
+
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            manager.generate_response(f"prompt {i}", model="tinyllama") for i in range(REQUESTS)
+        ])
+        elapsed = time.perf_counter() - start
+        stats = manager.get_performance_metrics()["dispatch"]["tinyllama"]
+    finally:
+        await manager.shutdown()
+
+    assert results == [f"ok:prompt {i}" for i in range(REQUESTS)]
+    return {
+        "requests_per_second": REQUESTS / elapsed,
+        "effective_parallelism": stats["effective_parallelism"]
+    }
+
+
+@pytest.mark.load
+def test_throughput_scales_with_model_concurrency():
+    async def run():
+        runner, base_url = await _start_fake_ollama()
+        try:
+            return {c: await _throughput(base_url, c) for c in (1, 4, 8)}
+        finally:
+            await runner.cleanup()
+
+    results = asyncio.run(run())
+
+    for concurrency, result in results.items():
+        logger.info(
+            f"model_concurrency={concurrency}: {result['requests_per_second']:.1f} req/s, "
+            f"effective parallelism {result['effective_parallelism']}"
+        )
+
+    assert results[4]["requests_per_second"] > 3 * results[1]["requests_per_second"]
+    assert results[8]["requests_per_second"] > results[4]["requests_per_second"]
+    assert results[8]["effective_parallelism"] > 6
@@ -0,0 +1,137 @@
+"""
+Benchmark for plan-scoped logistics context.
+
+Runs the Logistics Check and Venue Lookup tools over a 1k-task plan whose
+tasks need equipment from a venue and vendors with large equipment
+vocabularies, against a fake database that adds a fixed latency per query.
+Reports the time of both tools loading their own records against sharing
+one context, and the database queries each made.
+"""
+
+import logging
+import time
+import pytest
+from datetime import timedelta
+from types import SimpleNamespace
+
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import (
+    ConsolidatedTask, ConsolidatedTaskData
+)
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource
+from event_planning_agent_v2.agents.task_management.tools.logistics_check_tool import LogisticsCheckTool
+from event_planning_agent_v2.agents.task_management.tools.logistics_context import SharedLogisticsContext
+from event_planning_agent_v2.agents.task_management.tools.venue_lookup_tool import VenueLookupTool
+
+logger = logging.getLogger(__name__)
+
+TASKS = 1000
+QUERY_LATENCY = 0.005
+EQUIPMENT = [f"{i:03d} stage equipment" for i in range(120)]
+STATE = {
+    "selected_combination": {
+        "venue": {"vendor_id": "venue_1"},
+        "caterer": {"vendor_id": "caterer_1"},
+        "photographer": {"vendor_id": "photographer_1"},
+        "makeup_artist": {"vendor_id": "makeup_1"},
+    }
+}
+
+
+def _record(**fields):
+    base = dict(
+        vendor_id="v", name="Vendor", area_type="Banquet", location_city="Mumbai", location_full="Andheri, Mumbai",
+        max_seating_capacity=400, ideal_capacity=300, room_count=3, rental_cost=1000, room_cost=100,
+        decor_options={}, attributes={}, policies={"limited_setup_time": False},
+        max_guest_capacity=400, video_available=True, on_site_service=True,
+    )
+    base.update(fields)
+    return SimpleNamespace(**base)
+
+
+class FakeDatabase:
+    """Answers every query with the same record after a fixed latency"""
+
+    def __init__(self):
+        self.queries = 0
+        self.record = _record(
+            decor_options={name.replace(" ", "_"): True for name in EQUIPMENT[:50]},
+            attributes={f"feature_{i}": True for i in range(50)},
+        )
+
+    def get_sync_session(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def query(self, model):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        self.queries += 1
+        time.sleep(QUERY_LATENCY)
+        return self.record
+
+
+def _plan():
+    return ConsolidatedTaskData(tasks=[
+        ConsolidatedTask(
+            task_id=f"task_{i}",
+            task_name=f"Setup decoration area {i}",
+            priority_level="High",
+            priority_score=0.5,
+            priority_rationale="",
+            parent_task_id=None,
+            task_description="Arrange delivery of the stage equipment",
+            granularity_level=1,
+            estimated_duration=timedelta(hours=1),
+            resources_required=[
+                Resource("equipment", f"eq_{j}", EQUIPMENT[(i * 7 + j * 5) % len(EQUIPMENT)].title(), 1)
+                for j in range(3)
+            ],
+        )
+        for i in range(TASKS)
+    ])
+
+
+def _run(shared: bool):
+    db = FakeDatabase()
+    logistics_tool = LogisticsCheckTool(db_connection=db)
+    venue_tool = VenueLookupTool(db_connection=db, use_mcp=False)
+    data = _plan()
+
+    started = time.perf_counter()
+    if shared:
+        context = SharedLogisticsContext(db, STATE["selected_combination"])
+        statuses = logistics_tool.verify_logistics(data, STATE, context=context.get())
+        venues = venue_tool.lookup_venues(data, STATE, context=context.get())
+    else:
+        statuses = logistics_tool.verify_logistics(data, STATE)
+        venues = venue_tool.lookup_venues(data, STATE)
+    return time.perf_counter() - started, db.queries, statuses, venues
+
+
+@pytest.mark.load
+def test_shared_logistics_context_at_1k_tasks():
+    separate, separate_queries, expected_statuses, expected_venues = _run(shared=False)
+    shared, shared_queries, statuses, venues = _run(shared=True)
+
+    assert statuses == expected_statuses
+    assert venues == expected_venues
+    assert len(statuses) == TASKS
+    assert any(s.equipment_status == "issue" for s in statuses)
+    assert any(s.equipment_status == "verified" for s in statuses)
+
+    logger.info(
+        f"Logistics context benchmark: {TASKS} tasks, separate loads {separate * 1000:.0f}ms "
+        f"({separate_queries} queries), shared context {shared * 1000:.0f}ms ({shared_queries} queries)"
+    )
+
+    assert shared_queries == 4
+    assert shared < 1.0
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of middleware overhead on a no-op route.
+
+"Before" is eight BaseHTTPMiddleware layers that do nothing but call
+``call_next``, i.e. the bare wrapping cost of the previous middleware stack.
+"After" is the full RequestPipelineMiddleware, doing all of its real work.
+"""
+
+import asyncio
+import logging
+import time
+import pytest
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from event_planning_agent_v2.api.middleware import (
+    RequestPipelineMiddleware, AuthConfig, RateLimitConfig
+)
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = 1000
+WARMUP = 100
+
+
+class _PassthroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def _noop_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/noop")
+    async def noop():
+        return {"ok": True}
+
+    return app
+
+
+def _requests_per_second(app) -> float:
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(WARMUP):
+                await client.get("/noop")
+
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                response = await client.get("/noop")
+                assert response.status_code == 200
+            return REQUESTS / (time.perf_counter() - start)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.load
+def test_pipeline_beats_base_http_middleware_stack():
+    before_app = _noop_app()
+    for _ in range(8):
+        before_app.add_middleware(_PassthroughMiddleware)
+
+    after_app = _noop_app()
+    after_app.add_middleware(
+        RequestPipelineMiddleware,
+        auth_config=AuthConfig(enabled=False),
+        rate_limit_config=RateLimitConfig(enabled=False)
+    )
+
+    bare_rps = _requests_per_second(_noop_app())
+    before_rps = _requests_per_second(before_app)
+    after_rps = _requests_per_second(after_app)
+
+    logger.info(
+        f"No-op route: bare app {bare_rps:.0f} req/s, "
+        f"8x BaseHTTPMiddleware {before_rps:.0f} req/s, "
+        f"RequestPipelineMiddleware {after_rps:.0f} req/s"
+    )
+
+    assert after_rps > before_rps
@@ -0,0 +1,122 @@
+"""
+Benchmark for dashboard polling of plan status.
+
+Simulates a dashboard session that polls GET /v1/plans/{plan_id} while the
+plan is mostly unchanged, and compares bytes on the wire and server CPU time
+with and without ETag revalidation and response compression.
+"""
+
+import logging
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from event_planning_agent_v2.api import routes
+from event_planning_agent_v2.api.middleware import CompressionMiddleware
+
+logger = logging.getLogger(__name__)
+
+PLAN_ID = "6f1c1f0e-8a7e-4d5b-9a51-0c2f8f0d9a11"
+POLLS = 60
+CHANGE_EVERY = 15
+
+
+def _plan_data(revision: int) -> dict:
+    def vendor(service_type: str, i: int) -> dict:
+        return {
+            "vendor_id": f"{service_type}-{i}",
+            "name": f"{service_type.title()} {i}",
+            "service_type": service_type,
+            "location_city": "Bangalore",
+            "price_info": {"base_price": 50000.0 + i * 1000},
+        }
+
+    combinations = [
+        {
+            "combination_id": f"combo-{i}",
+            "venue": vendor("venue", i),
+            "caterer": vendor("caterer", i),
+            "photographer": vendor("photographer", i),
+            "total_score": 0.9 - i / 100,
+            "estimated_cost": 270000.0 + i,
+            "feasibility_score": 0.8,
+        }
+        for i in range(20)
+    ]
+    return {
+        "plan_id": PLAN_ID,
+        "status": "completed",
+        "client_name": "Priya Sharma",
+        "combinations": combinations,
+        "selected_combination": combinations[0],
+        "final_blueprint": "Day-of timeline and vendor contacts. " * 400,
+        "revision": revision,
+        "created_at": datetime(2024, 6, 1, 10, 0, 0),
+        "updated_at": datetime(2024, 6, 1, 11, revision % 60, 0),
+    }
+
+
+def _make_client(compress: bool):
+    state = {"revision": 1}
+    manager = Mock()
+    manager.load_plan.side_effect = lambda plan_id: _plan_data(state["revision"])
+    manager.get_plan_version.side_effect = lambda plan_id: (
+        _plan_data(state["revision"])["updated_at"], state["revision"]
+    )
+
+    app = FastAPI()
+    if compress:
+        app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    app.include_router(routes.router)
+    app.dependency_overrides[routes.get_db_state_manager] = lambda: manager
+    return TestClient(app), state
+
+
+def _run_session(use_etag: bool, compress: bool) -> dict:
+    client, state = _make_client(compress)
+    headers = {"Accept-Encoding": "gzip" if compress else "identity"}
+    etag = None
+    wire_bytes = 0
+    not_modified = 0
+
+    cpu_start = time.process_time()
+    for poll in range(POLLS):
+        if poll and poll % CHANGE_EVERY == 0:
+            state["revision"] += 1
+
+        request_headers = dict(headers)
+        if use_etag and etag:
+            request_headers["If-None-Match"] = etag
+
+        response = client.get(f"/v1/plans/{PLAN_ID}", headers=request_headers)
+        assert response.status_code in (200, 304)
+
+        wire_bytes += int(response.headers.get("content-length", len(response.content)))
+        if response.status_code == 304:
+            not_modified += 1
+        else:
+            etag = response.headers.get("etag")
+    cpu_seconds = time.process_time() - cpu_start
+
+    return {"bytes": wire_bytes, "cpu_seconds": cpu_seconds, "not_modified": not_modified}
+
+
+@pytest.mark.load
+def test_dashboard_polling_bytes_and_cpu():
+    baseline = _run_session(use_etag=False, compress=False)
+    optimized = _run_session(use_etag=True, compress=True)
+
+    logger.info(
+        f"Plan polling benchmark over {POLLS} polls: "
+        f"baseline {baseline['bytes']} bytes / {baseline['cpu_seconds']:.3f}s CPU, "
+        f"etag+gzip {optimized['bytes']} bytes / {optimized['cpu_seconds']:.3f}s CPU, "
+        f"{optimized['not_modified']} not-modified responses"
+    )
+
+    changes = (POLLS - 1) // CHANGE_EVERY
+    assert optimized["not_modified"] == POLLS - 1 - changes
+    assert optimized["bytes"] < baseline["bytes"] * 0.1
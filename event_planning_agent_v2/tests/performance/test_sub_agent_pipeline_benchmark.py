@@ -0,0 +1,71 @@
+"""
+Benchmark for pipelined sub-agent execution.
+
+Runs the three Task Management sub-agents over a 120-task plan against a
+fake LLM with a fixed latency per call, once as whole-list passes and once
+as a pipeline, and reports wall time against the busy time of each stage.
+"""
+
+import asyncio
+import logging
+import time
+import pytest
+from unittest.mock import Mock
+
+from event_planning_agent_v2.agents.task_management.core.task_management_agent import TaskManagementAgent
+from event_planning_agent_v2.database.state_manager import WorkflowStateManager
+
+logger = logging.getLogger(__name__)
+
+TASKS = 120
+LATENCY = 0.02
+STATE = {
+    "plan_id": "plan-benchmark",
+    "client_request": {"event_type": "wedding", "guest_count": 300},
+    "timeline_data": {"tasks": [
+        {"task_id": f"task_{i}", "task_name": f"Vendor booking {i}", "description": "Confirm the vendor"}
+        for i in range(TASKS)
+    ]},
+}
+
+
+class FixedLatencyLLMManager:
+    def select_model(self, task_class, model=None, **kwargs):
+        return model
+
+    async def generate_response(self, prompt, **kwargs):
+        await asyncio.sleep(LATENCY)
+        return "Priority: High\nRationale: Books early\nSub-task 1: Confirm details\nDescription: Call the vendor"
+
+
+def _agent(pipeline):
+    agent = TaskManagementAgent(state_manager=Mock(spec=WorkflowStateManager), llm_model="gemma:2b")
+    agent.config.pipeline_sub_agents = pipeline
+    for sub_agent in (agent.prioritization_agent, agent.granularity_agent, agent.resource_dependency_agent):
+        # One prompt per task, so every stage has the same amount of LLM work
+        sub_agent.settings = sub_agent.settings.model_copy(update={
+            "llm": sub_agent.settings.llm.model_copy(update={"enable_prompt_packing": False})
+        })
+        sub_agent.llm_manager = FixedLatencyLLMManager()
+    return agent
+
+
+@pytest.mark.load
+@pytest.mark.asyncio
+async def test_pipelined_sub_agents_approach_slowest_stage():
+    start = time.perf_counter()
+    expected = await _agent(pipeline=False)._invoke_sub_agents(STATE)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = await _agent(pipeline=True)._invoke_sub_agents(STATE)
+    pipelined = time.perf_counter() - start
+
+    assert result["dependency_tasks"] == expected["dependency_tasks"]
+
+    logger.info(
+        f"Sub-agent pipeline benchmark: {TASKS} tasks, {len(result['granular_tasks'])} granular, "
+        f"whole-list passes {sequential:.2f}s, pipelined {pipelined:.2f}s"
+    )
+
+    assert pipelined < sequential
@@ -0,0 +1,101 @@
+"""
+Benchmark for the memory footprint of the task models at scale.
+
+Builds the sub-agent outputs of a 50k-task plan the way the sub-agents
+parse them from LLM responses (labels are fresh strings, not literals),
+then consolidates, schedules, generates the extended task list and
+serializes it, tracing allocations throughout. Reports peak traced memory
+and end-to-end time against fixed targets.
+"""
+
+import logging
+import time
+import tracemalloc
+import pytest
+from datetime import timedelta
+from unittest.mock import Mock
+
+from event_planning_agent_v2.agents.task_management.core.data_consolidator import DataConsolidator
+from event_planning_agent_v2.agents.task_management.core.task_management_agent import TaskManagementAgent
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource
+from event_planning_agent_v2.agents.task_management.models.task_models import (
+    GranularTask, PrioritizedTask, TaskWithDependencies
+)
+from event_planning_agent_v2.agents.task_management.tools.timeline_calculation_tool import TimelineCalculationTool
+from event_planning_agent_v2.database.state_manager import WorkflowStateManager
+
+logger = logging.getLogger(__name__)
+
+TASKS = 50_000
+SUB_TASKS_PER_PARENT = 5
+STATE = {"client_request": {"eventDate": "2024-12-14"}}
+PRIORITIES = ("Critical", "High", "Medium", "Low")
+RESOURCE_TYPES = ("vendor", "equipment", "personnel")
+
+# Targets for the whole run under tracemalloc, which itself slows allocation-heavy code
+PEAK_MEMORY_TARGET_MB = 256
+END_TO_END_TARGET_S = 60
+
+
+def _parsed(label: str) -> str:
+    """A label as the sub-agents produce it: split out of a response line"""
+    return f"Label: {label}".split(": ", 1)[1]
+
+
+def _sub_agent_outputs(count: int):
+    prioritized, granular, dependency = [], [], []
+    parent_id = previous_id = None
+    for i in range(count):
+        task_id = f"task_{i}"
+        is_parent = i % (SUB_TASKS_PER_PARENT + 1) == 0
+        dependencies = [] if is_parent else [previous_id]
+        if is_parent:
+            parent_id = task_id
+        previous_id = task_id
+
+        prioritized.append(PrioritizedTask(
+            task_id, f"Task {i}", _parsed(PRIORITIES[i % 4]), 0.5, _parsed("Books early")
+        ))
+        granular.append(GranularTask(
+            task_id, None if is_parent else parent_id, f"Task {i}", f"Complete task {i}",
+            0 if is_parent else 1, timedelta(minutes=30)
+        ))
+        dependency.append(TaskWithDependencies(
+            task_id, f"Task {i}", dependencies,
+            [Resource(_parsed(RESOURCE_TYPES[i % 3]), _parsed(f"vendor_{i % 12}"), _parsed("Caterer"), 1)]
+        ))
+    return prioritized, granular, dependency
+
+
+@pytest.mark.load
+def test_task_models_peak_memory_and_time_at_scale():
+    agent = TaskManagementAgent(state_manager=Mock(spec=WorkflowStateManager), llm_model="gemma:2b")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        outputs = _sub_agent_outputs(TASKS)
+        built = tracemalloc.get_traced_memory()[0]
+
+        data = DataConsolidator().consolidate_sub_agent_data(*outputs)
+        timelines = TimelineCalculationTool().calculate_timelines(data, STATE)
+        extended = agent._generate_extended_task_list(data, {"timelines": timelines}, started)
+        serialized = agent._serialize_extended_task_list(extended)
+
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(serialized["tasks"]) == TASKS
+    assert {t["task_id"]: t["priority_level"] for t in serialized["tasks"]}["task_1"] == "High"
+
+    mb = 1024 * 1024
+    logger.info(
+        f"Task model memory benchmark: {TASKS} tasks, sub-agent outputs {built / mb:.0f}MB, "
+        f"peak {peak / mb:.0f}MB (target {PEAK_MEMORY_TARGET_MB}MB), retained {current / mb:.0f}MB, "
+        f"end-to-end {elapsed:.1f}s (target {END_TO_END_TARGET_S}s)"
+    )
+
+    assert peak < PEAK_MEMORY_TARGET_MB * mb
+    assert elapsed < END_TO_END_TARGET_S
@@ -0,0 +1,111 @@
+"""
+Benchmark for critical-path scheduling with resource leveling.
+
+Schedules synthetic plans of up to 10k granular tasks (parent tasks with
+chained sub-tasks, cross-links between workstreams, and a handful of shared
+vendors and one venue) and reports runtime and makespan against the
+back-to-back schedule the tool produced before.
+"""
+
+import logging
+import random
+import time
+import pytest
+from datetime import timedelta
+
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import (
+    ConsolidatedTask, ConsolidatedTaskData
+)
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource
+from event_planning_agent_v2.agents.task_management.tools.timeline_calculation_tool import TimelineCalculationTool
+
+logger = logging.getLogger(__name__)
+
+STATE = {"client_request": {"eventDate": "2024-12-14"}}
+SUB_TASKS_PER_PARENT = 5
+VENDORS = 12
+
+
+def _synthetic_plan(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    tasks = []
+    parent_id = previous_id = None
+    for i in range(count):
+        dependencies = []
+        if i % (SUB_TASKS_PER_PARENT + 1) == 0:
+            parent_id = previous_id = f"task_{i}"
+        else:
+            dependencies.append(previous_id)
+            previous_id = f"task_{i}"
+        if tasks and rng.random() < 0.1:
+            dependencies.append(tasks[rng.randrange(len(tasks))].task_id)
+
+        resources = []
+        if rng.random() < 0.3:
+            vendor = f"vendor_{rng.randrange(VENDORS)}"
+            resources.append(Resource("vendor", vendor, vendor, 1))
+        if rng.random() < 0.02:
+            resources.append(Resource("venue", "grand_hall", "Grand Hall", 1))
+
+        tasks.append(ConsolidatedTask(
+            task_id=f"task_{i}",
+            task_name=f"Task {i}",
+            priority_level=rng.choice(["Critical", "High", "Medium", "Low"]),
+            priority_score=0.5,
+            priority_rationale="",
+            parent_task_id=None if previous_id == parent_id else parent_id,
+            task_description="",
+            granularity_level=0 if previous_id == parent_id else 1,
+            estimated_duration=timedelta(minutes=rng.choice([15, 30, 60, 120])),
+            dependencies=dependencies,
+            resources_required=resources,
+        ))
+    return tasks
+
+
+def _serial_makespan(tool, tasks) -> timedelta:
+    """Makespan of the back-to-back schedule: each task starts after the previous one ends plus buffer"""
+    released = {}
+    current = end = timedelta(0)
+    for task in tool._topological_sort(tasks):
+        start = max([current] + [released[d] for d in task.dependencies if d in released])
+        end = start + task.estimated_duration
+        released[task.task_id] = current = end + tool._calculate_buffer_time(task)
+    return end
+
+
+@pytest.mark.load
+def test_critical_path_scheduler_runtime_and_makespan():
+    tool = TimelineCalculationTool()
+    results = {}
+
+    for count in (1000, 5000, 10000):
+        tasks = _synthetic_plan(count)
+        data = ConsolidatedTaskData(tasks=tasks)
+
+        start = time.perf_counter()
+        timelines = tool.calculate_timelines(data, STATE)
+        elapsed = time.perf_counter() - start
+
+        makespan = max(t.end_time for t in timelines) - min(t.start_time for t in timelines)
+        serial = _serial_makespan(tool, tasks)
+        results[count] = (elapsed, makespan, serial, len(data.processing_metadata["critical_path"]))
+
+        assert makespan <= serial
+
+        by_resource = {}
+        for task, timeline in zip(tool._topological_sort(tasks), timelines):
+            for key in tool._leveled_resources(task):
+                by_resource.setdefault(key, []).append(timeline)
+        for usages in by_resource.values():
+            usages.sort(key=lambda t: t.start_time)
+            assert all(a.end_time <= b.start_time for a, b in zip(usages, usages[1:]))
+
+    logger.info(
+        "Critical path scheduler benchmark: " + ", ".join(
+            f"{n} tasks in {elapsed:.2f}s, makespan {makespan} vs serial {serial}, {critical} critical"
+            for n, (elapsed, makespan, serial, critical) in results.items()
+        )
+    )
+
+    assert results[10000][0] < 10.0
@@ -0,0 +1,150 @@
+"""
+Unit tests for the adaptive (AIMD) LLM concurrency limiter.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+import httpx
+
+from event_planning_agent_v2.llm.concurrency import AdaptiveConcurrencyLimiter
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager
+
+
+class SaturatingHost:
+    """
+    Fake Ollama host with a fixed number of cores
+
+    Latency stays at ``base_latency`` up to ``capacity`` concurrent requests
+    and grows linearly beyond it, like a CPU-only host sharing its cores.
+    """
+
+    def __init__(self, capacity: int, base_latency: float = 0.01):
+        self.capacity = capacity
+        self.base_latency = base_latency
+        self.active = 0
+        self.peak = 0
+        self.latencies = []
+
+    async def call(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        latency = self.base_latency * max(1.0, self.active / self.capacity)
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            self.active -= 1
+        self.latencies.append(latency)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        await self.call()
+        return httpx.Response(200, json={"response": "ok"})
+
+
+def _limiter(**kwargs):
+    limiter = AdaptiveConcurrencyLimiter("tinyllama", **kwargs)
+    limiter.metrics_collector = Mock()
+    return limiter
+
+
+async def _drive(limiter, host, requests: int, workers: int):
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            async with limiter.slot():
+                await host.call()
+
+    await asyncio.gather(*[worker() for _ in range(workers)])
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for limit adaptation"""
+
+    @pytest.mark.asyncio
+    async def test_grows_from_minimum_until_latency_rises(self):
+        host = SaturatingHost(capacity=4)
+        limiter = _limiter(initial_limit=1, max_limit=32)
+
+        await _drive(limiter, host, requests=400, workers=32)
+
+        # Latency doubles past 8 in flight (2 x capacity at tolerance 2.0)
+        assert 4 <= limiter.limit <= 10
+        assert limiter.increases > 0 and limiter.decreases > 0
+        assert host.peak <= 12
+
+    @pytest.mark.asyncio
+    async def test_backs_off_on_overloaded_host(self):
+        host = SaturatingHost(capacity=2)
+        limiter = _limiter(initial_limit=32, max_limit=32)
+
+        await _drive(limiter, host, requests=300, workers=32)
+
+        assert limiter.limit <= 6
+        assert sorted(host.latencies)[len(host.latencies) // 2] <= host.base_latency * 2.5
+
+    @pytest.mark.asyncio
+    async def test_errors_cut_the_limit_once_per_round_trip(self):
+        limiter = _limiter(initial_limit=8)
+
+        starts = [await limiter.acquire() for _ in range(8)]
+        for started in starts:
+            limiter.release(started, success=False)
+
+        assert limiter.limit == 6
+        assert limiter.decreases == 1
+        assert limiter.errors == 8
+
+    @pytest.mark.asyncio
+    async def test_fixed_limit_behaves_like_semaphore(self):
+        host = SaturatingHost(capacity=100)
+        limiter = _limiter(initial_limit=3, adaptive=False)
+
+        await _drive(limiter, host, requests=30, workers=10)
+
+        assert host.peak == 3
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = _limiter(initial_limit=1, adaptive=False)
+        started = await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(started)
+
+        assert limiter.in_flight == 0
+        assert limiter.queue_depth == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_manager_adapts_limit_and_reports_gauges():
+    host = SaturatingHost(capacity=2)
+    manager = OptimizedLLMManager()
+    manager.llm_settings = manager.llm_settings.model_copy(
+        update={"model_concurrency": 16, "enable_response_cache": False}
+    )
+    manager._response_cache = None
+    manager.metrics_collector = Mock()
+    manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(host.handler))
+    limiter = manager._get_limiter("tinyllama")
+    limiter.metrics_collector = Mock()
+
+    try:
+        await asyncio.gather(*[
+            manager.generate_response(f"p{i}", model="tinyllama", use_batch=False) for i in range(200)
+        ])
+    finally:
+        await manager.shutdown()
+
+    stats = manager.get_performance_metrics()["concurrency"]["tinyllama"]
+    assert stats["limit"] < 16
+    gauges = {c.args[0] for c in limiter.metrics_collector.record_gauge.call_args_list}
+    assert {"llm_concurrency_limit", "llm_concurrency_queue_depth"} <= gauges
@@ -0,0 +1,204 @@
+"""
+Unit tests for plan ETags, conditional GET and response compression.
+"""
+
+import gzip
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from event_planning_agent_v2.api import routes
+from event_planning_agent_v2.api.conditional import compute_etag, etag_matches
+from event_planning_agent_v2.api.middleware import CompressionMiddleware
+
+PLAN_ID = "6f1c1f0e-8a7e-4d5b-9a51-0c2f8f0d9a11"
+UPDATED_AT = datetime(2024, 6, 1, 11, 0, 0)
+
+
+class TestEtags:
+    """Tests for ETag computation and matching"""
+
+    def test_etag_changes_with_revision(self):
+        assert compute_etag(PLAN_ID, UPDATED_AT, 1) != compute_etag(PLAN_ID, UPDATED_AT, 2)
+
+    def test_etag_changes_with_variant_and_live_status(self):
+        base = compute_etag(PLAN_ID, UPDATED_AT, 1, "plan")
+        assert base != compute_etag(PLAN_ID, UPDATED_AT, 1, "details")
+        assert compute_etag(PLAN_ID, UPDATED_AT, 1, "details", {"status": "running"}) != \
+            compute_etag(PLAN_ID, UPDATED_AT, 1, "details", {"status": "completed"})
+
+    def test_etag_is_weak(self):
+        assert compute_etag(PLAN_ID, UPDATED_AT, 1).startswith('W/"')
+
+    def test_matching_uses_weak_comparison(self):
+        etag = compute_etag(PLAN_ID, UPDATED_AT, 1)
+        opaque = etag[2:]
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(opaque, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestConditionalGetPlan:
+    """Tests for If-None-Match handling in get_plan"""
+
+    @pytest.fixture
+    def state_manager(self):
+        manager = Mock()
+        manager.get_plan_version.return_value = (UPDATED_AT, 3)
+        manager.load_plan.return_value = {
+            "plan_id": PLAN_ID,
+            "status": "completed",
+            "client_name": "Priya Sharma",
+            "combinations": [],
+            "final_blueprint": "Blueprint",
+            "revision": 3,
+            "created_at": UPDATED_AT,
+            "updated_at": UPDATED_AT,
+        }
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_full_response_sets_etag(self, state_manager):
+        response = Response()
+
+        result = await routes.get_plan(
+            plan_id=PLAN_ID,
+            response=response,
+            include_workflow_details=False,
+            if_none_match=None,
+            state_manager=state_manager
+        )
+
+        assert result.final_blueprint == "Blueprint"
+        assert response.headers["ETag"] == compute_etag(PLAN_ID, UPDATED_AT, 3, "plan")
+        assert response.headers["Cache-Control"] == "no-cache"
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304_without_loading_plan(self, state_manager):
+        etag = compute_etag(PLAN_ID, UPDATED_AT, 3, "plan")
+
+        result = await routes.get_plan(
+            plan_id=PLAN_ID,
+            response=Response(),
+            include_workflow_details=False,
+            if_none_match=etag,
+            state_manager=state_manager
+        )
+
+        assert result.status_code == 304
+        assert result.body == b""
+        assert result.headers["ETag"] == etag
+        state_manager.load_plan.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_full_plan(self, state_manager):
+        stale = compute_etag(PLAN_ID, UPDATED_AT, 2, "plan")
+
+        result = await routes.get_plan(
+            plan_id=PLAN_ID,
+            response=Response(),
+            include_workflow_details=False,
+            if_none_match=stale,
+            state_manager=state_manager
+        )
+
+        assert result.plan_id == PLAN_ID
+        state_manager.load_plan.assert_called_once_with(PLAN_ID)
+
+    @pytest.mark.asyncio
+    async def test_workflow_details_etag_tracks_live_status(self, state_manager):
+        etag = compute_etag(PLAN_ID, UPDATED_AT, 3, "details", {"status": "running"})
+
+        with patch.object(routes, "get_planning_workflow_status", return_value={"status": "completed"}):
+            result = await routes.get_plan(
+                plan_id=PLAN_ID,
+                response=Response(),
+                include_workflow_details=True,
+                if_none_match=etag,
+                state_manager=state_manager
+            )
+
+        assert result.workflow_status.current_step == "completed"
+
+
+class TestCompressionMiddleware:
+    """Tests for gzip response compression"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+        @app.get("/large")
+        def large():
+            return {"items": [{"name": f"vendor-{i}", "score": 0.5} for i in range(200)]}
+
+        @app.get("/small")
+        def small():
+            return {"ok": True}
+
+        @app.get("/stream")
+        def stream():
+            def chunks():
+                for i in range(50):
+                    yield json.dumps({"chunk": i, "pad": "x" * 100}) + "\n"
+            return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+        @app.get("/events")
+        def events():
+            return StreamingResponse(iter(["data: " + "x" * 1000 + "\n\n"]), media_type="text/event-stream")
+
+        return TestClient(app)
+
+    def test_large_json_is_gzipped(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(json.dumps(response.json()))
+        assert len(response.json()["items"]) == 200
+
+    def test_small_body_is_not_compressed(self, client):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_identity_client_is_not_compressed(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_response_is_compressed_incrementally(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert len(response.text.splitlines()) == 50
+
+    def test_event_stream_is_not_compressed(self, client):
+        response = client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_select_encoding_respects_quality(self):
+        middleware = CompressionMiddleware(app=None)
+
+        assert middleware._select_encoding("gzip;q=0, deflate") is None
+        assert middleware._select_encoding("deflate, gzip;q=0.5") == "gzip"
+
+    def test_gzip_payload_round_trips(self):
+        middleware = CompressionMiddleware(app=None)
+        compressor = middleware._create_compressor("gzip")
+        data = b'{"plan": "x"}' * 100
+
+        assert gzip.decompress(compressor.compress(data) + compressor.flush()) == data
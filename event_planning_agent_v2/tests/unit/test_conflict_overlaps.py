@@ -0,0 +1,70 @@
+"""
+Unit tests for sweep-line timeline overlap detection in the Conflict Check Tool.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import ConsolidatedTask
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource, TaskTimeline
+from event_planning_agent_v2.agents.task_management.tools.conflict_check_tool import ConflictCheckTool
+
+DAY = datetime(2024, 12, 14, 8, 0)
+
+
+def _task(task_id, start_minutes, length_minutes, priority="High", resources=()):
+    start = DAY + timedelta(minutes=start_minutes)
+    end = start + timedelta(minutes=length_minutes)
+    task = ConsolidatedTask(
+        task_id=task_id,
+        task_name=f"Task {task_id}",
+        priority_level=priority,
+        priority_score=0.8,
+        priority_rationale="",
+        parent_task_id=None,
+        task_description="",
+        granularity_level=1,
+        estimated_duration=end - start,
+        resources_required=[Resource(kind, rid, rid, 1) for kind, rid in resources],
+    )
+    task.timeline = TaskTimeline(task_id, start, end, end - start, timedelta(0))
+    return task
+
+
+def _pairwise_overlaps(tool, sorted_tasks):
+    return [
+        (i, j)
+        for i in range(len(sorted_tasks))
+        for j in range(i + 1, len(sorted_tasks))
+        if tool._tasks_overlap(sorted_tasks[i], sorted_tasks[j])
+    ]
+
+
+def test_sweep_finds_the_same_pairs_as_a_pairwise_scan():
+    tool = ConflictCheckTool(timeline_conflict_tool=Mock())
+    rng = random.Random(3)
+
+    for _ in range(50):
+        tasks = [_task(f"t{i}", rng.randrange(0, 600, 15), rng.choice([0, 15, 30, 60, 240])) for i in range(40)]
+        sorted_tasks = sorted(tasks, key=lambda t: t.timeline.start_time)
+
+        assert tool._overlapping_pairs(sorted_tasks) == _pairwise_overlaps(tool, sorted_tasks)
+
+
+def test_direct_overlap_conflicts_describe_both_tasks():
+    tool = ConflictCheckTool(timeline_conflict_tool=Mock())
+    tasks = [
+        _task("setup", 0, 120, resources=[("vendor", "av_team")]),
+        _task("sound", 60, 60, resources=[("vendor", "av_team")]),
+        _task("dinner", 180, 60),
+        _task("toasts", 200, 10),
+    ]
+
+    conflicts = tool._check_direct_timeline_overlaps(tasks)
+
+    # setup/sound share a vendor; dinner/toasts overlap but are independent and share nothing
+    assert [c.affected_tasks for c in conflicts] == [["setup", "sound"]]
+    assert conflicts[0].conflict_description == (
+        "Timeline overlap: 'Task setup' (08:00-10:00) overlaps with 'Task sound' (09:00-10:00)"
+    )
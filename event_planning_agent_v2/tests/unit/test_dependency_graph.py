@@ -0,0 +1,100 @@
+"""
+Unit tests for the dependency graph built by the DataConsolidator and reused by the scheduling tools.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from event_planning_agent_v2.agents.task_management.core.data_consolidator import DataConsolidator
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import ConsolidatedTaskData
+from event_planning_agent_v2.agents.task_management.models.dependency_graph import build_dependency_graph
+from event_planning_agent_v2.agents.task_management.models.task_models import (
+    GranularTask, PrioritizedTask, TaskWithDependencies
+)
+from event_planning_agent_v2.agents.task_management.tools.timeline_calculation_tool import TimelineCalculationTool
+
+STATE = {"client_request": {"eventDate": "2024-12-14"}}
+
+
+def _consolidate(dependencies):
+    """Consolidate sub-agent outputs for tasks given as task_id -> dependency IDs"""
+    prioritized, granular, dependency = [], [], []
+    for task_id, task_dependencies in dependencies.items():
+        prioritized.append(PrioritizedTask(task_id, f"Task {task_id}", "Medium", 0.5, ""))
+        granular.append(GranularTask(task_id, None, f"Task {task_id}", "", 0, timedelta(minutes=30)))
+        dependency.append(TaskWithDependencies(task_id, f"Task {task_id}", task_dependencies, []))
+    consolidator = DataConsolidator()
+    return consolidator, consolidator.consolidate_sub_agent_data(prioritized, granular, dependency)
+
+
+def test_deep_chain_is_ordered_without_recursion():
+    count = 20_000
+    # Listed last task first, each depending on the one listed after it
+    chain = {f"task_{i}": [f"task_{i - 1}"] if i else [] for i in reversed(range(count))}
+
+    consolidator, data = _consolidate(chain)
+    graph = data.dependency_graph
+
+    assert not [w for w in consolidator.warnings if w.get('validation') == 'circular_dependency']
+    assert graph.task_ids == [f"task_{i}" for i in range(count)]
+    assert graph.predecessors[0] == [] and graph.predecessors[-1] == [count - 2]
+    assert graph.successors[0] == [1] and graph.successors[-1] == []
+
+
+def test_every_cycle_is_reported_with_its_members():
+    consolidator, data = _consolidate({
+        "book_venue": ["confirm_budget"],
+        "confirm_budget": ["book_venue"],
+        "send_invites": ["book_venue", "print_cards"],
+        "print_cards": ["design_cards"],
+        "design_cards": ["approve_cards"],
+        "approve_cards": ["print_cards"],
+        "rehearse": ["rehearse"],
+    })
+    graph = data.dependency_graph
+
+    cycles = [w for w in consolidator.warnings if w.get('validation') == 'circular_dependency']
+    assert sorted(sorted(w['cycle']) for w in cycles) == [
+        ["approve_cards", "design_cards", "print_cards"],
+        ["book_venue", "confirm_budget"],
+        ["rehearse"],
+    ]
+    assert [w['cycle'] for w in cycles] == graph.cycles
+
+    # Members keep task list order; dependents of a cycle follow all of its members
+    listed = {task.task_id: i for i, task in enumerate(data.tasks)}
+    position = {task_id: i for i, task_id in enumerate(graph.task_ids)}
+    for members in graph.cycles:
+        assert members == sorted(members, key=listed.get)
+        assert [position[m] for m in members] == sorted(position[m] for m in members)
+    assert max(position[m] for m in ["book_venue", "confirm_budget", "print_cards"]) < position["send_invites"]
+    assert all(p < i for i, predecessors in enumerate(graph.predecessors) for p in predecessors)
+    assert graph.predecessors[position["rehearse"]] == []
+
+
+def test_timeline_tool_reuses_the_consolidated_graph():
+    _, data = _consolidate({
+        "book_venue": [],
+        "order_catering": ["book_venue"],
+        "plan_menu": ["order_catering"],
+        "send_invites": ["book_venue"],
+    })
+    tool = TimelineCalculationTool()
+    rebuilt = tool.calculate_timelines(ConsolidatedTaskData(tasks=data.tasks), STATE)
+
+    target = "event_planning_agent_v2.agents.task_management.tools.timeline_calculation_tool.build_dependency_graph"
+    with patch(target, side_effect=build_dependency_graph) as build, \
+            patch.object(tool, "_build_dependency_graph") as rebuild_positions:
+        timelines = tool.calculate_timelines(data, STATE)
+
+    build.assert_not_called()
+    rebuild_positions.assert_not_called()
+    assert timelines == rebuilt
+    order = [t.task_id for t in timelines]
+    assert order[0] == "book_venue" and order.index("order_catering") < order.index("plan_menu")
+
+    # A task list changed after consolidation gets a fresh graph
+    data.tasks.pop()
+    with patch(target, side_effect=build_dependency_graph) as build:
+        assert len(tool.calculate_timelines(data, STATE)) == 3
+    build.assert_called_once()
@@ -0,0 +1,49 @@
+"""
+Unit tests for the dependency index used by the Resource & Dependency Agent.
+"""
+
+import random
+from datetime import timedelta
+
+from event_planning_agent_v2.agents.task_management.models.task_models import GranularTask
+from event_planning_agent_v2.agents.task_management.sub_agents.dependency_index import PhraseMatcher
+from event_planning_agent_v2.agents.task_management.sub_agents.resource_dependency_agent import ResourceDependencyAgentCore
+
+
+def test_phrase_matcher_agrees_with_substring_checks():
+    rng = random.Random(7)
+    phrases = ["".join(rng.choice("abc ") for _ in range(rng.randint(1, 5))) for _ in range(60)] + [""]
+    matcher = PhraseMatcher(phrases)
+
+    for _ in range(200):
+        text = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 30)))
+        assert matcher.find(text) == {p for p in phrases if p and p in text}
+
+
+def test_overlapping_names_are_all_found():
+    matcher = PhraseMatcher(["book venue", "venue", "book venue deposit", "deposit"])
+
+    assert matcher.find("pay after book venue deposit is sent") == {
+        "book venue", "venue", "book venue deposit", "deposit"
+    }
+
+
+def _task(task_id, name, description, parent=None):
+    return GranularTask(task_id, parent, name, description, 1 if parent else 0, timedelta(hours=1))
+
+
+def test_detect_dependencies_uses_all_strategies():
+    agent = ResourceDependencyAgentCore()
+    tasks = [
+        _task("venue", "Venue booking", "Own the venue"),
+        _task("plan", "Plan layout", "Draw the floor plan", parent="venue"),
+        _task("deposit", "Pay deposit", "Transfer the deposit", parent="venue"),
+        _task("final", "Finalize venue", "Sign off after pay deposit clears", parent="venue"),
+    ]
+    index = agent._build_dependency_index(tasks)
+
+    dependencies = agent._detect_dependencies(tasks[3], tasks, index)
+
+    # Parent, early-stage sibling "Plan layout", and "Pay deposit" mentioned after "after"
+    assert sorted(dependencies) == ["deposit", "plan", "venue"]
+    assert sorted(agent._detect_dependencies(tasks[3], tasks)) == sorted(dependencies)
@@ -0,0 +1,313 @@
+"""
+Unit tests for incremental rescheduling and the task management update endpoints.
+"""
+
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from fastapi import BackgroundTasks, HTTPException
+from pydantic import ValidationError
+
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import (
+    ConsolidatedTask, ConsolidatedTaskData
+)
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource
+from event_planning_agent_v2.agents.task_management.tools.incremental_scheduler import (
+    IncrementalScheduler, get_plan_schedule_cache
+)
+from event_planning_agent_v2.api import routes
+from event_planning_agent_v2.api.schemas import ConflictResolution, TaskStatusUpdate
+
+STATE = {"client_request": {"eventDate": "2024-12-14"}}
+PLAN_ID = "plan-incremental"
+
+
+def _task(task_id, hours, dependencies=(), resources=()):
+    return ConsolidatedTask(
+        task_id=task_id,
+        task_name=task_id.title(),
+        priority_level="Medium",
+        priority_score=0.5,
+        priority_rationale="",
+        parent_task_id=None,
+        task_description="",
+        granularity_level=1,
+        estimated_duration=timedelta(hours=hours),
+        dependencies=list(dependencies),
+        resources_required=[Resource(kind, rid, rid, 1) for kind, rid in resources],
+    )
+
+
+def _random_tasks(rng, count=60):
+    tasks = []
+    for i in range(count):
+        dependencies = rng.sample([t.task_id for t in tasks], k=min(len(tasks), rng.randint(0, 2)))
+        resources = []
+        if rng.random() < 0.4:
+            resources.append(("vendor", f"v{rng.randint(0, 3)}"))
+        if rng.random() < 0.4:
+            resources.append(("equipment", f"e{rng.randint(0, 2)}"))
+        tasks.append(_task(f"t{i}", rng.choice([0.25, 0.5, 1, 2]), dependencies, resources))
+    return tasks
+
+
+def _assert_matches_full_recompute(scheduler):
+    plan = scheduler.plan
+    starts, finishes = list(plan.starts), list(plan.finishes)
+    for i in plan.placement_order:
+        scheduler.timeline_tool._place_task(plan, i)
+    assert plan.starts == starts and plan.finishes == finishes
+
+    full = scheduler.conflict_tool._check_direct_timeline_overlaps(plan.tasks)
+    assert {c.conflict_id for c in full} == set(scheduler._conflicts)
+
+
+def test_random_updates_match_full_recompute():
+    rng = random.Random(7)
+
+    for _ in range(10):
+        scheduler = IncrementalScheduler()
+        scheduler.load(ConsolidatedTaskData(tasks=_random_tasks(rng)), STATE)
+        _assert_matches_full_recompute(scheduler)
+
+        for _ in range(15):
+            task_id = f"t{rng.randrange(60)}"
+            before = {t.task_id: (t.start_time, t.end_time) for t in scheduler.timelines()}
+
+            update = scheduler.update_duration(task_id, timedelta(minutes=rng.choice([10, 45, 90, 240])))
+
+            _assert_matches_full_recompute(scheduler)
+            moved = {t.task_id for t in update.moved_timelines}
+            after = {t.task_id: (t.start_time, t.end_time) for t in scheduler.timelines()}
+            assert moved == {tid for tid in after if after[tid] != before[tid]}
+
+
+def test_only_downstream_cone_moves():
+    scheduler = IncrementalScheduler()
+    scheduler.load(ConsolidatedTaskData(tasks=[
+        _task("venue", 2),
+        _task("decor", 1, dependencies=["venue"]),
+        _task("rehearsal", 1, dependencies=["decor"]),
+        _task("music", 1),
+    ]), STATE)
+
+    update = scheduler.update_duration("venue", timedelta(hours=3))
+
+    assert {t.task_id for t in update.moved_timelines} == {"venue", "decor", "rehearsal"}
+    timelines = {t.task_id: t for t in scheduler.timelines()}
+    assert timelines["decor"].start_time == timelines["venue"].end_time + timelines["venue"].buffer_time
+    assert scheduler.critical_path() == ["venue", "decor", "rehearsal"]
+
+
+def test_completed_status_uses_actual_duration():
+    scheduler = IncrementalScheduler()
+    timelines = {t.task_id: t for t in scheduler.load(ConsolidatedTaskData(tasks=[
+        _task("venue", 4),
+        _task("decor", 1, dependencies=["venue"]),
+    ]), STATE)}
+
+    assert not scheduler.update_task_status("venue", "in_progress").moved_timelines
+
+    finished = timelines["venue"].start_time + timedelta(hours=1)
+    update = scheduler.update_task_status("venue", "completed", completed_at=finished)
+
+    moved = {t.task_id: t for t in update.moved_timelines}
+    assert moved["decor"].start_time == finished + moved["venue"].buffer_time
+    assert scheduler.statuses["venue"] == "completed"
+
+    # An aware completion time is converted to naive UTC: 13:00+02:00 is two hours after the 09:00 start
+    aware = (timelines["venue"].start_time + timedelta(hours=4)).replace(tzinfo=timezone(timedelta(hours=2)))
+    update = scheduler.update_task_status("venue", "completed", completed_at=aware)
+    assert {t.task_id: t.duration for t in update.moved_timelines}["venue"] == timedelta(hours=2)
+
+    with pytest.raises(ValueError):
+        scheduler.update_task_status("venue", "done")
+    with pytest.raises(KeyError):
+        scheduler.update_task_status("missing", "completed")
+
+
+def _speakers_task_list():
+    """Extended task list with a stored resource conflict between two tasks sharing the speakers"""
+    speakers = {"resource_type": "equipment", "resource_id": "speakers",
+                "resource_name": "Speakers", "quantity_required": 1}
+    return {"tasks": [
+        {"task_id": "sound_check", "timeline": {"duration": 7200.0}, "resources_required": [speakers],
+         "conflicts": [{"conflict_id": "resource_speakers", "conflict_type": "resource",
+                        "affected_tasks": ["sound_check", "first_dance"]}]},
+        {"task_id": "first_dance", "timeline": {"duration": 3600.0}, "resources_required": [speakers]},
+    ]}
+
+
+def test_resolving_a_conflict_applies_revised_durations():
+    scheduler = IncrementalScheduler()
+    scheduler.load_extended_task_list(_speakers_task_list(), STATE)
+
+    update = scheduler.resolve_conflict("resource_speakers", {"task_durations": {"sound_check": 30}})
+
+    assert "resource_speakers" in update.cleared_conflicts
+    assert "resource_speakers" in scheduler.resolved_conflicts
+    assert "sound_check" in {t.task_id for t in update.moved_timelines}
+    with pytest.raises(KeyError):
+        scheduler.resolve_conflict("unknown")
+
+
+def test_invalid_updates_change_nothing():
+    scheduler = IncrementalScheduler()
+    scheduler.load_extended_task_list(_speakers_task_list(), STATE)
+    starts = list(scheduler.plan.starts)
+
+    with pytest.raises(KeyError):
+        scheduler.resolve_conflict("resource_speakers", {"task_durations": {"sound_check": 30, "missing": 10}})
+
+    with pytest.raises(ValueError):
+        scheduler.resolve_conflict("resource_speakers", {"task_durations": {"sound_check": 30, "first_dance": -120}})
+
+    assert "resource_speakers" not in scheduler.resolved_conflicts
+    assert scheduler.plan.starts == starts
+    assert scheduler.plan.durations[scheduler._position("sound_check")] == timedelta(hours=2)
+
+    update = scheduler.update_task_status("first_dance", "completed", duration=timedelta(minutes=30))
+    assert scheduler.statuses["first_dance"] == "completed"
+    assert [t.duration for t in update.moved_timelines] == [timedelta(minutes=30)]
+
+
+class TestTaskManagementEndpoints:
+    """Tests for the incremental task status and conflict resolution routes"""
+
+    @pytest.fixture
+    def state_manager(self):
+        get_plan_schedule_cache().invalidate(PLAN_ID)
+        manager = Mock()
+        manager.get_plan_version.return_value = (datetime(2024, 12, 1), 1)
+        manager.save_workflow_state.return_value = True
+        manager.load_workflow_state.return_value = {
+            "plan_id": PLAN_ID,
+            "client_request": {"eventDate": "2024-12-14"},
+            "extended_task_list": {"tasks": [
+                {"task_id": "venue", "task_name": "Venue", "timeline": {"duration": 7200.0}},
+                {"task_id": "decor", "task_name": "Decor", "timeline": {"duration": 3600.0},
+                 "dependencies": ["venue"]},
+            ]},
+        }
+        yield manager
+        get_plan_schedule_cache().invalidate(PLAN_ID)
+
+    @pytest.mark.asyncio
+    async def test_status_update_returns_moved_tasks_and_saves_state(self, state_manager):
+        background_tasks = BackgroundTasks()
+
+        result = await routes.update_task_status(
+            plan_id=PLAN_ID,
+            task_id="venue",
+            update=TaskStatusUpdate(status="in_progress", duration_minutes=180),
+            background_tasks=background_tasks,
+            state_manager=state_manager
+        )
+
+        assert [t["task_id"] for t in result["moved_tasks"]] == ["venue", "decor"]
+        assert result["critical_path"] == ["venue", "decor"]
+
+        await background_tasks()
+        saved = state_manager.save_workflow_state.call_args[0][0]["extended_task_list"]["tasks"]
+        assert saved[0]["status"] == "in_progress"
+        assert saved[0]["timeline"]["duration"] == 3 * 3600
+        assert isinstance(saved[1]["timeline"]["start_time"], datetime)
+
+    @pytest.mark.asyncio
+    async def test_stored_conflicts_of_any_type_can_be_resolved(self, state_manager):
+        tasks = state_manager.load_workflow_state.return_value["extended_task_list"]["tasks"]
+        tasks[0]["conflicts"] = [{
+            "conflict_id": "resource_caterer", "conflict_type": "resource", "severity": "high",
+            "affected_tasks": ["venue", "decor"], "resolution_status": "pending",
+        }]
+        background_tasks = BackgroundTasks()
+
+        result = await routes.resolve_conflict(
+            plan_id=PLAN_ID, conflict_id="resource_caterer", resolution=ConflictResolution(title="Book a second caterer"),
+            background_tasks=background_tasks, state_manager=state_manager
+        )
+
+        assert result["resolution_status"] == "resolved"
+        assert result["moved_tasks"] == []
+        await background_tasks()
+        saved = state_manager.save_workflow_state.call_args[0][0]["extended_task_list"]["tasks"]
+        assert saved[0]["conflicts"][0]["resolution_status"] == "resolved"
+
+    @pytest.mark.asyncio
+    async def test_plan_saved_elsewhere_is_reloaded_and_saves_are_snapshots(self, state_manager):
+        async def set_status(task_id, status):
+            background_tasks = BackgroundTasks()
+            await routes.update_task_status(
+                plan_id=PLAN_ID, task_id=task_id, update=TaskStatusUpdate(status=status),
+                background_tasks=background_tasks, state_manager=state_manager
+            )
+            return background_tasks
+
+        first_save = await set_status("venue", "in_progress")
+        await set_status("decor", "blocked")
+        await first_save()  # Runs after the second edit, but saves the state as of the first
+        snapshot = state_manager.save_workflow_state.call_args[0][0]["extended_task_list"]["tasks"]
+        assert [t.get("status") for t in snapshot] == ["in_progress", "pending"]
+
+        # Our own save bumped the revision; the cached schedule is still current
+        state_manager.get_plan_version.return_value = (datetime(2024, 12, 2), 2)
+        await set_status("venue", "completed")
+        assert state_manager.load_workflow_state.call_count == 1
+
+        # Another worker saved the plan since; its state is reloaded before the edit
+        state_manager.get_plan_version.return_value = (datetime(2024, 12, 3), 4)
+        await (await set_status("decor", "in_progress"))()
+        assert state_manager.load_workflow_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_saves_finishing_out_of_order_keep_the_newest_state(self, state_manager):
+        edits = []
+        for task_id, status in [("venue", "in_progress"), ("decor", "blocked")]:
+            background_tasks = BackgroundTasks()
+            await routes.update_task_status(
+                plan_id=PLAN_ID, task_id=task_id, update=TaskStatusUpdate(status=status),
+                background_tasks=background_tasks, state_manager=state_manager
+            )
+            edits.append(background_tasks)
+
+        await edits[1]()
+        await edits[0]()  # Older snapshot, already superseded
+
+        assert state_manager.save_workflow_state.call_count == 1
+        saved = state_manager.save_workflow_state.call_args[0][0]["extended_task_list"]["tasks"]
+        assert [t["status"] for t in saved] == ["in_progress", "blocked"]
+
+        # One save, so one revision bump; the cached schedule is still current
+        state_manager.get_plan_version.return_value = (datetime(2024, 12, 2), 2)
+        await routes.update_task_status(
+            plan_id=PLAN_ID, task_id="venue", update=TaskStatusUpdate(status="completed"),
+            background_tasks=BackgroundTasks(), state_manager=state_manager
+        )
+        assert state_manager.load_workflow_state.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_task_status_and_conflict(self, state_manager):
+        with pytest.raises(HTTPException) as not_found:
+            await routes.update_task_status(
+                plan_id=PLAN_ID, task_id="missing", update=TaskStatusUpdate(status="completed"),
+                background_tasks=BackgroundTasks(), state_manager=state_manager
+            )
+        with pytest.raises(HTTPException) as bad_status:
+            await routes.update_task_status(
+                plan_id=PLAN_ID, task_id="venue", update=TaskStatusUpdate(status="done"),
+                background_tasks=BackgroundTasks(), state_manager=state_manager
+            )
+        with pytest.raises(HTTPException) as no_conflict:
+            await routes.resolve_conflict(
+                plan_id=PLAN_ID, conflict_id="missing", resolution=ConflictResolution(title="Move"),
+                background_tasks=BackgroundTasks(), state_manager=state_manager
+            )
+
+        with pytest.raises(ValidationError):
+            ConflictResolution(task_durations={"venue": 0})
+
+        assert not_found.value.status_code == 404
+        assert bad_status.value.status_code == 400
+        assert no_conflict.value.status_code == 404
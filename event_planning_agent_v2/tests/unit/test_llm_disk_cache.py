@@ -0,0 +1,124 @@
+"""
+Unit tests for the persistent LLM response cache tier.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+import httpx
+
+from event_planning_agent_v2.llm.disk_cache import PersistentResponseCache
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager
+
+
+class TestPersistentResponseCache:
+    """Tests for the SQLite store"""
+
+    def test_round_trip_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        cache = PersistentResponseCache(path)
+        cache.put("k1", "gemma:2b", "v1", "response")
+        cache.close()
+
+        reopened = PersistentResponseCache(path)
+
+        assert reopened.get("k1", "v1") == "response"
+        assert len(reopened) == 1
+
+    def test_other_model_version_is_a_miss(self, tmp_path):
+        cache = PersistentResponseCache(str(tmp_path / "cache.sqlite3"))
+        cache.put("k1", "gemma:2b", "v1", "old answer")
+
+        assert cache.get("k1", "v2") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = PersistentResponseCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+        cache.put("a", "m", "v", "A")
+        cache.put("b", "m", "v", "B")
+        cache.get("a", "v")
+
+        cache.put("c", "m", "v", "C")
+
+        assert len(cache) == 2
+        assert cache.get("b", "v") is None
+        assert cache.get("a", "v") == "A"
+
+    def test_hot_entries_ordered_by_hits(self, tmp_path):
+        cache = PersistentResponseCache(str(tmp_path / "cache.sqlite3"))
+        cache.put("cold", "m", "v", "C")
+        cache.put("hot", "m", "v", "H")
+        for _ in range(3):
+            cache.get("hot", "v")
+
+        assert [entry[0] for entry in cache.hot_entries(2)] == ["hot", "cold"]
+
+
+class TestManagerDiskTier:
+    """Tests for the persistent tier inside OptimizedLLMManager"""
+
+    def _manager(self, tmp_path, handler, warm_entries=500):
+        manager = OptimizedLLMManager()
+        manager.llm_settings = manager.llm_settings.model_copy(update={
+            "disk_cache_path": str(tmp_path / "cache.sqlite3"),
+            "disk_cache_warm_entries": warm_entries,
+        })
+        manager.metrics_collector = Mock()
+        manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_responses_survive_restart(self, tmp_path):
+        calls = []
+
+        def handler(request):
+            if request.url.path.endswith("/api/tags"):
+                return httpx.Response(200, json={"models": [{"name": "tinyllama:latest", "digest": "d1"}]})
+            calls.append(request)
+            return httpx.Response(200, json={"response": "decomposed"})
+
+        first = self._manager(tmp_path, handler)
+        await first._refresh_model_versions()
+        await first._open_disk_cache()
+        await first.generate_response("Book venue", model="tinyllama", use_batch=False)
+        await first.shutdown()
+
+        warm = self._manager(tmp_path, handler)
+        await warm._refresh_model_versions()
+        await warm._open_disk_cache()
+        assert await warm.generate_response("Book venue", model="tinyllama", use_batch=False) == "decomposed"
+
+        cold = self._manager(tmp_path, handler, warm_entries=0)
+        await cold._refresh_model_versions()
+        await cold._open_disk_cache()
+        assert await cold.generate_response("Book venue", model="tinyllama", use_batch=False) == "decomposed"
+
+        assert len(calls) == 1
+        assert warm.get_performance_metrics()["memory_cache_hits"] == 1
+        assert cold.get_performance_metrics()["disk_cache_hits"] == 1
+        assert cold.get_performance_metrics()["disk_cache_hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_model_upgrade_invalidates_entries(self, tmp_path):
+        digest = {"value": "d1"}
+        calls = []
+
+        def handler(request):
+            if request.url.path.endswith("/api/tags"):
+                return httpx.Response(200, json={"models": [{"name": "tinyllama", "digest": digest["value"]}]})
+            calls.append(request)
+            return httpx.Response(200, json={"response": f"answer from {digest['value']}"})
+
+        first = self._manager(tmp_path, handler)
+        await first._refresh_model_versions()
+        await first._open_disk_cache()
+        await first.generate_response("Book venue", model="tinyllama", use_batch=False)
+        await first.shutdown()
+
+        digest["value"] = "d2"
+        upgraded = self._manager(tmp_path, handler)
+        await upgraded._refresh_model_versions()
+        await upgraded._open_disk_cache()
+
+        assert await upgraded.generate_response("Book venue", model="tinyllama", use_batch=False) == "answer from d2"
+        assert len(calls) == 2
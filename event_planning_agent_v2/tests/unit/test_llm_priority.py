@@ -0,0 +1,129 @@
+"""
+Unit tests for LLM request priority classes and weighted-fair queuing.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from event_planning_agent_v2.llm.concurrency import AdaptiveConcurrencyLimiter
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager, LLMRequest, ModelDispatcher
+from event_planning_agent_v2.llm.priority import LLMPriority, WeightedFairQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWeightedFairQueue:
+    """Tests for weighted-fair dequeuing"""
+
+    def test_lanes_are_served_by_weight_and_interleaved(self):
+        queue = WeightedFairQueue(starvation_timeout=None)
+        for i in range(12):
+            for priority in LLMPriority:
+                queue.push(f"{priority.value}-{i}", priority)
+
+        served = [queue.pop().split("-")[0] for _ in range(12)]
+
+        assert served.count("interactive") == 8
+        assert served.count("standard") == 3
+        assert served.count("background") == 1
+        assert "iiii" not in "".join(name[0] for name in served)
+
+    def test_fifo_within_a_lane(self):
+        queue = WeightedFairQueue()
+        for i in range(3):
+            queue.push(i, LLMPriority.BACKGROUND)
+
+        assert [queue.pop() for _ in range(3)] == [0, 1, 2]
+        assert len(queue) == 0
+
+    def test_starved_item_is_served_first(self):
+        clock = FakeClock()
+        queue = WeightedFairQueue(starvation_timeout=5.0, clock=clock)
+        queue.push("old-background", LLMPriority.BACKGROUND)
+        clock.now = 6.0
+        for i in range(10):
+            queue.push(f"interactive-{i}", LLMPriority.INTERACTIVE)
+
+        assert queue.pop() == "old-background"
+        assert queue.starvation_promotions == 1
+
+    def test_remove(self):
+        queue = WeightedFairQueue()
+        a, b = object(), object()
+        queue.push(a, LLMPriority.STANDARD)
+        queue.push(b, LLMPriority.STANDARD)
+
+        assert queue.remove(a)
+        assert not queue.remove(a)
+        assert queue.pop() is b
+
+
+class TestPriorityScheduling:
+    """Tests for priority ordering in the dispatcher and limiter"""
+
+    @pytest.mark.asyncio
+    async def test_dispatcher_starts_interactive_before_queued_background(self):
+        started = []
+
+        async def execute(request):
+            started.append(request.request_id)
+            await asyncio.sleep(0.01)
+
+        limiter = AdaptiveConcurrencyLimiter("tinyllama", initial_limit=1, adaptive=False)
+        limiter.metrics_collector = Mock()
+        dispatcher = ModelDispatcher("tinyllama", limiter, execute)
+        for i in range(3):
+            dispatcher.submit(LLMRequest("p", "tinyllama", f"bg{i}", priority=LLMPriority.BACKGROUND))
+        dispatcher.submit(LLMRequest("p", "tinyllama", "ui", priority=LLMPriority.INTERACTIVE))
+
+        while len(started) < 4:
+            await asyncio.sleep(0.01)
+
+        assert started[:2] == ["bg0", "ui"]
+
+    @pytest.mark.asyncio
+    async def test_limiter_wakes_interactive_waiter_first(self):
+        limiter = AdaptiveConcurrencyLimiter("tinyllama", initial_limit=1, adaptive=False)
+        limiter.metrics_collector = Mock()
+        token = await limiter.acquire()
+        order = []
+
+        async def wait(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        background = asyncio.create_task(wait("background", LLMPriority.BACKGROUND))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(wait("interactive", LLMPriority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        limiter.release(token)
+        await asyncio.sleep(0)
+
+        assert order == ["interactive"]
+        background.cancel()
+        await asyncio.gather(background, interactive, return_exceptions=True)
+
+
+def test_queue_wait_percentiles_are_reported_per_class():
+    manager = OptimizedLLMManager()
+    manager.metrics_collector = Mock()
+    for i in range(20):
+        manager._record_queue_wait(LLMRequest("p", "tinyllama", f"r{i}", priority=LLMPriority.BACKGROUND), i / 10)
+    manager._record_queue_wait(LLMRequest("p", "tinyllama", "ui", priority=LLMPriority.INTERACTIVE), 0.01)
+
+    waits = manager.get_performance_metrics()["queue_wait_by_priority"]
+
+    assert waits["interactive"] == {"count": 1, "p50": 0.01, "p95": 0.01}
+    assert waits["background"]["p50"] == pytest.approx(0.95)
+    assert waits["background"]["p95"] > 1.8
+    assert "standard" not in waits
+    labels = manager.metrics_collector.record_timer.call_args.kwargs["labels"]
+    assert labels == {"model": "tinyllama", "priority": "interactive"}
@@ -0,0 +1,116 @@
+"""
+Unit tests for cost-aware model routing in the LLM manager.
+"""
+
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock
+
+import httpx
+
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager
+from event_planning_agent_v2.llm.routing import LLMTaskClass, RouteMetrics
+
+
+class ModelEcho:
+    """Fake Ollama host answering with the model name, or a bad answer for chosen models"""
+
+    def __init__(self, bad_models=()):
+        self.bad_models = set(bad_models)
+        self.models = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.models.append(payload["model"])
+        answer = "???" if payload["model"] in self.bad_models else f"Priority: High ({payload['model']})"
+        return httpx.Response(200, json={"response": answer})
+
+
+def _manager(host, **settings):
+    manager = OptimizedLLMManager()
+    manager.llm_settings = manager.llm_settings.model_copy(
+        update={"enable_batch_processing": False, "enable_response_cache": False, **settings}
+    )
+    manager._response_cache = None
+    manager.metrics_collector = Mock()
+    manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(host.handler))
+    return manager
+
+
+def _is_priority(answer):
+    return answer.startswith("Priority:")
+
+
+@pytest_asyncio.fixture
+async def host_and_manager(request):
+    host = ModelEcho(**getattr(request, "param", {}))
+    manager = _manager(host)
+    yield host, manager
+    await manager.shutdown()
+
+
+class TestModelRouting:
+    """Tests for model selection and fallback"""
+
+    @pytest.mark.asyncio
+    async def test_short_classification_goes_to_small_model(self, host_and_manager):
+        host, manager = host_and_manager
+
+        answer = await manager.generate_response(
+            "Classify this task", task_class=LLMTaskClass.CLASSIFICATION, validate=_is_priority
+        )
+
+        assert answer == "Priority: High (tinyllama)"
+        assert host.models == ["tinyllama"]
+        assert manager.get_performance_metrics()["routing"]["classification:tinyllama"]["fallback_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_generation_and_oversized_prompts_stay_on_requested_model(self, host_and_manager):
+        host, manager = host_and_manager
+
+        await manager.generate_response("Write a plan", task_class=LLMTaskClass.GENERATION)
+        await manager.generate_response("x" * 8000, task_class=LLMTaskClass.EXTRACTION, max_tokens=300)
+
+        assert host.models == ["gemma:2b", "gemma:2b"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("host_and_manager", [{"bad_models": {"tinyllama"}}], indirect=True)
+    async def test_failed_validation_falls_back_to_larger_model(self, host_and_manager):
+        host, manager = host_and_manager
+
+        answer = await manager.generate_response(
+            "Classify this task", task_class=LLMTaskClass.CLASSIFICATION, validate=_is_priority
+        )
+
+        assert answer == "Priority: High (gemma:2b)"
+        assert host.models == ["tinyllama", "gemma:2b"]
+        route = manager.get_performance_metrics()["routing"]["classification:tinyllama"]
+        assert route["requests"] == 1 and route["fallback_rate"] == 1.0
+        manager.metrics_collector.record_counter.assert_any_call(
+            "llm_route_fallbacks", 1, labels={"route": "classification", "model": "tinyllama"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_routing_can_be_disabled(self):
+        host = ModelEcho()
+        manager = _manager(host, enable_model_routing=False)
+        try:
+            await manager.generate_response("Classify this task", task_class=LLMTaskClass.CLASSIFICATION)
+        finally:
+            await manager.shutdown()
+
+        assert host.models == ["gemma:2b"]
+
+
+def test_route_metrics_summary():
+    metrics = RouteMetrics()
+    for i in range(20):
+        metrics.record(LLMTaskClass.EXTRACTION, "tinyllama", latency=(i + 1) / 100, fell_back=i < 5)
+
+    route = metrics.get_stats()["extraction:tinyllama"]
+
+    assert route["requests"] == 20
+    assert route["fallback_rate"] == 0.25
+    assert route["latency_p50"] == pytest.approx(0.105)
+    assert route["latency_p95"] > 0.19
@@ -0,0 +1,149 @@
+"""
+Unit tests for streamed LLM generation and plan progress events.
+"""
+
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock
+
+import httpx
+
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager
+from event_planning_agent_v2.llm.streaming import JSONCompletionDetector
+from event_planning_agent_v2.observability.progress import ProgressBroker, progress_channel
+from event_planning_agent_v2.observability import progress
+
+
+class StreamingOllama:
+    """Fake Ollama that streams one NDJSON line per chunk"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.sent = 0
+        self.payloads = []
+
+    async def _body(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield (json.dumps({"response": chunk, "done": False}) + "\n").encode()
+            await asyncio.sleep(0)
+        yield (json.dumps({"response": "", "done": True, "eval_count": len(self.chunks)}) + "\n").encode()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.payloads.append(json.loads(request.content))
+        return httpx.Response(200, content=self._body())
+
+
+@pytest_asyncio.fixture
+async def make_manager():
+    managers = []
+
+    def factory(chunks):
+        server = StreamingOllama(chunks)
+        manager = OptimizedLLMManager()
+        manager.llm_settings = manager.llm_settings.model_copy()
+        manager.metrics_collector = Mock()
+        manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+        managers.append(manager)
+        return manager, server
+
+    yield factory
+    for manager in managers:
+        await manager.shutdown()
+
+
+class TestJSONCompletionDetector:
+    """Tests for incremental JSON end detection"""
+
+    def test_detects_end_across_chunks_and_skips_prefix(self):
+        detector = JSONCompletionDetector()
+
+        first = "```json\n{\"a\": [1, "
+        assert detector.feed(first) == len(first)
+        assert not detector.complete
+        assert detector.feed("2]} trailing text") == 3
+
+        assert detector.complete
+        assert json.loads(detector.json_text) == {"a": [1, 2]}
+
+    def test_brackets_inside_strings_are_ignored(self):
+        detector = JSONCompletionDetector()
+
+        detector.feed('[{"name": "a } \\" ]"}')
+        assert not detector.complete
+        detector.feed("]")
+
+        assert json.loads(detector.json_text) == [{"name": 'a } " ]'}]
+
+
+class TestGenerateStream:
+    """Tests for the streaming generation API"""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks_and_caches_full_response(self, make_manager):
+        manager, server = make_manager(["Hello", ", ", "world"])
+
+        chunks = [c async for c in manager.generate_stream("greet", model="tinyllama")]
+
+        assert chunks == ["Hello", ", ", "world"]
+        assert server.payloads[0]["stream"] is True
+
+        cached = [c async for c in manager.generate_stream("greet", model="tinyllama")]
+        assert cached == ["Hello, world"]
+        assert len(server.payloads) == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_generation_after_complete_json(self, make_manager):
+        manager, server = make_manager(['{"ok": ', 'true}', " Here is why:", " more", " text"])
+
+        text = "".join([c async for c in manager.generate_stream("json", model="tinyllama", stop_at_json=True)])
+
+        assert json.loads(text) == {"ok": True}
+        assert server.sent == 2
+        assert manager.get_performance_metrics()["stream_early_stops"] == 1
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_published_to_progress_channel(self, make_manager):
+        manager, _ = make_manager(["a", "b"])
+        broker = ProgressBroker()
+        progress._progress_broker, previous = broker, progress._progress_broker
+
+        try:
+            with broker.subscribe("plan-1") as subscription, progress_channel("plan-1"):
+                async for _ in manager.generate_stream("p", model="tinyllama", progress_event="task_enhancement"):
+                    pass
+        finally:
+            progress._progress_broker = previous
+
+        events = [subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())]
+        assert [e.data.get("text") for e in events] == ["a", "b", None]
+        assert events[-1].data["done"] is True
+        assert events[0].to_sse().startswith("event: task_enhancement\ndata: ")
+
+
+class TestProgressBroker:
+    """Tests for plan progress fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_publish_from_worker_thread_reaches_subscriber(self):
+        broker = ProgressBroker()
+
+        with broker.subscribe("plan-1") as subscription:
+            await asyncio.to_thread(broker.publish, "plan-1", "blueprint_section", {"section": "Summary"})
+            event = await asyncio.wait_for(subscription.queue.get(), timeout=1)
+
+        assert event.data == {"section": "Summary"}
+        assert broker.get_stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest_events(self):
+        broker = ProgressBroker(max_queue=2)
+
+        with broker.subscribe("plan-1") as subscription:
+            for i in range(3):
+                broker.publish("plan-1", "tick", {"i": i})
+
+        assert [subscription.queue.get_nowait().data["i"] for _ in range(2)] == [1, 2]
+        assert subscription.dropped == 1
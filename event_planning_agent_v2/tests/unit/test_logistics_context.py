@@ -0,0 +1,96 @@
+"""
+Unit tests for the plan-scoped logistics context shared by the Logistics Check and Venue Lookup tools.
+"""
+
+import threading
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import (
+    ConsolidatedTask, ConsolidatedTaskData
+)
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource
+from event_planning_agent_v2.agents.task_management.tools.logistics_check_tool import LogisticsCheckTool
+from event_planning_agent_v2.agents.task_management.tools.logistics_context import (
+    LogisticsContext, SharedLogisticsContext
+)
+from event_planning_agent_v2.agents.task_management.tools.venue_lookup_tool import VenueLookupTool
+
+VENUE = {
+    'vendor_id': 'venue_1',
+    'name': 'Grand Hall',
+    'area_type': 'Banquet',
+    'location_city': 'Mumbai',
+    'max_seating_capacity': 300,
+    'room_count': 1,
+    'decor_options': {'sound_system': True, 'Stage': True},
+    'attributes': {'projector': True},
+    'policies': {'limited_setup_time': True},
+}
+VENDORS = {'caterer': {'attributes': {'chafing-dishes': True}}, 'photographer': None}
+
+
+def _task(*equipment):
+    return ConsolidatedTask(
+        task_id='task_1', task_name='Setup stage', priority_level='High', priority_score=0.8,
+        priority_rationale='', parent_task_id=None, task_description='Prepare the hall',
+        granularity_level=1, estimated_duration=timedelta(hours=3),
+        resources_required=[Resource('equipment', f'eq_{i}', name, 1) for i, name in enumerate(equipment)],
+    )
+
+
+def test_equipment_lookup_normalizes_names_and_remembers_matches():
+    context = LogisticsContext(VENUE, VENDORS)
+
+    assert context.equipment_source('Sound System') == 'venue'
+    assert context.equipment_source('HD Projector') == 'venue'
+    assert context.equipment_source('Chafing Dishes') == 'vendor'
+    assert context.equipment_source('Fog Machine') is None
+
+    context.venue_equipment = frozenset()
+    assert context.equipment_source('sound-system') == 'venue'
+
+    result = LogisticsCheckTool(db_connection=MagicMock())._check_equipment(
+        _task('Sound System', 'Fog Machine'), context
+    )
+    assert result['status'] == 'issue'
+    assert result['issues'] == ["Equipment 'Fog Machine' not available from venue or vendors"]
+
+
+def test_shared_context_loads_once_for_parallel_tools():
+    db = MagicMock()
+    session = db.get_sync_session.return_value.__enter__.return_value
+    session.query.return_value.filter.return_value.first.return_value = MagicMock(
+        vendor_id='venue_1', decor_options={}, attributes={}, policies={}
+    )
+    shared = SharedLogisticsContext(db, {'venue': {'vendor_id': 'venue_1'}, 'caterer': {'id': 'caterer_1'}})
+
+    contexts = []
+    threads = [threading.Thread(target=lambda: contexts.append(shared.get())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(context) for context in contexts}) == 1
+    assert db.get_sync_session.call_count == 1
+    assert session.query.call_count == 2
+    assert SharedLogisticsContext(db, None).get() is None
+
+
+def test_tools_use_the_context_instead_of_querying():
+    db = MagicMock()
+    state = {'selected_combination': {'venue': {'vendor_id': 'venue_1'}}}
+    data = ConsolidatedTaskData(tasks=[_task('Projector')])
+    context = LogisticsContext(VENUE, VENDORS)
+
+    statuses = LogisticsCheckTool(db_connection=db).verify_logistics(data, state, context=context)
+    venues = VenueLookupTool(db_connection=db, use_mcp=False).lookup_venues(data, state, context=context)
+
+    assert statuses[0].equipment_status == 'verified'
+    assert 'Venue has limited setup time restrictions' in statuses[0].issues
+    assert venues[0].venue_name == 'Grand Hall'
+    assert venues[0].venue_type == 'Banquet'
+    assert sorted(venues[0].available_equipment) == ['Stage', 'projector', 'sound_system']
+    assert venues[0].access_restrictions == ['Limited setup time']
+    db.get_sync_session.assert_not_called()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the raw ASGI request pipeline middleware.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from event_planning_agent_v2.api import middleware as mw
+from event_planning_agent_v2.api.middleware import (
+    RequestPipelineMiddleware, AuthConfig, RateLimitConfig
+)
+
+
+def _client(rate_limit_config=None, auth_config=None):
+    app = FastAPI()
+
+    @app.get("/v1/plans")
+    async def plans():
+        return {"plans": []}
+
+    @app.post("/v1/plans")
+    async def create_plan():
+        return {"created": True}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        auth_config=auth_config or AuthConfig(enabled=False),
+        rate_limit_config=rate_limit_config or RateLimitConfig(enabled=False)
+    )
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestRequestPipeline:
+    """Tests that the composed pipeline keeps the per-layer behavior"""
+
+    def test_observability_headers_are_added(self):
+        response = _client().get("/v1/plans", headers={"X-Correlation-Id": "corr-1"})
+
+        assert response.status_code == 200
+        assert response.headers["X-Correlation-Id"] == "corr-1"
+        assert response.headers["X-Response-Time"].endswith("ms")
+
+    def test_unhandled_errors_become_json_500(self):
+        response = _client().get("/boom", headers={"X-Correlation-Id": "corr-2"})
+
+        assert response.status_code == 500
+        assert response.json()["error"]["type"] == "InternalServerError"
+        assert response.json()["error"]["correlation_id"] == "corr-2"
+
+    def test_rate_limit_headers_and_429(self):
+        client = _client(rate_limit_config=RateLimitConfig(burst_limit=2))
+
+        first = client.get("/v1/plans")
+        client.get("/v1/plans")
+        limited = client.get("/v1/plans")
+
+        assert first.headers["X-RateLimit-Limit"] == "60"
+        assert first.headers["X-RateLimit-Remaining"] == "59"
+        assert limited.status_code == 429
+        assert limited.headers["Retry-After"] == "60"
+
+    def test_request_validation_rejects_non_json_body(self):
+        response = _client().post("/v1/plans", content=b"x", headers={"Content-Type": "text/plain"})
+
+        assert response.status_code == 415
+        assert response.json()["error"]["type"] == "UnsupportedMediaType"
+
+    def test_authorization_uses_user_from_authentication(self):
+        with patch.object(mw.AuthenticationMiddleware, "_requires_auth", return_value=True), \
+                patch.object(
+                    mw.AuthenticationMiddleware, "_authenticate_request",
+                    return_value={"valid": True, "user": {"user_id": "u1", "roles": ["viewer"]}}
+                ):
+            client = _client(auth_config=AuthConfig())
+            read = client.get("/v1/plans")
+            write = client.post("/v1/plans", json={})
+
+        assert read.status_code == 200
+        assert write.status_code == 403
+
+    def test_streaming_response_passes_through(self):
+        response = _client().get("/stream")
+
+        assert response.text == "abc"
+
+    def test_health_fast_path_skips_pipeline(self):
+        client = _client(rate_limit_config=RateLimitConfig(burst_limit=1))
+        health = Mock()
+        health.get_system_health.return_value.overall_status.value = "healthy"
+        health.get_system_health.return_value.to_json.return_value = json.dumps({"status": "healthy"})
+
+        with patch("event_planning_agent_v2.observability.health.get_health_checker", return_value=health):
+            responses = [client.get("/health") for _ in range(3)]
+        live = client.get("/health/live")
+
+        assert all(r.status_code == 200 for r in responses)
+        assert "X-RateLimit-Limit" not in responses[0].headers
+        assert "X-Correlation-Id" not in responses[0].headers
+        assert live.json() == {"status": "alive"}
+
+    def test_static_routes_skip_pipeline(self):
+        client = _client(rate_limit_config=RateLimitConfig(burst_limit=1))
+
+        responses = [client.get("/openapi.json") for _ in range(3)]
+
+        assert all(r.status_code == 200 for r in responses)
+        assert "X-Correlation-Id" not in responses[0].headers
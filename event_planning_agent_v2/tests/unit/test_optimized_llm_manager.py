@@ -0,0 +1,236 @@
+"""
+Unit tests for the optimized LLM manager request pipeline.
+"""
+
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock
+
+import httpx
+
+from event_planning_agent_v2.llm.concurrency import AdaptiveConcurrencyLimiter
+from event_planning_agent_v2.llm.optimized_manager import OptimizedLLMManager, LLMRequest, ModelDispatcher
+
+
+class FakeOllama:
+    """In-process stand-in for Ollama's /api/generate endpoint"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.cancelled = 0
+        self.fail = False
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.calls.append(payload)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            return httpx.Response(500, text="model error")
+        return httpx.Response(200, json={"response": f"echo:{payload['prompt']}"})
+
+
+@pytest.fixture
+def fake_ollama():
+    return FakeOllama(delay=0.05)
+
+
+@pytest_asyncio.fixture
+async def manager(fake_ollama):
+    manager = OptimizedLLMManager()
+    manager.llm_settings = manager.llm_settings.model_copy()
+    manager.metrics_collector = Mock()
+    manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(fake_ollama.handler))
+    manager._batch_processor_task = asyncio.create_task(manager._batch_processor())
+    yield manager
+    await manager.shutdown()
+
+
+class TestFutureDelivery:
+    """Tests for future-based result delivery from the batch processor"""
+
+    @pytest.mark.asyncio
+    async def test_batched_request_resolves_future(self, manager):
+        result = await manager.generate_response("hello", model="tinyllama")
+
+        assert result == "echo:hello"
+
+    @pytest.mark.asyncio
+    async def test_processed_request_resolves_its_future(self, manager):
+        request = LLMRequest(prompt="hi", model="tinyllama", request_id="r1")
+        request.future = asyncio.get_running_loop().create_future()
+
+        await manager._process_request(request)
+
+        response = request.future.result()
+        assert response.content == "echo:hi"
+        assert response.queue_time >= 0
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_and_model_time_are_recorded(self, manager):
+        await manager.generate_response("hello", model="tinyllama")
+
+        timers = {c.args[0] for c in manager.metrics_collector.record_timer.call_args_list}
+        assert {"llm_queue_wait_duration", "llm_model_duration"} <= timers
+        assert manager.get_performance_metrics()["avg_queue_time"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_cancels_http_call(self, manager, fake_ollama):
+        fake_ollama.delay = 5.0
+        caller = asyncio.create_task(manager.generate_response("slow", model="tinyllama"))
+        while not fake_ollama.calls:
+            await asyncio.sleep(0.01)
+
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0.05)
+
+        assert fake_ollama.cancelled == 1
+        assert manager.get_performance_metrics()["cancelled_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_cancelled_while_queued_is_skipped(self, manager, fake_ollama):
+        request = LLMRequest(prompt="gone", model="tinyllama", request_id="r1")
+        request.future = asyncio.get_running_loop().create_future()
+        request.future.cancel()
+
+        await manager._process_request(request)
+
+        assert fake_ollama.calls == []
+
+    @pytest.mark.asyncio
+    async def test_batch_responses_keep_request_order(self, manager):
+        responses = await manager.generate_batch_responses([
+            {"prompt": "a", "model": "tinyllama"},
+            {"prompt": "b", "model": "gemma:2b"},
+        ])
+
+        assert [r.content for r in responses] == ["echo:a", "echo:b"]
+
+
+class TestModelDispatcher:
+    """Tests for concurrent per-model dispatch"""
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently_up_to_limit(self, manager, fake_ollama):
+        manager.llm_settings.model_concurrency = 3
+        fake_ollama.delay = 0.1
+
+        responses = await manager.generate_batch_responses(
+            [{"prompt": str(i), "model": "tinyllama"} for i in range(6)]
+        )
+
+        stats = manager.get_performance_metrics()["dispatch"]["tinyllama"]
+        assert [r.content for r in responses] == [f"echo:{i}" for i in range(6)]
+        assert stats["peak_in_flight"] == 3
+        assert stats["effective_parallelism"] > 2.0
+
+    @pytest.mark.asyncio
+    async def test_dispatches_immediately_when_slots_are_free(self, manager):
+        started = []
+
+        async def execute(request):
+            started.append(request.request_id)
+            await asyncio.sleep(0.05)
+
+        dispatcher = ModelDispatcher("tinyllama", AdaptiveConcurrencyLimiter("tinyllama", initial_limit=2, adaptive=False), execute)
+        for i in range(3):
+            dispatcher.submit(LLMRequest(prompt="p", model="tinyllama", request_id=f"r{i}"))
+        await asyncio.sleep(0)
+
+        assert started == ["r0", "r1"]
+        assert len(dispatcher.pending) == 1
+
+        await asyncio.sleep(0.1)
+        assert started == ["r0", "r1", "r2"]
+
+    @pytest.mark.asyncio
+    async def test_dispatched_requests_take_limiter_slots_without_queueing_in_it(self, manager, fake_ollama):
+        manager.llm_settings.model_concurrency = 1
+        limiter = manager._get_limiter("tinyllama")
+        held = await limiter.acquire()  # A direct call holds the only slot
+
+        batch = asyncio.ensure_future(manager.generate_batch_responses(
+            [{"prompt": str(i), "model": "tinyllama"} for i in range(2)]
+        ))
+        await asyncio.sleep(0.05)
+        dispatcher = manager._get_dispatcher("tinyllama")
+        assert dispatcher.in_flight == 0 and len(dispatcher.pending) == 2
+        assert limiter.queue_depth == 0
+
+        limiter.release(held, None)
+        responses = await batch
+
+        assert [r.content for r in responses] == ["echo:0", "echo:1"]
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_models_do_not_block_each_other(self, manager, fake_ollama):
+        manager.llm_settings.model_concurrency = 1
+        fake_ollama.delay = 0.1
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(
+            manager.generate_response("a", model="tinyllama"),
+            manager.generate_response("b", model="gemma:2b"),
+        )
+
+        assert loop.time() - start < 0.19
+
+
+class TestSingleFlight:
+    """Tests for coalescing identical concurrent prompts"""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_prompts_share_one_call(self, manager, fake_ollama):
+        results = await asyncio.gather(*[
+            manager.generate_response("Book venue", model="tinyllama", use_batch=False) for _ in range(5)
+        ])
+
+        assert results == ["echo:Book venue"] * 5
+        assert len(fake_ollama.calls) == 1
+        assert manager.get_performance_metrics()["deduplicated_requests"] == 4
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_are_not_coalesced(self, manager, fake_ollama):
+        await asyncio.gather(
+            manager.generate_response("a", model="tinyllama", use_batch=False),
+            manager.generate_response("a", model="gemma:2b", use_batch=False),
+        )
+
+        assert len(fake_ollama.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_follower_survives_leader_cancellation(self, manager, fake_ollama):
+        fake_ollama.delay = 0.1
+        leader = asyncio.create_task(manager.generate_response("p", model="tinyllama", use_batch=False))
+        follower = asyncio.create_task(manager.generate_response("p", model="tinyllama", use_batch=False))
+        await asyncio.sleep(0.02)
+
+        leader.cancel()
+
+        assert await follower == "echo:p"
+        assert fake_ollama.cancelled == 0
+        assert len(fake_ollama.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_remembered(self, manager, fake_ollama):
+        fake_ollama.fail = True
+        results = await asyncio.gather(*[
+            manager.generate_response("p", model="tinyllama", use_batch=False) for _ in range(3)
+        ], return_exceptions=True)
+
+        assert all(isinstance(r, Exception) for r in results)
+        assert len(fake_ollama.calls) == 1
+
+        fake_ollama.fail = False
+        assert await manager.generate_response("p", model="tinyllama", use_batch=False) == "echo:p"
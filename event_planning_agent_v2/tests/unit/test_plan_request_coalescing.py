@@ -0,0 +1,222 @@
+"""
+Unit tests for single-flight coalescing of duplicate plan requests.
+"""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from fastapi import BackgroundTasks
+
+from event_planning_agent_v2.api import routes
+from event_planning_agent_v2.api.coalescing import (
+    PlanRequestCoalescer, build_coalescing_key, fingerprint_request
+)
+from event_planning_agent_v2.api.schemas import EventPlanRequest, EventPlanResponse
+
+
+def _plan_request(**overrides):
+    data = {
+        "clientName": "Priya Sharma",
+        "guestCount": 150,
+        "clientVision": "Garden wedding",
+        "budget": 500000.0,
+    }
+    data.update(overrides)
+    return EventPlanRequest(**data)
+
+
+class TestCoalescingKeys:
+    """Tests for request fingerprints and coalescing keys"""
+
+    def test_fingerprint_ignores_key_order(self):
+        assert fingerprint_request({"a": 1, "b": [1, 2]}) == fingerprint_request({"b": [1, 2], "a": 1})
+
+    def test_fingerprint_changes_with_content(self):
+        assert fingerprint_request({"a": 1}) != fingerprint_request({"a": 2})
+
+    def test_key_is_scoped_to_client(self):
+        request = {"clientVision": "Garden wedding"}
+        assert build_coalescing_key("Priya", request) != build_coalescing_key("Rohit", request)
+
+    def test_idempotency_key_overrides_fingerprint(self):
+        key_a = build_coalescing_key("Priya", {"budget": 1}, idempotency_key="retry-1")
+        key_b = build_coalescing_key("Priya", {"budget": 2}, idempotency_key="retry-1")
+        assert key_a == key_b == "idempotency:retry-1"
+
+
+class TestPlanRequestCoalescer:
+    """Tests for the in-flight registry"""
+
+    @pytest.mark.asyncio
+    async def test_followers_receive_leader_result(self):
+        coalescer = PlanRequestCoalescer()
+        inflight = coalescer.register("k", "plan-1")
+
+        waiter = asyncio.ensure_future(coalescer.wait(inflight))
+        await asyncio.sleep(0)
+        coalescer.complete("k", "done")
+
+        assert await waiter == "done"
+        assert coalescer.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_follower_timeout_does_not_cancel_leader(self):
+        coalescer = PlanRequestCoalescer()
+        inflight = coalescer.register("k", "plan-1")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await coalescer.wait(inflight, timeout=0.01)
+
+        assert not inflight.future.cancelled()
+        coalescer.complete("k", "done")
+        assert inflight.future.result() == "done"
+
+    @pytest.mark.asyncio
+    async def test_leader_error_propagates(self):
+        coalescer = PlanRequestCoalescer()
+        inflight = coalescer.register("k", "plan-1")
+        waiter = asyncio.ensure_future(coalescer.wait(inflight))
+        await asyncio.sleep(0)
+
+        coalescer.complete("k", error=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await waiter
+
+    def test_coalesced_requests_are_counted(self):
+        coalescer = PlanRequestCoalescer()
+        coalescer.metrics_collector = Mock()
+        inflight = SimpleNamespace(key="idempotency:abc", plan_id="plan-1", subscribers=0)
+
+        coalescer.record_coalesced(inflight, "sync")
+
+        assert inflight.subscribers == 1
+        coalescer.metrics_collector.record_counter.assert_called_once_with(
+            "api_plan_requests_coalesced",
+            1.0,
+            labels={"reason": "idempotency_key", "mode": "sync"}
+        )
+
+
+class TestCreatePlanCoalescing:
+    """Tests for coalescing in the create_plan endpoint"""
+
+    @pytest.fixture
+    def state_manager(self):
+        plans = {}
+        manager = Mock()
+        manager.save_plan.side_effect = lambda plan: plans.__setitem__(plan["plan_id"], dict(plan))
+        manager.load_plan.side_effect = lambda plan_id: plans.get(plan_id)
+        return manager
+
+    @pytest.fixture(autouse=True)
+    def fresh_coalescer(self):
+        coalescer = PlanRequestCoalescer()
+        coalescer.metrics_collector = Mock()
+        with patch.object(routes, "get_plan_coalescer", return_value=coalescer):
+            yield coalescer
+
+    @pytest.mark.asyncio
+    async def test_duplicate_sync_requests_share_one_workflow(self, state_manager, fresh_coalescer):
+        calls = []
+
+        def slow_execute(client_request, plan_id, async_execution):
+            calls.append(plan_id)
+            time.sleep(0.1)
+            return SimpleNamespace(
+                plan_id=plan_id, success=True, final_state={"beam_candidates": []},
+                nodes_executed=["budget"], error=None
+            )
+
+        with patch.object(routes, "execute_event_planning", side_effect=slow_execute):
+            responses = await asyncio.gather(*[
+                routes.create_plan(
+                    request=_plan_request(),
+                    background_tasks=BackgroundTasks(),
+                    async_execution=False,
+                    idempotency_key=None,
+                    settings=None,
+                    state_manager=state_manager
+                )
+                for _ in range(3)
+            ])
+
+        assert len(calls) == 1
+        assert all(isinstance(r, EventPlanResponse) for r in responses)
+        assert len({r.plan_id for r in responses}) == 1
+        assert fresh_coalescer.inflight_count() == 0
+        assert fresh_coalescer.metrics_collector.record_counter.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_releases_its_key(self, state_manager, fresh_coalescer):
+        def slow_execute(client_request, plan_id, async_execution):
+            time.sleep(0.2)
+
+        def create():
+            return routes.create_plan(
+                request=_plan_request(),
+                background_tasks=BackgroundTasks(),
+                async_execution=False,
+                idempotency_key=None,
+                settings=None,
+                state_manager=state_manager
+            )
+
+        with patch.object(routes, "execute_event_planning", side_effect=slow_execute):
+            leader = asyncio.create_task(create())
+            await asyncio.sleep(0.05)
+            follower = asyncio.create_task(create())
+            await asyncio.sleep(0.05)
+
+            leader.cancel()  # Client disconnected
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            follower_response = await asyncio.wait_for(follower, timeout=1.0)
+
+        assert fresh_coalescer.inflight_count() == 0
+        assert follower_response.plan_id == state_manager.save_plan.call_args.args[0]["plan_id"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_async_request_returns_running_plan(self, state_manager, fresh_coalescer):
+        first_tasks = BackgroundTasks()
+        first = await routes.create_plan(
+            request=_plan_request(),
+            background_tasks=first_tasks,
+            async_execution=True,
+            idempotency_key=None,
+            settings=None,
+            state_manager=state_manager
+        )
+
+        second_tasks = BackgroundTasks()
+        second = await routes.create_plan(
+            request=_plan_request(),
+            background_tasks=second_tasks,
+            async_execution=True,
+            idempotency_key=None,
+            settings=None,
+            state_manager=state_manager
+        )
+
+        assert second.plan_id == first.plan_id
+        assert second.status == "processing"
+        assert len(first_tasks.tasks) == 1
+        assert len(second_tasks.tasks) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_idempotency_keys_start_separate_plans(self, state_manager):
+        responses = []
+        for key in ("key-1", "key-2"):
+            responses.append(await routes.create_plan(
+                request=_plan_request(),
+                background_tasks=BackgroundTasks(),
+                async_execution=True,
+                idempotency_key=key,
+                settings=None,
+                state_manager=state_manager
+            ))
+
+        assert responses[0].plan_id != responses[1].plan_id
@@ -0,0 +1,154 @@
+"""
+Unit tests for the plan_summaries projection and plan listing queries.
+"""
+
+import pytest
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from event_planning_agent_v2.database import state_manager as sm
+
+
+def _event_plan(**overrides):
+    data = {
+        "plan_id": uuid4(),
+        "client_id": "Priya Sharma",
+        "status": "completed",
+        "workflow_state": {"beam_candidates": []},
+        "selected_combination": None,
+        "final_blueprint": None,
+        "created_at": datetime(2024, 6, 1, 10, 0, 0),
+        "updated_at": datetime(2024, 6, 1, 11, 0, 0),
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+class TestBuildPlanSummary:
+    """Tests for building the compact summary row"""
+
+    def test_keeps_top_k_by_score(self):
+        candidates = [
+            {"combination_id": f"c{i}", "total_score": i / 10, "venue": {"name": "x" * 1000}}
+            for i in range(10)
+        ]
+        plan = _event_plan(workflow_state={"beam_candidates": candidates})
+
+        summary = sm.build_plan_summary(plan, top_k=3)
+
+        assert summary["best_score"] == pytest.approx(0.9)
+        assert summary["combination_count"] == 10
+        assert [c["combination_id"] for c in summary["top_combinations"]] == ["c9", "c8", "c7"]
+        assert "venue" not in summary["top_combinations"][0]
+
+    def test_falls_back_to_fitness_score(self):
+        plan = _event_plan(workflow_state={"beam_candidates": [
+            {"combination_id": "a", "fitness_score": 72.5},
+            {"combination_id": "b"},
+        ]})
+
+        summary = sm.build_plan_summary(plan)
+
+        assert summary["best_score"] == 72.5
+        assert summary["top_combinations"][0]["combination_id"] == "a"
+
+    def test_handles_missing_workflow_state(self):
+        plan = _event_plan(
+            workflow_state=None,
+            selected_combination={"combination_id": "sel"},
+            final_blueprint="Blueprint"
+        )
+
+        summary = sm.build_plan_summary(plan)
+
+        assert summary["best_score"] is None
+        assert summary["top_combinations"] == []
+        assert summary["selected_combination_id"] == "sel"
+        assert summary["has_blueprint"] is True
+
+
+class TestPlanCursor:
+    """Tests for keyset pagination cursors"""
+
+    def test_round_trip(self):
+        created_at = datetime(2024, 6, 1, 10, 0, 0, 123456)
+        plan_id = uuid4()
+
+        assert sm.decode_plan_cursor(sm.encode_plan_cursor(created_at, plan_id)) == (created_at, plan_id)
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            sm.decode_plan_cursor("not-a-cursor")
+
+
+class TestListPlansQueries:
+    """Tests that listing only reads the narrow projection"""
+
+    @pytest.fixture
+    def session(self):
+        session = MagicMock()
+        session.execute.return_value.scalar_one.return_value = 100000
+        session.execute.return_value.scalars.return_value.all.return_value = []
+        return session
+
+    @pytest.fixture
+    def manager(self, session):
+        @contextmanager
+        def fake_session():
+            yield session
+
+        with patch.object(sm, "get_sync_session", fake_session), \
+                patch.object(sm, "get_settings", return_value=SimpleNamespace()):
+            yield sm.PlanManager()
+
+    def _compiled(self, session):
+        return [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.call_args_list
+        ]
+
+    def test_count_uses_count_star_on_summaries(self, manager, session):
+        plans, total = manager.list_plans(page=1, page_size=10)
+
+        count_sql, list_sql = self._compiled(session)
+        assert total == 100000
+        assert "count(*)" in count_sql
+        assert "plan_summaries" in count_sql
+        assert "event_plans" not in list_sql
+        assert "workflow_state" not in list_sql
+
+    def test_cursor_uses_keyset_instead_of_offset(self, manager, session):
+        cursor = sm.encode_plan_cursor(datetime(2024, 6, 1), uuid4())
+
+        manager.list_plans(page_size=10, cursor=cursor, filters={"status": "completed"})
+
+        _, list_sql = self._compiled(session)
+        assert "OFFSET" not in list_sql
+        assert "(plan_summaries.created_at, plan_summaries.plan_id) <" in list_sql
+        assert "plan_summaries.status =" in list_sql
+
+    def test_summary_rows_convert_to_plan_data(self, manager, session):
+        summary = SimpleNamespace(
+            plan_id=uuid4(),
+            client_id="Priya Sharma",
+            status="completed",
+            best_score=0.9,
+            combination_count=7,
+            top_combinations=[{"combination_id": "c1", "total_score": 0.9}],
+            selected_combination_id="c1",
+            has_blueprint=True,
+            created_at=datetime(2024, 6, 1),
+            updated_at=datetime(2024, 6, 2),
+        )
+        session.execute.return_value.scalars.return_value.all.return_value = [summary]
+
+        plans, _ = manager.list_plans()
+
+        assert plans[0]["combinations"] == [{"combination_id": "c1", "total_score": 0.9}]
+        assert plans[0]["selected_combination"] == {"combination_id": "c1"}
+        assert plans[0]["client_name"] == "Priya Sharma"
@@ -0,0 +1,170 @@
+"""
+Unit tests for multi-task prompt packing in the task-management sub-agents.
+"""
+
+import json
+import re
+import pytest
+from datetime import timedelta
+
+from event_planning_agent_v2.llm.packing import extract_json_array, pack_size, plan_packs, split_packed_response
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import (
+    ConsolidatedTask, ConsolidatedTaskData
+)
+from event_planning_agent_v2.agents.task_management.models.task_models import PrioritizedTask
+from event_planning_agent_v2.agents.task_management.sub_agents.granularity_agent import GranularityAgentCore
+from event_planning_agent_v2.agents.task_management.sub_agents.prioritization_agent import PrioritizationAgentCore
+from event_planning_agent_v2.agents.task_management.tools.api_llm_tool import APILLMTool
+
+
+class FakeLLMManager:
+    """
+    Answers packed prompts with a JSON array built from their task IDs
+
+    Task IDs in ``drop`` are left out of packed answers. Single-task prompts
+    get ``single_response``.
+    """
+
+    def __init__(self, packed_entry, single_response, drop=()):
+        self.packed_entry = packed_entry
+        self.single_response = single_response
+        self.drop = set(drop)
+        self.packed_prompts = []
+        self.single_prompts = []
+
+    def _respond(self, prompt):
+        if "JSON array" not in prompt:
+            self.single_prompts.append(prompt)
+            return self.single_response
+        self.packed_prompts.append(prompt)
+        task_ids = re.findall(r"^Task ID: (\S+)$", prompt, re.MULTILINE)
+        entries = [self.packed_entry(task_id) for task_id in task_ids if task_id not in self.drop]
+        return "Here you go:\n```json\n" + json.dumps(entries) + "\n```"
+
+    def select_model(self, task_class, model=None, **kwargs):
+        return model
+
+    async def generate_response(self, prompt, **kwargs):
+        return self._respond(prompt)
+
+    async def generate_stream(self, prompt, **kwargs):
+        yield self._respond(prompt)
+
+
+def _with_pack_limit(agent, max_tasks):
+    agent.settings = agent.settings.model_copy(update={
+        "llm": agent.settings.llm.model_copy(update={"max_tasks_per_prompt": max_tasks})
+    })
+    return agent
+
+
+class TestPackingHelpers:
+    """Tests for pack sizing and answer splitting"""
+
+    def test_pack_size_is_bounded_by_context_window_and_limit(self):
+        assert pack_size(2048, 248, 300, max_tasks=8) == 6
+        assert pack_size(8192, 248, 300, max_tasks=8) == 8
+        assert pack_size(512, 500, 300, max_tasks=8) == 1
+
+    def test_plan_packs_preserves_order(self):
+        packs = plan_packs(list(range(10)), lambda i: "x" * 40, "", 100, 10, max_tasks=4)
+
+        assert packs == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    def test_split_matches_entries_by_id(self):
+        response = 'Sure! [{"task_id": "b", "v": 2}, {"task_id": "a", "v": 1}, {"task_id": "zz", "v": 9}]'
+
+        assert split_packed_response(response, ["a", "b", "c"]) == {
+            "a": {"task_id": "a", "v": 1},
+            "b": {"task_id": "b", "v": 2},
+        }
+
+    def test_split_falls_back_to_position_without_ids(self):
+        assert split_packed_response('[{"v": 1}, {"v": 2}]', ["a", "b"]) == {"a": {"v": 1}, "b": {"v": 2}}
+
+    def test_prose_brackets_are_skipped(self):
+        assert extract_json_array('Answer for [all tasks]: [{"task_id": "a"}]') == [{"task_id": "a"}]
+
+    def test_truncated_array_is_a_parse_failure(self):
+        response = '[{"task_id": "a", "sub_tasks": [{"name": "x"}]}, {"task_id": "b", "sub_'
+
+        assert split_packed_response(response, ["a", "b"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_granularity_decomposes_forty_tasks_in_five_prompts():
+    manager = FakeLLMManager(
+        lambda task_id: {"task_id": task_id, "sub_tasks": [{"name": f"{task_id} step", "description": "Do it"}]},
+        single_response="Sub-task 1: Single step\nDescription: Done alone"
+    )
+    agent = _with_pack_limit(GranularityAgentCore(), 8)
+    agent.llm_manager = manager
+    tasks = [
+        PrioritizedTask(f"t{i}", f"Vendor booking {i}", "High", 0.8, "Books early") for i in range(40)
+    ]
+
+    result = await agent.decompose_tasks(tasks, {"client_request": {"event_type": "wedding"}})
+
+    assert len(manager.packed_prompts) == 5
+    assert manager.single_prompts == []
+    assert [t.task_id for t in result if t.parent_task_id is None] == [f"t{i}" for i in range(40)]
+    assert result[1].task_name == "t0 step"
+    # The event context is sent once per pack, not once per task
+    assert manager.packed_prompts[0].count("Event Type: wedding") == 1
+
+
+@pytest.mark.asyncio
+async def test_prioritization_reruns_only_failed_tasks_singly():
+    manager = FakeLLMManager(
+        lambda task_id: {"task_id": task_id, "priority": "Critical", "rationale": "Packed"},
+        single_response="Priority: Low\nRationale: Single",
+        drop={"task_3"}
+    )
+    agent = _with_pack_limit(PrioritizationAgentCore(), 4)
+    agent.llm_manager = manager
+    state = {"timeline_data": {"tasks": [{"task_id": f"task_{i}", "task_name": f"Task {i}"} for i in range(6)]}}
+
+    result = await agent.prioritize_tasks(state)
+
+    assert len(manager.packed_prompts) == 2
+    assert len(manager.single_prompts) == 1
+    assert "task_3" not in manager.single_prompts[0] and "Task 3" in manager.single_prompts[0]
+    by_id = {t.task_id: t for t in result}
+    assert by_id["task_3"].priority_rationale == "Single"
+    assert all(by_id[f"task_{i}"].priority_rationale == "Packed" for i in (0, 1, 2, 4, 5))
+
+
+@pytest.mark.asyncio
+async def test_enhancement_uses_packed_answers_and_falls_back_per_task():
+    manager = FakeLLMManager(
+        lambda task_id: {
+            "task_id": task_id,
+            "enhanced_description": f"Detailed plan for {task_id} with all the steps",
+            "suggestions": ["Book early"],
+            "potential_issues": ["Delays"],
+            "best_practices": ["Confirm in writing"],
+        },
+        single_response=json.dumps({
+            "enhanced_description": "Enhanced on its own with full detail",
+            "suggestions": ["Alone"],
+        }),
+        drop={"e2"}
+    )
+    tool = APILLMTool()
+    tool.llm_manager = manager
+    tasks = [
+        ConsolidatedTask(
+            task_id=f"e{i}", task_name=f"Task {i}", priority_level="Medium", priority_score=0.5,
+            priority_rationale="", parent_task_id=None, task_description="Coordinate the vendor",
+            granularity_level=0, estimated_duration=timedelta(hours=2)
+        )
+        for i in range(5)
+    ]
+
+    result = await tool.enhance_tasks(ConsolidatedTaskData(tasks=tasks, event_context={"event_type": "gala"}))
+
+    assert len(manager.packed_prompts) == 1
+    assert len(manager.single_prompts) == 1
+    assert [t.task_id for t in result] == [f"e{i}" for i in range(5)]
+    assert result[0].enhanced_description == "Detailed plan for e0 with all the steps"
+    assert result[2].enhanced_description == "Enhanced on its own with full detail"
@@ -0,0 +1,159 @@
+"""
+Unit tests for the sliding-window rate limiter backends.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from event_planning_agent_v2.api.rate_limiting import (
+    SlidingWindowCounter, InMemoryRateLimiter, RedisRateLimiter,
+    build_window_specs, create_rate_limiter
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlidingWindowCounter:
+    """Tests for the ring buffer counter"""
+
+    def test_events_expire_as_window_slides(self):
+        counter = SlidingWindowCounter(window_seconds=10, bucket_seconds=1)
+        for t in range(5):
+            counter.record(100.0 + t)
+
+        assert counter.count(104.5) == 5
+        assert counter.count(110.0) == 4
+        assert counter.count(114.0) == 0
+
+    def test_long_idle_gap_resets_window(self):
+        counter = SlidingWindowCounter(window_seconds=60, bucket_seconds=1)
+        counter.record(0.0)
+
+        assert counter.count(10_000.0) == 0
+        assert len(counter.counts) == 60
+
+
+class TestInMemoryRateLimiter:
+    """Tests for the per-process limiter"""
+
+    def _limiter(self, clock, per_minute=60, per_hour=1000, burst=10, **kwargs):
+        return InMemoryRateLimiter(build_window_specs(per_minute, per_hour, burst), clock=clock, **kwargs)
+
+    def test_burst_limit(self):
+        clock = FakeClock()
+        limiter = self._limiter(clock, burst=3)
+
+        decisions = [limiter.hit("ip:1") for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[-1].exceeded_window == "burst"
+
+        clock.now += 11
+        assert limiter.hit("ip:1").allowed
+
+    def test_minute_limit_and_remaining(self):
+        clock = FakeClock()
+        limiter = self._limiter(clock, per_minute=5, burst=100)
+
+        remaining = []
+        for _ in range(5):
+            remaining.append(limiter.hit("ip:1").remaining)
+            clock.now += 1
+
+        assert remaining == [4, 3, 2, 1, 0]
+        assert limiter.hit("ip:1").exceeded_window == "minute"
+
+        clock.now += 60
+        assert limiter.hit("ip:1").allowed
+
+    def test_hour_limit_spans_minutes(self):
+        clock = FakeClock()
+        limiter = self._limiter(clock, per_minute=100, per_hour=3, burst=100)
+
+        for _ in range(3):
+            assert limiter.hit("ip:1").allowed
+            clock.now += 120
+
+        assert limiter.hit("ip:1").exceeded_window == "hour"
+
+    def test_clients_are_isolated_and_bounded(self):
+        limiter = self._limiter(FakeClock(), burst=1, max_clients=2)
+
+        assert limiter.hit("ip:1").allowed
+        assert limiter.hit("ip:2").allowed
+        assert not limiter.hit("ip:1").allowed
+        limiter.hit("ip:3")
+
+        assert limiter.client_count() == 2
+
+
+class TestRedisRateLimiter:
+    """Tests for the Redis backed limiter"""
+
+    def _client(self, script):
+        client = Mock()
+        client.register_script.return_value = script
+        return client
+
+    @pytest.mark.asyncio
+    async def test_decodes_script_result(self):
+        script = AsyncMock(return_value=[1, 0, 3])
+        limiter = RedisRateLimiter(build_window_specs(60, 1000, 10), "redis://unused", client=self._client(script))
+
+        decision = await limiter.acquire("ip:1")
+
+        assert decision.allowed
+        assert decision.remaining == 57
+        keys = script.call_args.kwargs["keys"]
+        assert keys == ["api:ratelimit:ip:1:minute", "api:ratelimit:ip:1:hour", "api:ratelimit:ip:1:burst"]
+
+    @pytest.mark.asyncio
+    async def test_reports_exceeded_window(self):
+        script = AsyncMock(return_value=[0, 3, 10])
+        limiter = RedisRateLimiter(build_window_specs(60, 1000, 10), "redis://unused", client=self._client(script))
+
+        decision = await limiter.acquire("ip:1")
+
+        assert not decision.allowed
+        assert decision.exceeded_window == "burst"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_limits_when_redis_fails(self):
+        script = AsyncMock(side_effect=ConnectionError("down"))
+        limiter = RedisRateLimiter(build_window_specs(60, 1000, 1), "redis://unused", client=self._client(script))
+
+        assert (await limiter.acquire("ip:1")).allowed
+        assert not (await limiter.acquire("ip:1")).allowed
+
+    @pytest.mark.asyncio
+    async def test_lua_script_enforces_limits_across_limiters(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+
+        server = fakeredis.FakeServer()
+        clock = FakeClock()
+        windows = build_window_specs(60, 1000, 3)
+        workers = [
+            RedisRateLimiter(windows, "redis://unused", client=fakeredis.FakeAsyncRedis(server=server), clock=clock)
+            for _ in range(2)
+        ]
+
+        decisions = [await workers[i % 2].acquire("ip:1") for i in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert decisions[2].remaining == 57
+
+        clock.now += 11
+        assert (await workers[0].acquire("ip:1")).allowed
+
+
+def test_redis_backend_without_url_uses_memory():
+    limiter = create_rate_limiter(60, 1000, 10, backend="redis", redis_url=None)
+
+    assert isinstance(limiter, InMemoryRateLimiter)
@@ -0,0 +1,111 @@
+"""
+Unit tests for pipelined sub-agent execution in the Task Management Agent.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock
+
+from event_planning_agent_v2.agents.task_management.core.sub_agent_pipeline import SubAgentPipeline
+from event_planning_agent_v2.agents.task_management.core.task_management_agent import TaskManagementAgent
+from event_planning_agent_v2.agents.task_management.models.task_models import GranularTask, PrioritizedTask
+from event_planning_agent_v2.agents.task_management.sub_agents.resource_dependency_agent import ResourceDependencyAgentCore
+from event_planning_agent_v2.database.state_manager import WorkflowStateManager
+
+LATENCY = 0.05
+TASK_NAMES = [
+    "Book venue", "Finalize catering menu", "Arrange decorations", "Hire photographer",
+    "Send invitations", "Plan ceremony music", "Setup lighting", "Confirm transportation",
+]
+STATE = {
+    "plan_id": "plan-pipeline",
+    "client_request": {"event_type": "wedding", "guest_count": 150},
+    "timeline_data": {"tasks": [
+        {"task_id": f"task_{i}", "task_name": name, "description": f"{name} for the wedding"}
+        for i, name in enumerate(TASK_NAMES)
+    ]},
+}
+
+
+class SlowLLMManager:
+    """Answers every prompt after a fixed latency, recording when it was called"""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def select_model(self, task_class, model=None, **kwargs):
+        return model
+
+    async def generate_response(self, prompt, **kwargs):
+        self.calls.append(time.perf_counter())
+        await asyncio.sleep(LATENCY)
+        return "Priority: High\nRationale: Books early\nSub-task 1: Confirm details\nDescription: Call the vendor"
+
+
+def _agent(pipeline):
+    agent = TaskManagementAgent(state_manager=Mock(spec=WorkflowStateManager), llm_model="gemma:2b")
+    agent.config.pipeline_sub_agents = pipeline
+    calls = {}
+    for name in ("prioritization_agent", "granularity_agent", "resource_dependency_agent"):
+        sub_agent = getattr(agent, name)
+        sub_agent.settings = sub_agent.settings.model_copy(update={
+            "llm": sub_agent.settings.llm.model_copy(update={"enable_prompt_packing": False})
+        })
+        calls[name] = []
+        sub_agent.llm_manager = SlowLLMManager(calls[name])
+    return agent, calls
+
+
+@pytest.mark.asyncio
+async def test_pipeline_matches_whole_list_passes_and_overlaps_stages():
+    sequential_agent, _ = _agent(pipeline=False)
+    pipelined_agent, calls = _agent(pipeline=True)
+
+    expected = await sequential_agent._invoke_sub_agents(STATE)
+    result = await pipelined_agent._invoke_sub_agents(STATE)
+
+    assert result["prioritized_tasks"] == expected["prioritized_tasks"]
+    assert result["granular_tasks"] == expected["granular_tasks"]
+    assert result["dependency_tasks"] == expected["dependency_tasks"]
+    assert any(t.dependencies for t in result["dependency_tasks"])
+    # Decomposition started while prioritization was still running
+    assert min(calls["granularity_agent"]) < max(calls["prioritization_agent"])
+
+
+class _Prioritizer:
+    async def prioritize_tasks_stream(self, state):
+        for i in range(6):
+            yield PrioritizedTask(f"t{i}", f"Task {i}", "High", 0.8, "")
+
+
+class _Decomposer:
+    def __init__(self):
+        self.batches = []
+
+    async def decompose_tasks(self, tasks, state):
+        self.batches.append([t.task_id for t in tasks])
+        if "t0" in self.batches[-1]:
+            raise RuntimeError("model unavailable")
+        return [GranularTask(t.task_id, None, t.task_name, "", 0) for t in tasks]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_keeps_the_rest_of_the_plan():
+    resource_agent = ResourceDependencyAgentCore()
+
+    async def no_resources(task, event_context, state):
+        return []
+
+    resource_agent._identify_resources = no_resources
+    decomposer = _Decomposer()
+    pipeline = SubAgentPipeline(_Prioritizer(), decomposer, resource_agent, queue_size=1, batch_size=2)
+
+    result = await pipeline.run({"client_request": {}})
+
+    assert len(result.prioritized_tasks) == 6
+    assert all(len(batch) <= 2 for batch in decomposer.batches)
+    assert "t0" not in {t.task_id for t in result.granular_tasks}
+    assert [t.task_id for t in result.dependency_tasks] == [t.task_id for t in result.granular_tasks]
+    assert isinstance(result.errors["GranularityAgent"], RuntimeError)
+    assert set(result.stage_ms) == {"PrioritizationAgent", "GranularityAgent", "ResourceDependencyAgent"}
@@ -0,0 +1,104 @@
+"""
+Unit tests for bounded-concurrency fan-out of per-task LLM work.
+"""
+
+import asyncio
+import time
+import pytest
+
+from event_planning_agent_v2.llm.fanout import gather_bounded
+from event_planning_agent_v2.agents.task_management.models.task_models import PrioritizedTask
+from event_planning_agent_v2.agents.task_management.sub_agents.granularity_agent import GranularityAgentCore
+
+
+class TestGatherBounded:
+    """Tests for the fan-out helper"""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_bounds_concurrency(self):
+        active = peak = 0
+
+        async def worker(i):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01 * (5 - i % 5))
+            active -= 1
+            return i * 10
+
+        results = await gather_bounded(list(range(20)), worker, lambda i, e: None, limit=4)
+
+        assert results == [i * 10 for i in range(20)]
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_items_get_their_fallback(self):
+        async def worker(i):
+            if i == 2:
+                raise ValueError("boom")
+            return i
+
+        results = await gather_bounded([1, 2, 3], worker, lambda i, e: f"fallback {i}: {e}", limit=2)
+
+        assert results == [1, "fallback 2: boom", 3]
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_unfinished_items(self):
+        cancelled = []
+
+        async def worker(i):
+            try:
+                await asyncio.sleep(0 if i < 2 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+            return i
+
+        results = await gather_bounded(
+            [0, 1, 2, 3], worker, lambda i, e: type(e).__name__, limit=4, deadline=0.05
+        )
+
+        assert results == [0, 1, "TimeoutError", "TimeoutError"]
+        assert sorted(cancelled) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_item_cancelled_from_inside_gets_its_fallback(self):
+        async def worker(i):
+            if i == 1:
+                inner = asyncio.ensure_future(asyncio.sleep(10))
+                inner.cancel()
+                await inner  # Cancellation of an awaited inner task propagates out
+            return i
+
+        results = await gather_bounded([0, 1, 2], worker, lambda i, e: type(e).__name__, limit=3)
+
+        assert results == [0, "CancelledError", 2]
+
+
+class SlowLLMManager:
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+
+    async def generate_response(self, prompt, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return "Sub-task 1: Confirm details\nDescription: Call the vendor"
+
+
+@pytest.mark.asyncio
+async def test_granularity_wall_time_is_close_to_single_task_latency():
+    agent = GranularityAgentCore()
+    agent.settings = agent.settings.model_copy(update={
+        "llm": agent.settings.llm.model_copy(update={"enable_prompt_packing": False, "task_fanout_concurrency": 16})
+    })
+    agent.llm_manager = SlowLLMManager(latency=0.1)
+    tasks = [PrioritizedTask(f"t{i}", f"Vendor booking {i}", "High", 0.8, "Books early") for i in range(12)]
+
+    start = time.perf_counter()
+    result = await agent.decompose_tasks(tasks, {"client_request": {}})
+    elapsed = time.perf_counter() - start
+
+    assert agent.llm_manager.calls == 12
+    assert elapsed < 0.5
+    assert [t.task_id for t in result if t.parent_task_id is None] == [f"t{i}" for i in range(12)]
@@ -5,6 +5,7 @@ Tests database persistence operations for Task Management Agent.
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock, patch
 from sqlalchemy.exc import OperationalError
@@ -306,6 +307,38 @@ class TestTaskManagementRepository:
         assert mock_session.execute.called
         assert mock_session.commit.called
     
+    @patch('event_planning_agent_v2.database.task_management_repository.get_sync_session')
+    def test_save_extended_tasks_batches_rows(
+        self,
+        mock_get_session,
+        sample_extended_task,
+        sample_processing_summary
+    ):
+        """Test tasks are written with one multi-row statement per batch"""
+        # Setup mock
+        mock_session = MagicMock()
+        mock_get_session.return_value.__enter__ = Mock(return_value=mock_session)
+        mock_get_session.return_value.__exit__ = Mock(return_value=False)
+        
+        tasks = [replace(sample_extended_task, task_id=f'task_{i}') for i in range(5)]
+        tasks.append(replace(sample_extended_task, task_id='task_0', task_name='Renamed'))
+        task_list = ExtendedTaskList(tasks=tasks, processing_summary=sample_processing_summary)
+        
+        # Execute
+        repo = TaskManagementRepository()
+        repo.BULK_INSERT_BATCH_SIZE = 2
+        count = repo.save_extended_tasks(task_management_run_id=123, extended_task_list=task_list)
+        
+        # Verify: a repeated task ID keeps its last version
+        assert count == 5
+        assert mock_session.execute.call_count == 3
+        params = [call.args[1] for call in mock_session.execute.call_args_list]
+        assert [len(p) for p in params] == [10, 10, 5]
+        assert params[0]['task_id_0'] == 'task_0'
+        assert '"Renamed"' in params[0]['task_data_0']
+        assert 'ON CONFLICT' in str(mock_session.execute.call_args_list[0].args[0])
+        assert mock_session.commit.call_count == 1
+    
     @patch('event_planning_agent_v2.database.task_management_repository.get_sync_session')
     def test_get_task_management_run_success(self, mock_get_session):
         """Test successful retrieval of task management run"""
@@ -0,0 +1,63 @@
+"""
+Unit tests for the compact Task Management models.
+"""
+
+import sys
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
+import pytest
+from unittest.mock import Mock
+
+from event_planning_agent_v2.agents.task_management.core.task_management_agent import TaskManagementAgent
+from event_planning_agent_v2.agents.task_management.models import (
+    Conflict, ExtendedTask, ExtendedTaskList, PrioritizedTask, Resource, TaskTimeline
+)
+from event_planning_agent_v2.database.state_manager import WorkflowStateManager
+
+
+def _label(value):
+    """A fresh string equal to value, as parsed from an LLM response"""
+    return "".join(list(value))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10")
+def test_models_have_no_instance_dict():
+    resource = Resource("vendor", "vendor_1", "Caterer", 1)
+    task = PrioritizedTask("task_1", "Book venue", "High", 0.9, "")
+
+    assert not hasattr(resource, "__dict__")
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.notes = "not a field"
+
+
+def test_repeated_labels_are_interned():
+    first = Resource(_label("vendor"), _label("vendor_1"), _label("Caterer"), 1)
+    second = Resource(_label("vendor"), _label("vendor_1"), _label("Caterer"), 2)
+    priority = PrioritizedTask("task_1", "Book venue", _label("High"), 0.9, "")
+
+    assert first.resource_type is second.resource_type
+    assert first.resource_name is second.resource_name
+    assert replace(priority, task_id="task_2").priority_level is priority.priority_level
+    assert Conflict("c1", _label("timeline"), _label("high")).severity is sys.intern("high")
+
+
+def test_serialized_task_list_matches_asdict():
+    agent = TaskManagementAgent(state_manager=Mock(spec=WorkflowStateManager), llm_model="gemma:2b")
+    start = datetime(2024, 6, 15, 9, 0)
+    task = ExtendedTask(
+        task_id="task_1", task_name="Book venue", task_description="", priority_level="High",
+        priority_score=0.9, granularity_level=0, parent_task_id=None,
+        resources_required=[Resource("venue", "hall", "Grand Hall", 1)],
+        timeline=TaskTimeline("task_1", start, start + timedelta(hours=1), timedelta(hours=1), timedelta(minutes=15)),
+        llm_enhancements={"suggestions": ["Book early"]},
+    )
+    task_list = ExtendedTaskList(tasks=[task], metadata={"agent_version": "1.0.0"})
+
+    expected = asdict(task_list)
+    expected["tasks"][0]["timeline"].update(duration=3600.0, buffer_time=900.0)
+
+    serialized = agent._serialize_extended_task_list(task_list)
+
+    assert serialized == expected
+    assert serialized["tasks"][0]["llm_enhancements"] is not task.llm_enhancements
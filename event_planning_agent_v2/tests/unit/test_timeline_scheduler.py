@@ -0,0 +1,139 @@
+"""
+Unit tests for critical-path scheduling with resource leveling in the Timeline Calculation Tool.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import (
+    ConsolidatedTask, ConsolidatedTaskData
+)
+from event_planning_agent_v2.agents.task_management.models.data_models import Resource
+from event_planning_agent_v2.agents.task_management.tools.conflict_check_tool import ConflictCheckTool
+from event_planning_agent_v2.agents.task_management.tools.timeline_calculation_tool import TimelineCalculationTool
+
+STATE = {"client_request": {"eventDate": "2024-12-14"}}
+START = datetime(2024, 12, 14, 9, 0)
+
+
+def _task(task_id, hours, dependencies=(), resources=(), priority="Medium"):
+    return ConsolidatedTask(
+        task_id=task_id,
+        task_name=task_id.title(),
+        priority_level=priority,
+        priority_score=0.5,
+        priority_rationale="",
+        parent_task_id=None,
+        task_description="",
+        granularity_level=1,
+        estimated_duration=timedelta(hours=hours),
+        dependencies=list(dependencies),
+        resources_required=[Resource(kind, rid, rid, 1) for kind, rid in resources],
+    )
+
+
+def _schedule(tasks):
+    data = ConsolidatedTaskData(tasks=tasks)
+    timelines = TimelineCalculationTool().calculate_timelines(data, STATE)
+    return {t.task_id: t for t in timelines}, data.processing_metadata["critical_path"]
+
+
+def test_independent_tasks_run_in_parallel():
+    timelines, _ = _schedule([_task("flowers", 2), _task("music", 1), _task("cake", 3)])
+
+    assert {t.start_time for t in timelines.values()} == {START}
+    assert timelines["cake"].is_critical
+    assert timelines["music"].slack == timedelta(hours=2)
+
+
+def test_dependencies_and_buffers_are_respected():
+    timelines, critical_path = _schedule([
+        _task("venue", 2),
+        _task("decor", 1, dependencies=["venue"]),
+        _task("lights", 1, dependencies=["venue"]),
+        _task("rehearsal", 1, dependencies=["decor", "lights"]),
+    ])
+
+    buffer = timelines["venue"].buffer_time
+    assert timelines["decor"].start_time == timelines["venue"].end_time + buffer
+    assert timelines["decor"].start_time == timelines["lights"].start_time
+    assert timelines["rehearsal"].start_time == timelines["decor"].end_time + timelines["decor"].buffer_time
+    assert critical_path == ["venue", "decor", "lights", "rehearsal"]
+
+
+def test_tasks_sharing_a_resource_never_overlap():
+    timelines, critical_path = _schedule([
+        _task("florist_ceremony", 2, resources=[("vendor", "florist")]),
+        _task("florist_reception", 1, resources=[("vendor", "florist")], priority="Critical"),
+        _task("hall_setup", 1, resources=[("venue", "hall")]),
+        _task("hall_sound", 1, resources=[("venue", "hall"), ("equipment", "speakers")]),
+        _task("speakers", 0.5, resources=[("equipment", "speakers")]),
+    ])
+
+    def overlap(a, b):
+        return a.start_time < b.end_time and b.start_time < a.end_time
+
+    assert not overlap(timelines["florist_ceremony"], timelines["florist_reception"])
+    assert not overlap(timelines["hall_setup"], timelines["hall_sound"])
+    assert not overlap(timelines["hall_sound"], timelines["speakers"])
+    assert any("Waits for" in c for t in timelines.values() for c in t.scheduling_constraints)
+    assert set(critical_path) == {"florist_ceremony", "florist_reception"}
+
+
+def _serial_makespan(tool, tasks):
+    """End of the last task when every task runs after the previous one, as the tool used to schedule"""
+    sorted_tasks = tool._topological_sort(tasks)
+    released = {}  # task_id -> end plus buffer
+    current = end = START
+    for task in sorted_tasks:
+        start = max([current] + [released[d] for d in task.dependencies if d in released])
+        end = start + task.estimated_duration
+        released[task.task_id] = current = end + tool._calculate_buffer_time(task)
+    return end - START
+
+
+def test_makespan_is_never_worse_than_serial_schedule():
+    rng = random.Random(11)
+    tool = TimelineCalculationTool()
+
+    for _ in range(30):
+        tasks = []
+        for i in range(40):
+            dependencies = rng.sample([t.task_id for t in tasks], k=min(len(tasks), rng.randint(0, 2)))
+            resources = [("vendor", f"v{rng.randint(0, 3)}")] if rng.random() < 0.6 else []
+            tasks.append(_task(f"t{i}", rng.choice([0.25, 0.5, 1, 2]), dependencies, resources,
+                               priority=rng.choice(["Critical", "High", "Medium", "Low"])))
+
+        timelines, _ = _schedule(tasks)
+        makespan = max(t.end_time for t in timelines.values()) - START
+
+        assert makespan <= _serial_makespan(tool, tasks)
+        assert all(t.slack >= timedelta(0) for t in timelines.values())
+
+
+def test_scheduled_plans_have_no_overlap_or_resource_conflicts():
+    rng = random.Random(5)
+    plans = [
+        [_task("speeches", 1, priority="High"), _task("photos", 1, priority="High")],
+        [_task("slides", 1, resources=[("equipment", "projector")], priority="High"),
+         _task("video", 1, resources=[("equipment", "projector")], priority="Low")],
+    ]
+    for _ in range(3):
+        tasks = []
+        for i in range(200):
+            dependencies = rng.sample([t.task_id for t in tasks], k=min(len(tasks), rng.randint(0, 2)))
+            resources = [(kind, f"{kind}{rng.randint(0, 3)}")
+                         for kind in ("vendor", "venue", "equipment", "personnel") if rng.random() < 0.2]
+            tasks.append(_task(f"t{i}", rng.choice([0.25, 0.5, 1, 2]), dependencies, resources,
+                               priority=rng.choice(["Critical", "High", "Medium", "Low"])))
+        plans.append(tasks)
+    tool = ConflictCheckTool(timeline_conflict_tool=Mock())
+
+    for tasks in plans:
+        timelines, _ = _schedule(tasks)
+        for task in tasks:
+            task.timeline = timelines[task.task_id]
+
+        assert tool._check_direct_timeline_overlaps(tasks) == []
+        assert tool._check_resource_conflicts(tasks) == []
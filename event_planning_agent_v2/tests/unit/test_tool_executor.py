@@ -0,0 +1,128 @@
+"""
+Unit tests for the Task Management tool graph executor and concurrent tool processing.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from event_planning_agent_v2.agents.task_management.core.task_management_agent import TaskManagementAgent
+from event_planning_agent_v2.agents.task_management.core.tool_executor import ToolGraphExecutor, ToolNode
+from event_planning_agent_v2.agents.task_management.models.consolidated_models import ConsolidatedTaskData
+from event_planning_agent_v2.database.state_manager import WorkflowStateManager
+
+DELAY = 0.2
+
+
+def _sleeper(result, log=None):
+    def run(outputs):
+        if log is not None:
+            log.append(("start", result, set(outputs)))
+        time.sleep(DELAY)
+        return result
+    return run
+
+
+def _slow_tool(result):
+    def run(*args, **kwargs):
+        time.sleep(DELAY)
+        return result
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_tools_overlap_and_dependents_wait():
+    log = []
+    executor = ToolGraphExecutor([
+        ToolNode("timeline", _sleeper(["t"], log), "timelines"),
+        ToolNode("vendor", _sleeper(["v"]), "vendors"),
+        ToolNode("logistics", _sleeper(["l"]), "logistics"),
+        ToolNode("conflict", _sleeper(["c"], log), "conflicts", inputs=("timelines",)),
+    ])
+
+    outputs, runs, timings = await executor.run()
+
+    assert outputs == {"timelines": ["t"], "vendors": ["v"], "logistics": ["l"], "conflicts": ["c"]}
+    conflict_start = next(entry for entry in log if entry[1] == ["c"])
+    assert "timelines" in conflict_start[2]
+    assert runs["conflict"].started_ms >= runs["timeline"].duration_ms
+    # Two levels of the graph, not four tools back to back
+    assert timings.wall_ms < 3 * DELAY * 1000
+    assert timings.critical_path == ["timeline", "conflict"]
+    assert timings.critical_path_ms >= 2 * DELAY * 1000
+
+
+@pytest.mark.asyncio
+async def test_failures_are_isolated_and_reported():
+    finished = []
+
+    def fail(outputs):
+        raise RuntimeError("database unavailable")
+
+    async def enhance(outputs):
+        await asyncio.sleep(0.01)
+        return ["e"]
+
+    executor = ToolGraphExecutor([
+        ToolNode("timeline", fail, "timelines"),
+        ToolNode("llm", enhance, "enhancements"),
+        ToolNode("conflict", lambda outputs: outputs.get("timelines", []), "conflicts", inputs=("timelines",)),
+    ], on_complete=finished.append)
+
+    outputs, runs, _ = await executor.run()
+
+    assert not runs["timeline"].success
+    assert "database unavailable" in str(runs["timeline"].error)
+    assert outputs == {"enhancements": ["e"], "conflicts": []}
+    assert {run.name for run in finished} == {"timeline", "llm", "conflict"}
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_keeps_declared_order():
+    order = []
+    executor = ToolGraphExecutor(
+        [ToolNode(name, lambda outputs, n=name: order.append(n) or [], name) for name in ("a", "b", "c")],
+        concurrent=False
+    )
+
+    await executor.run()
+
+    assert order == ["a", "b", "c"]
+
+
+def test_cycles_and_duplicate_outputs_are_rejected():
+    with pytest.raises(ValueError):
+        ToolGraphExecutor([
+            ToolNode("a", lambda outputs: [], "x", inputs=("y",)),
+            ToolNode("b", lambda outputs: [], "y", inputs=("x",)),
+        ])
+    with pytest.raises(ValueError):
+        ToolGraphExecutor([ToolNode("a", lambda outputs: [], "x"), ToolNode("b", lambda outputs: [], "x")])
+
+
+@pytest.mark.asyncio
+async def test_agent_runs_tools_concurrently_with_status_and_timings():
+    agent = TaskManagementAgent(state_manager=Mock(spec=WorkflowStateManager), llm_model="gemma:2b")
+    agent.config.parallel_tool_execution = True
+    agent.config.enable_llm_enhancement = True
+
+    agent.timeline_tool = Mock(calculate_timelines=Mock(side_effect=_slow_tool(["timeline"])))
+    agent.llm_tool = Mock(enhance_tasks=AsyncMock(return_value=["enhancement"]))
+    agent.vendor_tool = Mock(assign_vendors=Mock(side_effect=_slow_tool(["assignment"])))
+    agent.logistics_tool = Mock(verify_logistics=Mock(side_effect=RuntimeError("no vendor data")))
+    agent.conflict_tool = Mock(check_conflicts=Mock(return_value=[]))
+    agent.venue_tool = Mock(lookup_venues=Mock(side_effect=_slow_tool(["venue"])))
+
+    data = ConsolidatedTaskData(tasks=[])
+    started = time.perf_counter()
+    outputs = await agent._process_tools(data, {"client_request": {}})
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 2 * DELAY
+    assert outputs["timelines"] == ["timeline"]
+    assert outputs["logistics_statuses"] == []
+    assert agent.tool_execution_status["vendor_assignment"] == "success"
+    assert agent.tool_execution_status["logistics_check"] == "failed: no vendor data"
+    assert len(agent.tool_execution_status) == 6
+    assert set(data.processing_metadata["tool_timings"]["tool_ms"]) == set(agent.tool_execution_status)
@@ -12,6 +12,12 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+try:
+    from ..observability.progress import publish_progress
+except ImportError:
+    # Fall back to absolute imports (when running tests directly)
+    from observability.progress import publish_progress
+
 
 class BlueprintGenerationInput(BaseModel):
     """Input schema for BlueprintGenerationTool"""
@@ -269,19 +275,35 @@ This comprehensive event blueprint outlines the complete planning strategy, vend
         
         return recommendations
 
+    def _publish_section(self, section: str, content: str) -> str:
+        """Publish a finished blueprint section to the progress stream"""
+        publish_progress("blueprint_section", {"section": section, "content": content})
+        return content
+
     def _run(self, client_requirements: dict, vendor_combination: dict, 
              event_timeline: dict, budget_allocation: dict) -> str:
         """
         Main execution method for blueprint generation.
         Compiles comprehensive event blueprint document.
         """
-        # Generate document sections
-        executive_summary = self._generate_executive_summary(client_requirements, vendor_combination)
-        vendor_details = self._generate_vendor_details(vendor_combination)
-        timeline_section = self._generate_timeline_section(event_timeline)
-        budget_section = self._generate_budget_section(budget_allocation, vendor_combination)
-        recommendations = self._generate_recommendations(
-            client_requirements, vendor_combination, event_timeline
+        # Generate document sections, streaming each to the plan's progress
+        # channel so previews can render before the whole document is ready
+        executive_summary = self._publish_section(
+            "Executive Summary",
+            self._generate_executive_summary(client_requirements, vendor_combination)
+        )
+        vendor_details = self._publish_section(
+            "Vendor Partners", self._generate_vendor_details(vendor_combination)
+        )
+        timeline_section = self._publish_section(
+            "Event Timeline", self._generate_timeline_section(event_timeline)
+        )
+        budget_section = self._publish_section(
+            "Budget Allocation", self._generate_budget_section(budget_allocation, vendor_combination)
+        )
+        recommendations = self._publish_section(
+            "Recommendations",
+            self._generate_recommendations(client_requirements, vendor_combination, event_timeline)
         )
         
         # Compile complete blueprint
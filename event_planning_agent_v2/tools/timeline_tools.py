@@ -12,6 +12,14 @@ try:
 except ImportError:
     from langchain_community.llms import Ollama as OllamaLLM
 
+try:
+    from ..llm.streaming import JSONCompletionDetector
+    from ..observability.progress import publish_progress
+except ImportError:
+    # Fall back to absolute imports (when running tests directly)
+    from llm.streaming import JSONCompletionDetector
+    from observability.progress import publish_progress
+
 
 class ConflictDetectionInput(BaseModel):
     """Input schema for ConflictDetectionTool"""
@@ -452,7 +460,7 @@ class TimelineGenerationTool(BaseTool):
         """
         
         try:
-            response = self.llm.invoke(prompt)
+            response = self._stream_json_response(prompt, progress_event="timeline_enhancement")
             # Clean up the response
             cleaned_response = response.strip()
             if cleaned_response.startswith("```json"):
@@ -467,6 +475,29 @@ class TimelineGenerationTool(BaseTool):
             print(f"LLM enhancement failed: {e}")
             return base_timeline
 
+    def _stream_json_response(self, prompt: str, progress_event: str) -> str:
+        """
+        Stream the LLM response and stop once a complete JSON value is generated.
+        
+        Closing the stream early ends generation instead of waiting for any
+        trailing commentary. Chunks are forwarded to the plan's progress stream.
+        """
+        detector = JSONCompletionDetector()
+        chunks = []
+        stream = self.llm.stream(prompt)
+        try:
+            for chunk in stream:
+                chunk = chunk[:detector.feed(chunk)]
+                if chunk:
+                    chunks.append(chunk)
+                    publish_progress(progress_event, {"text": chunk})
+                if detector.complete:
+                    break
+        finally:
+            stream.close()
+        publish_progress(progress_event, {"done": True})
+        return "".join(chunks)
+
     def _validate_timeline(self, timeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Validate and fix any issues in the generated timeline.
@@ -34,6 +34,7 @@ from typing import Dict, Any, Optional
 
 from .state_models import EventPlanningState, WorkflowStatus, transition_logger
 from ..agents.task_management.core.task_management_agent import TaskManagementAgent
+from ..agents.task_management.tools.incremental_scheduler import get_plan_schedule_cache
 from ..agents.orchestrator import StateManagementTool
 from ..database.state_manager import get_state_manager
 
@@ -199,6 +200,9 @@ def task_management_node(state: EventPlanningState) -> EventPlanningState:
             # Set next node to blueprint generation
             state['next_node'] = 'blueprint_generation'
             
+            # Schedules loaded for incremental edits refer to the previous task list
+            get_plan_schedule_cache().invalidate(state.get('plan_id'))
+            
             # Final state save with extended task list
             logger.info("Saving final state with extended task list...")
             try: